@@ -0,0 +1,5 @@
+"""
+Бенчмарки движка резолюций.
+Запуск: python -m benchmarks.bench_resolution
+Размеры промптов модели: python -m benchmarks.bench_prompts
+"""
@@ -0,0 +1,145 @@
+"""
+Бенчмарк размера промптов формализатора и объяснителя.
+Показывает, какая часть промпта неизменна (системный промпт, который
+сервер Ollama обрабатывает один раз и берет из кэша контекста модели),
+а какая отправляется заново в каждом запросе. С флагом --live промпты
+отправляются запущенному серверу, и для каждого запроса печатается
+prompt_eval_count - сколько токенов промпта сервер действительно обработал.
+
+Запуск:
+    python -m benchmarks.bench_prompts
+    python -m benchmarks.bench_prompts --live --model deepseek-v3.1:671b-cloud
+"""
+
+import argparse
+import statistics
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.logic_formalizer import LogicFormalizer
+from src.ollama_client import OllamaClient, OllamaError
+from src.proof_explainer import ProofExplainer
+from src.resolution_engine import ResolutionEngine
+
+from .problems import example_problems
+
+# Тексты задач для промптов формализатора
+PROMPT_TEXTS = [
+    "Сократ — человек. Все люди смертны. Докажи, что Сократ смертен.",
+    "Маша старше Кати, а Катя старше Лены. Докажи, что Маша старше Лены.",
+    "Все пингвины — птицы. Ни один пингвин не летает. Тукс — пингвин. Докажи, что некоторые птицы не летают.",
+    "Если идет дождь, дорога мокрая. Если дорога мокрая, случаются аварии. Идет дождь. Докажи, что случаются аварии.",
+]
+
+
+def build_prompts() -> Dict[str, Tuple[str, List[str]]]:
+    """
+    Строит промпты всех видов для набора задач.
+
+    Returns:
+        Dict[str, Tuple[str, List[str]]]: Вид промпта -> (системный промпт,
+            изменяемые части промптов по задачам)
+    """
+    formalizer = LogicFormalizer(client=OllamaClient())
+    fol_formalizer = LogicFormalizer(client=OllamaClient(), fol_mode=True)
+    explainer = ProofExplainer(client=OllamaClient())
+
+    explanation_prompts = []
+    for problem in example_problems():
+        success, log = ResolutionEngine().prove(problem.clauses)
+        explanation_prompts.append(
+            explainer._build_explanation_prompt(explainer._prepare_proof_data(log, success)))
+
+    return {
+        'formalizer': (formalizer._system_prompt(),
+                       [formalizer._build_prompt(text) for text in PROMPT_TEXTS]),
+        'formalizer-fol': (fol_formalizer._system_prompt(),
+                           [fol_formalizer._build_prompt(text) for text in PROMPT_TEXTS]),
+        'explainer': (ProofExplainer.SYSTEM_PROMPT, explanation_prompts),
+    }
+
+
+def prompt_sizes(system: str, prompts: List[str]) -> Dict[str, Any]:
+    """
+    Размеры неизменной и изменяемой частей промпта.
+
+    Args:
+        system: Системный промпт
+        prompts: Изменяемые части промптов
+
+    Returns:
+        Dict[str, Any]: Символы и слова системного промпта, средние символы
+            и слова изменяемой части, доля изменяемой части в полном промпте
+    """
+    variable_chars = statistics.mean(len(prompt) for prompt in prompts)
+    return {
+        'system_chars': len(system),
+        'system_words': len(system.split()),
+        'variable_chars': variable_chars,
+        'variable_words': statistics.mean(len(prompt.split()) for prompt in prompts),
+        'variable_share': variable_chars / (len(system) + variable_chars),
+    }
+
+
+def measure_live(client: OllamaClient, model: str, system: str,
+                 prompts: List[str]) -> List[Optional[int]]:
+    """
+    Отправляет промпты серверу и возвращает prompt_eval_count каждого запроса.
+
+    Генерация ограничена одним токеном: измеряется только обработка
+    промпта. Первый запрос обрабатывает промпт целиком, следующие -
+    только то, что не совпало с кэшированным началом.
+
+    Args:
+        client: Клиент сервера Ollama
+        model: Модель
+        system: Системный промпт
+        prompts: Изменяемые части промптов
+
+    Returns:
+        List[Optional[int]]: Обработанные токены промпта по запросам
+    """
+    counts = []
+    for prompt in prompts:
+        metrics: Dict[str, Any] = {}
+        client.generate(prompt, model=model, system=system,
+                        options={'num_predict': 1}, on_metrics=metrics.update)
+        counts.append(metrics.get('prompt_eval_count'))
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Точка входа командной строки.
+
+    Args:
+        argv: Аргументы командной строки (None - sys.argv)
+
+    Returns:
+        int: Код завершения (1, если сервер недоступен в режиме --live)
+    """
+    parser = argparse.ArgumentParser(description="Размеры промптов формализатора и объяснителя")
+    parser.add_argument('--live', action='store_true',
+                        help="измерить prompt_eval_count на запущенном сервере Ollama")
+    parser.add_argument('--model', default="deepseek-v3.1:671b-cloud",
+                        help="модель для режима --live")
+    args = parser.parse_args(argv)
+
+    client = OllamaClient(model=args.model) if args.live else None
+    for kind, (system, prompts) in build_prompts().items():
+        sizes = prompt_sizes(system, prompts)
+        print(f"{kind:<16} системный: {sizes['system_chars']:5d} симв. {sizes['system_words']:4d} сл.  "
+              f"изменяемый: {sizes['variable_chars']:7.1f} симв. {sizes['variable_words']:6.1f} сл.  "
+              f"доля в запросе: {sizes['variable_share']:.0%}")
+        if client is not None:
+            try:
+                counts = measure_live(client, args.model, system, prompts)
+            except OllamaError as error:
+                print(f"Сервер Ollama недоступен: {error}")
+                return 1
+            print(f"{'':<16} prompt_eval_count по запросам: {counts}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
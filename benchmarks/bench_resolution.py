@@ -0,0 +1,212 @@
+"""
+Бенчмарк движка резолюций.
+Запускает примеры и сгенерированные семейства задач, измеряет время,
+количество порожденных и сохраненных клауз, вызовов унификации и пиковую
+память, и записывает результаты в JSON для отслеживания по версиям.
+
+Запуск:
+    python -m benchmarks.bench_resolution --output bench_results.json
+    python -m benchmarks.bench_resolution --profile chain-3   # профили одной задачи
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.engine_stats import profile_prove
+from src.resolution_engine import ResolutionEngine
+
+from .problems import FAMILIES, BenchmarkProblem, default_problems
+
+# Версия формата файла результатов
+RESULTS_FORMAT_VERSION = 1
+
+
+def run_problem(problem: BenchmarkProblem, repeat: int = 3, max_steps: int = 100,
+                measure_memory: bool = True) -> Dict[str, Any]:
+    """
+    Выполняет одну задачу бенчмарка.
+
+    Время измеряется в repeat отдельных прогонах; пиковая память -
+    в дополнительном прогоне под tracemalloc, чтобы трассировка
+    не искажала время.
+
+    Args:
+        problem: Задача бенчмарка
+        repeat: Количество прогонов для измерения времени
+        max_steps: Ограничение количества раундов движка
+        measure_memory: Измерять ли пиковую память
+
+    Returns:
+        Dict[str, Any]: Метрики задачи
+    """
+    wall_times = []
+    for _ in range(repeat):
+        engine = ResolutionEngine(max_steps=max_steps)
+        start = time.perf_counter()
+        result, log = engine.prove(problem.clauses)
+        wall_times.append(time.perf_counter() - start)
+
+    peak_memory = None
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            ResolutionEngine(max_steps=max_steps).prove(problem.clauses)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    stats = engine.stats
+    return {
+        'name': problem.name,
+        'family': problem.family,
+        'size': problem.size,
+        'clauses': len(problem.clauses),
+        'expected': problem.expected,
+        'result': result,
+        'correct': None if problem.expected is None else result == problem.expected,
+        'outcome': log[-1]['type'],
+        'wall_time': statistics.median(wall_times),
+        'wall_times': wall_times,
+        'rounds': engine.step_counter,
+        'generated_clauses': stats.resolvents_generated,
+        'kept_clauses': stats.resolvents_kept,
+        'unification_calls': stats.unification_attempts,
+        'tautologies_deleted': stats.tautologies_deleted,
+        'subsumed_deleted': stats.subsumed_deleted,
+        'peak_memory': peak_memory,
+    }
+
+
+def run_benchmarks(problems: List[BenchmarkProblem], repeat: int = 3, max_steps: int = 100,
+                   measure_memory: bool = True, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Выполняет набор задач и собирает отчет.
+
+    Args:
+        problems: Задачи бенчмарка
+        repeat: Количество прогонов для измерения времени
+        max_steps: Ограничение количества раундов движка
+        measure_memory: Измерять ли пиковую память
+        verbose: Печатать ли строку результата для каждой задачи
+
+    Returns:
+        Dict[str, Any]: Отчет с описанием окружения и метриками задач
+    """
+    results = []
+    for problem in problems:
+        metrics = run_problem(problem, repeat, max_steps, measure_memory)
+        results.append(metrics)
+        if verbose:
+            print(format_result(metrics), flush=True)
+
+    return {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'max_steps': max_steps,
+        'problems': results,
+    }
+
+
+def format_result(metrics: Dict[str, Any]) -> str:
+    """Форматирует метрики задачи в строку таблицы."""
+    memory = metrics['peak_memory']
+    memory_text = f"{memory / 1024:9.1f} КБ" if memory is not None else f"{'-':>12}"
+    return (f"{metrics['name']:<28} {str(metrics['result']):<6} "
+            f"{metrics['wall_time'] * 1000:9.1f} мс "
+            f"{metrics['generated_clauses']:8d} порожд. {metrics['kept_clauses']:7d} сохр. "
+            f"{metrics['unification_calls']:8d} униф. {memory_text}")
+
+
+def profile_problem(name: str, output_dir: str, max_steps: int = 100) -> int:
+    """
+    Профилирует одну задачу набора и записывает профили в output_dir.
+
+    Args:
+        name: Имя задачи, например "chain-3"
+        output_dir: Каталог для файлов профилей
+        max_steps: Ограничение количества раундов движка
+
+    Returns:
+        int: Код завершения (2, если задача не найдена)
+    """
+    problems = {problem.name: problem for problem in default_problems()}
+    if name not in problems:
+        print(f"Задача не найдена: {name}. Доступны: {', '.join(problems)}")
+        return 2
+
+    result, _, stats = profile_prove(ResolutionEngine(max_steps=max_steps),
+                                     problems[name].clauses, output_dir, name)
+    print(f"{name}: результат {result}")
+    print(stats)
+    print(f"Профили записаны в {output_dir}")
+    return 0
+
+
+def _git_commit() -> Optional[str]:
+    """Возвращает короткий хэш текущего коммита или None вне репозитория."""
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                   capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Точка входа командной строки.
+
+    Args:
+        argv: Аргументы командной строки (None - sys.argv)
+
+    Returns:
+        int: Код завершения (1, если результат расходится с ожидаемым)
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарк движка резолюций")
+    parser.add_argument('--output', default='bench_results.json',
+                        help="путь к JSON-файлу результатов")
+    parser.add_argument('--families', nargs='+', choices=['examples'] + list(FAMILIES),
+                        help="семейства задач (по умолчанию все)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="количество прогонов для измерения времени")
+    parser.add_argument('--max-steps', type=int, default=100,
+                        help="ограничение количества раундов движка")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="не измерять пиковую память (tracemalloc)")
+    parser.add_argument('--profile', metavar='ЗАДАЧА',
+                        help="профилировать одну задачу (cProfile и tracemalloc)")
+    parser.add_argument('--profile-dir', default='profiles',
+                        help="каталог для файлов профилей")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        return profile_problem(args.profile, args.profile_dir, args.max_steps)
+
+    report = run_benchmarks(default_problems(args.families), repeat=args.repeat,
+                            max_steps=args.max_steps, measure_memory=not args.no_memory)
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"Результаты записаны в {args.output}")
+
+    wrong = [metrics['name'] for metrics in report['problems'] if metrics['correct'] is False]
+    if wrong:
+        print(f"Неверный результат: {', '.join(wrong)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""
+Модуль наборов задач для бенчмарков движка резолюций.
+Содержит примеры из test_resolution.py и генераторы масштабируемых
+семейств задач: принцип Дирихле, транзитивные цепочки, башни хорновых
+правил, случайные 3-КНФ и задачи с вложенными сколемовскими функциями.
+"""
+
+import random
+from typing import Dict, List, NamedTuple, Optional
+
+
+class BenchmarkProblem(NamedTuple):
+    """
+    Задача бенчмарка.
+
+    Атрибуты:
+        name (str): Уникальное имя задачи, например "php-3"
+        family (str): Семейство задач
+        size (int): Параметр размера внутри семейства
+        clauses (List[str]): Дизъюнкты в записи движка
+        expected (Optional[bool]): Ожидаемый результат (None - неизвестен)
+    """
+    name: str
+    family: str
+    size: int
+    clauses: List[str]
+    expected: Optional[bool]
+
+
+# Примеры из test_resolution.py: имя -> (клаузы, ожидаемый результат)
+EXAMPLES: Dict[str, tuple] = {
+    'сократ': ([
+        "Человек(Сократ)",
+        "¬Человек(x) ∨ Смертен(x)",
+        "¬Смертен(Сократ)",
+    ], True),
+    'студент-экзамен': ([
+        "¬Студент(x) ∨ СдалЭкзамен(x, f(x))",
+        "Студент(Иван)",
+        "¬СдалЭкзамен(Иван, y)",
+    ], True),
+    'три-предиката': ([
+        "Студент(Иван)",
+        "¬Студент(x) ∨ УчитсяВУниверситете(x)",
+        "¬УчитсяВУниверситете(y) ∨ СдаетЭкзамены(y)",
+        "¬СдаетЭкзамены(Иван)",
+    ], True),
+    'транзитивность': ([
+        "Больше(A, B)",
+        "Больше(B, C)",
+        "¬Больше(x, y) ∨ ¬Больше(y, z) ∨ Больше(x, z)",
+        "¬Больше(A, C)",
+    ], True),
+    'умный-петя': ([
+        "Студент(Петя)",
+        "Изучает(Петя, Математика)",
+        "¬Изучает(y, Математика) ∨ Умный(y)",
+        "¬Умный(Петя)",
+    ], True),
+    'симметричность': ([
+        "Друг(Алиса, Боб)",
+        "¬Друг(x, y) ∨ Друг(y, x)",
+        "¬Друг(Боб, Алиса)",
+    ], True),
+    'переменные': ([
+        "R(a, b)",
+        "¬R(x, y) ∨ S(y, x)",
+        "¬S(b, a)",
+    ], True),
+    'пирог': ([
+        "БылДома(ребёнок)",
+        "БылДома(мама)",
+        "БылДома(папа)",
+        "¬БылДома(x) ∨ ¬ЛюбитСладкое(x) ∨ УкралПирог(x)",
+        "ЛюбитСладкое(ребёнок)",
+        "¬ЛюбитСладкое(папа)",
+        "¬УкралПирог(ребёнок)",
+    ], True),
+    'волк-коза-капуста': ([
+        "¬ФермерПрисутствует",
+        "НаОдномБерегу(волк, коза)",
+        "НаОдномБерегу(коза, капуста)",
+        "¬ФермерПрисутствует ∨ ¬НаОдномБерегу(волк, коза) ∨ ¬Съест(волк, коза)",
+        "¬ФермерПрисутствует ∨ ¬НаОдномБерегу(коза, капуста) ∨ ¬Съест(коза, капуста)",
+        "¬Съест(волк, коза) ∨ ¬Съест(коза, капуста)",
+    ], False),
+    'поклонник': ([
+        "Поклонник(Антон) ∨ Поклонник(Борис) ∨ Поклонник(Виктор)",
+        "¬Поклонник(x) ∨ ДаритЦветыКаждыйДень(x)",
+        "¬ДаритЦветыКаждыйДень(Антон)",
+        "¬Понедельник ∨ ДаритЦветы(Борис)",
+        "¬Понедельник",
+        "¬Поклонник(Виктор)",
+    ], False),
+    'остров-лжецов': ([
+        "Лжец(абориген) ∨ Правдивый(абориген)",
+        "¬Лжец(абориген) ∨ ¬Правдивый(абориген)",
+        "¬Лжец(абориген) ∨ ¬ГоворитПравду(абориген)",
+        "¬Правдивый(абориген) ∨ ГоворитПравду(абориген)",
+        "¬ГоворитПравду(абориген) ∨ Лжец(абориген)",
+        "ГоворитПравду(абориген) ∨ ¬Лжец(абориген)",
+        "Лжец(абориген)",
+        "Правдивый(абориген)",
+    ], True),
+    'все-виноваты': ([
+        "УбийствоСовершено",
+        "ВиноватОдин ∨ ВиноватыВсе",
+        "¬ВиноватОдин ∨ ЕстьМотивИВозможность(кто-то)",
+        "¬ЕстьМотивИВозможность(все_пассажиры_по_отдельности)",
+        "¬ВиноватыВсе",
+    ], True),
+    'вампиры': ([
+        "¬Вампир(x) ∨ БоитсяЧеснока(x)",
+        "Бессмертный(Дракула)",
+        "ЕстЧеснок(Дракула)",
+        "¬ЕстЧеснок(y) ∨ ¬БоитсяЧеснока(y)",
+        "Бессмертный(z) ∨ Вампир(z)",
+        "Вампир(Дракула)",
+    ], True),
+}
+
+
+def example_problems() -> List[BenchmarkProblem]:
+    """Возвращает примеры из test_resolution.py как задачи бенчмарка."""
+    return [BenchmarkProblem(f"пример-{name}", 'examples', len(clauses), clauses, expected)
+            for name, (clauses, expected) in EXAMPLES.items()]
+
+
+def pigeonhole(n: int) -> BenchmarkProblem:
+    """
+    Принцип Дирихле PHP(n): n+1 голубей нельзя рассадить в n лунок.
+
+    Атом P{i}_{j} означает "голубь i сидит в лунке j". Множество клауз
+    невыполнимо; задача экспоненциально трудна для резолюции.
+
+    Args:
+        n: Количество лунок
+
+    Returns:
+        BenchmarkProblem: Задача семейства 'pigeonhole'
+    """
+    clauses = []
+    for pigeon in range(1, n + 2):
+        clauses.append(' ∨ '.join(f"P{pigeon}_{hole}" for hole in range(1, n + 1)))
+    for hole in range(1, n + 1):
+        for first in range(1, n + 2):
+            for second in range(first + 1, n + 2):
+                clauses.append(f"¬P{first}_{hole} ∨ ¬P{second}_{hole}")
+    return BenchmarkProblem(f"php-{n}", 'pigeonhole', n, clauses, True)
+
+
+def transitive_chain(n: int) -> BenchmarkProblem:
+    """
+    Транзитивная цепочка длины n: A0 < A1 < ... < An, доказать A0 < An.
+
+    Args:
+        n: Количество звеньев цепочки
+
+    Returns:
+        BenchmarkProblem: Задача семейства 'chain'
+    """
+    clauses = [f"Меньше(A{i}, A{i + 1})" for i in range(n)]
+    clauses.append("¬Меньше(x, y) ∨ ¬Меньше(y, z) ∨ Меньше(x, z)")
+    clauses.append(f"¬Меньше(A0, A{n})")
+    return BenchmarkProblem(f"chain-{n}", 'chain', n, clauses, True)
+
+
+def horn_tower(n: int) -> BenchmarkProblem:
+    """
+    Башня хорновых правил высоты n: Q{i}(x) ∧ R{i}(x) → Q{i+1}(x).
+
+    Args:
+        n: Количество уровней правил
+
+    Returns:
+        BenchmarkProblem: Задача семейства 'horn'
+    """
+    clauses = ["Q0(C)"]
+    for level in range(n):
+        clauses.append(f"R{level}(C)")
+        clauses.append(f"¬Q{level}(x) ∨ ¬R{level}(x) ∨ Q{level + 1}(x)")
+    clauses.append(f"¬Q{n}(C)")
+    return BenchmarkProblem(f"horn-{n}", 'horn', n, clauses, True)
+
+
+def random_3cnf(n: int, ratio: float = 4.26, seed: int = 0) -> BenchmarkProblem:
+    """
+    Случайная 3-КНФ над n переменными вблизи порога выполнимости.
+
+    Генератор детерминирован при фиксированном seed, поэтому результаты
+    сравнимы между запусками и версиями.
+
+    Args:
+        n: Количество пропозициональных переменных
+        ratio: Отношение числа клауз к числу переменных
+        seed: Начальное значение генератора случайных чисел
+
+    Returns:
+        BenchmarkProblem: Задача семейства 'random3cnf' (ожидаемый результат неизвестен)
+    """
+    rng = random.Random(seed * 1000 + n)
+    clauses = []
+    for _ in range(round(n * ratio)):
+        variables = rng.sample(range(1, n + 1), 3)
+        clauses.append(' ∨ '.join(
+            f"{'¬' if rng.random() < 0.5 else ''}X{variable}" for variable in variables))
+    return BenchmarkProblem(f"random3cnf-{n}", 'random3cnf', n, clauses, None)
+
+
+def skolem_tower(n: int) -> BenchmarkProblem:
+    """
+    Задача с вложенными сколемовскими функциями глубины n.
+
+    У каждого элемента есть преемник F(x) и свидетель G(x, y);
+    требуется опровергнуть отсутствие элемента глубины n.
+
+    Args:
+        n: Глубина вложенности функций в цели
+
+    Returns:
+        BenchmarkProblem: Задача семейства 'skolem'
+    """
+    goal = 'A'
+    for _ in range(n):
+        goal = f"F({goal})"
+    clauses = [
+        "Элемент(A, B)",
+        "¬Элемент(x, y) ∨ Элемент(F(x), G(x, y))",
+        "¬Элемент(x, y) ∨ Связан(x, G(x, y))",
+        f"¬Элемент({goal}, z)",
+    ]
+    return BenchmarkProblem(f"skolem-{n}", 'skolem', n, clauses, True)
+
+
+# Семейства и размеры по умолчанию (подобраны так, чтобы полный прогон
+# занимал секунды: насыщение по уровням растет экспоненциально)
+FAMILIES = {
+    'pigeonhole': (pigeonhole, [1, 2]),
+    'chain': (transitive_chain, [1, 2, 3]),
+    'horn': (horn_tower, [2, 3, 4, 5]),
+    'random3cnf': (random_3cnf, [3, 4]),
+    'skolem': (skolem_tower, [4, 8, 16, 32]),
+}
+
+
+def default_problems(families: Optional[List[str]] = None) -> List[BenchmarkProblem]:
+    """
+    Возвращает набор задач бенчмарка по умолчанию.
+
+    Args:
+        families: Семейства для включения ('examples' и ключи FAMILIES);
+                  None - все семейства
+
+    Returns:
+        List[BenchmarkProblem]: Задачи в детерминированном порядке
+    """
+    problems = []
+    if families is None or 'examples' in families:
+        problems.extend(example_problems())
+    for family, (generator, sizes) in FAMILIES.items():
+        if families is None or family in families:
+            problems.extend(generator(size) for size in sizes)
+    return problems
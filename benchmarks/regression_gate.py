@@ -0,0 +1,207 @@
+"""
+Проверка регрессий производительности движка резолюций.
+Запускает набор бенчмарков (или читает готовый отчет), сравнивает его
+с сохраненным базовым отчетом и завершается с ненулевым кодом, если
+какая-либо задача стала медленнее порога с учетом разброса измерений или
+выросли детерминированные счетчики (порожденные резольвенты, унификации).
+
+Запуск:
+    python -m benchmarks.regression_gate
+    python -m benchmarks.regression_gate --update   # обновить базовый отчет
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from .bench_resolution import run_benchmarks
+from .problems import default_problems
+
+# Базовый отчет, хранящийся в репозитории
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Детерминированные счетчики, рост которых считается регрессией
+COUNTER_METRICS = ('generated_clauses', 'kept_clauses', 'unification_calls', 'rounds')
+
+# Множитель межквартильного размаха, в пределах которого разница времени - шум
+NOISE_IQR_FACTOR = 1.5
+
+
+def summarize_times(times: List[float]) -> Tuple[float, float]:
+    """
+    Вычисляет медиану и межквартильный размах времени прогонов.
+
+    Args:
+        times: Время отдельных прогонов в секундах
+
+    Returns:
+        Tuple[float, float]: Медиана и IQR (0 для одного прогона)
+    """
+    median = statistics.median(times)
+    if len(times) < 2:
+        return median, 0.0
+    quartiles = statistics.quantiles(times, n=4)
+    return median, quartiles[2] - quartiles[0]
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any],
+                    time_threshold: float = 0.5, counter_threshold: float = 0.0,
+                    min_time: float = 0.05) -> List[Dict[str, Any]]:
+    """
+    Сравнивает текущий отчет бенчмарка с базовым.
+
+    Замедление считается регрессией, если медиана выросла больше чем на
+    time_threshold, разница превышает шум (NOISE_IQR_FACTOR * наибольший
+    IQR двух отчетов), и задача выполняется дольше min_time. Счетчики
+    детерминированы, поэтому их рост сверх counter_threshold - регрессия
+    независимо от шума.
+
+    Args:
+        baseline: Базовый отчет bench_resolution
+        current: Текущий отчет bench_resolution
+        time_threshold: Допустимая доля замедления медианы
+        counter_threshold: Допустимая доля роста счетчиков
+        min_time: Время, ниже которого замедление не проверяется (секунды)
+
+    Returns:
+        List[Dict[str, Any]]: Строки сравнения для задач обоих отчетов
+    """
+    baseline_problems = {metrics['name']: metrics for metrics in baseline['problems']}
+    rows = []
+
+    for metrics in current['problems']:
+        name = metrics['name']
+        base = baseline_problems.get(name)
+        if base is None:
+            rows.append({'name': name, 'status': 'new', 'regressions': []})
+            continue
+
+        base_median, base_iqr = summarize_times(base['wall_times'])
+        median, iqr = summarize_times(metrics['wall_times'])
+        ratio = median / base_median if base_median > 0 else 1.0
+        noise = NOISE_IQR_FACTOR * max(base_iqr, iqr)
+
+        regressions = []
+        if (ratio > 1 + time_threshold and median - base_median > noise
+                and median >= min_time):
+            regressions.append(f"время x{ratio:.2f}")
+
+        counter_changes = {}
+        for counter in COUNTER_METRICS:
+            before, after = base.get(counter), metrics.get(counter)
+            if before is None or after is None or before == after:
+                continue
+            counter_changes[counter] = (before, after)
+            if after > before * (1 + counter_threshold):
+                regressions.append(f"{counter} {before} -> {after}")
+
+        if base.get('result') != metrics.get('result'):
+            regressions.append(f"результат {base.get('result')} -> {metrics.get('result')}")
+
+        if regressions:
+            status = 'regression'
+        elif ratio < 1 - time_threshold and base_median - median > noise:
+            status = 'faster'
+        else:
+            status = 'ok'
+
+        rows.append({
+            'name': name,
+            'status': status,
+            'baseline_median': base_median,
+            'median': median,
+            'ratio': ratio,
+            'noise': noise,
+            'counter_changes': counter_changes,
+            'regressions': regressions,
+        })
+
+    current_names = {metrics['name'] for metrics in current['problems']}
+    for name in baseline_problems:
+        if name not in current_names:
+            rows.append({'name': name, 'status': 'missing', 'regressions': []})
+    return rows
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    """Форматирует строки сравнения в таблицу ускорений и замедлений."""
+    lines = [f"{'Задача':<28} {'База, мс':>10} {'Сейчас, мс':>11} {'Изм.':>7}  Статус",
+             '-' * 78]
+    for row in rows:
+        if 'median' not in row:
+            lines.append(f"{row['name']:<28} {'-':>10} {'-':>11} {'-':>7}  {row['status']}")
+            continue
+        change = (row['ratio'] - 1) * 100
+        details = '; '.join(row['regressions']) or ', '.join(
+            f"{counter} {before} -> {after}"
+            for counter, (before, after) in row['counter_changes'].items())
+        lines.append(
+            f"{row['name']:<28} {row['baseline_median'] * 1000:10.1f} "
+            f"{row['median'] * 1000:11.1f} {change:+6.1f}%  {row['status']}"
+            + (f" ({details})" if details else ''))
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Точка входа командной строки.
+
+    Args:
+        argv: Аргументы командной строки (None - sys.argv)
+
+    Returns:
+        int: 0 - регрессий нет, 1 - найдены регрессии, 2 - нет базового отчета
+    """
+    parser = argparse.ArgumentParser(description="Проверка регрессий производительности")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help="путь к базовому отчету")
+    parser.add_argument('--current',
+                        help="готовый отчет для сравнения (по умолчанию бенчмарк запускается)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="количество прогонов для медианы и IQR")
+    parser.add_argument('--time-threshold', type=float, default=0.5,
+                        help="допустимая доля замедления медианы")
+    parser.add_argument('--counter-threshold', type=float, default=0.0,
+                        help="допустимая доля роста детерминированных счетчиков")
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help="время (с), ниже которого замедление не проверяется")
+    parser.add_argument('--update', action='store_true',
+                        help="записать текущий отчет как базовый")
+    args = parser.parse_args(argv)
+
+    if args.current:
+        with open(args.current, encoding='utf-8') as file:
+            current = json.load(file)
+    else:
+        current = run_benchmarks(default_problems(), repeat=args.repeat,
+                                 measure_memory=False, verbose=False)
+
+    if args.update:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(current, file, ensure_ascii=False, indent=2)
+        print(f"Базовый отчет обновлен: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Базовый отчет не найден: {args.baseline} (создайте его с --update)")
+        return 2
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)
+
+    rows = compare_reports(baseline, current, args.time_threshold,
+                           args.counter_threshold, args.min_time)
+    print(format_table(rows))
+
+    regressions = [row for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"\nРегрессии производительности: {len(regressions)}")
+        return 1
+    print("\nРегрессий не обнаружено")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
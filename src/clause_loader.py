@@ -0,0 +1,477 @@
+"""
+Модуль загрузки дизъюнктов из файлов стандартных форматов.
+Читает задачи в формате TPTP CNF (с поддержкой include) и DIMACS CNF
+построчно и лениво выдает клаузы в записи движка резолюций (¬, ∨),
+не загружая текст файла в память целиком.
+"""
+
+import os
+import re
+from typing import Iterator, List, Optional, Set, Tuple
+
+
+class ClauseFileError(ValueError):
+    """
+    Ошибка формата файла клауз.
+
+    Атрибуты:
+        path (str): Путь к файлу
+        line (int): Номер строки, на которой обнаружена ошибка (с единицы)
+    """
+
+    def __init__(self, message: str, path: str, line: int):
+        super().__init__(f"{message} ({path}, строка {line})")
+        self.path = path
+        self.line = line
+
+
+# Токены TPTP: пробелы и комментарии пропускаются, кавычки - целиком
+TPTP_TOKEN_PATTERN = re.compile(r"""
+      (?P<space>\s+|%.*)
+    | (?P<comment>/\*.*?\*/)
+    | (?P<quoted>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    | (?P<word>\$*\w+)
+    | (?P<symbol>!=|[(),.|~=\[\]])
+    | (?P<other>\S)
+""", re.VERBOSE)
+
+# Начало многострочного блочного комментария
+BLOCK_COMMENT_START = '/*'
+BLOCK_COMMENT_END = '*/'
+
+# Символы, недопустимые в именах движка (для имен в кавычках)
+NAME_SANITIZE_PATTERN = re.compile(r"[^\w]+")
+
+# Имя предиката равенства в записи движка
+EQUALITY_PREDICATE = 'equal'
+
+# Расширения файлов для определения формата
+TPTP_EXTENSIONS = ('.p', '.ax', '.tptp')
+DIMACS_EXTENSIONS = ('.cnf', '.dimacs')
+
+
+def load_clauses(path: str, file_format: Optional[str] = None) -> Iterator[str]:
+    """
+    Лениво читает клаузы из файла в формате TPTP или DIMACS.
+
+    Args:
+        path: Путь к файлу задачи
+        file_format: 'tptp' или 'dimacs' (None - по расширению файла)
+
+    Returns:
+        Iterator[str]: Клаузы в записи движка
+
+    Raises:
+        ValueError: Если формат не удалось определить
+
+    Пример:
+        >>> engine = ResolutionEngine()
+        >>> success, log = engine.prove(load_clauses("PUZ001-1.p"))
+    """
+    if file_format is None:
+        extension = os.path.splitext(path)[1].lower()
+        if extension in TPTP_EXTENSIONS:
+            file_format = 'tptp'
+        elif extension in DIMACS_EXTENSIONS:
+            file_format = 'dimacs'
+        else:
+            raise ValueError(f"Не удалось определить формат файла по расширению: {path}")
+
+    if file_format == 'tptp':
+        return iter_tptp_clauses(path)
+    if file_format == 'dimacs':
+        return iter_dimacs_clauses(path)
+    raise ValueError(f"Неизвестный формат файла клауз: {file_format}")
+
+
+def iter_dimacs_clauses(path: str) -> Iterator[str]:
+    """
+    Лениво читает пропозициональные клаузы из файла DIMACS CNF.
+
+    Переменная n записывается как атом арности 0 "P<n>", отрицательный
+    литерал -n - как "¬P<n>". Клауза может занимать несколько строк
+    и заканчивается нулем; строки комментариев "c" пропускаются.
+
+    Args:
+        path: Путь к файлу DIMACS
+
+    Returns:
+        Iterator[str]: Клаузы в записи движка
+
+    Raises:
+        ClauseFileError: При нарушении формата
+
+    Пример:
+        Строка "1 -3 0" дает клаузу "P1 ∨ ¬P3".
+    """
+    literals: List[str] = []
+    header_seen = False
+    line_number = 0
+
+    with open(path, encoding='utf-8') as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line or line[0] == 'c':
+                continue
+            if line[0] == '%':
+                # Маркер конца данных в файлах SATLIB
+                break
+            if line[0] == 'p':
+                fields = line.split()
+                if len(fields) != 4 or fields[1] != 'cnf':
+                    raise ClauseFileError("Некорректный заголовок DIMACS", path, line_number)
+                header_seen = True
+                continue
+            if not header_seen:
+                raise ClauseFileError("Клаузы до заголовка 'p cnf'", path, line_number)
+
+            for field in line.split():
+                try:
+                    literal = int(field)
+                except ValueError:
+                    raise ClauseFileError(f"Некорректный литерал '{field}'",
+                                          path, line_number) from None
+                if literal == 0:
+                    yield ' ∨ '.join(literals) if literals else '□'
+                    literals = []
+                elif literal > 0:
+                    literals.append(f"P{literal}")
+                else:
+                    literals.append(f"¬P{-literal}")
+
+    if literals:
+        raise ClauseFileError("Последняя клауза не завершена нулем", path, line_number)
+
+
+def iter_tptp_clauses(path: str, include_dirs: Optional[List[str]] = None) -> Iterator[str]:
+    """
+    Лениво читает клаузы из файла TPTP в формате cnf(...).
+
+    Директивы include обрабатываются рекурсивно: путь ищется относительно
+    каталога включающего файла, затем в include_dirs и в каталоге из
+    переменной окружения TPTP. Символы переводятся в соглашения движка:
+    переменные (с заглавной буквы) начинаются со строчной, константы
+    и функциональные символы - с заглавной, '~' и '|' заменяются на '¬'
+    и '∨', равенство - на предикат equal. Клаузы с $true пропускаются.
+
+    Args:
+        path: Путь к файлу TPTP
+        include_dirs: Дополнительные каталоги поиска включаемых файлов
+
+    Returns:
+        Iterator[str]: Клаузы в записи движка
+
+    Raises:
+        ClauseFileError: При нарушении формата или отсутствии включаемого файла
+
+    Пример:
+        Запись "cnf(c1, axiom, ~ man(X) | mortal(X))." дает
+        клаузу "¬man(x) ∨ mortal(x)".
+    """
+    search_dirs = list(include_dirs or [])
+    if os.environ.get('TPTP'):
+        search_dirs.append(os.environ['TPTP'])
+    yield from _iter_tptp_file(path, search_dirs, None, set())
+
+
+def _iter_tptp_file(path: str, search_dirs: List[str], selection: Optional[Set[str]],
+                    active_paths: Set[str]) -> Iterator[str]:
+    """
+    Читает один файл TPTP, рекурсивно обрабатывая include.
+
+    Args:
+        path: Путь к файлу
+        search_dirs: Каталоги поиска включаемых файлов
+        selection: Имена клауз, выбранные в include (None - все)
+        active_paths: Файлы в текущей цепочке включений (защита от циклов)
+
+    Returns:
+        Iterator[str]: Клаузы в записи движка
+    """
+    real_path = os.path.realpath(path)
+    if real_path in active_paths:
+        raise ClauseFileError("Циклическое включение файла", path, 0)
+    active_paths.add(real_path)
+
+    try:
+        for tokens, line_number in _iter_tptp_statements(path):
+            kind = tokens[0][1]
+            parser = _TPTPStatementParser(tokens, path, line_number)
+
+            if kind == 'include':
+                include_path, names = parser.parse_include()
+                resolved = _resolve_include(include_path, os.path.dirname(path), search_dirs)
+                if resolved is None:
+                    raise ClauseFileError(f"Включаемый файл не найден: {include_path}",
+                                          path, line_number)
+                yield from _iter_tptp_file(resolved, search_dirs, names, active_paths)
+            elif kind == 'cnf':
+                name, clause = parser.parse_cnf()
+                if clause is not None and (selection is None or name in selection):
+                    yield clause
+            else:
+                raise ClauseFileError(
+                    f"Поддерживаются только формулы cnf и include, найдено '{kind}'",
+                    path, line_number)
+    finally:
+        active_paths.discard(real_path)
+
+
+def _resolve_include(include_path: str, base_dir: str, search_dirs: List[str]) -> Optional[str]:
+    """Находит включаемый файл относительно включающего файла и каталогов поиска."""
+    for directory in [base_dir] + search_dirs:
+        candidate = os.path.join(directory, include_path)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _iter_tptp_statements(path: str) -> Iterator[Tuple[List[Tuple[str, str]], int]]:
+    """
+    Построчно собирает токены TPTP в утверждения, завершенные точкой.
+
+    Args:
+        path: Путь к файлу
+
+    Returns:
+        Iterator: Пары (токены утверждения, номер строки начала утверждения);
+            токен - пара (вид, значение)
+    """
+    statement: List[Tuple[str, str]] = []
+    start_line = 0
+    depth = 0
+    in_comment = False
+    line_number = 0
+
+    with open(path, encoding='utf-8') as file:
+        for line_number, line in enumerate(file, 1):
+            if in_comment:
+                end = line.find(BLOCK_COMMENT_END)
+                if end < 0:
+                    continue
+                line = line[end + len(BLOCK_COMMENT_END):]
+                in_comment = False
+
+            for match in TPTP_TOKEN_PATTERN.finditer(line):
+                kind = match.lastgroup
+                value = match.group()
+                if kind in ('space', 'comment'):
+                    continue
+                if kind == 'other':
+                    if line.startswith(BLOCK_COMMENT_START, match.start()):
+                        # Блочный комментарий продолжается на следующих строках
+                        in_comment = True
+                        break
+                    raise ClauseFileError(f"Недопустимый символ '{value}'", path, line_number)
+
+                if not statement:
+                    start_line = line_number
+                if value == '.' and depth == 0:
+                    yield statement, start_line
+                    statement = []
+                    continue
+
+                if value in ('(', '['):
+                    depth += 1
+                elif value in (')', ']'):
+                    depth -= 1
+                statement.append((kind, value))
+
+    if statement:
+        raise ClauseFileError("Утверждение не завершено точкой", path, start_line)
+
+
+class _TPTPStatementParser:
+    """
+    Разбор одного утверждения TPTP (include или cnf) в запись движка.
+
+    Грамматика cnf:
+        cnf      := 'cnf' '(' имя ',' роль ',' дизъюнкт [',' аннотации] ')'
+        дизъюнкт := литерал ('|' литерал)*
+        литерал  := '(' дизъюнкт ')' | '~' литерал | атом
+                    | терм '=' терм | терм '!=' терм
+    """
+
+    def __init__(self, tokens: List[Tuple[str, str]], path: str, line: int):
+        self.tokens = tokens
+        self.tokens.append(('end', ''))
+        self.index = 1
+        self.path = path
+        self.line = line
+
+    def parse_include(self) -> Tuple[str, Optional[Set[str]]]:
+        """
+        Разбирает include('файл'[, [имена]]).
+
+        Returns:
+            Tuple[str, Optional[Set[str]]]: Путь и выбранные имена клауз
+        """
+        self._expect('(')
+        kind, value = self._advance()
+        if kind != 'quoted':
+            self._error("Ожидался путь в кавычках")
+        include_path = value[1:-1]
+
+        names = None
+        if self._peek() == ',':
+            self._advance()
+            self._expect('[')
+            names = set()
+            while self._peek() != ']':
+                names.add(self._parse_name())
+                if self._peek() == ',':
+                    self._advance()
+            self._expect(']')
+        self._expect(')')
+        self._expect_end()
+        return include_path, names
+
+    def parse_cnf(self) -> Tuple[str, Optional[str]]:
+        """
+        Разбирает cnf(имя, роль, формула[, аннотации]).
+
+        Returns:
+            Tuple[str, Optional[str]]: Имя клаузы и ее запись в синтаксисе
+                движка (None для тавтологии с $true)
+        """
+        self._expect('(')
+        name = self._parse_name()
+        self._expect(',')
+        self._parse_name()
+        self._expect(',')
+        literals = self._parse_disjunction()
+
+        # Аннотации (источник, полезная информация) пропускаются
+        if self._peek() == ',':
+            depth = 0
+            while not (depth == 0 and self._peek() == ')'):
+                kind, value = self._advance()
+                if kind == 'end':
+                    self._error("Незакрытые аннотации")
+                if value in ('(', '['):
+                    depth += 1
+                elif value in (')', ']'):
+                    depth -= 1
+        self._expect(')')
+        self._expect_end()
+
+        if '$true' in literals:
+            return name, None
+        literals = [literal for literal in literals if literal != '$false']
+        return name, ' ∨ '.join(literals) if literals else '□'
+
+    def _parse_disjunction(self) -> List[str]:
+        """
+        Разбирает дизъюнкцию литералов, в том числе в скобках.
+
+        Returns:
+            List[str]: Литералы в записи движка ('$true'/'$false' для констант)
+        """
+        literals = self._parse_literal()
+        while self._peek() == '|':
+            self._advance()
+            literals.extend(self._parse_literal())
+        return literals
+
+    def _parse_literal(self) -> List[str]:
+        """Разбирает литерал (или дизъюнкцию в скобках) в записи движка."""
+        if self._peek() == '(':
+            self._advance()
+            literals = self._parse_disjunction()
+            self._expect(')')
+            return literals
+
+        if self._peek() == '~':
+            self._advance()
+            negated = self._parse_literal()
+            if len(negated) != 1:
+                self._error("Отрицание дизъюнкции не является клаузой CNF")
+            atom = negated[0]
+            if atom in ('$true', '$false'):
+                return ['$false' if atom == '$true' else '$true']
+            return [atom[1:] if atom.startswith('¬') else f"¬{atom}"]
+
+        if self._peek() in ('$true', '$false'):
+            return [self._advance()[1]]
+
+        # Атом или левая часть равенства
+        start = self.index
+        atom = self._parse_term(predicate=True)
+        if self._peek() not in ('=', '!='):
+            return [atom]
+
+        # Левая часть разбиралась как атом: повторно разбирается как терм
+        self.index = start
+        left = self._parse_term()
+        _, operator = self._advance()
+        right = self._parse_term()
+        atom = f"{EQUALITY_PREDICATE}({left}, {right})"
+        return [f"¬{atom}" if operator == '!=' else atom]
+
+    def _parse_term(self, predicate: bool = False) -> str:
+        """
+        Разбирает терм (или атом при predicate=True) в запись движка.
+
+        Args:
+            predicate: Разбирается предикатный символ (имя сохраняется)
+
+        Returns:
+            str: Запись терма, например "F(x, A)"
+        """
+        kind, value = self._advance()
+        if kind == 'quoted':
+            value = NAME_SANITIZE_PATTERN.sub('_', value[1:-1]).strip('_') or 'q'
+        elif kind != 'word' or value.startswith('$'):
+            self._error(f"Ожидался терм, найдено '{value or 'конец утверждения'}'")
+
+        if self._peek() == '(':
+            self._advance()
+            args = [self._parse_term()]
+            while self._peek() == ',':
+                self._advance()
+                args.append(self._parse_term())
+            self._expect(')')
+            name = value if predicate else _functor_name(value)
+            return f"{name}({', '.join(args)})"
+
+        if predicate:
+            return value
+        if kind == 'word' and value[0].isupper():
+            # Переменная TPTP: в движке переменные начинаются со строчной буквы
+            return value[0].lower() + value[1:]
+        return _functor_name(value)
+
+    def _parse_name(self) -> str:
+        """Разбирает имя (слово, число или строку в кавычках)."""
+        kind, value = self._advance()
+        if kind not in ('word', 'quoted'):
+            self._error(f"Ожидалось имя, найдено '{value}'")
+        return value
+
+    def _peek(self) -> str:
+        return self.tokens[self.index][1]
+
+    def _advance(self) -> Tuple[str, str]:
+        token = self.tokens[self.index]
+        if token[0] != 'end':
+            self.index += 1
+        return token
+
+    def _expect(self, value: str):
+        kind, found = self._advance()
+        if found != value:
+            self._error(f"Ожидалось '{value}', найдено '{found or 'конец утверждения'}'")
+
+    def _expect_end(self):
+        if self.tokens[self.index][0] != 'end':
+            self._error(f"Лишний токен '{self._peek()}'")
+
+    def _error(self, message: str):
+        raise ClauseFileError(message, self.path, self.line)
+
+
+def _functor_name(name: str) -> str:
+    """Константы и функциональные символы в движке начинаются с заглавной буквы."""
+    if name[0].isdigit():
+        return f"N{name}"
+    return name[0].upper() + name[1:]
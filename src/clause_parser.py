@@ -0,0 +1,460 @@
+"""
+Модуль разбора дизъюнктов логики предикатов первого порядка.
+Реализует однопроходный токенизатор и парсер рекурсивного спуска, которые
+строят структурированные термы и сообщают о синтаксических ошибках
+с указанием позиции. Результаты разбора кэшируются (LRU) по строке клаузы.
+Сканер ClauseScanner по той же грамматике извлекает списки дизъюнктов
+из произвольного текста (ответа языковой модели).
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional, Tuple, Union
+
+
+class ClauseSyntaxError(ValueError):
+    """
+    Синтаксическая ошибка в записи клаузы.
+
+    Атрибуты:
+        message (str): Описание ошибки без позиции и строки
+        position (int): Позиция ошибки в строке (с нуля)
+        text (str): Разбираемая строка
+    """
+
+    def __init__(self, message: str, position: int, text: str):
+        super().__init__(f"{message} (позиция {position + 1}): {text}")
+        self.message = message
+        self.position = position
+        self.text = text
+
+
+class Term(NamedTuple):
+    """
+    Структурированный терм: символ и кортеж аргументов.
+
+    Переменные и константы - термы без аргументов, функциональные термы
+    содержат вложенные термы.
+    """
+    name: str
+    args: Tuple['Term', ...] = ()
+
+    def __str__(self) -> str:
+        if not self.args:
+            return self.name
+        return f"{self.name}({', '.join(str(arg) for arg in self.args)})"
+
+
+class Literal(NamedTuple):
+    """Литерал клаузы: предикат, аргументы-термы и признак отрицания."""
+    predicate: str
+    args: Tuple[Term, ...]
+    negated: bool
+
+
+class ParsedClause(NamedTuple):
+    """
+    Разобранный дизъюнкт: каноническая запись и литералы.
+
+    Передается движку резолюций вместо строки, чтобы тот же текст
+    не разбирался повторно; str() возвращает каноническую запись.
+    """
+    text: str
+    literals: Tuple[Literal, ...]
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class ClauseDiagnostic(NamedTuple):
+    """Фрагмент текста, не распознанный сканером как дизъюнкт."""
+    line: int  # Номер просмотренной строки (с 1)
+    position: int  # Позиция ошибки в строке (с нуля)
+    fragment: str  # Текст фрагмента
+    message: str  # Описание ошибки
+
+
+# Символы токенов записи клаузы
+NOT_SYMBOL = '¬'
+OR_SYMBOL = '∨'
+EMPTY_CLAUSE_SYMBOL = '□'
+
+# Шаблон токена после необязательных пробелов: имя (допускает дефис и штрих
+# внутри: "кто-то", "x'"), служебный символ или недопустимый символ
+TOKEN_PATTERN = re.compile(r"\s*(?:(\w[\w'\-]*)|([¬∨(),□])|(\S))")
+
+# Виды токенов для служебных символов
+SYMBOL_KINDS = {
+    NOT_SYMBOL: 'not',
+    OR_SYMBOL: 'or',
+    '(': 'lparen',
+    ')': 'rparen',
+    ',': 'comma',
+    EMPTY_CLAUSE_SYMBOL: 'empty',
+}
+
+# Шаблон быстрого прохода: только значения токенов без позиций
+SCAN_PATTERN = re.compile(r"\s*(\w[\w'\-]*|[¬∨(),□]|\S)")
+
+# Токен - кортеж (вид, значение, позиция в строке)
+Token = Tuple[str, str, int]
+
+
+def tokenize(text: str, strict: bool = True) -> List[Token]:
+    """
+    Разбивает строку клаузы на токены за один проход регулярного выражения.
+
+    Args:
+        text: Строка клаузы, например "¬P(x) ∨ Q(f(a), y)"
+        strict: Сообщать о недопустимых символах (False - такие символы
+            становятся токенами вида 'invalid')
+
+    Returns:
+        List[Token]: Токены (вид, значение, позиция) без пробелов;
+            последний токен имеет вид 'end'
+
+    Raises:
+        ClauseSyntaxError: При недопустимом символе (только при strict=True)
+    """
+    tokens = []
+    append = tokens.append
+
+    for match in TOKEN_PATTERN.finditer(text):
+        name, symbol, invalid = match.groups()
+        if name is not None:
+            append(('name', name, match.start(1)))
+        elif symbol is not None:
+            append((SYMBOL_KINDS[symbol], symbol, match.start(2)))
+        elif strict:
+            raise ClauseSyntaxError(f"Недопустимый символ '{invalid}'", match.start(3), text)
+        else:
+            append(('invalid', invalid, match.start(3)))
+
+    append(('end', '', len(text)))
+    return tokens
+
+
+def _build_term(name: str, args: Tuple) -> Term:
+    """Строит структурированный терм."""
+    return Term(name, args)
+
+
+def _render_term(name: str, args: Tuple[str, ...]) -> str:
+    """Строит строковую запись терма в формате движка: "f(x, A)"."""
+    return f"{name}({', '.join(args)})" if args else name
+
+
+class ClauseParser:
+    """
+    Парсер рекурсивного спуска для записи дизъюнкта.
+
+    Грамматика:
+        клауза  := '□' | литерал ('∨' литерал)*
+        литерал := '¬'* атом
+        атом    := ИМЯ [ '(' терм (',' терм)* ')' ]
+        терм    := ИМЯ [ '(' терм (',' терм)* ')' ]
+
+    Атомы без скобок - пропозициональные переменные (предикаты арности 0).
+
+    Разбор идет по значениям токенов, полученным одним вызовом findall;
+    позиции вычисляются токенизатором только при синтаксической ошибке.
+    Готовые токены (фрагмент строки, см. ClauseScanner) разбираются
+    без повторной токенизации.
+    """
+
+    def __init__(self, text: str, make_term: Callable = _build_term,
+                 tokens: Optional[List[Token]] = None):
+        """
+        Инициализация парсера для строки.
+
+        Args:
+            text: Строка клаузы
+            make_term: Фабрика термов make_term(имя, аргументы); по умолчанию
+                строит Term, _render_term строит строковые записи
+            tokens: Токены фрагмента text, завершенные токеном 'end'
+                (None - токенизировать всю строку)
+        """
+        self.text = text
+        self.tokens = tokens
+        if tokens is None:
+            self.values = SCAN_PATTERN.findall(text)
+            self.values.append('')
+        else:
+            self.values = [value for _, value, _ in tokens]
+        self.index = 0
+        self.make_term = make_term
+
+    def parse_clause(self) -> Tuple[Literal, ...]:
+        """
+        Разбирает всю строку как дизъюнкт.
+
+        Returns:
+            Tuple[Literal, ...]: Литералы клаузы (пустой кортеж для '□')
+
+        Raises:
+            ClauseSyntaxError: При нарушении грамматики
+        """
+        values = self.values
+        if values[0] == EMPTY_CLAUSE_SYMBOL:
+            self.index = 1
+            self._expect('')
+            return ()
+
+        literals = [self.parse_literal()]
+        while values[self.index] == OR_SYMBOL:
+            self.index += 1
+            literals.append(self.parse_literal())
+
+        self._expect('')
+        return tuple(literals)
+
+    def parse_literal(self) -> Literal:
+        """Разбирает литерал с необязательными отрицаниями."""
+        values = self.values
+        negated = False
+        while values[self.index] == NOT_SYMBOL:
+            self.index += 1
+            negated = not negated
+
+        predicate = self._expect_name()
+        return Literal(predicate, self._parse_arguments(), negated)
+
+    def parse_term(self):
+        """Разбирает терм: переменную, константу или функциональный терм."""
+        name = self._expect_name()
+        return self.make_term(name, self._parse_arguments())
+
+    def _parse_arguments(self) -> Tuple:
+        """Разбирает необязательный список аргументов в скобках."""
+        values = self.values
+        if values[self.index] != '(':
+            return ()
+
+        self.index += 1
+        args = [self.parse_term()]
+        while values[self.index] == ',':
+            self.index += 1
+            args.append(self.parse_term())
+        self._expect(')')
+        return tuple(args)
+
+    def _expect_name(self) -> str:
+        """Проверяет, что текущий токен - имя, и переходит к следующему."""
+        value = self.values[self.index]
+        first = value[:1]
+        if not (first.isalnum() or first == '_'):
+            self._error('name')
+        self.index += 1
+        return value
+
+    def _expect(self, value: str):
+        """Проверяет значение текущего токена и переходит к следующему."""
+        if self.values[self.index] != value:
+            self._error(SYMBOL_KINDS.get(value, 'end'))
+        self.index += 1
+
+    def _error(self, kind: str):
+        """
+        Сообщает о синтаксической ошибке в текущем токене.
+
+        Позиция вычисляется повторным проходом токенизатора, который также
+        сообщает о недопустимых символах (если токены не переданы готовыми).
+
+        Raises:
+            ClauseSyntaxError: Всегда
+        """
+        tokens = self.tokens if self.tokens is not None else tokenize(self.text)
+        _, value, position = tokens[self.index]
+        found = f"'{value}'" if value else "конец строки"
+        raise ClauseSyntaxError(
+            f"Ожидалось {TOKEN_DESCRIPTIONS[kind]}, найдено {found}", position, self.text)
+
+
+# Описания видов токенов для сообщений об ошибках
+TOKEN_DESCRIPTIONS = {
+    'name': 'имя предиката или терма',
+    'lparen': "'('",
+    'rparen': "')'",
+    'comma': "','",
+    'not': f"'{NOT_SYMBOL}'",
+    'or': f"'{OR_SYMBOL}'",
+    'empty': f"'{EMPTY_CLAUSE_SYMBOL}'",
+    'end': 'конец клаузы',
+}
+
+
+@lru_cache(maxsize=16384)
+def parse_clause(text: str) -> Tuple[Literal, ...]:
+    """
+    Разбирает строку клаузы в структурированные литералы (с кэшированием).
+
+    Args:
+        text: Строка клаузы
+
+    Returns:
+        Tuple[Literal, ...]: Литералы клаузы
+
+    Raises:
+        ClauseSyntaxError: При синтаксической ошибке
+
+    Пример:
+        >>> parse_clause("¬P(x) ∨ Q(f(a))")
+        (Literal(predicate='P', args=(Term(name='x', args=()),), negated=True),
+         Literal(predicate='Q', args=(Term(name='f', args=(Term(name='a', args=()),)),), negated=False))
+    """
+    return ClauseParser(text).parse_clause()
+
+
+@lru_cache(maxsize=16384)
+def parse_clause_strings(text: str) -> Tuple[Tuple[str, Tuple[str, ...], bool], ...]:
+    """
+    Разбирает строку клаузы в литералы с аргументами в виде строк термов.
+
+    Формат соответствует внутреннему представлению движка резолюций.
+
+    Args:
+        text: Строка клаузы
+
+    Returns:
+        Tuple: Кортежи (предикат, аргументы, отрицание)
+
+    Пример:
+        >>> parse_clause_strings("P(x) ∨ ¬Q(a, f(b,c))")
+        (('P', ('x',), False), ('Q', ('a', 'f(b, c)'), True))
+    """
+    return ClauseParser(text, _render_term).parse_clause()
+
+
+def render_clause(literals: Tuple[Literal, ...]) -> str:
+    """Записывает дизъюнкт в формате движка: "¬P(x) ∨ Q(x)" или "□"."""
+    if not literals:
+        return EMPTY_CLAUSE_SYMBOL
+    return f" {OR_SYMBOL} ".join(
+        (NOT_SYMBOL if literal.negated else '') + str(Term(literal.predicate, literal.args))
+        for literal in literals)
+
+
+def clause_literals(clause: Union[str, ParsedClause]) -> Tuple[Literal, ...]:
+    """
+    Возвращает литералы дизъюнкта, разбирая строку только при необходимости.
+
+    Raises:
+        ClauseSyntaxError: При синтаксической ошибке в строке
+    """
+    if isinstance(clause, ParsedClause):
+        return clause.literals
+    return parse_clause(clause)
+
+
+# Маркеры элементов списка в начале строки: "1." / "1)" и "-" / "•" / "*"
+LIST_NUMBER_DELIMITERS = ('.', ')')
+LIST_BULLETS = ('-', '•', '*')
+
+# Разделители дизъюнктов в строке (вне скобок)
+CLAUSE_SEPARATORS = (',', ';')
+
+# Токены, по которым строка распознается как запись дизъюнктов
+CLAUSE_TOKEN_KINDS = {'lparen', 'not', 'or', 'empty'}
+
+
+class ClauseScanner:
+    """
+    Однопроходный сканер списков дизъюнктов в произвольном тексте.
+
+    Каждая строка токенизируется один раз (недопустимые символы становятся
+    токенами 'invalid'), делится на фрагменты запятыми и точками с запятой
+    вне скобок, и каждый фрагмент разбирается ClauseParser - той же
+    грамматикой, что и в движке резолюций. Номер или маркер элемента
+    списка в начале строки, пометка вида "Дизъюнкты:" и точка в конце
+    пропускаются.
+
+    Строки без скобок, отрицаний, дизъюнкций и "□" считаются текстом
+    и не разбираются. Нераспознанные фрагменты остальных строк, а также
+    атомы из одного имени, записываются в diagnostics.
+
+    Атрибуты:
+        diagnostics (List[ClauseDiagnostic]): Нераспознанные фрагменты
+        lines (int): Число просмотренных строк
+    """
+
+    def __init__(self):
+        """Инициализация сканера без диагностик."""
+        self.diagnostics: List[ClauseDiagnostic] = []
+        self.lines = 0
+
+    def scan_line(self, line: str) -> List[ParsedClause]:
+        """
+        Извлекает дизъюнкты из одной строки.
+
+        Args:
+            line: Строка текста
+
+        Returns:
+            List[ParsedClause]: Распознанные дизъюнкты в порядке записи
+
+        Пример:
+            >>> ClauseScanner().scan_line("1. Человек(Сократ), ¬Человек(x) ∨ Смертен(x).")
+            [ParsedClause(text='Человек(Сократ)', ...), ParsedClause(text='¬Человек(x) ∨ Смертен(x)', ...)]
+        """
+        self.lines += 1
+        tokens = tokenize(line, strict=False)
+        if not any(kind in CLAUSE_TOKEN_KINDS for kind, _, _ in tokens):
+            return []
+
+        clauses = []
+        for fragment in self._fragments(tokens):
+            end = fragment[-1][2] + len(fragment[-1][1])
+            parser = ClauseParser(line, tokens=fragment + [('end', '', end)])
+            try:
+                literals = parser.parse_clause()
+            except ClauseSyntaxError as error:
+                self._report(line, fragment, error.position, error.message)
+                continue
+
+            if len(fragment) == 1 and fragment[0][0] == 'name':
+                # Одно слово в строке с дизъюнктами - скорее текст, чем пропозиция
+                self._report(line, fragment, fragment[0][2], "Атом без аргументов вне дизъюнкции")
+                continue
+            clauses.append(ParsedClause(render_clause(literals), literals))
+        return clauses
+
+    def _fragments(self, tokens: List[Token]) -> List[List[Token]]:
+        """Делит токены строки (без маркера списка, пометки и точки) на фрагменты."""
+        start, stop = 0, len(tokens) - 1  # последний токен - 'end'
+
+        # Шаг 1: Номер или маркер элемента списка
+        if tokens[0][0] == 'name' and tokens[0][1].isdigit() and tokens[1][1] in LIST_NUMBER_DELIMITERS:
+            start = 2
+        elif tokens[0][0] == 'invalid' and tokens[0][1] in LIST_BULLETS:
+            start = 1
+
+        # Шаг 2: Пометка "...:" и завершающая точка
+        depth = 0
+        for index in range(start, stop):
+            kind, value, _ = tokens[index]
+            depth += (kind == 'lparen') - (kind == 'rparen')
+            if depth == 0 and value == ':':
+                start = index + 1
+        if stop > start and tokens[stop - 1][1] == '.':
+            stop -= 1
+
+        # Шаг 3: Разделение запятыми и точками с запятой вне скобок
+        fragments, current, depth = [], [], 0
+        for token in tokens[start:stop]:
+            kind, value, _ = token
+            if depth == 0 and value in CLAUSE_SEPARATORS:
+                if current:
+                    fragments.append(current)
+                current = []
+                continue
+            depth += (kind == 'lparen') - (kind == 'rparen')
+            current.append(token)
+        if current:
+            fragments.append(current)
+        return fragments
+
+    def _report(self, line: str, fragment: List[Token], position: int, message: str):
+        """Записывает диагностику нераспознанного фрагмента."""
+        begin = fragment[0][2]
+        end = fragment[-1][2] + len(fragment[-1][1])
+        self.diagnostics.append(ClauseDiagnostic(self.lines, position, line[begin:end], message))
@@ -0,0 +1,303 @@
+"""
+Модуль хранилища клауз движка резолюций.
+Хранит клаузы в компактном виде (массивы целочисленных ID символов) и ведет
+приблизительный учет занимаемой памяти для стратегии ограниченных ресурсов
+(limited resource strategy).
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class SymbolTable:
+    """
+    Таблица интернированных символов.
+
+    Сопоставляет именам предикатов и термов целочисленные ID и обратно,
+    чтобы клаузы хранили только ID, а строки - один раз на символ.
+
+    Атрибуты:
+        memory_usage (int): Оценка памяти, занимаемой именами символов
+    """
+
+    __slots__ = ('_ids', '_names', '_weights', 'memory_usage')
+
+    def __init__(self):
+        """Инициализация пустой таблицы символов."""
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._weights: List[int] = []
+        self.memory_usage = 0
+
+    def intern(self, name: str) -> int:
+        """
+        Возвращает ID символа, добавляя его в таблицу при первом обращении.
+
+        Args:
+            name: Имя предиката или запись терма, например "f(x, A)"
+
+        Returns:
+            int: ID символа
+        """
+        symbol_id = self._ids.get(name)
+        if symbol_id is None:
+            symbol_id = len(self._names)
+            self._ids[name] = symbol_id
+            self._names.append(name)
+            # Вес терма: количество входящих в него символов
+            self._weights.append(name.count('(') + name.count(',') + 1)
+            self.memory_usage += sys.getsizeof(name) + 2 * sys.getsizeof(symbol_id)
+        return symbol_id
+
+    def name(self, symbol_id: int) -> str:
+        """Возвращает имя символа по ID."""
+        return self._names[symbol_id]
+
+    def weight(self, symbol_id: int) -> int:
+        """Возвращает вес терма (количество символов) по ID."""
+        return self._weights[symbol_id]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+class Clause:
+    """
+    Компактная запись клаузы в хранилище.
+
+    Литералы хранятся в одном массиве array('i') подряд в формате
+    [заголовок, арность, ID терма 1, ..., ID терма N], где заголовок равен
+    ID предиката + 1 со знаком минус для отрицательного литерала. Поэтому
+    комплементарные литералы имеют противоположные заголовки.
+
+    Атрибуты:
+        literals (array): Закодированные литералы клаузы
+        source (str): Описание источника клаузы
+        parents (array): ID родительских клауз
+    """
+
+    __slots__ = ('literals', 'source', 'parents')
+
+    def __init__(self, literals: array, source: str, parents: Iterable[int] = ()):
+        self.literals = literals
+        self.source = sys.intern(source)
+        self.parents = array('i', parents)
+
+    def headers(self) -> Iterator[int]:
+        """Перебирает заголовки литералов клаузы."""
+        literals = self.literals
+        position = 0
+        while position < len(literals):
+            yield literals[position]
+            position += 2 + literals[position + 1]
+
+    def __len__(self) -> int:
+        """Возвращает количество литералов клаузы."""
+        return sum(1 for _ in self.headers())
+
+
+class ClauseStore:
+    """
+    Реестр клауз с компактным представлением и учетом памяти.
+
+    Поддерживает интерфейс словаря "ID -> Clause", кодирует и декодирует
+    литералы через общую таблицу символов и подсчитывает приблизительный
+    объем памяти записей. Если задан лимит памяти, движок использует
+    is_near_limit и select_evictions для вытеснения тяжелых необработанных
+    клауз.
+
+    Атрибуты:
+        symbols (SymbolTable): Таблица символов предикатов и термов
+        memory_limit (Optional[int]): Лимит памяти в байтах (None - без лимита)
+        memory_usage (int): Текущая оценка занимаемой памяти в байтах
+        evicted_count (int): Общее количество вытесненных клауз
+    """
+
+    # Доля лимита, при достижении которой начинается вытеснение
+    HIGH_WATERMARK = 0.9
+    # Доля лимита, до которой освобождается память при вытеснении
+    LOW_WATERMARK = 0.75
+    # Оценка накладных расходов на ячейку словаря реестра и ключ-ID
+    ENTRY_OVERHEAD = 64
+
+    def __init__(self, memory_limit: Optional[int] = None):
+        """
+        Инициализация пустого хранилища.
+
+        Args:
+            memory_limit: Лимит памяти в байтах (None - без ограничения)
+        """
+        self.symbols = SymbolTable()
+        self.memory_limit = memory_limit
+        self.evicted_count = 0
+        self._clauses_usage = 0
+        self._entries: Dict[int, Clause] = {}
+
+    @property
+    def memory_usage(self) -> int:
+        """Оценка памяти записей клауз и таблицы символов в байтах."""
+        return self._clauses_usage + self.symbols.memory_usage
+
+    def encode(self, clause: List[Tuple[str, List[str], bool]]) -> array:
+        """
+        Кодирует клаузу из списка литералов в массив ID символов.
+
+        Args:
+            clause: Клауза как список (предикат, аргументы, отрицание)
+
+        Returns:
+            array: Закодированные литералы
+
+        Пример:
+            >>> store.encode([('P', ['x'], False), ('Q', ['a'], True)])
+            array('i', [1, 1, 1, -3, 1, 3])
+        """
+        intern = self.symbols.intern
+        encoded = array('i')
+        for predicate, args, negated in clause:
+            header = intern(predicate) + 1
+            encoded.append(-header if negated else header)
+            encoded.append(len(args))
+            encoded.extend(intern(arg) for arg in args)
+        return encoded
+
+    def decode(self, literals: array) -> List[Tuple[str, List[str], bool]]:
+        """
+        Декодирует массив литералов обратно в список кортежей.
+
+        Args:
+            literals: Закодированные литералы
+
+        Returns:
+            List[Tuple[str, List[str], bool]]: Клауза в виде списка литералов
+        """
+        name = self.symbols.name
+        clause = []
+        position = 0
+        while position < len(literals):
+            header = literals[position]
+            arity = literals[position + 1]
+            args = [name(term_id) for term_id in literals[position + 2:position + 2 + arity]]
+            clause.append((name(abs(header) - 1), args, header < 0))
+            position += 2 + arity
+        return clause
+
+    def literals(self, clause_id: int) -> List[Tuple[str, List[str], bool]]:
+        """Возвращает декодированные литералы клаузы по ID."""
+        return self.decode(self._entries[clause_id].literals)
+
+    def add(self, clause_id: int, clause: Clause):
+        """
+        Добавляет запись клаузы и учитывает ее размер.
+
+        Args:
+            clause_id: ID клаузы
+            clause: Компактная запись клаузы
+        """
+        if clause_id in self._entries:
+            self.remove(clause_id)
+        self._entries[clause_id] = clause
+        self._clauses_usage += self._record_size(clause)
+
+    def remove(self, clause_id: int):
+        """Удаляет запись клаузы и освобождает учтенную память."""
+        self._clauses_usage -= self._record_size(self._entries.pop(clause_id))
+
+    def _record_size(self, clause: Clause) -> int:
+        """
+        Оценивает объем памяти записи клаузы вместе с ячейкой реестра.
+
+        Args:
+            clause: Компактная запись клаузы
+
+        Returns:
+            int: Оценка в байтах
+        """
+        return (sys.getsizeof(clause) + sys.getsizeof(clause.literals) +
+                sys.getsizeof(clause.parents) + self.ENTRY_OVERHEAD)
+
+    def is_near_limit(self) -> bool:
+        """
+        Проверяет, приблизилось ли потребление памяти к лимиту.
+
+        Returns:
+            bool: True если лимит задан и превышен верхний порог
+        """
+        return (self.memory_limit is not None and
+                self.memory_usage >= self.memory_limit * self.HIGH_WATERMARK)
+
+    def select_evictions(self, passive_ids: List[int]) -> List[int]:
+        """
+        Выбирает необработанные клаузы для вытеснения.
+
+        Клаузы упорядочиваются по весу (количество символов) и возрасту:
+        в первую очередь остаются легкие и старые клаузы, которые были бы
+        выбраны раньше. Вытесняются самые тяжелые клаузы, пока потребление
+        не опустится до нижнего порога. Пустая клауза не вытесняется.
+
+        Args:
+            passive_ids: ID клауз, еще не участвовавших в резолюции
+
+        Returns:
+            List[int]: ID клауз для вытеснения
+        """
+        if self.memory_limit is None:
+            return []
+
+        target = self.memory_limit * self.LOW_WATERMARK
+        excess = self.memory_usage - target
+        if excess <= 0:
+            return []
+
+        # Сначала вытесняются самые тяжелые, при равном весе - самые новые
+        candidates = sorted(
+            (clause_id for clause_id in passive_ids if self._entries[clause_id].literals),
+            key=lambda clause_id: (self.clause_weight(clause_id), clause_id),
+            reverse=True)
+
+        evictions = []
+        for clause_id in candidates:
+            if excess <= 0:
+                break
+            evictions.append(clause_id)
+            excess -= self._record_size(self._entries[clause_id])
+        return evictions
+
+    def clause_weight(self, clause_id: int) -> int:
+        """
+        Вычисляет вес клаузы: количество предикатных и термовых символов.
+
+        Args:
+            clause_id: ID клаузы
+
+        Returns:
+            int: Вес клаузы
+        """
+        literals = self._entries[clause_id].literals
+        weight = 0
+        position = 0
+        while position < len(literals):
+            arity = literals[position + 1]
+            weight += 1 + sum(self.symbols.weight(term_id)
+                              for term_id in literals[position + 2:position + 2 + arity])
+            position += 2 + arity
+        return weight
+
+    def __getitem__(self, clause_id: int) -> Clause:
+        return self._entries[clause_id]
+
+    def __contains__(self, clause_id: int) -> bool:
+        return clause_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._entries)
+
+    def keys(self):
+        return self._entries.keys()
+
+    def items(self) -> Iterator[Tuple[int, Clause]]:
+        return iter(self._entries.items())
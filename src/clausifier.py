@@ -0,0 +1,820 @@
+"""
+Модуль перевода формул логики предикатов первого порядка в дизъюнкты.
+Разбирает формулы со связками ¬ ∧ ∨ → ↔ и кванторами ∀ ∃ и локально
+выполняет преобразования, которые раньше поручались языковой модели:
+негативная нормальная форма, переименование связанных переменных,
+сколемизация со свежими символами, удаление кванторов всеобщности,
+конъюнктивная нормальная форма и разбиение на дизъюнкты. Подформулы,
+дистрибуция которых дала бы слишком много дизъюнктов, заменяются
+определениями (структурная КНФ Плистеда-Гринбаума).
+"""
+
+import re
+import math
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+try:
+    from .clause_parser import (ClauseSyntaxError, Literal, ParsedClause, Term, NOT_SYMBOL, OR_SYMBOL,
+                                render_clause)
+except ImportError:
+    from clause_parser import (ClauseSyntaxError, Literal, ParsedClause, Term, NOT_SYMBOL, OR_SYMBOL,
+                               render_clause)
+
+
+class FormulaSyntaxError(ClauseSyntaxError):
+    """Синтаксическая ошибка в записи формулы первого порядка."""
+
+
+class Atom(NamedTuple):
+    """Атомарная формула: предикат и аргументы-термы."""
+    predicate: str
+    args: Tuple[Term, ...] = ()
+
+
+class Truth(NamedTuple):
+    """Логическая константа ⊤ (истина) или ⊥ (ложь)."""
+    value: bool
+
+
+class Not(NamedTuple):
+    """Отрицание формулы."""
+    operand: 'Formula'
+
+
+class And(NamedTuple):
+    """Конъюнкция формул."""
+    operands: Tuple['Formula', ...]
+
+
+class Or(NamedTuple):
+    """Дизъюнкция формул."""
+    operands: Tuple['Formula', ...]
+
+
+class Implies(NamedTuple):
+    """Импликация left → right."""
+    left: 'Formula'
+    right: 'Formula'
+
+
+class Iff(NamedTuple):
+    """Эквивалентность left ↔ right."""
+    left: 'Formula'
+    right: 'Formula'
+
+
+class Quantified(NamedTuple):
+    """Формула под квантором ∀ или ∃ по одной переменной."""
+    quantifier: str
+    variable: str
+    body: 'Formula'
+
+
+Formula = Union[Atom, Truth, Not, And, Or, Implies, Iff, Quantified]
+
+# Сколько дизъюнктов подформула может дать дистрибуцией, прежде чем ее
+# операнды заменяются определениями
+DEFAULT_DEFINITION_THRESHOLD = 8
+
+# Версия перевода в дизъюнкты: входит в ключ кэша формализатора в режиме
+# fol_mode, увеличивается при изменении результата Clausifier
+CLAUSIFIER_VERSION = 1
+
+FORALL_SYMBOL = '∀'
+EXISTS_SYMBOL = '∃'
+
+# Синонимы связок: ASCII-запись и варианты символов приводятся к основным
+SYMBOL_ALIASES = {
+    '~': '¬', '&': '∧', '|': '∨', '->': '→', '=>': '→', '⇒': '→', '⊃': '→',
+    '<->': '↔', '<=>': '↔', '⇔': '↔', '≡': '↔',
+}
+
+# Имя (дефис допускается только между символами слова: "кто-то"), связка или недопустимый символ
+FORMULA_TOKEN_PATTERN = re.compile(
+    r"\s*(?:(\w[\w']*(?:-\w[\w']*)*)|(<->|<=>|->|=>|[¬~∧&∨|→⇒⊃↔⇔≡∀∃⊤⊥(),.:])|(\S))")
+
+
+def tokenize_formula(text: str) -> List[Tuple[str, int]]:
+    """
+    Разбивает запись формулы на токены.
+
+    Args:
+        text: Запись формулы
+
+    Returns:
+        List[Tuple[str, int]]: Пары (значение, позиция); в конце - ('', длина)
+
+    Raises:
+        FormulaSyntaxError: При недопустимом символе
+    """
+    tokens = []
+    for match in FORMULA_TOKEN_PATTERN.finditer(text):
+        name, symbol, invalid = match.groups()
+        if name is not None:
+            tokens.append((name, match.start(1)))
+        elif symbol is not None:
+            tokens.append((SYMBOL_ALIASES.get(symbol, symbol), match.start(2)))
+        else:
+            raise FormulaSyntaxError(f"Недопустимый символ '{invalid}'", match.start(3), text)
+    tokens.append(('', len(text)))
+    return tokens
+
+
+class FormulaParser:
+    """
+    Парсер рекурсивного спуска для формул первого порядка.
+
+    Грамматика (по убыванию приоритета связок снизу вверх):
+        формула    := импликация ('↔' импликация)*
+        импликация := дизъюнкция ['→' импликация]
+        дизъюнкция := конъюнкция ('∨' конъюнкция)*
+        конъюнкция := унарная ('∧' унарная)*
+        унарная    := '¬' унарная | квантор | '(' формула ')' | '⊤' | '⊥' | атом
+        квантор    := ('∀' | '∃') ИМЯ (','? ИМЯ)* ['.' | ':'] формула
+        атом       := ИМЯ [ '(' терм (',' терм)* ')' ]
+        терм       := ИМЯ [ '(' терм (',' терм)* ')' ]
+
+    Область действия квантора продолжается до конца формулы или
+    закрывающей скобки: "∀x P(x) → Q(x)" означает "∀x (P(x) → Q(x))".
+    Импликация правоассоциативна, эквивалентность - левоассоциативна.
+    """
+
+    def __init__(self, text: str):
+        """
+        Инициализация парсера для строки.
+
+        Args:
+            text: Запись формулы
+        """
+        self.text = text
+        self.tokens = tokenize_formula(text)
+        self.index = 0
+
+    def parse(self) -> Formula:
+        """
+        Разбирает всю строку как формулу.
+
+        Returns:
+            Formula: Дерево формулы
+
+        Raises:
+            FormulaSyntaxError: При нарушении грамматики
+        """
+        formula = self._parse_iff()
+        self._expect('')
+        return formula
+
+    def _parse_iff(self) -> Formula:
+        formula = self._parse_implies()
+        while self._peek() == '↔':
+            self.index += 1
+            formula = Iff(formula, self._parse_implies())
+        return formula
+
+    def _parse_implies(self) -> Formula:
+        formula = self._parse_or()
+        if self._peek() == '→':
+            self.index += 1
+            return Implies(formula, self._parse_implies())
+        return formula
+
+    def _parse_or(self) -> Formula:
+        operands = [self._parse_and()]
+        while self._peek() == OR_SYMBOL:
+            self.index += 1
+            operands.append(self._parse_and())
+        return operands[0] if len(operands) == 1 else Or(tuple(operands))
+
+    def _parse_and(self) -> Formula:
+        operands = [self._parse_unary()]
+        while self._peek() == '∧':
+            self.index += 1
+            operands.append(self._parse_unary())
+        return operands[0] if len(operands) == 1 else And(tuple(operands))
+
+    def _parse_unary(self) -> Formula:
+        token = self._peek()
+        if token == NOT_SYMBOL:
+            self.index += 1
+            return Not(self._parse_unary())
+        if token in (FORALL_SYMBOL, EXISTS_SYMBOL):
+            return self._parse_quantified()
+        if token == '(':
+            self.index += 1
+            formula = self._parse_iff()
+            self._expect(')')
+            return formula
+        if token in ('⊤', '⊥'):
+            self.index += 1
+            return Truth(token == '⊤')
+        return self._parse_atom()
+
+    def _parse_quantified(self) -> Formula:
+        """Разбирает квантор с одной или несколькими переменными и его область."""
+        quantifier = self.tokens[self.index][0]
+        self.index += 1
+        variables = [self._expect_name()]
+        while True:
+            token = self._peek()
+            if token == ',':
+                self.index += 1
+                variables.append(self._expect_name())
+            elif token[:1].isalpha() and (self._peek(1)[:1].isalnum()
+                                          or self._peek(1) in (NOT_SYMBOL, FORALL_SYMBOL, EXISTS_SYMBOL)):
+                # ∀x y P(x, y) - несколько переменных без разделителя
+                variables.append(self._expect_name())
+            else:
+                break
+        if self._peek() in ('.', ':'):
+            self.index += 1
+
+        body = self._parse_iff()
+        for variable in reversed(variables):
+            body = Quantified(quantifier, variable, body)
+        return body
+
+    def _parse_atom(self) -> Atom:
+        predicate = self._expect_name()
+        return Atom(predicate, self._parse_arguments())
+
+    def _parse_term(self) -> Term:
+        name = self._expect_name()
+        return Term(name, self._parse_arguments())
+
+    def _parse_arguments(self) -> Tuple[Term, ...]:
+        if self._peek() != '(':
+            return ()
+        self.index += 1
+        args = [self._parse_term()]
+        while self._peek() == ',':
+            self.index += 1
+            args.append(self._parse_term())
+        self._expect(')')
+        return tuple(args)
+
+    def _peek(self, offset: int = 0) -> str:
+        return self.tokens[min(self.index + offset, len(self.tokens) - 1)][0]
+
+    def _expect_name(self) -> str:
+        value = self._peek()
+        if not (value[:1].isalnum() or value[:1] == '_'):
+            self._error("имя предиката, терма или переменной")
+        self.index += 1
+        return value
+
+    def _expect(self, value: str):
+        if self._peek() != value:
+            self._error(f"'{value}'" if value else "конец формулы")
+        self.index += 1
+
+    def _error(self, expected: str):
+        value, position = self.tokens[self.index]
+        found = f"'{value}'" if value else "конец строки"
+        raise FormulaSyntaxError(f"Ожидалось {expected}, найдено {found}", position, self.text)
+
+
+def parse_formula(text: str) -> Formula:
+    """
+    Разбирает запись формулы первого порядка.
+
+    Args:
+        text: Запись формулы
+
+    Returns:
+        Formula: Дерево формулы
+
+    Raises:
+        FormulaSyntaxError: При синтаксической ошибке
+
+    Пример:
+        >>> parse_formula("∀x (Человек(x) → Смертен(x))")
+        Quantified(quantifier='∀', variable='x', body=Implies(...))
+    """
+    return FormulaParser(text).parse()
+
+
+Clause = Tuple[Literal, ...]
+
+
+class Clausifier:
+    """
+    Перевод формул первого порядка в дизъюнкты в формате движка резолюций.
+
+    Этапы преобразования:
+    1. Разбор формулы (FormulaParser)
+    2. Переименование связанных переменных: каждый квантор получает свою
+       переменную, свободные переменные (строчные имена) считаются
+       связанными квантором всеобщности
+    3. Определения: если дистрибуция подформулы дала бы больше
+       definition_threshold дизъюнктов, ее крупные операнды заменяются
+       атомами Def<n>(x, ...) от свободных переменных операнда
+    4. Негативная нормальная форма: устранение → и ↔, спуск отрицаний
+    5. Сколемизация: ∃y заменяется свежей константой Sk<n> или функцией
+       Sk<n>(x, ...) от переменных внешних кванторов ∀, входящих в область ∃
+    6. Удаление кванторов ∀ и дистрибуция ∨ над ∧ (КНФ)
+    7. Удаление тавтологий, повторных литералов и дизъюнктов
+
+    Определения учитывают полярность (Плистед-Гринбаум): для операнда в
+    положительном контексте добавляется только Def → F, в отрицательном -
+    F → Def, и лишь под ↔ - обе импликации. Операнд заменяется, только
+    если это уменьшает общее число дизъюнктов, поэтому вложенные
+    эквивалентности дают линейное, а не экспоненциальное число дизъюнктов.
+
+    Сколемовские символы и предикаты определений не повторяются в пределах
+    одного экземпляра, поэтому формулы одной задачи переводятся одним
+    экземпляром.
+
+    Атрибуты:
+        skolem_prefix (str): Префикс имен сколемовских символов
+        definition_prefix (str): Префикс имен предикатов определений
+        definition_threshold (Optional[int]): Порог числа дизъюнктов
+            подформулы для введения определений (None - только дистрибуция)
+    """
+
+    def __init__(self, skolem_prefix: str = 'Sk', definition_prefix: str = 'Def',
+                 definition_threshold: Optional[int] = DEFAULT_DEFINITION_THRESHOLD):
+        """
+        Инициализация переводчика.
+
+        Args:
+            skolem_prefix: Префикс имен сколемовских символов (с заглавной
+                буквы: сколемовские константы - константы движка)
+            definition_prefix: Префикс имен предикатов определений
+            definition_threshold: Порог числа дизъюнктов подформулы, выше
+                которого вводятся определения (None - без определений)
+        """
+        self.skolem_prefix = skolem_prefix
+        self.definition_prefix = definition_prefix
+        self.definition_threshold = definition_threshold
+        self._counters: Dict[str, int] = {}
+        self._used_symbols: Set[str] = set()
+
+    def clausify(self, formulas: Iterable[Union[str, Formula]]) -> List[str]:
+        """
+        Переводит набор формул в дизъюнкты.
+
+        Args:
+            formulas: Записи формул или уже разобранные формулы
+
+        Returns:
+            List[str]: Дизъюнкты без повторов ("□" - пустой дизъюнкт)
+
+        Raises:
+            FormulaSyntaxError: При синтаксической ошибке в формуле
+
+        Пример:
+            >>> Clausifier().clausify(["∀x (Человек(x) → Смертен(x))", "Человек(Сократ)"])
+            ['¬Человек(x) ∨ Смертен(x)', 'Человек(Сократ)']
+        """
+        return [clause.text for clause in self.clausify_parsed(formulas)]
+
+    def clausify_parsed(self, formulas: Iterable[Union[str, Formula]]) -> List[ParsedClause]:
+        """
+        Переводит набор формул в разобранные дизъюнкты (см. clausify).
+
+        Результат передается движку резолюций без повторного разбора строк.
+        """
+        parsed = [parse_formula(formula) if isinstance(formula, str) else formula
+                  for formula in formulas]
+        for formula in parsed:
+            self._used_symbols.update(_symbols(formula))
+
+        clauses = []
+        seen = set()
+        for formula in parsed:
+            for clause in self._clauses(formula):
+                rendered = render_clause(clause)
+                if rendered not in seen:
+                    seen.add(rendered)
+                    clauses.append(ParsedClause(rendered, tuple(clause)))
+        return clauses
+
+    def reserve_symbols(self, clauses: Iterable[ParsedClause]):
+        """
+        Помечает символы готовых дизъюнктов как занятые.
+
+        Новые сколемовские символы и предикаты определений не повторяют
+        имен из этих дизъюнктов (например, переведенных другим экземпляром).
+
+        Args:
+            clauses: Разобранные дизъюнкты
+        """
+        for clause in clauses:
+            for literal in clause.literals:
+                self._used_symbols.update(_symbols(Atom(literal.predicate, literal.args)))
+
+    def clausify_formula(self, formula: Union[str, Formula]) -> List[str]:
+        """Переводит одну формулу в дизъюнкты (см. clausify)."""
+        return self.clausify([formula])
+
+    def _clauses(self, formula: Formula) -> List[Clause]:
+        """Выполняет этапы 2-7 для одной разобранной формулы."""
+        # Шаг 2: Переименование связанных переменных и замыкание свободных
+        free_variables = _free_variables(formula)
+        formula = _standardize(formula, {}, set(free_variables))
+
+        # Шаг 3: Определения для операндов, дистрибуция которых слишком дорога
+        definitions: List[Formula] = []
+        if self.definition_threshold is not None:
+            formula = self._define_subformulas(formula, 1, definitions)[0]
+
+        clauses = self._normal_form(formula, free_variables)
+        for definition in definitions:
+            clauses.extend(self._normal_form(definition, []))
+        return clauses
+
+    def _normal_form(self, formula: Formula, free_variables: List[str]) -> List[Clause]:
+        """Выполняет этапы 4-7: ННФ, сколемизация, КНФ и упрощение."""
+        # Шаг 4: Негативная нормальная форма
+        formula = _nnf(formula, True)
+
+        # Шаг 5: Сколемизация
+        formula = self._skolemize(formula, free_variables)
+
+        # Шаги 6-7: КНФ и упрощение
+        return _simplify(_cnf(formula))
+
+    def _define_subformulas(self, formula: Formula, polarity: int,
+                            definitions: List[Formula]) -> Tuple[Formula, int, int]:
+        """
+        Заменяет определениями операнды, дистрибуция которых слишком дорога.
+
+        Поддеревья обрабатываются снизу вверх. Если подформула в своей
+        полярности дает больше definition_threshold дизъюнктов, ее операнды
+        (от самых дорогих) заменяются атомами определений, пока замена
+        уменьшает общее число дизъюнктов.
+
+        Args:
+            formula: Формула с переименованными переменными
+            polarity: 1 - положительный контекст, -1 - под отрицанием, 0 - под ↔
+            definitions: Список, в который добавляются формулы определений
+
+        Returns:
+            Tuple[Formula, int, int]: Формула и число дизъюнктов ее КНФ
+            и КНФ ее отрицания
+        """
+        if isinstance(formula, (Atom, Truth)):
+            return formula, 1, 1
+        if isinstance(formula, Not):
+            operand, positive, negative = self._define_subformulas(formula.operand, -polarity, definitions)
+            return Not(operand), negative, positive
+        if isinstance(formula, Quantified):
+            body, positive, negative = self._define_subformulas(formula.body, polarity, definitions)
+            return Quantified(formula.quantifier, formula.variable, body), positive, negative
+
+        polarities = _operand_polarities(formula, polarity)
+        results = [self._define_subformulas(operand, operand_polarity, definitions)
+                   for operand, operand_polarity in zip(_operands(formula), polarities)]
+        counts = _clause_counts(formula, [(positive, negative) for _, positive, negative in results])
+        cost = _polarity_cost(counts, polarity)
+
+        if cost > self.definition_threshold:
+            order = sorted(range(len(results)), reverse=True,
+                           key=lambda i: _polarity_cost(results[i][1:], polarities[i]))
+            for i in order:
+                operand, positive, negative = results[i]
+                operand_cost = _polarity_cost((positive, negative), polarities[i])
+                trial = [(1, 1) if j == i else (p, n) for j, (_, p, n) in enumerate(results)]
+                trial_counts = _clause_counts(formula, trial)
+                trial_cost = _polarity_cost(trial_counts, polarity)
+                # Определение выгодно, если дизъюнктов вместе с ним становится меньше
+                if trial_cost + operand_cost < cost:
+                    results[i] = (self._define(operand, polarities[i], definitions), 1, 1)
+                    counts, cost = trial_counts, trial_cost
+                if cost <= self.definition_threshold:
+                    break
+
+        return _rebuild(formula, [operand for operand, _, _ in results]), counts[0], counts[1]
+
+    def _define(self, formula: Formula, polarity: int, definitions: List[Formula]) -> Atom:
+        """
+        Вводит предикат определения подформулы и возвращает его атом.
+
+        Args:
+            formula: Подформула
+            polarity: Полярность вхождения подформулы (1, -1 или 0)
+            definitions: Список, в который добавляется формула определения
+
+        Returns:
+            Atom: Атом Def<n>(x, ...) от свободных переменных подформулы
+        """
+        variables = _free_variables(formula)
+        atom = Atom(self._fresh_symbol(self.definition_prefix),
+                    tuple(Term(variable) for variable in variables))
+        if polarity > 0:
+            definition = Implies(atom, formula)
+        elif polarity < 0:
+            definition = Implies(formula, atom)
+        else:
+            definition = Iff(atom, formula)
+        for variable in reversed(variables):
+            definition = Quantified(FORALL_SYMBOL, variable, definition)
+        definitions.append(definition)
+        return atom
+
+    def _skolemize(self, formula: Formula, universals: List[str]) -> Formula:
+        """Заменяет кванторы ∃ сколемовскими термами (формула в ННФ)."""
+        if isinstance(formula, (And, Or)):
+            return type(formula)(tuple(self._skolemize(operand, universals)
+                                       for operand in formula.operands))
+        if isinstance(formula, Quantified):
+            if formula.quantifier == FORALL_SYMBOL:
+                return Quantified(FORALL_SYMBOL, formula.variable,
+                                  self._skolemize(formula.body, universals + [formula.variable]))
+
+            # Аргументы - только переменные ∀, от которых зависит область ∃
+            body_variables = _term_names(formula.body)
+            args = tuple(Term(variable) for variable in universals if variable in body_variables)
+            skolem_term = Term(self._fresh_symbol(self.skolem_prefix), args)
+            body = _substitute_formula(formula.body, {formula.variable: skolem_term})
+            return self._skolemize(body, universals)
+        return formula
+
+    def _fresh_symbol(self, prefix: str) -> str:
+        """Возвращает еще не использованное имя вида <prefix><n>."""
+        while True:
+            self._counters[prefix] = self._counters.get(prefix, 0) + 1
+            name = f"{prefix}{self._counters[prefix]}"
+            if name not in self._used_symbols:
+                self._used_symbols.add(name)
+                return name
+
+
+def clausify(formulas: Iterable[str]) -> List[str]:
+    """
+    Переводит формулы одной задачи в дизъюнкты (см. Clausifier.clausify).
+
+    Args:
+        formulas: Записи формул первого порядка
+
+    Returns:
+        List[str]: Дизъюнкты в формате движка резолюций
+    """
+    return Clausifier().clausify(formulas)
+
+
+def _is_variable_name(name: str) -> bool:
+    """Свободное имя со строчной буквы - переменная (соглашение движка)."""
+    return name[:1].islower()
+
+
+def _term_names(formula: Formula) -> Set[str]:
+    """Возвращает имена всех символов в термах формулы."""
+    names: Set[str] = set()
+
+    def visit_term(term: Term):
+        names.add(term.name)
+        for arg in term.args:
+            visit_term(arg)
+
+    for atom in _atoms(formula):
+        for arg in atom.args:
+            visit_term(arg)
+    return names
+
+
+def _atoms(formula: Formula) -> Iterator[Atom]:
+    """Перебирает атомы формулы."""
+    if isinstance(formula, Atom):
+        yield formula
+    elif isinstance(formula, Not):
+        yield from _atoms(formula.operand)
+    elif isinstance(formula, (And, Or)):
+        for operand in formula.operands:
+            yield from _atoms(operand)
+    elif isinstance(formula, (Implies, Iff)):
+        yield from _atoms(formula.left)
+        yield from _atoms(formula.right)
+    elif isinstance(formula, Quantified):
+        yield from _atoms(formula.body)
+
+
+def _symbols(formula: Formula) -> Set[str]:
+    """Возвращает имена предикатов и символов термов формулы."""
+    return _term_names(formula) | {atom.predicate for atom in _atoms(formula)}
+
+
+def _free_variables(formula: Formula) -> List[str]:
+    """Свободные переменные формулы (строчные имена вне кванторов) в порядке появления."""
+    result: List[str] = []
+
+    def visit_term(term: Term, bound: Set[str]):
+        if not term.args:
+            if (_is_variable_name(term.name) and term.name not in bound
+                    and term.name not in result):
+                result.append(term.name)
+        for arg in term.args:
+            visit_term(arg, bound)
+
+    def visit(node: Formula, bound: Set[str]):
+        if isinstance(node, Atom):
+            for arg in node.args:
+                visit_term(arg, bound)
+        elif isinstance(node, Not):
+            visit(node.operand, bound)
+        elif isinstance(node, (And, Or)):
+            for operand in node.operands:
+                visit(operand, bound)
+        elif isinstance(node, (Implies, Iff)):
+            visit(node.left, bound)
+            visit(node.right, bound)
+        elif isinstance(node, Quantified):
+            visit(node.body, bound | {node.variable})
+
+    visit(formula, set())
+    return result
+
+
+def _standardize(formula: Formula, renaming: Dict[str, str], used: Set[str]) -> Formula:
+    """
+    Дает каждому квантору собственную переменную.
+
+    Имя переменной сохраняется, если оно еще не занято в формуле,
+    иначе к нему добавляется номер: x, x1, x2...
+    """
+    if isinstance(formula, Atom):
+        return Atom(formula.predicate, tuple(_rename_term(arg, renaming) for arg in formula.args))
+    if isinstance(formula, Truth):
+        return formula
+    if isinstance(formula, Not):
+        return Not(_standardize(formula.operand, renaming, used))
+    if isinstance(formula, (And, Or)):
+        return type(formula)(tuple(_standardize(operand, renaming, used)
+                                   for operand in formula.operands))
+    if isinstance(formula, (Implies, Iff)):
+        return type(formula)(_standardize(formula.left, renaming, used),
+                             _standardize(formula.right, renaming, used))
+
+    # Квантор: переменная должна начинаться со строчной буквы (переменная движка)
+    base = formula.variable if _is_variable_name(formula.variable) else formula.variable.lower()
+    name, suffix = base, 0
+    while name in used:
+        suffix += 1
+        name = f"{base}{suffix}"
+    used.add(name)
+    inner = dict(renaming)
+    inner[formula.variable] = name
+    return Quantified(formula.quantifier, name, _standardize(formula.body, inner, used))
+
+
+def _rename_term(term: Term, renaming: Dict[str, str]) -> Term:
+    """Переименовывает переменные терма."""
+    if not term.args:
+        return Term(renaming.get(term.name, term.name))
+    return Term(term.name, tuple(_rename_term(arg, renaming) for arg in term.args))
+
+
+def _substitute_term(term: Term, substitution: Dict[str, Term]) -> Term:
+    """Заменяет переменные терма термами подстановки."""
+    if not term.args:
+        return substitution.get(term.name, term)
+    return Term(term.name, tuple(_substitute_term(arg, substitution) for arg in term.args))
+
+
+def _substitute_formula(formula: Formula, substitution: Dict[str, Term]) -> Formula:
+    """Применяет подстановку к формуле в ННФ (переменные уже переименованы)."""
+    if isinstance(formula, Atom):
+        return Atom(formula.predicate,
+                    tuple(_substitute_term(arg, substitution) for arg in formula.args))
+    if isinstance(formula, Not):
+        return Not(_substitute_formula(formula.operand, substitution))
+    if isinstance(formula, (And, Or)):
+        return type(formula)(tuple(_substitute_formula(operand, substitution)
+                                   for operand in formula.operands))
+    if isinstance(formula, Quantified):
+        return Quantified(formula.quantifier, formula.variable,
+                          _substitute_formula(formula.body, substitution))
+    return formula
+
+
+def _operands(formula: Formula) -> List[Formula]:
+    """Возвращает операнды связки ∧, ∨, → или ↔."""
+    if isinstance(formula, (And, Or)):
+        return list(formula.operands)
+    return [formula.left, formula.right]
+
+
+def _operand_polarities(formula: Formula, polarity: int) -> List[int]:
+    """Полярности операндов связки: посылка → меняет знак, операнды ↔ - нулевые."""
+    if isinstance(formula, (And, Or)):
+        return [polarity] * len(formula.operands)
+    if isinstance(formula, Implies):
+        return [-polarity, polarity]
+    return [0, 0]
+
+
+def _rebuild(formula: Formula, operands: List[Formula]) -> Formula:
+    """Собирает связку того же вида из новых операндов."""
+    if isinstance(formula, (And, Or)):
+        return type(formula)(tuple(operands))
+    return type(formula)(*operands)
+
+
+def _clause_counts(formula: Formula, counts: List[Tuple[int, int]]) -> Tuple[int, int]:
+    """
+    Число дизъюнктов КНФ связки и ее отрицания по числам для операндов.
+
+    Args:
+        formula: Связка ∧, ∨, → или ↔
+        counts: Пары (дизъюнктов у операнда, дизъюнктов у его отрицания)
+
+    Returns:
+        Tuple[int, int]: Оценка сверху (до удаления тавтологий)
+    """
+    if isinstance(formula, And):
+        return sum(p for p, _ in counts), math.prod(n for _, n in counts)
+    if isinstance(formula, Or):
+        return math.prod(p for p, _ in counts), sum(n for _, n in counts)
+    (left_p, left_n), (right_p, right_n) = counts
+    if isinstance(formula, Implies):
+        return left_n * right_p, left_p + right_n
+    # A ↔ B = (¬A ∨ B) ∧ (A ∨ ¬B);  ¬(A ↔ B) = (A ∨ B) ∧ (¬A ∨ ¬B)
+    return left_n * right_p + left_p * right_n, left_p * right_p + left_n * right_n
+
+
+def _polarity_cost(counts: Tuple[int, int], polarity: int) -> int:
+    """Число дизъюнктов подформулы с учетом полярности ее вхождения."""
+    positive, negative = counts
+    if polarity > 0:
+        return positive
+    if polarity < 0:
+        return negative
+    return positive + negative
+
+
+def _nnf(formula: Formula, positive: bool) -> Formula:
+    """
+    Переводит формулу в негативную нормальную форму.
+
+    Args:
+        formula: Формула
+        positive: False - перевести отрицание формулы
+
+    Returns:
+        Formula: Формула из атомов, отрицаний атомов, ∧, ∨, ∀, ∃ и ⊤/⊥
+    """
+    if isinstance(formula, Atom):
+        return formula if positive else Not(formula)
+    if isinstance(formula, Truth):
+        return Truth(formula.value == positive)
+    if isinstance(formula, Not):
+        return _nnf(formula.operand, not positive)
+    if isinstance(formula, (And, Or)):
+        # Закон де Моргана: отрицание меняет ∧ на ∨ и наоборот
+        same = isinstance(formula, And) == positive
+        operands = tuple(_nnf(operand, positive) for operand in formula.operands)
+        return And(operands) if same else Or(operands)
+    if isinstance(formula, Implies):
+        # A → B = ¬A ∨ B;  ¬(A → B) = A ∧ ¬B
+        if positive:
+            return Or((_nnf(formula.left, False), _nnf(formula.right, True)))
+        return And((_nnf(formula.left, True), _nnf(formula.right, False)))
+    if isinstance(formula, Iff):
+        # A ↔ B = (¬A ∨ B) ∧ (A ∨ ¬B);  ¬(A ↔ B) = (A ∨ B) ∧ (¬A ∨ ¬B)
+        left, right = formula.left, formula.right
+        return And((Or((_nnf(left, False), _nnf(right, positive))),
+                    Or((_nnf(left, True), _nnf(right, not positive)))))
+
+    # ¬∀x F = ∃x ¬F;  ¬∃x F = ∀x ¬F
+    quantifier = formula.quantifier
+    if not positive:
+        quantifier = EXISTS_SYMBOL if quantifier == FORALL_SYMBOL else FORALL_SYMBOL
+    return Quantified(quantifier, formula.variable, _nnf(formula.body, positive))
+
+
+def _cnf(formula: Formula) -> List[Clause]:
+    """Строит дизъюнкты формулы в ННФ без кванторов ∃ (дистрибуция ∨ над ∧)."""
+    if isinstance(formula, Atom):
+        return [(Literal(formula.predicate, formula.args, False),)]
+    if isinstance(formula, Not):
+        atom = formula.operand
+        return [(Literal(atom.predicate, atom.args, True),)]
+    if isinstance(formula, Truth):
+        return [] if formula.value else [()]
+    if isinstance(formula, And):
+        return [clause for operand in formula.operands for clause in _cnf(operand)]
+    if isinstance(formula, Or):
+        clauses: List[Clause] = [()]
+        for operand in formula.operands:
+            operand_clauses = _cnf(operand)
+            clauses = [left + right for left in clauses for right in operand_clauses]
+        return clauses
+    # Квантор ∀ подразумевается для всех переменных дизъюнкта
+    return _cnf(formula.body)
+
+
+def _simplify(clauses: List[Clause]) -> List[Clause]:
+    """Удаляет повторные литералы и тавтологии (P ∨ ¬P ∨ ...)."""
+    result = []
+    for clause in clauses:
+        literals = list(dict.fromkeys(clause))
+        signs: Dict[Tuple[str, Tuple[Term, ...]], bool] = {}
+        tautology = False
+        for literal in literals:
+            key = (literal.predicate, literal.args)
+            if signs.setdefault(key, literal.negated) != literal.negated:
+                tautology = True
+                break
+        if not tautology:
+            result.append(tuple(literals))
+    return result
@@ -0,0 +1,91 @@
+"""
+Модуль срока выполнения запроса пользователя.
+Один объект Deadline передается через все этапы запроса (формализация,
+доказательство, объяснение): каждый этап берет таймауты и бюджет из
+оставшегося времени, а необязательные этапы пропускаются или упрощаются,
+когда времени не осталось. Так общее время ответа ограничено сверху.
+"""
+
+import time
+from typing import Callable, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """Срок выполнения запроса истек."""
+
+
+class Deadline:
+    """
+    Срок выполнения запроса: момент, после которого этапы не начинаются.
+
+    Атрибуты:
+        budget (Optional[float]): Полный бюджет запроса в секундах
+            (None - без ограничения)
+        expires_at (Optional[float]): Момент истечения по часам clock
+    """
+
+    def __init__(self, budget: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Инициализация срока, отсчитываемого от текущего момента.
+
+        Args:
+            budget: Бюджет времени в секундах (None - без ограничения)
+            clock: Монотонные часы (подменяются в тестах)
+        """
+        self.budget = budget
+        self.clock = clock
+        self.expires_at = None if budget is None else clock() + budget
+
+    def remaining(self) -> Optional[float]:
+        """Возвращает оставшееся время в секундах (не меньше 0) или None без ограничения."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - self.clock())
+
+    @property
+    def expired(self) -> bool:
+        """Истек ли срок."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def timeout(self, default: float) -> float:
+        """
+        Возвращает таймаут этапа: собственный лимит, но не больше оставшегося времени.
+
+        Args:
+            default: Собственный лимит этапа в секундах
+
+        Returns:
+            float: Таймаут в секундах
+
+        Raises:
+            DeadlineExceeded: Если срок уже истек
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        if remaining <= 0:
+            raise DeadlineExceeded("Истек срок выполнения запроса")
+        return min(default, remaining)
+
+    def check(self, stage: str):
+        """
+        Проверяет, что срок не истек, перед началом этапа.
+
+        Args:
+            stage: Название этапа для сообщения об ошибке
+
+        Raises:
+            DeadlineExceeded: Если срок истек
+        """
+        if self.expired:
+            raise DeadlineExceeded(f"Истек срок выполнения запроса: {stage}")
+
+    def __repr__(self) -> str:
+        remaining = self.remaining()
+        return f"Deadline(remaining={'∞' if remaining is None else f'{remaining:.2f}'})"
+
+
+# Срок без ограничения (значение по умолчанию для этапов)
+NO_DEADLINE = Deadline()
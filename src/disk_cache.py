@@ -0,0 +1,160 @@
+"""
+Модуль дискового кэша на основе SQLite.
+Хранит произвольные бинарные значения по строковому ключу с ограничением
+размера (LRU-вытеснение) и необязательным ограничением возраста записей.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class DiskCache:
+    """
+    Персистентный кэш "ключ -> значение" в файле SQLite.
+
+    При превышении лимита количества записей или суммарного объема
+    вытесняются записи, к которым дольше всего не обращались (LRU).
+    Записи старше max_age секунд считаются отсутствующими и удаляются.
+    Экземпляр можно использовать из нескольких потоков.
+
+    Атрибуты:
+        path (str): Путь к файлу базы данных (":memory:" - кэш в памяти)
+        max_entries (int): Максимальное количество записей
+        max_bytes (Optional[int]): Максимальный суммарный объем значений в байтах
+        max_age (Optional[float]): Максимальный возраст записи в секундах
+    """
+
+    def __init__(self, path: str, max_entries: int = 1000,
+                 max_bytes: Optional[int] = None, max_age: Optional[float] = None):
+        """
+        Открывает (или создает) файл кэша.
+
+        Args:
+            path: Путь к файлу базы данных SQLite
+            max_entries: Максимальное количество записей
+            max_bytes: Максимальный суммарный объем значений (None - без ограничения)
+            max_age: Максимальный возраст записи в секундах (None - без ограничения)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path)) if path != ':memory:' else ''
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Возвращает значение по ключу и отмечает обращение к нему.
+
+        Args:
+            key: Ключ записи
+
+        Returns:
+            Optional[bytes]: Значение или None, если записи нет или она устарела
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            value, created = row
+            if self.max_age is not None and now - created > self.max_age:
+                # Устаревшая запись удаляется при обращении
+                self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._connection.commit()
+                return None
+
+            self._connection.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self._connection.commit()
+            return bytes(value)
+
+    def set(self, key: str, value: bytes):
+        """
+        Сохраняет значение по ключу и вытесняет лишние записи.
+
+        Args:
+            key: Ключ записи
+            value: Бинарное значение
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), now, now))
+            self._evict(now)
+            self._connection.commit()
+
+    def delete(self, key: str):
+        """Удаляет запись по ключу, если она есть."""
+        with self._lock:
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._connection.commit()
+
+    def clear(self):
+        """Удаляет все записи кэша."""
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+            self._connection.commit()
+
+    def close(self):
+        """Закрывает соединение с базой данных."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def _evict(self, now: float):
+        """
+        Удаляет устаревшие записи и вытесняет наименее используемые.
+
+        Вызывается под блокировкой, фиксация транзакции выполняется вызывающим.
+        """
+        if self.max_age is not None:
+            self._connection.execute(
+                "DELETE FROM entries WHERE created < ?", (now - self.max_age,))
+
+        # Ограничение по количеству записей
+        count = self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        if count > self.max_entries:
+            self._connection.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY accessed ASC LIMIT ?)",
+                (count - self.max_entries,))
+
+        # Ограничение по суммарному объему
+        if self.max_bytes is not None:
+            total = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                rows = self._connection.execute(
+                    "SELECT key, size FROM entries ORDER BY accessed ASC").fetchall()
+                for key, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    total -= size
@@ -0,0 +1,144 @@
+"""
+Модуль статистики и профилирования движка резолюций.
+Содержит счетчики и таймеры этапов доказательства, а также режим
+профилирования одной задачи с записью профилей cProfile и tracemalloc
+на диск.
+"""
+
+import os
+import json
+import time
+import cProfile
+import pstats
+import functools
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+class EngineStats:
+    """
+    Счетчики и таймеры одного доказательства.
+
+    Счетчики обновляются всегда (целочисленные инкременты). Таймеры этапов
+    включаются только по запросу (prove(..., with_stats=True)): движок
+    временно оборачивает измеряемые методы, поэтому без запроса таймеры
+    ничего не стоят.
+
+    Атрибуты:
+        pairs_considered (int): Пары клауз, к которым применялась резолюция
+        index_hits (int): Кандидаты, найденные по индексу литералов
+            (стратегия множества поддержки)
+        unification_attempts (int): Попытки унификации комплементарных литералов
+        unification_successes (int): Успешные унификации
+        ill_sorted_rejected (int): Пары литералов, отброшенные до унификации
+            из-за несовпадения сортов
+        resolvents_generated (int): Порожденные резольвенты
+        resolvents_kept (int): Резольвенты, добавленные в множество клауз
+        tautologies_deleted (int): Отброшенные тавтологии
+        subsumed_deleted (int): Отброшенные поглощенные клаузы
+        rounds (int): Раунды насыщения
+        timings (Dict[str, float]): Время этапов в секундах:
+            parse, unify, subsume, log и total
+    """
+
+    COUNTERS = ('pairs_considered', 'index_hits', 'unification_attempts',
+                'unification_successes', 'ill_sorted_rejected',
+                'resolvents_generated', 'resolvents_kept',
+                'tautologies_deleted', 'subsumed_deleted', 'rounds')
+    TIMERS = ('parse', 'unify', 'subsume', 'log', 'total')
+
+    __slots__ = COUNTERS + ('timings',)
+
+    def __init__(self):
+        """Инициализация нулевых счетчиков и таймеров."""
+        for counter in self.COUNTERS:
+            setattr(self, counter, 0)
+        self.timings: Dict[str, float] = dict.fromkeys(self.TIMERS, 0.0)
+
+    def timed(self, timer: str, function: Callable) -> Callable:
+        """
+        Оборачивает функцию так, что ее время добавляется к таймеру.
+
+        Args:
+            timer: Имя таймера из TIMERS
+            function: Измеряемая функция
+
+        Returns:
+            Callable: Обертка с тем же интерфейсом
+        """
+        timings = self.timings
+        perf_counter = time.perf_counter
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timings[timer] += perf_counter() - start
+
+        return wrapper
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Возвращает счетчики и таймеры в виде словаря (для JSON)."""
+        result = {counter: getattr(self, counter) for counter in self.COUNTERS}
+        result['timings'] = dict(self.timings)
+        return result
+
+    def __str__(self) -> str:
+        lines = [f"{counter}: {getattr(self, counter)}" for counter in self.COUNTERS]
+        lines.extend(f"time_{timer}: {seconds * 1000:.2f} мс"
+                     for timer, seconds in self.timings.items())
+        return '\n'.join(lines)
+
+
+def profile_prove(engine, clauses: Iterable[str], output_dir: str,
+                  name: str = 'profile') -> Tuple[bool, List[Dict], EngineStats]:
+    """
+    Доказывает одну задачу под cProfile и tracemalloc и записывает профили.
+
+    В output_dir создаются файлы:
+        <name>.prof            - профиль cProfile (для pstats/snakeviz)
+        <name>.cprofile.txt    - 40 функций с наибольшим накопленным временем
+        <name>.tracemalloc.txt - пиковая память и 30 строк с наибольшими выделениями
+        <name>.stats.json      - счетчики и таймеры EngineStats
+
+    Args:
+        engine: Экземпляр ResolutionEngine
+        clauses: Дизъюнкты задачи
+        output_dir: Каталог для файлов профилей
+        name: Базовое имя файлов
+
+    Returns:
+        Tuple[bool, List[Dict], EngineStats]: Результат, лог и статистика
+
+    Пример:
+        >>> profile_prove(ResolutionEngine(), ["P(x)", "¬P(A)"], "profiles", "simple")
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    base_path = os.path.join(output_dir, name)
+
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        result, log, stats = engine.prove(clauses, with_stats=True)
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    profiler.dump_stats(f"{base_path}.prof")
+    with open(f"{base_path}.cprofile.txt", 'w', encoding='utf-8') as file:
+        pstats.Stats(profiler, stream=file).sort_stats('cumulative').print_stats(40)
+
+    with open(f"{base_path}.tracemalloc.txt", 'w', encoding='utf-8') as file:
+        file.write(f"Пиковая память: {peak_memory} байт\n\n")
+        for statistic in snapshot.statistics('lineno')[:30]:
+            file.write(f"{statistic}\n")
+
+    with open(f"{base_path}.stats.json", 'w', encoding='utf-8') as file:
+        json.dump(stats.as_dict(), file, ensure_ascii=False, indent=2)
+
+    return result, log, stats
@@ -1,395 +1,506 @@
-import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
-import threading
-from logic_formalizer import LogicFormalizer
-from resolution_engine import ResolutionEngine
-from proof_explainer import ProofExplainer
-
-class LogicProofApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Система логического доказательства")
-        self.root.geometry("900x700")
-        
-        # Инициализация компонентов
-        self.formalizer = LogicFormalizer()
-        self.resolution_engine = ResolutionEngine()
-        self.explainer = ProofExplainer()
-        
-        self.setup_ui()
-    
-    def setup_ui(self):
-        """Создание интерфейса"""
-        # Основной фрейм
-        main_frame = ttk.Frame(self.root, padding="10")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Настройка весов для растягивания
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(1, weight=1)
-        
-        # Заголовок
-        title_label = ttk.Label(main_frame, 
-                               text="Система логического доказательства методом резолюций",
-                               font=("Arial", 14, "bold"))
-        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
-        
-        # Ввод логического высказывания
-        ttk.Label(main_frame, text="Введите логическое высказывание:").grid(row=1, column=0, sticky=tk.W, pady=(0, 5))
-        
-        self.input_text = scrolledtext.ScrolledText(main_frame, height=4, width=80)
-        self.input_text.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-
-        # Кнопки управления
-        button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=3, column=0, columnspan=2, pady=(0, 20))
-        
-        self.prove_button = ttk.Button(button_frame, text="Доказать высказывание", 
-                                      command=self.start_proof_process)
-        self.prove_button.pack(side=tk.LEFT, padx=(0, 10))
-        
-        self.clear_button = ttk.Button(button_frame, text="Очистить", 
-                                      command=self.clear_all)
-        self.clear_button.pack(side=tk.LEFT)
-        
-        # Прогресс бар
-        self.progress = ttk.Progressbar(main_frame, mode='indeterminate')
-        self.progress.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 20))
-        
-        # Создаем Notebook для вкладок
-        self.notebook = ttk.Notebook(main_frame)
-        self.notebook.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Вкладка 1: Формализованные формулы
-        self.formulas_frame = ttk.Frame(self.notebook, padding="5")
-        self.notebook.add(self.formulas_frame, text="Формализованные формулы")
-        
-        ttk.Label(self.formulas_frame, text="Формулы логики предикатов:").pack(anchor=tk.W)
-        self.formulas_text = scrolledtext.ScrolledText(self.formulas_frame, height=6)
-        self.formulas_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
-        
-        # Вкладка 2: Детали доказательства
-        self.proof_frame = ttk.Frame(self.notebook, padding="5")
-        self.notebook.add(self.proof_frame, text="Детали доказательства")
-        
-        ttk.Label(self.proof_frame, text="Пошаговое доказательство:").pack(anchor=tk.W)
-        self.proof_text = scrolledtext.ScrolledText(self.proof_frame, height=8)
-        self.proof_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
-        
-        # Вкладка 3: Объяснение
-        self.explanation_frame = ttk.Frame(self.notebook, padding="5")
-        self.notebook.add(self.explanation_frame, text="Объяснение")
-        
-        ttk.Label(self.explanation_frame, text="Объяснение доказательства простым языком:").pack(anchor=tk.W)
-        self.explanation_text = scrolledtext.ScrolledText(self.explanation_frame, height=6)
-        self.explanation_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
-        
-        # Статус бар
-        self.status_var = tk.StringVar(value="Готов к работе")
-        status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
-        status_bar.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
-        
-        # Примеры высказываний
-        self.setup_examples_section(main_frame)
-
-        self.setup_text_shortcuts()
-    
-
-    def setup_text_shortcuts(self):
-        """Настраивает горячие клавиши и контекстные меню для всех текстовых полей"""
-        widgets = [self.input_text, self.formulas_text, self.proof_text, self.explanation_text]
-        
-        for widget in widgets:
-            self.add_context_menu(widget)
-            self.bind_shortcuts(widget)
-
-    def add_context_menu(self, widget):
-        """Добавляет контекстное меню для текстового поля"""
-        context_menu = tk.Menu(widget, tearoff=0)
-        context_menu.add_command(label="Копировать", 
-                               command=lambda: self.widget_copy(widget))
-        context_menu.add_command(label="Вставить", 
-                               command=lambda: self.widget_paste(widget))
-        context_menu.add_command(label="Вырезать", 
-                               command=lambda: self.widget_cut(widget))
-        context_menu.add_separator()
-        context_menu.add_command(label="Выделить все", 
-                               command=lambda: self.widget_select_all(widget))
-        
-        # Привязываем меню к правой кнопке мыши
-        widget.bind("<Button-3>", lambda event: self.show_context_menu(event, context_menu))
-
-    def bind_shortcuts(self, widget):
-        """Привязывает горячие клавиши к виджету"""
-        # Альтернативный подход - используем привязку на уровне виджета
-        widget.bind('<Control-a>', self._select_all)
-        widget.bind('<Control-c>', self._copy)
-        widget.bind('<Control-v>', self._paste)
-        widget.bind('<Control-x>', self._cut)
-        
-        # Также привяжем комбинации с Shift
-        widget.bind('<Control-A>', self._select_all)
-        widget.bind('<Control-C>', self._copy)
-        widget.bind('<Control-V>', self._paste)
-        widget.bind('<Control-X>', self._cut)
-
-    def _select_all(self, event):
-        """Обработчик Ctrl+A"""
-        event.widget.tag_add('sel', '1.0', 'end')
-        return 'break'
-
-    def _copy(self, event):
-        """Обработчик Ctrl+C"""
-        try:
-            if event.widget.tag_ranges('sel'):
-                # Используем встроенную функциональность копирования
-                event.widget.event_generate('<<Copy>>')
-        except Exception:
-            pass
-        return 'break'
-
-    def _paste(self, event):
-        """Обработчик Ctrl+V"""
-        try:
-            # Используем встроенную функциональность вставки
-            event.widget.event_generate('<<Paste>>')
-        except Exception:
-            pass
-        return 'break'
-
-    def _cut(self, event):
-        """Обработчик Ctrl+X"""
-        try:
-            if event.widget.tag_ranges('sel'):
-                # Используем встроенную функциональность вырезания
-                event.widget.event_generate('<<Cut>>')
-        except Exception:
-            pass
-        return 'break'
-
-    def show_context_menu(self, event, menu):
-        """Показывает контекстное меню"""
-        try:
-            menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            menu.grab_release()
-
-    def widget_copy(self, widget):
-        """Копирует выделенный текст через меню"""
-        try:
-            if widget.tag_ranges('sel'):
-                widget.event_generate('<<Copy>>')
-        except Exception:
-            pass
-
-    def widget_paste(self, widget):
-        """Вставляет текст из буфера обмена через меню"""
-        try:
-            widget.event_generate('<<Paste>>')
-        except Exception:
-            pass
-
-    def widget_cut(self, widget):
-        """Вырезает выделенный текст через меню"""
-        try:
-            if widget.tag_ranges('sel'):
-                widget.event_generate('<<Cut>>')
-        except Exception:
-            pass
-
-    def widget_select_all(self, widget):
-        """Выделяет весь текст через меню"""
-        widget.tag_add('sel', '1.0', 'end')
-
-
-    def setup_examples_section(self, parent):
-        """Секция с примерами высказываний"""
-        examples_frame = ttk.LabelFrame(parent, text="Примеры высказываний", padding="5")
-        examples_frame.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(20, 0))
-        
-        examples = [
-            "Сократ — человек. Все люди смертны. Докажи, что Сократ смертен.",
-            "Все кошки — животные. Мурка — кошка. Докажи, что Мурка — животное.",
-            "Все честные люди говорят правду. Джон лжет. Докажи, что Джон не честный человек.",
-            "Все птицы летают. Пингвин не летает. Значит, пингвин не птица."
-        ]
-        
-        for i, example in enumerate(examples):
-            btn = ttk.Button(examples_frame, text=f"Пример {i+1}", 
-                           command=lambda ex=example: self.load_example(ex))
-            btn.grid(row=i//2, column=i%2, padx=5, pady=2, sticky=tk.W)
-    
-    def load_example(self, example):
-        """Загрузка примера в поле ввода"""
-        self.input_text.delete(1.0, tk.END)
-        self.input_text.insert(1.0, example)
-    
-    def clear_all(self):
-        """Очистка всех полей"""
-        self.input_text.delete(1.0, tk.END)
-        self.formulas_text.delete(1.0, tk.END)
-        self.proof_text.delete(1.0, tk.END)
-        self.explanation_text.delete(1.0, tk.END)
-        self.status_var.set("Готов к работе")
-    
-    def start_proof_process(self):
-        """Запуск процесса доказательства в отдельном потоке"""
-        user_input = self.input_text.get(1.0, tk.END).strip()
-        if not user_input:
-            messagebox.showwarning("Предупреждение", "Введите логическое высказывание")
-            return
-        
-        # Блокируем кнопку и запускаем прогресс
-        self.prove_button.config(state='disabled')
-        self.progress.start()
-        self.status_var.set("Начинаем доказательство...")
-        
-        # Запускаем в отдельном потоке
-        thread = threading.Thread(target=self.run_proof_process, args=(user_input,))
-        thread.daemon = True
-        thread.start()
-    
-    def run_proof_process(self, user_input):
-        """Основной процесс доказательства"""
-        try:
-            # Шаг 1: Формализация
-            self.update_status("Формализуем высказывание...")
-            formulas = self.formalizer.formalize_problem(user_input)
-            
-            # Обновляем UI в основном потоке
-            self.root.after(0, self.update_formulas_tab, formulas)
-            
-            if "Ошибка" in str(formulas[0]) or "Не удалось" in str(formulas[0]):
-                self.root.after(0, self.show_error, f"Ошибка формализации: {formulas[0]}")
-                return
-            
-            # Шаг 2: Доказательство методом резолюций
-            self.update_status("Применяем метод резолюций...")
-            success, proof_log = self.resolution_engine.prove(formulas)
-            
-            # Обновляем UI в основном потоке
-            self.root.after(0, self.update_proof_tab, success, proof_log)
-            
-            # Шаг 3: Генерация объяснения
-            self.update_status("Генерируем объяснение...")
-            explanation = self.generate_explanation(proof_log, success)
-            
-            # Обновляем UI в основном потоке
-            self.root.after(0, self.update_explanation_tab, explanation, success)
-            
-            self.update_status("Доказательство завершено!")
-            
-        except Exception as e:
-            self.root.after(0, self.show_error, f"Ошибка: {str(e)}")
-        finally:
-            # Восстанавливаем интерфейс
-            self.root.after(0, self.proof_complete)
-    
-    def update_status(self, message):
-        """Обновление статуса в основном потоке"""
-        self.root.after(0, lambda: self.status_var.set(message))
-    
-    def update_formulas_tab(self, formulas):
-        """Обновление вкладки с формулами"""
-        self.formulas_text.delete(1.0, tk.END)
-        if isinstance(formulas, list):
-            for i, formula in enumerate(formulas, 1):
-                self.formulas_text.insert(tk.END, f"{i}. {formula}\n")
-        else:
-            self.formulas_text.insert(tk.END, str(formulas))
-    
-    def update_proof_tab(self, success, proof_log):
-        """Обновление вкладки с доказательством"""
-        self.proof_text.delete(1.0, tk.END)
-        
-        if not proof_log:
-            self.proof_text.insert(tk.END, "Не удалось получить лог доказательства")
-            return
-        
-        result_text = "Доказательство успешно!\n\n" if success else "Доказательство не удалось\n\n"
-        self.proof_text.insert(tk.END, result_text)
-        
-        for step in proof_log:
-            step_type = step.get('type', 'unknown')
-            
-            if step_type == 'initial':
-                self.proof_text.insert(tk.END, "Исходные клаузы:\n")
-                for clause_info in step.get('clauses', []):
-                    self.proof_text.insert(tk.END, f"  {clause_info['id']}. {clause_info['clause']}\n")
-                self.proof_text.insert(tk.END, "\n")
-            
-            elif step_type == 'resolution_step':
-                clause1_id = step.get('clause1_id', '?')
-                clause2_id = step.get('clause2_id', '?')
-                resolvent_id = step.get('resolvent_id', '?')
-                resolvent = step.get('resolvent', '')
-                unification = step.get('unification', {})
-                
-                self.proof_text.insert(tk.END, f"Шаг {step.get('step', '?')}: Резолюция {clause1_id} и {clause2_id}\n")
-                self.proof_text.insert(tk.END, f"  Резольвента {resolvent_id}: {resolvent}\n")
-                if unification:
-                    self.proof_text.insert(tk.END, f"  Унификация: {unification}\n")
-                self.proof_text.insert(tk.END, "\n")
-            
-            elif step_type == 'contradiction_found':
-                clause_id = step.get('clause_id', '?')
-                parents = step.get('parents', [])
-                self.proof_text.insert(tk.END, f"НАЙДЕНА ПУСТАЯ КЛАУЗА {clause_id}!\n")
-                self.proof_text.insert(tk.END, f"Получена из клауз: {parents}\n")
-                self.proof_text.insert(tk.END, "ДОКАЗАТЕЛЬСТВО ЗАВЕРШЕНО - ПРОТИВОРЕЧИЕ!\n\n")
-            
-            elif step_type in ['no_new_clauses', 'timeout', 'error']:
-                self.proof_text.insert(tk.END, f"{step.get('message', '')}\n\n")
-    
-    def generate_explanation(self, proof_log, success):
-        """Генерация объяснения на основе полного лога доказательства"""
-        if not proof_log:
-            return "Не удалось сгенерировать объяснение для пустого лога доказательства"
-    
-        try:
-            explanation = self.explainer.explain_proof(
-                proof_log=proof_log,
-                success=success
-            )
-            return explanation
-        except Exception as e:
-            return f"Ошибка при генерации объяснения: {str(e)}"
-    
-    def update_explanation_tab(self, explanation, success):
-        """Обновление вкладки с объяснением"""
-        self.explanation_text.delete(1.0, tk.END)
-        
-        result_marker = "Доказано! " if success else "РЕЗУЛЬТАТ: "
-        self.explanation_text.insert(tk.END, result_marker)
-        
-        if explanation and "Ошибка" not in explanation:
-            self.explanation_text.insert(tk.END, explanation)
-        else:
-            default_explanation = """
-Доказательство методом резолюций основано на поиске противоречия в множестве формул. 
-Мы последовательно применяем правило резолюции к парам формул, пытаясь вывести пустую клаузу (□). 
-Нахождение пустой клаузы означает, что исходное предположение ведет к противоречию, 
-что доказывает истинность доказываемого утверждения.
-            """
-            self.explanation_text.insert(tk.END, default_explanation.strip())
-    
-    def proof_complete(self):
-        """Завершение процесса доказательства"""
-        self.progress.stop()
-        self.prove_button.config(state='normal')
-    
-    def show_error(self, message):
-        """Показать сообщение об ошибке"""
-        messagebox.showerror("Ошибка", message)
-        self.proof_complete()
-        self.status_var.set("Ошибка при выполнении")
-
-def main():
-    """Запуск приложения"""
-    root = tk.Tk()
-    app = LogicProofApp(root)
-    root.mainloop()
-
-if __name__ == "__main__":
+import tkinter as tk
+from tkinter import ttk, scrolledtext, messagebox
+import threading
+import os
+from logic_formalizer import LogicFormalizer
+from resolution_engine import ResolutionEngine
+from proof_explainer import ProofExplainer
+from disk_cache import DiskCache
+from tracing import tracer
+from deadline import Deadline
+from ollama_client import ModelWarmer, WARMUP_IDLE, WARMUP_LOADING, WARMUP_READY, WARMUP_UNAVAILABLE
+
+# Каталог для пользовательских данных приложения (кэши)
+APP_DATA_DIR = os.path.join(os.path.expanduser("~"), ".logic_proof_app")
+
+# Срок хранения результатов формализации (30 дней): модель на сервере может обновиться
+FORMALIZATION_CACHE_MAX_AGE = 30 * 24 * 3600
+
+# Файл трасс запросов (по одному интервалу на строку)
+TRACE_FILE = os.path.join(APP_DATA_DIR, "traces.jsonl")
+
+# Этапы запроса, показываемые в строке статуса
+STAGE_SPANS = (
+    ("формализация", "formalizer.formalize_problem"),
+    ("доказательство", "engine.prove"),
+    ("объяснение", "explainer.explain_proof"),
+)
+
+# Простой (в секундах), после которого модель перестает удерживаться в памяти сервера
+MODEL_IDLE_TIMEOUT = 30 * 60
+
+# Срок выполнения одного запроса (формализация, доказательство и объяснение), в секундах
+REQUEST_BUDGET = 180
+
+# Состояние модели в строке статуса
+MODEL_STATUS_TEXT = {
+    WARMUP_LOADING: "Модель: загружается...",
+    WARMUP_READY: "Модель: готова",
+    WARMUP_UNAVAILABLE: "Модель: сервер недоступен",
+    WARMUP_IDLE: "Модель: выгружается после простоя",
+}
+
+class LogicProofApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Система логического доказательства")
+        self.root.geometry("900x700")
+        
+        # Инициализация компонентов
+        self.formalization_cache = DiskCache(os.path.join(APP_DATA_DIR, "formalization_cache.sqlite"),
+                                             max_entries=1000,
+                                             max_age=FORMALIZATION_CACHE_MAX_AGE)
+        self.formalizer = LogicFormalizer(cache=self.formalization_cache, repair_rounds=2)
+        self.proof_cache = DiskCache(os.path.join(APP_DATA_DIR, "proof_cache.sqlite"),
+                                     max_entries=500)
+        self.resolution_engine = ResolutionEngine(cache=self.proof_cache)
+        self.explainer = ProofExplainer()
+        
+        self.setup_ui()
+
+        # Фоновая загрузка модели: первый запрос не ждет ее загрузки
+        self.model_warmer = ModelWarmer(
+            self.formalizer.client, self.formalizer.model_name,
+            on_state=lambda state: self.root.after(0, self.update_model_status, state),
+            idle_timeout=MODEL_IDLE_TIMEOUT)
+        self.model_warmer.start()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def setup_ui(self):
+        """Создание интерфейса"""
+        # Основной фрейм
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Настройка весов для растягивания
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        
+        # Заголовок
+        title_label = ttk.Label(main_frame, 
+                               text="Система логического доказательства методом резолюций",
+                               font=("Arial", 14, "bold"))
+        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
+        
+        # Ввод логического высказывания
+        ttk.Label(main_frame, text="Введите логическое высказывание:").grid(row=1, column=0, sticky=tk.W, pady=(0, 5))
+        
+        self.input_text = scrolledtext.ScrolledText(main_frame, height=4, width=80)
+        self.input_text.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+
+        # Кнопки управления
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=3, column=0, columnspan=2, pady=(0, 20))
+        
+        self.prove_button = ttk.Button(button_frame, text="Доказать высказывание", 
+                                      command=self.start_proof_process)
+        self.prove_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.clear_button = ttk.Button(button_frame, text="Очистить", 
+                                      command=self.clear_all)
+        self.clear_button.pack(side=tk.LEFT)
+        
+        # Прогресс бар
+        self.progress = ttk.Progressbar(main_frame, mode='indeterminate')
+        self.progress.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 20))
+        
+        # Создаем Notebook для вкладок
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Вкладка 1: Формализованные формулы
+        self.formulas_frame = ttk.Frame(self.notebook, padding="5")
+        self.notebook.add(self.formulas_frame, text="Формализованные формулы")
+        
+        ttk.Label(self.formulas_frame, text="Формулы логики предикатов:").pack(anchor=tk.W)
+        self.formulas_text = scrolledtext.ScrolledText(self.formulas_frame, height=6)
+        self.formulas_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        
+        # Вкладка 2: Детали доказательства
+        self.proof_frame = ttk.Frame(self.notebook, padding="5")
+        self.notebook.add(self.proof_frame, text="Детали доказательства")
+        
+        ttk.Label(self.proof_frame, text="Пошаговое доказательство:").pack(anchor=tk.W)
+        self.proof_text = scrolledtext.ScrolledText(self.proof_frame, height=8)
+        self.proof_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        
+        # Вкладка 3: Объяснение
+        self.explanation_frame = ttk.Frame(self.notebook, padding="5")
+        self.notebook.add(self.explanation_frame, text="Объяснение")
+        
+        ttk.Label(self.explanation_frame, text="Объяснение доказательства простым языком:").pack(anchor=tk.W)
+        self.explanation_text = scrolledtext.ScrolledText(self.explanation_frame, height=6)
+        self.explanation_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        
+        # Статус бар: состояние запроса и готовность модели
+        status_frame = ttk.Frame(main_frame)
+        status_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        self.status_var = tk.StringVar(value="Готов к работе")
+        status_bar = ttk.Label(status_frame, textvariable=self.status_var, relief=tk.SUNKEN)
+        status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.model_status_var = tk.StringVar(value=MODEL_STATUS_TEXT[WARMUP_LOADING])
+        model_status_bar = ttk.Label(status_frame, textvariable=self.model_status_var, relief=tk.SUNKEN)
+        model_status_bar.pack(side=tk.RIGHT, padx=(5, 0))
+        
+        # Примеры высказываний
+        self.setup_examples_section(main_frame)
+
+        self.setup_text_shortcuts()
+    
+
+    def setup_text_shortcuts(self):
+        """Настраивает горячие клавиши и контекстные меню для всех текстовых полей"""
+        widgets = [self.input_text, self.formulas_text, self.proof_text, self.explanation_text]
+        
+        for widget in widgets:
+            self.add_context_menu(widget)
+            self.bind_shortcuts(widget)
+
+    def add_context_menu(self, widget):
+        """Добавляет контекстное меню для текстового поля"""
+        context_menu = tk.Menu(widget, tearoff=0)
+        context_menu.add_command(label="Копировать", 
+                               command=lambda: self.widget_copy(widget))
+        context_menu.add_command(label="Вставить", 
+                               command=lambda: self.widget_paste(widget))
+        context_menu.add_command(label="Вырезать", 
+                               command=lambda: self.widget_cut(widget))
+        context_menu.add_separator()
+        context_menu.add_command(label="Выделить все", 
+                               command=lambda: self.widget_select_all(widget))
+        
+        # Привязываем меню к правой кнопке мыши
+        widget.bind("<Button-3>", lambda event: self.show_context_menu(event, context_menu))
+
+    def bind_shortcuts(self, widget):
+        """Привязывает горячие клавиши к виджету"""
+        # Альтернативный подход - используем привязку на уровне виджета
+        widget.bind('<Control-a>', self._select_all)
+        widget.bind('<Control-c>', self._copy)
+        widget.bind('<Control-v>', self._paste)
+        widget.bind('<Control-x>', self._cut)
+        
+        # Также привяжем комбинации с Shift
+        widget.bind('<Control-A>', self._select_all)
+        widget.bind('<Control-C>', self._copy)
+        widget.bind('<Control-V>', self._paste)
+        widget.bind('<Control-X>', self._cut)
+
+    def _select_all(self, event):
+        """Обработчик Ctrl+A"""
+        event.widget.tag_add('sel', '1.0', 'end')
+        return 'break'
+
+    def _copy(self, event):
+        """Обработчик Ctrl+C"""
+        try:
+            if event.widget.tag_ranges('sel'):
+                # Используем встроенную функциональность копирования
+                event.widget.event_generate('<<Copy>>')
+        except Exception:
+            pass
+        return 'break'
+
+    def _paste(self, event):
+        """Обработчик Ctrl+V"""
+        try:
+            # Используем встроенную функциональность вставки
+            event.widget.event_generate('<<Paste>>')
+        except Exception:
+            pass
+        return 'break'
+
+    def _cut(self, event):
+        """Обработчик Ctrl+X"""
+        try:
+            if event.widget.tag_ranges('sel'):
+                # Используем встроенную функциональность вырезания
+                event.widget.event_generate('<<Cut>>')
+        except Exception:
+            pass
+        return 'break'
+
+    def show_context_menu(self, event, menu):
+        """Показывает контекстное меню"""
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+
+    def widget_copy(self, widget):
+        """Копирует выделенный текст через меню"""
+        try:
+            if widget.tag_ranges('sel'):
+                widget.event_generate('<<Copy>>')
+        except Exception:
+            pass
+
+    def widget_paste(self, widget):
+        """Вставляет текст из буфера обмена через меню"""
+        try:
+            widget.event_generate('<<Paste>>')
+        except Exception:
+            pass
+
+    def widget_cut(self, widget):
+        """Вырезает выделенный текст через меню"""
+        try:
+            if widget.tag_ranges('sel'):
+                widget.event_generate('<<Cut>>')
+        except Exception:
+            pass
+
+    def widget_select_all(self, widget):
+        """Выделяет весь текст через меню"""
+        widget.tag_add('sel', '1.0', 'end')
+
+
+    def setup_examples_section(self, parent):
+        """Секция с примерами высказываний"""
+        examples_frame = ttk.LabelFrame(parent, text="Примеры высказываний", padding="5")
+        examples_frame.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(20, 0))
+        
+        examples = [
+            "Сократ — человек. Все люди смертны. Докажи, что Сократ смертен.",
+            "Все кошки — животные. Мурка — кошка. Докажи, что Мурка — животное.",
+            "Все честные люди говорят правду. Джон лжет. Докажи, что Джон не честный человек.",
+            "Все птицы летают. Пингвин не летает. Значит, пингвин не птица."
+        ]
+        
+        for i, example in enumerate(examples):
+            btn = ttk.Button(examples_frame, text=f"Пример {i+1}", 
+                           command=lambda ex=example: self.load_example(ex))
+            btn.grid(row=i//2, column=i%2, padx=5, pady=2, sticky=tk.W)
+    
+    def load_example(self, example):
+        """Загрузка примера в поле ввода"""
+        self.input_text.delete(1.0, tk.END)
+        self.input_text.insert(1.0, example)
+    
+    def clear_all(self):
+        """Очистка всех полей"""
+        self.input_text.delete(1.0, tk.END)
+        self.formulas_text.delete(1.0, tk.END)
+        self.proof_text.delete(1.0, tk.END)
+        self.explanation_text.delete(1.0, tk.END)
+        self.status_var.set("Готов к работе")
+    
+    def start_proof_process(self):
+        """Запуск процесса доказательства в отдельном потоке"""
+        user_input = self.input_text.get(1.0, tk.END).strip()
+        if not user_input:
+            messagebox.showwarning("Предупреждение", "Введите логическое высказывание")
+            return
+        
+        # Приложение используется - модель продолжает удерживаться в памяти
+        self.model_warmer.touch()
+
+        # Блокируем кнопку и запускаем прогресс
+        self.prove_button.config(state='disabled')
+        self.progress.start()
+        self.status_var.set("Начинаем доказательство...")
+        
+        # Запускаем в отдельном потоке
+        thread = threading.Thread(target=self.run_proof_process, args=(user_input,))
+        thread.daemon = True
+        thread.start()
+    
+    def run_proof_process(self, user_input):
+        """Основной процесс доказательства"""
+        with tracer.span("gui.request", input_length=len(user_input)) as request_span:
+            deadline = Deadline(REQUEST_BUDGET)
+            try:
+                # Шаг 1: Формализация
+                self.update_status("Формализуем высказывание...")
+                self.root.after(0, self.formulas_text.delete, 1.0, tk.END)
+                formulas = self.formalizer.formalize_problem(
+                    user_input,
+                    on_formula=lambda formula: self.root.after(0, self.append_formula, formula),
+                    deadline=deadline)
+
+                # Обновляем UI в основном потоке
+                self.root.after(0, self.traced_render, request_span, "gui.render_formulas",
+                                self.update_formulas_tab, formulas)
+
+                if "Ошибка" in str(formulas[0]) or "Не удалось" in str(formulas[0]):
+                    self.root.after(0, self.show_error, f"Ошибка формализации: {formulas[0]}")
+                    return
+
+                # Шаг 2: Доказательство методом резолюций
+                self.update_status("Применяем метод резолюций...")
+                success, proof_log = self.resolution_engine.prove(
+                    self.formalizer.last_clauses, signature=self.formalizer.last_signature,
+                    deadline=deadline)
+
+                # Обновляем UI в основном потоке
+                self.root.after(0, self.traced_render, request_span, "gui.render_proof",
+                                self.update_proof_tab, success, proof_log)
+
+                # Шаг 3: Генерация объяснения
+                self.update_status("Генерируем объяснение...")
+                explanation = self.generate_explanation(proof_log, success, deadline)
+
+                # Обновляем UI в основном потоке
+                self.root.after(0, self.traced_render, request_span, "gui.render_explanation",
+                                self.update_explanation_tab, explanation, success)
+
+                self.update_status(f"Доказательство завершено! {self.format_stage_times(request_span)}")
+
+            except Exception as e:
+                self.root.after(0, self.show_error, f"Ошибка: {str(e)}")
+            finally:
+                # Восстанавливаем интерфейс
+                self.root.after(0, self.proof_complete)
+                # Трасса записывается после отрисовки всех вкладок
+                self.root.after(0, self.save_trace, request_span)
+
+    def traced_render(self, request_span, name, callback, *args):
+        """Выполнение обновления вкладки внутри интервала трассировки запроса"""
+        with tracer.span(name, parent=request_span):
+            callback(*args)
+
+    def format_stage_times(self, request_span):
+        """Длительности этапов запроса для строки статуса"""
+        if not tracer.enabled:
+            return ""
+        summary = tracer.summary(request_span.trace_id)
+        parts = [f"{label} {summary[name]['total']:.1f} с"
+                 for label, name in STAGE_SPANS if name in summary]
+        return f"({', '.join(parts)})" if parts else ""
+
+    def save_trace(self, request_span):
+        """Дописывание трассы запроса в файл TRACE_FILE"""
+        if not tracer.enabled:
+            return
+        try:
+            tracer.export_jsonl(TRACE_FILE, request_span.trace_id)
+        except OSError:
+            # Трасса вспомогательная: ошибка записи не должна мешать работе
+            pass
+
+    def update_status(self, message):
+        """Обновление статуса в основном потоке"""
+        self.root.after(0, lambda: self.status_var.set(message))
+
+    def update_model_status(self, state):
+        """Обновление готовности модели в строке статуса"""
+        text = MODEL_STATUS_TEXT.get(state, "")
+        if state == WARMUP_READY and self.model_warmer.load_time is not None:
+            text += f" (загрузка {self.model_warmer.load_time:.1f} с)"
+        self.model_status_var.set(text)
+
+    def on_close(self):
+        """Закрытие окна: продление удержания модели прекращается"""
+        self.model_warmer.stop()
+        self.root.destroy()
+    
+    def append_formula(self, formula):
+        """Добавление формулы на вкладку по мере получения от модели"""
+        number = int(self.formulas_text.index("end-1c").split(".")[0])
+        self.formulas_text.insert(tk.END, f"{number}. {formula}\n")
+
+    def update_formulas_tab(self, formulas):
+        """Обновление вкладки с формулами"""
+        self.formulas_text.delete(1.0, tk.END)
+        if isinstance(formulas, list):
+            for i, formula in enumerate(formulas, 1):
+                self.formulas_text.insert(tk.END, f"{i}. {formula}\n")
+        else:
+            self.formulas_text.insert(tk.END, str(formulas))
+    
+    def update_proof_tab(self, success, proof_log):
+        """Обновление вкладки с доказательством"""
+        self.proof_text.delete(1.0, tk.END)
+        
+        if not proof_log:
+            self.proof_text.insert(tk.END, "Не удалось получить лог доказательства")
+            return
+        
+        result_text = "Доказательство успешно!\n\n" if success else "Доказательство не удалось\n\n"
+        self.proof_text.insert(tk.END, result_text)
+        
+        for step in proof_log:
+            step_type = step.get('type', 'unknown')
+            
+            if step_type == 'initial':
+                self.proof_text.insert(tk.END, "Исходные клаузы:\n")
+                for clause_info in step.get('clauses', []):
+                    self.proof_text.insert(tk.END, f"  {clause_info['id']}. {clause_info['clause']}\n")
+                self.proof_text.insert(tk.END, "\n")
+            
+            elif step_type == 'resolution_step':
+                clause1_id = step.get('clause1_id', '?')
+                clause2_id = step.get('clause2_id', '?')
+                resolvent_id = step.get('resolvent_id', '?')
+                resolvent = step.get('resolvent', '')
+                unification = step.get('unification', {})
+                
+                self.proof_text.insert(tk.END, f"Шаг {step.get('step', '?')}: Резолюция {clause1_id} и {clause2_id}\n")
+                self.proof_text.insert(tk.END, f"  Резольвента {resolvent_id}: {resolvent}\n")
+                if unification:
+                    self.proof_text.insert(tk.END, f"  Унификация: {unification}\n")
+                self.proof_text.insert(tk.END, "\n")
+            
+            elif step_type == 'contradiction_found':
+                clause_id = step.get('clause_id', '?')
+                parents = step.get('parents', [])
+                self.proof_text.insert(tk.END, f"НАЙДЕНА ПУСТАЯ КЛАУЗА {clause_id}!\n")
+                self.proof_text.insert(tk.END, f"Получена из клауз: {parents}\n")
+                self.proof_text.insert(tk.END, "ДОКАЗАТЕЛЬСТВО ЗАВЕРШЕНО - ПРОТИВОРЕЧИЕ!\n\n")
+            
+            elif step_type in ['no_new_clauses', 'timeout', 'error', 'clauses_evicted']:
+                self.proof_text.insert(tk.END, f"{step.get('message', '')}\n\n")
+    
+    def generate_explanation(self, proof_log, success, deadline=None):
+        """Генерация объяснения на основе полного лога доказательства"""
+        if not proof_log:
+            return "Не удалось сгенерировать объяснение для пустого лога доказательства"
+    
+        try:
+            explanation = self.explainer.explain_proof(
+                proof_log=proof_log,
+                success=success,
+                deadline=deadline
+            )
+            return explanation
+        except Exception as e:
+            return f"Ошибка при генерации объяснения: {str(e)}"
+    
+    def update_explanation_tab(self, explanation, success):
+        """Обновление вкладки с объяснением"""
+        self.explanation_text.delete(1.0, tk.END)
+        
+        result_marker = "Доказано! " if success else "РЕЗУЛЬТАТ: "
+        self.explanation_text.insert(tk.END, result_marker)
+        
+        if explanation and "Ошибка" not in explanation:
+            self.explanation_text.insert(tk.END, explanation)
+        else:
+            default_explanation = """
+Доказательство методом резолюций основано на поиске противоречия в множестве формул. 
+Мы последовательно применяем правило резолюции к парам формул, пытаясь вывести пустую клаузу (□). 
+Нахождение пустой клаузы означает, что исходное предположение ведет к противоречию, 
+что доказывает истинность доказываемого утверждения.
+            """
+            self.explanation_text.insert(tk.END, default_explanation.strip())
+    
+    def proof_complete(self):
+        """Завершение процесса доказательства"""
+        self.progress.stop()
+        self.prove_button.config(state='normal')
+    
+    def show_error(self, message):
+        """Показать сообщение об ошибке"""
+        messagebox.showerror("Ошибка", message)
+        self.proof_complete()
+        self.status_var.set("Ошибка при выполнении")
+
+def main():
+    """Запуск приложения"""
+    root = tk.Tk()
+    app = LogicProofApp(root)
+    root.mainloop()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
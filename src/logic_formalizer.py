@@ -1,406 +1,1090 @@
-"""
-Модуль для формализации текстовых задач в логику предикатов первого порядка.
-Использует языковую модель Ollama для преобразования естественно-языковых описаний
-в формальные логические выражения, готовые для применения метода резолюций.
-"""
-
-import subprocess
-import re
-import os
-from typing import List
-
-
-class LogicFormalizer:
-    """
-    Класс для преобразования текстовых задач в формальные логические выражения.
-    
-    Использует языковую модель для выполнения последовательных преобразований:
-    1. Предваренная нормальная форма (ПНФ)
-    2. Сколемовская нормальная форма (СНФ) 
-    3. Удаление кванторов всеобщности
-    4. Конъюнктивная нормальная форма (КНФ)
-    5. Разделение на дизъюнкты
-    
-    Атрибуты:
-        model_name (str): Название модели Ollama для использования
-    """
-
-    def __init__(self, model_name: str = "deepseek-v3.1:671b-cloud"):
-        """
-        Инициализация формализатора логики.
-        
-        Args:
-            model_name: Название модели Ollama для использования.
-                      По умолчанию "deepseek-v3.1:671b-cloud"
-        """
-        self.model_name = model_name
-
-    def formalize_problem(self, user_input: str) -> List[str]:
-        """
-        Основной метод для преобразования текстовой задачи в логические формулы.
-        
-        Args:
-            user_input: Текстовое описание логической задачи на естественном языке
-        
-        Returns:
-            List[str]: Список дизъюнктов в формате логики предикатов
-        
-        Пример:
-            >>> formalizer = LogicFormalizer()
-            >>> formulas = formalizer.formalize_problem("Сократ человек. Все люди смертны.")
-            >>> print(formulas)
-            ['Человек(Сократ)', '¬Человек(x) ∨ Смертен(x)']
-        """
-        prompt = self._build_prompt(user_input)
-
-        try:
-            # Шаг 1: Запуск языковой модели через Ollama
-            raw_output = self._run_ollama_model(prompt)
-
-            # Шаг 2: Очистка и извлечение формул из вывода модели
-            formulas = self._extract_formulas(raw_output)
-
-            return formulas
-
-        except subprocess.TimeoutExpired:
-            return ["Таймаут запроса к модели"]
-        except Exception as e:
-            return [f"Ошибка выполнения: {str(e)}"]
-
-    def _build_prompt(self, user_input: str) -> str:
-        """
-        Создает промпт для языковой модели с инструкциями по преобразованию.
-        
-        Args:
-            user_input: Исходная текстовая задача от пользователя
-        
-        Returns:
-            str: Форматированный промпт с инструкциями и примером
-        """
-        prompt_template = """
-Ты — экспертный ассистент по формальной логике. 
-Твоя задача — преобразовать текстовое описание задачи в набор дизъюнктов логики предикатов, готовых для применения метода резолюций.
-
-**ОБЯЗАТЕЛЬНЫЕ ПРАВИЛА ПРЕОБРАЗОВАНИЯ (выполняй строго по порядку):**
-
-1. **ПНФ (Предваренная нормальная форма):**
-   - Исключи логические связки: P → Q = ¬P ∨ Q
-   - Примени законы де Моргана: ¬(F ∨ G) = ¬F ∧ ¬G; ¬(F ∧ G) = ¬F ∨ ¬G
-   - Отрицание кванторов: ¬∀x F(x) = ∃x ¬F(x); ¬∃x F(x) = ∀x ¬F(x)
-   - Вынеси все кванторы в начало формулы
-
-2. **СНФ (Сколемовская нормальная форма):**
-   - Замени ∃x на константы (a, b, c...) если перед ним нет ∀
-   - Замени ∃y на функции f(x), g(x)... если перед ним есть ∀x
-   - Удали все кванторы существования после замены
-
-3. **Удали все кванторы всеобщности ∀** (они подразумеваются)
-
-4. **Преобразуй в КНФ:**
-   - Приведи к конъюнкции дизъюнктов
-   - Используй дистрибутивность: F ∨ (G ∧ H) = (F ∨ G) ∧ (F ∨ H)
-
-5. **Раздели на дизъюнкты:** Разбей конъюнкцию на отдельные дизъюнкты
-
-**ДЛЯ ТРАНЗИТИВНОСТИ (обязательно добавляй):**
-Если в задаче есть цепочка отношений (старше, больше, меньше и т.д.):
-- Добавь явно аксиому транзитивности: ¬Старше(x,y) ∨ ¬Старше(y,z) ∨ Старше(x,z)
-- Добавь отрицание цели как отдельный дизъюнкт
-
-**СТРОГИЕ ПРАВИЛА ВЫВОДА:**
-1. Выводи ТОЛЬКО готовые дизъюнкты
-2. НИКАКИХ комментариев, пояснений, шагов преобразования
-3. НИКАКИХ кванторов ∀, ∃ в выводе
-4. НИКАКИХ шагов преобразования в выводе  
-5. НИКАКИХ комментариев, только дизъюнкты
-
-**КОНКРЕТНЫЕ ПРИМЕРЫ:**
-Вход: "Маша старше Кати, а Катя старше Лены. Докажи, что Маша старше Лены."
-Выход: Старше(Маша,Катя), Старше(Катя,Лена), ¬Старше(x,y) ∨ ¬Старше(y,z) ∨ Старше(x,z), ¬Старше(Маша,Лена)
-
-Вход: "Сократ — человек. Все люди смертны. Докажи, что Сократ смертен."
-Выход: Человек(Сократ), ¬Человек(x) ∨ Смертен(x), ¬Смертен(Сократ)
-
-Вход: "Каждый студент сдал экзамен. Иван — студент."
-Выход: ¬Студент(x) ∨ СдалЭкзамен(x), Студент(Иван)
-
-**КОНКРЕТНЫЕ УКАЗАНИЯ:**
-- Для сколемовских функций используй: f, g, h
-- Для сколемовских констант используй: a, b, c  
-- Все переменные в итоговых дизъюнктах считаются всеобщими
-- Отрицание цели всегда добавляй как отдельный дизъюнкт
-- Разделяй конъюнкции на отдельные дизъюнкты
-
-Теперь преобразуй следующую задачу: {user_input}
-"""
-
-        return prompt_template.format(user_input=user_input)
-
-    def _run_ollama_model(self, prompt: str) -> str:
-        """
-        Запускает модель Ollama с заданным промптом и возвращает результат.
-        
-        Args:
-            prompt: Текст промпта для модели
-        
-        Returns:
-            str: Сырой вывод от модели Ollama
-        
-        Raises:
-            subprocess.TimeoutExpired: Если выполнение занимает больше 120 секунд
-            Exception: При других ошибках выполнения подпроцесса
-        """
-        # Определение пути к исполняемому файлу Ollama в Windows
-        ollama_executable_path = os.path.join(
-            os.environ["LOCALAPPDATA"],
-            "Programs", "Ollama", "ollama.exe"
-        )
-
-        # Проверка существования файла Ollama
-        if not os.path.exists(ollama_executable_path):
-            raise FileNotFoundError(f"Ollama не найден по пути: {ollama_executable_path}")
-            
-        if os.name == 'nt':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = 0
-            kwargs = {
-                'startupinfo': startupinfo,
-                'creationflags': subprocess.CREATE_NO_WINDOW
-            }
-        else:
-            kwargs = {}
-
-        # Запуск процесса Ollama
-        process_result = subprocess.run([
-            ollama_executable_path,
-            "run",
-            self.model_name,
-            prompt
-        ], 
-        capture_output=True, 
-        text=True, 
-        timeout=120,  # Таймаут 2 минуты
-        encoding='utf-8',
-        **kwargs 
-        )
-
-        # Проверка успешности выполнения
-        if process_result.returncode == 0:
-            return process_result.stdout.strip()
-        else:
-            error_message = f"Ошибка модели (код {process_result.returncode}): {process_result.stderr}"
-            raise RuntimeError(error_message)
-
-    def _extract_formulas(self, raw_output: str) -> List[str]:
-        """
-        Извлекает и очищает логические формулы из вывода модели.
-        
-        Args:
-            raw_output: Сырой текст вывода от языковой модели
-        
-        Returns:
-            List[str]: Список очищенных логических формул
-        """
-        # Шаг 1: Удаление служебных сообщений модели
-        cleaned_output = self._remove_model_artifacts(raw_output)
-
-        # Шаг 2: Поиск строк с формулами
-        formula_lines = self._find_formula_lines(cleaned_output)
-
-        # Шаг 3: Извлечение и валидация формул
-        formulas = self._parse_formulas(formula_lines)
-
-        return formulas if formulas else ["Не удалось извлечь валидные формулы"]
-
-    def _remove_model_artifacts(self, text: str) -> str:
-        """
-        Удаляет служебные сообщения и артефакты из вывода модели.
-        
-        Args:
-            text: Исходный текст вывода модели
-        
-        Returns:
-            str: Очищенный текст
-        """
-        # Удаление сообщений о "размышлении" модели
-        cleaned_text = re.sub(
-            r'Thinking\.\.\..*?\.\.\.done thinking\.', 
-            '', 
-            text, 
-            flags=re.DOTALL
-        )
-
-        # Удаление лишних пробелов и пустых строк
-        cleaned_text = re.sub(r'\n\s*\n', '\n', cleaned_text)
-        cleaned_text = cleaned_text.strip()
-
-        return cleaned_text
-
-    def _find_formula_lines(self, text: str) -> List[str]:
-        """
-        Находит строки, содержащие логические формулы.
-        
-        Args:
-            text: Очищенный текст для анализа
-        
-        Returns:
-            List[str]: Список строк, потенциально содержащих формулы
-        """
-        formula_lines = []
-        lines = text.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Признаки логических формул:
-            # - Содержат скобки (предикаты с аргументами)
-            # - Содержат логические операторы (∨, ¬)
-            # - Не содержат служебных слов
-            if (('(' in line and ')' in line) or 
-                any(logic_symbol in line for logic_symbol in ['∨', '¬', '∧'])):
-                formula_lines.append(line)
-
-        return formula_lines
-
-    def _parse_formulas(self, formula_lines: List[str]) -> List[str]:
-        """
-        Парсит строки и извлекает из них валидные логические формулы.
-        """
-        all_formulas = []
-
-        for line in formula_lines:
-            # Умное разделение строки на формулы
-            potential_formulas = self._smart_split(line)
-            
-            # Фильтрация и валидация формул
-            valid_formulas = [
-                formula for formula in potential_formulas 
-                if self._is_valid_formula(formula)
-            ]
-            
-            all_formulas.extend(valid_formulas)
-
-        return all_formulas
-
-    def _smart_split(self, line: str) -> List[str]:
-        """
-        Умное разделение строки на формулы, учитывая вложенные структуры.
-        """
-        formulas = []
-        current = ""
-        paren_depth = 0
-        
-        for char in line:
-            if char == '(':
-                paren_depth += 1
-                current += char
-            elif char == ')':
-                paren_depth -= 1
-                current += char
-            elif char == ',' and paren_depth == 0:
-                # Запятая на верхнем уровне - разделитель формул
-                if current.strip():
-                    formulas.append(current.strip())
-                current = ""
-            else:
-                current += char
-        
-        # Добавляем последнюю формулу
-        if current.strip():
-            formulas.append(current.strip())
-        
-        return formulas
-
-    def _is_valid_formula(self, formula: str) -> bool:
-        """
-        Проверяет, является ли строка валидной логической формулой.
-        
-        Критерии валидности:
-        - Содержит открывающую и закрывающую скобки
-        - Имеет осмысленную структуру предиката
-        - Не содержит явно нелогических конструкций
-        
-        Args:
-            formula: Строка для проверки
-        
-        Returns:
-            bool: True если строка является валидной формулой
-        """
-        # Базовые проверки
-        if not formula or len(formula) < 3:
-            return False
-
-        # Должна содержать парные скобки для аргументов предиката
-        if '(' not in formula or ')' not in formula:
-            return False
-
-        # Проверка баланса скобок
-        if formula.count('(') != formula.count(')'):
-            return False
-
-        # Проверка порядка скобок
-        open_bracket_pos = formula.find('(')
-        close_bracket_pos = formula.find(')')
-        if open_bracket_pos > close_bracket_pos:
-            return False
-
-        # Дополнительные проверки для сложных формул
-        if '∨' in formula or '¬' in formula:
-            return self._validate_complex_formula(formula)
-
-        return True
-
-    def _validate_complex_formula(self, formula: str) -> bool:
-        """
-        Выполняет дополнительную валидацию для сложных формул с операторами.
-        """
-        try:
-            # Проверка на наличие недопустимых символов
-            invalid_chars = ['{', '}', '[', ']', '<', '>', ';', '"', "'"]
-            if any(char in formula for char in invalid_chars):
-                return False
-
-            # Для дизъюнкций проверяем только общую структуру
-            if '∨' in formula:
-                parts = formula.split('∨')
-                if len(parts) < 2:
-                    return False
-                if not any(self._is_valid_literal(part.strip()) for part in parts):
-                    return False
-
-            return True
-
-        except Exception:
-            return False
-
-    def _is_valid_literal(self, literal: str) -> bool:
-        """
-        Проверяет валидность отдельного литерала (предиката с аргументами).
-        
-        Args:
-            literal: Строка литерала для проверки
-        
-        Returns:
-            bool: True если литерал корректен
-        """
-        literal = literal.strip()
-
-        # Обработка отрицания
-        if literal.startswith('¬'):
-            literal = literal[1:].strip()
-
-        # Проверка наличия предиката и аргументов
-        if '(' not in literal or not literal.endswith(')'):
-            return False
-
-        # Извлечение имени предиката
-        predicate_name = literal.split('(')[0].strip()
-        if not predicate_name or not predicate_name[0].isalpha():
-            return False
-
-        return True
-
-
+"""
+Модуль для формализации текстовых задач в логику предикатов первого порядка.
+Использует языковую модель Ollama для преобразования естественно-языковых описаний
+в формальные логические выражения, готовые для применения метода резолюций.
+"""
+
+import subprocess
+import re
+import os
+import json
+import zlib
+import hashlib
+import threading
+import unicodedata
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .tracing import tracer
+    from .disk_cache import DiskCache
+    from .clause_parser import (ClauseDiagnostic, ClauseScanner, Literal, ParsedClause, Term,
+                                parse_clause, render_clause)
+    from .clausifier import (CLAUSIFIER_VERSION, DEFAULT_DEFINITION_THRESHOLD, And, Clausifier,
+                             Formula, FormulaSyntaxError, Not, parse_formula)
+    from .signature import Signature, SignatureError
+    from .deadline import Deadline, DeadlineExceeded, NO_DEADLINE
+    from .ollama_client import OllamaClient, OllamaTimeoutError, OllamaUnavailableError, default_client
+except ImportError:
+    from tracing import tracer
+    from disk_cache import DiskCache
+    from clause_parser import (ClauseDiagnostic, ClauseScanner, Literal, ParsedClause, Term,
+                               parse_clause, render_clause)
+    from clausifier import (CLAUSIFIER_VERSION, DEFAULT_DEFINITION_THRESHOLD, And, Clausifier,
+                            Formula, FormulaSyntaxError, Not, parse_formula)
+    from signature import Signature, SignatureError
+    from deadline import Deadline, DeadlineExceeded, NO_DEADLINE
+    from ollama_client import OllamaClient, OllamaTimeoutError, OllamaUnavailableError, default_client
+
+
+class LogicFormalizer:
+    """
+    Класс для преобразования текстовых задач в формальные логические выражения.
+    
+    Использует языковую модель для выполнения последовательных преобразований:
+    1. Предваренная нормальная форма (ПНФ)
+    2. Сколемовская нормальная форма (СНФ) 
+    3. Удаление кванторов всеобщности
+    4. Конъюнктивная нормальная форма (КНФ)
+    5. Разделение на дизъюнкты
+    
+    Атрибуты:
+        model_name (str): Название модели Ollama для использования
+        client (OllamaClient): Клиент REST API сервера Ollama
+        cache (Optional[DiskCache]): Кэш результатов формализации
+        fol_mode (bool): Модель переводит задачу в формулы первого порядка,
+            а нормальные формы строятся локально (clausifier.py)
+        split_sentences (bool): Формализовать предложения задачи по отдельности
+        max_workers (int): Максимальное число одновременных запросов к модели
+            при пофразовой формализации
+        repair_rounds (int): Максимальное число уточняющих запросов
+            о нераспознанных фрагментах ответа (0 - без исправления)
+        hedge_delay (Optional[float]): Задержка в секундах перед страхующим
+            запросом к модели (None - без страхующего запроса)
+        hedge_model (Optional[str]): Модель страхующего запроса (None - еще
+            одна выборка той же модели)
+        last_cache_hit (bool): Был ли последний результат взят из кэша
+        last_signature (Optional[Signature]): Сигнатура последних дизъюнктов
+            (виды и арности символов) для ResolutionEngine.prove
+        last_clauses (List[ParsedClause]): Разобранные последние дизъюнкты
+            (передаются ResolutionEngine.prove без повторного разбора)
+        last_diagnostics (List[ClauseDiagnostic]): Фрагменты ответа модели,
+            не распознанные как дизъюнкты (и не исправленные)
+    """
+
+    # Версия промпта: входит в ключ кэша, увеличивается при изменении
+    # SYSTEM_PROMPT, FOL_SYSTEM_PROMPT или _build_prompt
+    PROMPT_VERSION = 2
+
+    # Неизменная часть промпта (системный промпт): одинаковый префикс всех
+    # запросов обрабатывается сервером Ollama один раз и берется из кэша
+    # контекста загруженной модели
+    SYSTEM_PROMPT = """Ты — экспертный ассистент по формальной логике.
+Твоя задача — преобразовать текстовое описание задачи в набор дизъюнктов логики предикатов для метода резолюций.
+
+**ПРЕОБРАЗОВАНИЕ (строго по порядку):**
+1. ПНФ: исключи импликацию (P → Q = ¬P ∨ Q), внеси отрицания внутрь по законам де Моргана (¬(F ∨ G) = ¬F ∧ ¬G; ¬(F ∧ G) = ¬F ∨ ¬G; ¬∀x F(x) = ∃x ¬F(x); ¬∃x F(x) = ∀x ¬F(x)), вынеси кванторы в начало
+2. СНФ: замени ∃x константой (a, b, c), если перед ним нет ∀, иначе функцией f(x), g(x), h(x) от переменных предшествующих ∀
+3. Удали кванторы ∀: все переменные дизъюнктов считаются всеобщими
+4. КНФ: приведи к конъюнкции дизъюнктов по дистрибутивности F ∨ (G ∧ H) = (F ∨ G) ∧ (F ∨ H) и раздели конъюнкцию на отдельные дизъюнкты
+5. Добавь отрицание цели отдельным дизъюнктом
+6. Для цепочки отношений (старше, больше, меньше) добавь аксиому транзитивности: ¬Старше(x,y) ∨ ¬Старше(y,z) ∨ Старше(x,z)
+
+**ВЫВОД:** только готовые дизъюнкты через запятую — без кванторов, шагов преобразования, комментариев и пояснений.
+
+**ПРИМЕРЫ:**
+Вход: "Маша старше Кати, а Катя старше Лены. Докажи, что Маша старше Лены."
+Выход: Старше(Маша,Катя), Старше(Катя,Лена), ¬Старше(x,y) ∨ ¬Старше(y,z) ∨ Старше(x,z), ¬Старше(Маша,Лена)
+
+Вход: "Сократ — человек. Все люди смертны. Докажи, что Сократ смертен."
+Выход: Человек(Сократ), ¬Человек(x) ∨ Смертен(x), ¬Смертен(Сократ)
+
+Вход: "Каждый студент сдал экзамен. Иван — студент."
+Выход: ¬Студент(x) ∨ СдалЭкзамен(x), Студент(Иван)"""
+
+    # Системный промпт режима fol_mode: только перевод в формулы первого порядка
+    FOL_SYSTEM_PROMPT = """Ты — экспертный ассистент по формальной логике.
+Твоя задача — перевести текстовое описание задачи на язык логики предикатов первого порядка.
+Приводить формулы к нормальным формам НЕ нужно: это сделает программа.
+
+**ЗАПИСЬ ФОРМУЛ:**
+- Связки: ¬ (не), ∧ (и), ∨ (или), → (если ..., то), ↔ (тогда и только тогда)
+- Кванторы: ∀x (для всех), ∃x (существует); область квантора заключай в скобки
+- Предикаты и константы пиши с заглавной буквы: Человек(Сократ), Старше(Маша, Катя)
+- Переменные пиши строчными буквами: x, y, z
+- Одно и то же понятие всегда обозначай одним предикатом
+
+**ПРАВИЛА ВЫВОДА:**
+1. Каждая формула на отдельной строке
+2. Доказываемое утверждение выведи последней строкой с пометкой «Цель:», БЕЗ отрицания
+3. Если в задаче есть цепочка отношений (старше, больше, меньше), добавь аксиому транзитивности
+4. НИКАКИХ комментариев и пояснений, только формулы
+
+**ПРИМЕР:**
+Вход: "Сократ — человек. Все люди смертны. Докажи, что Сократ смертен."
+Выход:
+Человек(Сократ)
+∀x (Человек(x) → Смертен(x))
+Цель: Смертен(Сократ)"""
+
+    # Изменяемая часть промпта для всей задачи и для отдельных предложений
+    TASK_TEMPLATES = {
+        'problem': "Теперь преобразуй следующую задачу: {text}",
+        'premise': ("Это одна из посылок задачи. Преобразуй в дизъюнкты только ее, "
+                    "не добавляй отрицание цели: {text}"),
+        'goal': ("Это доказываемое утверждение задачи. Выведи только дизъюнкты "
+                 "его отрицания: {text}"),
+    }
+
+    # То же для режима fol_mode (модель выводит формулы первого порядка)
+    FOL_TASK_TEMPLATES = {
+        'problem': "Теперь переведи следующую задачу: {text}",
+        'premise': ("Это одна из посылок задачи. Переведи только ее, "
+                    "без пометки «Цель:»: {text}"),
+        'goal': ("Это доказываемое утверждение задачи. Выведи его формулу "
+                 "с пометкой «Цель:»: {text}"),
+    }
+
+    # Строка ответа в режиме fol_mode: необязательный номер или маркер списка,
+    # необязательная пометка цели и формула
+    FOL_LINE_PATTERN = re.compile(r'^(?:\d+[.)]\s*|[-•*]\s+)?(?:(Цель|Goal)\s*:\s*)?(.*)$',
+                                  re.IGNORECASE)
+
+    # Уточняющий запрос: только нераспознанные фрагменты и ошибки разбора
+    REPAIR_TEMPLATE = (
+        "Эти фрагменты твоего ответа не являются дизъюнктами:\n{fragments}\n"
+        "Исправь каждый фрагмент. Дизъюнкт - литералы, соединенные «∨»; литерал - "
+        "Предикат(аргументы) с необязательным «¬»; переменные со строчной буквы, "
+        "константы с заглавной; конъюнкцию «∧» раздели на отдельные дизъюнкты. "
+        "Выведи только исправленные дизъюнкты через запятую в одной строке, без пояснений."
+    )
+
+    # Уточняющий запрос в режиме fol_mode: строки, формулы которых не разобраны
+    FOL_REPAIR_TEMPLATE = (
+        "Эти строки твоего ответа не являются формулами первого порядка:\n{fragments}\n"
+        "Исправь каждую строку. Связки: ¬, ∧, ∨, →, ↔; кванторы ∀x и ∃x, область "
+        "действия квантора - в скобках; предикаты и константы с заглавной буквы, "
+        "переменные со строчной. Пометку «Цель:» сохрани. Выведи только исправленные "
+        "формулы, каждую на отдельной строке, без пояснений."
+    )
+
+    # Признак формулы в строке: скобки, связки или кванторы
+    FOL_SYMBOL_PATTERN = re.compile(r'[()¬∧∨→↔∀∃~&|]|->')
+
+    # Начало предложения, формулирующего цель доказательства
+    GOAL_PATTERN = re.compile(
+        r'^(докажи|доказать|покажи|следовательно|значит|верно ли|правда ли)', re.IGNORECASE)
+
+    # Сколемовские константы (a, b, c...) и функции (f, g, h) из правил промпта
+    # и символы Sk<n> локального переводчика (fol_mode)
+    SKOLEM_CONSTANT_PATTERN = re.compile(r'^([a-e]\d*|Sk\d+)$')
+    SKOLEM_FUNCTION_PATTERN = re.compile(r'^([f-h]\d*|Sk\d+)$')
+
+    # Сколемовские символы локального переводчика: в режиме fol_mode строчные
+    # имена в формулах модели - переменные
+    FOL_SKOLEM_PATTERN = re.compile(r'^Sk\d+$')
+
+    # Предикаты определений Def<n> локального переводчика (Clausifier):
+    # нумерация начинается заново в каждом предложении
+    DEFINITION_PATTERN = re.compile(r'^Def\d+$')
+
+    def __init__(self, model_name: str = "deepseek-v3.1:671b-cloud",
+                 client: Optional[OllamaClient] = None,
+                 cache: Optional[DiskCache] = None, fol_mode: bool = False,
+                 split_sentences: bool = False, max_workers: int = 4,
+                 repair_rounds: int = 0, hedge_delay: Optional[float] = None,
+                 hedge_model: Optional[str] = None):
+        """
+        Инициализация формализатора логики.
+        
+        Args:
+            model_name: Название модели Ollama для использования.
+                      По умолчанию "deepseek-v3.1:671b-cloud"
+            client: Клиент сервера Ollama (None - общий клиент приложения)
+            cache: Дисковый кэш результатов формализации (None - без кэша)
+            fol_mode: Запрашивать у модели только перевод в формулы первого
+                порядка и строить дизъюнкты локально
+            split_sentences: Формализовать предложения задачи параллельно
+                и по отдельности (каждое кэшируется отдельно)
+            max_workers: Максимальное число одновременных запросов к модели
+            repair_rounds: Максимальное число уточняющих запросов, в которых
+                модели отправляются только нераспознанные фрагменты
+            hedge_delay: Через сколько секунд без валидного ответа отправить
+                страхующий запрос (0 - сразу, None - не отправлять)
+            hedge_model: Модель страхующего запроса (None - та же модель)
+        """
+        self.model_name = model_name
+        self.client = client if client is not None else default_client()
+        self.cache = cache
+        self.fol_mode = fol_mode
+        self.split_sentences = split_sentences
+        self.max_workers = max_workers
+        self.repair_rounds = repair_rounds
+        self.hedge_delay = hedge_delay
+        self.hedge_model = hedge_model
+        self._deadline = NO_DEADLINE  # Срок текущего вызова formalize_problem
+        self.last_cache_hit = False
+        self.last_signature: Optional[Signature] = None
+        self.last_clauses: List[ParsedClause] = []
+        self.last_diagnostics: List[ClauseDiagnostic] = []
+
+    def formalize_problem(self, user_input: str,
+                          on_formula: Optional[Callable[[str], None]] = None,
+                          use_cache: bool = True,
+                          deadline: Optional[Deadline] = None) -> List[str]:
+        """
+        Основной метод для преобразования текстовой задачи в логические формулы.
+        
+        Ответ модели читается потоком: каждая завершенная строка сразу
+        разбирается сканером дизъюнктов (грамматика движка резолюций),
+        а найденные в ней формулы передаются в on_formula. Генерация
+        прерывается, как только после списка дизъюнктов начинается
+        посторонний текст. Разобранные дизъюнкты сохраняются в last_clauses,
+        нераспознанные фрагменты - в last_diagnostics.
+        
+        При repair_rounds > 0 нераспознанные фрагменты с сообщениями парсера
+        отправляются модели коротким уточняющим запросом (_repair_clauses),
+        а исправленные дизъюнкты добавляются к результату.
+        
+        При заданном hedge_delay запрос страхуется вторым (_hedged_model_call):
+        принимается первый ответ, прошедший проверку дизъюнктов, остальные
+        запросы отменяются.
+        
+        Срок запроса (deadline) ограничивает таймауты вызовов модели
+        и чтение потока ответа; уточняющие запросы после истечения срока
+        не отправляются.
+        
+        Вместе с дизъюнктами строится их сигнатура (last_signature):
+        сколемовские константы объявляются константами, даже если модель
+        записала их со строчной буквы.
+        
+        Если задан кэш, результат для того же текста (с точностью до
+        пробелов), модели и версии промпта возвращается без обращения
+        к модели. Сохраняются только успешные результаты.
+        
+        При split_sentences задача разбивается на посылки и цель, которые
+        формализуются параллельно и объединяются (_formalize_sentences).
+        
+        Args:
+            user_input: Текстовое описание логической задачи на естественном языке
+            on_formula: Функция, вызываемая для каждой формулы по мере получения
+            use_cache: Использовать кэш (False - всегда обращаться к модели
+                и перезаписать результат в кэше)
+            deadline: Срок запроса пользователя (None - только таймаут клиента)
+        
+        Returns:
+            List[str]: Список дизъюнктов в формате логики предикатов
+        
+        Пример:
+            >>> formalizer = LogicFormalizer()
+            >>> formulas = formalizer.formalize_problem("Сократ человек. Все люди смертны.")
+            >>> print(formulas)
+            ['Человек(Сократ)', '¬Человек(x) ∨ Смертен(x)']
+        """
+        self.last_cache_hit = False
+        self.last_signature = None
+        self.last_clauses = []
+        self.last_diagnostics = []
+        self._deadline = deadline if deadline is not None else NO_DEADLINE
+        diagnostics: List[ClauseDiagnostic] = []
+
+        with tracer.span('formalizer.formalize_problem', model=self.model_name,
+                         input_length=len(user_input)) as span:
+            try:
+                sentences = self._split_sentences(user_input) if self.split_sentences else []
+                if len(sentences) > 1:
+                    clauses, cache_hit = self._formalize_sentences(
+                        sentences, on_formula, use_cache, span, diagnostics)
+                else:
+                    clauses, cache_hit = self._formalize_text(
+                        user_input, 'problem', on_formula, use_cache, diagnostics)
+
+                formulas = [clause.text for clause in clauses]
+                self.last_cache_hit = cache_hit
+                self.last_clauses = clauses
+                self.last_diagnostics = diagnostics
+                self.last_signature = self._build_signature(clauses, span)
+                span.set_attribute('cache_hit', cache_hit)
+                span.set_attribute('formulas', len(formulas))
+                span.set_attribute('diagnostics', len(diagnostics))
+                return formulas if formulas else ["Не удалось извлечь валидные формулы"]
+
+            except DeadlineExceeded:
+                span.set_attribute('error', 'deadline')
+                return ["Ошибка: истек срок выполнения запроса"]
+            except (subprocess.TimeoutExpired, OllamaTimeoutError):
+                span.set_attribute('error', 'timeout')
+                return ["Таймаут запроса к модели"]
+            except Exception as e:
+                span.set_attribute('error', str(e))
+                return [f"Ошибка выполнения: {str(e)}"]
+
+    def _build_signature(self, clauses: List[ParsedClause], span) -> Optional[Signature]:
+        """
+        Строит сигнатуру дизъюнктов по соглашениям промпта.
+        
+        Args:
+            clauses: Разобранные дизъюнкты
+            span: Интервал трассировки запроса
+        
+        Returns:
+            Optional[Signature]: Сигнатура или None, если символ используется
+                с разной арностью (тогда движок классифицирует символы по регистру)
+        """
+        skolem_constants, skolem_functions = self._skolem_patterns()
+        try:
+            return Signature.from_clauses(clauses, skolem_constants, skolem_functions)
+        except SignatureError as e:
+            span.set_attribute('signature_error', str(e))
+            return None
+
+    def _skolem_patterns(self) -> Tuple[re.Pattern, re.Pattern]:
+        """
+        Возвращает шаблоны сколемовских констант и функций для текущего режима.
+        
+        В режиме fol_mode строчные имена в формулах модели - переменные,
+        сколемовские только символы Sk<n> локального переводчика.
+        """
+        if self.fol_mode:
+            return self.FOL_SKOLEM_PATTERN, self.FOL_SKOLEM_PATTERN
+        return self.SKOLEM_CONSTANT_PATTERN, self.SKOLEM_FUNCTION_PATTERN
+
+    def _formalize_text(self, text: str, role: str,
+                        on_formula: Optional[Callable[[str], None]],
+                        use_cache: bool,
+                        diagnostics: List[ClauseDiagnostic]) -> Tuple[List[ParsedClause], bool]:
+        """
+        Формализует задачу или одно ее предложение с учетом кэша.
+        
+        Args:
+            text: Текст задачи или предложения
+            role: Роль текста: "problem", "premise" или "goal"
+            on_formula: Функция, вызываемая для каждой формулы по мере получения
+            use_cache: Использовать кэш
+            diagnostics: Список, в который добавляются нераспознанные
+                фрагменты ответа модели
+        
+        Returns:
+            Tuple[List[ParsedClause], bool]: Дизъюнкты (пустой список
+                при неудаче) и признак попадания в кэш
+        """
+        # Шаг 1: Поиск готового результата в кэше
+        cache_key = self._cache_key(text, role) if self.cache is not None else None
+        if cache_key is not None and use_cache:
+            cached_clauses = self._cache_lookup(cache_key)
+            if cached_clauses is not None:
+                if on_formula is not None:
+                    for clause in cached_clauses:
+                        on_formula(clause.text)
+                return cached_clauses, True
+
+        with tracer.span('formalizer.build_prompt'):
+            prompt = self._build_prompt(text, role)
+        self._deadline.check('формализация')
+
+        # Шаг 2: Потоковый запуск языковой модели через Ollama
+        # Шаг 3: Извлечение формул из каждой завершенной строки вывода
+        # (в режиме fol_mode - перевод формул первого порядка в дизъюнкты)
+        clauses = []
+        text_diagnostics: List[ClauseDiagnostic] = []
+        with tracer.span('formalizer.model_call', prompt_length=len(prompt)) as call_span:
+            if self.hedge_delay is not None:
+                clauses = self._hedged_model_call(prompt, role, text_diagnostics, call_span, on_formula)
+            else:
+                chunks = self._stream_model_output(prompt)
+                try:
+                    for clause in self._extract_clauses(
+                            _iter_until(chunks, deadline=self._deadline), role, text_diagnostics):
+                        if not clauses:
+                            call_span.set_attribute('first_formula_time', call_span.duration)
+                        clauses.append(clause)
+                        if on_formula is not None:
+                            on_formula(clause.text)
+                finally:
+                    _close_stream(chunks)
+
+        # Шаг 4: Уточняющие запросы только о нераспознанных фрагментах
+        if text_diagnostics and self.repair_rounds > 0:
+            text_diagnostics = self._repair_clauses(clauses, text_diagnostics, role, on_formula)
+        diagnostics.extend(text_diagnostics)
+
+        if clauses and cache_key is not None:
+            self._cache_store(cache_key, clauses)
+        return clauses, False
+
+    def _extract_clauses(self, chunks: Iterable[str], role: str,
+                         diagnostics: List[ClauseDiagnostic],
+                         clausifier: Optional[Clausifier] = None) -> Iterator[ParsedClause]:
+        """Извлекает дизъюнкты из потока вывода модели в текущем режиме (fol_mode или КНФ)."""
+        if self.fol_mode:
+            return self._iter_fol_clauses(chunks, role, diagnostics, clausifier)
+        return self._iter_formulas(chunks, diagnostics)
+
+    def _hedged_model_call(self, prompt: str, role: str,
+                           diagnostics: List[ClauseDiagnostic], span,
+                           on_formula: Optional[Callable[[str], None]] = None) -> List[ParsedClause]:
+        """
+        Выполняет основной и страхующий запросы к модели и возвращает первый валидный ответ.
+        
+        Страхующий запрос (_stream_hedge_output) отправляется через
+        hedge_delay секунд или сразу, как только основной ответ завершился
+        без валидных дизъюнктов. Ответ валиден, если в нем есть дизъюнкты
+        и нет нераспознанных фрагментов. Как только один запрос дал валидный
+        ответ, остальные прерываются: их потоки перестают читаться
+        и закрываются, что останавливает генерацию на сервере. Если валидного
+        ответа нет, выбирается первый ответ с дизъюнктами.
+        
+        Формулы передаются в on_formula по мере генерации из ведущего
+        запроса - того, который первым выдал дизъюнкт. Если выбран ответ
+        другого запроса, его формулы передаются в on_formula после выбора:
+        показанные ранее формулы ведущего запроса заменяет итоговый
+        результат formalize_problem.
+        
+        Args:
+            prompt: Промпт для модели
+            role: Роль текста: "problem", "premise" или "goal"
+            diagnostics: Список, в который добавляются нераспознанные
+                фрагменты выбранного ответа
+            span: Интервал трассировки вызова модели
+            on_formula: Функция, вызываемая для каждой формулы ведущего
+                и выбранного ответов
+        
+        Returns:
+            List[ParsedClause]: Дизъюнкты выбранного ответа (пустой список,
+                если ни один запрос не дал дизъюнктов)
+        
+        Raises:
+            Exception: Ошибка основного запроса, если оба запроса завершились ошибкой
+        """
+        cancelled = threading.Event()
+        hedge_now = threading.Event()
+        leader_lock = threading.Lock()
+        leader = []  # Имя ведущего запроса (первым выдавшего дизъюнкт)
+
+        def attempt(name, stream, delay):
+            if delay:
+                hedge_now.wait(delay)
+            if cancelled.is_set():
+                return None
+            clauses = []
+            attempt_diagnostics: List[ClauseDiagnostic] = []
+            chunks = stream(prompt)
+            try:
+                for clause in self._extract_clauses(
+                        _iter_until(chunks, cancelled, self._deadline), role, attempt_diagnostics):
+                    clauses.append(clause)
+                    with leader_lock:
+                        if not leader:
+                            leader.append(name)
+                        leading = leader[0] == name
+                    if leading and on_formula is not None and not cancelled.is_set():
+                        on_formula(clause.text)
+            finally:
+                _close_stream(chunks)
+            return clauses, attempt_diagnostics
+
+        def accept(name, clauses):
+            span.set_attribute('hedge_winner', name)
+            if on_formula is not None and leader[:1] != [name]:
+                for clause in clauses:
+                    on_formula(clause.text)
+            return clauses
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        futures = {executor.submit(attempt, 'primary', self._stream_model_output, 0): 'primary',
+                   executor.submit(attempt, 'hedge', self._stream_hedge_output, self.hedge_delay): 'hedge'}
+        pending = set(futures)
+        fallback = None
+        errors = {}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures[future]
+                    try:
+                        clauses, attempt_diagnostics = future.result()
+                    except Exception as error:
+                        errors[name] = error
+                        clauses, attempt_diagnostics = [], []
+
+                    if clauses and not attempt_diagnostics:
+                        # Первый валидный ответ: остальные запросы прерываются
+                        cancelled.set()
+                        return accept(name, clauses)
+                    if clauses and fallback is None:
+                        fallback = (name, clauses, attempt_diagnostics)
+                    # Ответ не прошел проверку - страхующий запрос отправляется сразу
+                    hedge_now.set()
+        finally:
+            cancelled.set()
+            hedge_now.set()
+            executor.shutdown(wait=False)
+
+        if fallback is None:
+            if errors:
+                raise errors.get('primary', next(iter(errors.values())))
+            return []
+        winner, clauses, attempt_diagnostics = fallback
+        diagnostics.extend(attempt_diagnostics)
+        return accept(winner, clauses)
+
+    def _repair_clauses(self, clauses: List[ParsedClause], diagnostics: List[ClauseDiagnostic],
+                        role: str, on_formula: Optional[Callable[[str], None]]) -> List[ClauseDiagnostic]:
+        """
+        Исправляет нераспознанные фрагменты ответа уточняющими запросами.
+        
+        Модели отправляются только фрагменты и сообщения парсера
+        (_build_repair_prompt), поэтому запрос во много раз короче полного
+        промпта. Исправленные дизъюнкты без повторов добавляются в конец
+        clauses. Фрагменты нового ответа, которые снова не разобраны,
+        отправляются в следующем раунде; всего не более repair_rounds
+        запросов. В режиме fol_mode исправляются строки с формулами,
+        которые не удалось разобрать, а новые символы Sk<n> и Def<n>
+        не совпадают с символами основного ответа.
+        
+        Args:
+            clauses: Дизъюнкты основного ответа (дополняются исправленными)
+            diagnostics: Нераспознанные фрагменты основного ответа
+            role: Роль текста: "problem", "premise" или "goal"
+            on_formula: Функция, вызываемая для каждого исправленного дизъюнкта
+        
+        Returns:
+            List[ClauseDiagnostic]: Фрагменты, которые исправить не удалось
+        """
+        known = {clause.text for clause in clauses}
+        clausifier = None
+        if self.fol_mode:
+            clausifier = Clausifier()
+            clausifier.reserve_symbols(clauses)
+
+        for repair_round in range(1, self.repair_rounds + 1):
+            # Исправление необязательно: после истечения срока не выполняется
+            if self._deadline.expired:
+                break
+            prompt = self._build_repair_prompt(diagnostics)
+            remaining: List[ClauseDiagnostic] = []
+            repaired = 0
+
+            with tracer.span('formalizer.repair', round=repair_round, fragments=len(diagnostics),
+                             prompt_length=len(prompt)) as span:
+                chunks = self._stream_model_output(prompt)
+                try:
+                    for clause in self._extract_clauses(_iter_until(chunks, deadline=self._deadline),
+                                                        role, remaining, clausifier):
+                        repaired += 1
+                        if clause.text not in known:
+                            known.add(clause.text)
+                            clauses.append(clause)
+                            if on_formula is not None:
+                                on_formula(clause.text)
+                finally:
+                    _close_stream(chunks)
+                span.set_attribute('repaired', repaired)
+
+            # Ответ из одного пояснения ничего не исправил - фрагменты остаются прежними
+            if repaired or remaining:
+                diagnostics = remaining
+            if not diagnostics:
+                break
+        return diagnostics
+
+    def _build_repair_prompt(self, diagnostics: List[ClauseDiagnostic]) -> str:
+        """
+        Создает уточняющий запрос о нераспознанных фрагментах.
+        
+        Args:
+            diagnostics: Нераспознанные фрагменты (повторы отбрасываются)
+        
+        Returns:
+            str: Промпт с фрагментами и сообщениями парсера
+        """
+        fragments = {}
+        for diagnostic in diagnostics:
+            fragments.setdefault(diagnostic.fragment, diagnostic.message)
+        listing = '\n'.join(f"- {fragment} ({message})" for fragment, message in fragments.items())
+        template = self.FOL_REPAIR_TEMPLATE if self.fol_mode else self.REPAIR_TEMPLATE
+        return template.format(fragments=listing)
+
+    def _split_sentences(self, user_input: str) -> List[Tuple[str, str]]:
+        """
+        Разбивает задачу на предложения и определяет их роль.
+        
+        Args:
+            user_input: Текст задачи
+        
+        Returns:
+            List[Tuple[str, str]]: Пары (предложение, "premise" или "goal")
+        """
+        sentences = re.split(r'(?<=[.!?…])\s+', user_input.strip())
+        return [(sentence, 'goal' if self.GOAL_PATTERN.match(sentence) else 'premise')
+                for sentence in sentences if sentence.strip()]
+
+    def _formalize_sentences(self, sentences: List[Tuple[str, str]],
+                             on_formula: Optional[Callable[[str], None]],
+                             use_cache: bool, parent_span,
+                             diagnostics: List[ClauseDiagnostic]) -> Tuple[List[ParsedClause], bool]:
+        """
+        Формализует предложения параллельно и объединяет результаты.
+        
+        Запросы выполняются пулом из не более чем max_workers потоков.
+        Результаты объединяются в порядке предложений: имена предикатов
+        приводятся к первому встреченному написанию, сколемовские символы
+        каждого предложения переименовываются (_reconcile_formulas).
+        Предложение, которое не удалось формализовать, пропускается.
+        
+        Args:
+            sentences: Пары (предложение, роль)
+            on_formula: Функция, вызываемая для каждой объединенной формулы
+            use_cache: Использовать кэш
+            parent_span: Интервал трассировки задачи
+            diagnostics: Список для нераспознанных фрагментов ответов
+                (в порядке предложений)
+        
+        Returns:
+            Tuple[List[ParsedClause], bool]: Дизъюнкты и признак того, что
+                все предложения взяты из кэша
+        
+        Raises:
+            Exception: Ошибка первого предложения, если не удалось
+                формализовать ни одно
+        """
+        def formalize_sentence(sentence, role, sentence_diagnostics):
+            with tracer.span('formalizer.sentence', parent=parent_span, role=role,
+                             input_length=len(sentence)):
+                return self._formalize_text(sentence, role, None, use_cache, sentence_diagnostics)
+
+        clauses = []
+        predicate_names: Dict[str, str] = {}
+        all_cached = True
+        errors = []
+        failed_sentences = 0
+
+        workers = max(1, min(self.max_workers, len(sentences)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sentence_diagnostics = [[] for _ in sentences]
+            futures = [executor.submit(formalize_sentence, sentence, role, sentence_diagnostics[index])
+                       for index, (sentence, role) in enumerate(sentences)]
+
+            # Результаты объединяются по порядку: формулы первых предложений
+            # выдаются, пока остальные еще формализуются
+            for index, future in enumerate(futures, 1):
+                try:
+                    sentence_clauses, cache_hit = future.result()
+                except Exception as error:
+                    errors.append(error)
+                    sentence_clauses, cache_hit = [], False
+
+                diagnostics.extend(sentence_diagnostics[index - 1])
+                all_cached = all_cached and cache_hit
+                if not sentence_clauses:
+                    failed_sentences += 1
+                    continue
+
+                for clause in self._reconcile_formulas(sentence_clauses, index, predicate_names):
+                    clauses.append(clause)
+                    if on_formula is not None:
+                        on_formula(clause.text)
+
+        parent_span.set_attribute('sentences', len(sentences))
+        parent_span.set_attribute('failed_sentences', failed_sentences)
+        if not clauses and errors:
+            raise errors[0]
+        return clauses, all_cached
+
+    def _reconcile_formulas(self, clauses: List[ParsedClause], sentence_index: int,
+                            predicate_names: Dict[str, str]) -> List[ParsedClause]:
+        """
+        Согласует символы формул одного предложения с уже объединенными.
+        
+        Имена предикатов, отличающиеся только регистром, "_" и "-",
+        заменяются первым встреченным написанием. Сколемовские константы
+        a, b, c... получают номер предложения и записываются с заглавной
+        буквы (константы движка), функции f, g, h - номер предложения:
+        a -> A_2, f(x) -> f_2(x), Sk1 -> Sk1_2. В режиме fol_mode
+        переименовываются только символы Sk<n> (см. _skolem_patterns),
+        а также предикаты определений: Def1 -> Def1_2.
+        
+        Args:
+            clauses: Дизъюнкты предложения
+            sentence_index: Номер предложения (с 1)
+            predicate_names: Написания предикатов по ключу нормализации
+                (дополняется новыми предикатами)
+        
+        Returns:
+            List[ParsedClause]: Согласованные дизъюнкты
+        """
+        skolem_constants, skolem_functions = self._skolem_patterns()
+
+        def rename_term(term: Term) -> Term:
+            if term.args:
+                name = term.name
+                if skolem_functions.match(name):
+                    name = f"{name}_{sentence_index}"
+                return Term(name, tuple(rename_term(arg) for arg in term.args))
+            if skolem_constants.match(term.name):
+                return Term(f"{term.name[0].upper()}{term.name[1:]}_{sentence_index}")
+            return term
+
+        reconciled = []
+        for clause in clauses:
+            literals = []
+            for literal in clause.literals:
+                if self.fol_mode and self.DEFINITION_PATTERN.match(literal.predicate):
+                    predicate = f"{literal.predicate}_{sentence_index}"
+                else:
+                    key = re.sub(r'[_\-]', '', literal.predicate).casefold()
+                    predicate = predicate_names.setdefault(key, literal.predicate)
+                args = tuple(rename_term(arg) for arg in literal.args)
+                literals.append(Literal(predicate, args, literal.negated))
+            reconciled.append(ParsedClause(render_clause(tuple(literals)), tuple(literals)))
+        return reconciled
+
+    def _cache_key(self, user_input: str, role: str = 'problem') -> str:
+        """
+        Вычисляет ключ кэша по нормализованному тексту, модели и версии промпта.
+        
+        Текст приводится к форме NFKC, пробельные символы схлопываются.
+        В режиме fol_mode в ключ входят также версия переводчика
+        в дизъюнкты и порог введения определений.
+        
+        Args:
+            user_input: Текст задачи или предложения
+            role: Роль текста: "problem", "premise" или "goal"
+        
+        Returns:
+            str: Хэш-ключ
+        """
+        normalized_text = ' '.join(unicodedata.normalize('NFKC', user_input).split())
+        payload = json.dumps({
+            'text': normalized_text,
+            'role': role,
+            'fol_mode': self.fol_mode,
+            'model': self.model_name,
+            'prompt_version': self.PROMPT_VERSION,
+            'clausifier': ([CLAUSIFIER_VERSION, DEFAULT_DEFINITION_THRESHOLD]
+                           if self.fol_mode else None)
+        }, ensure_ascii=False, sort_keys=True)
+        return 'formalize:' + hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _cache_lookup(self, cache_key: str) -> Optional[List[ParsedClause]]:
+        """
+        Ищет список формул в кэше.
+        
+        Args:
+            cache_key: Ключ кэша
+        
+        Returns:
+            Optional[List[ParsedClause]]: Дизъюнкты или None при промахе
+        """
+        raw_entry = self.cache.get(cache_key)
+        if raw_entry is None:
+            return None
+
+        try:
+            formulas = json.loads(zlib.decompress(raw_entry).decode('utf-8'))
+            return [ParsedClause(formula, parse_clause(formula)) for formula in formulas]
+        except (zlib.error, ValueError):
+            # Запись повреждена (ClauseSyntaxError - тоже ValueError)
+            self.cache.delete(cache_key)
+            return None
+
+    def _cache_store(self, cache_key: str, clauses: List[ParsedClause]):
+        """
+        Сохраняет сжатый список формул в кэш.
+        
+        Args:
+            cache_key: Ключ кэша
+            clauses: Дизъюнкты успешной формализации
+        """
+        payload = json.dumps([clause.text for clause in clauses], ensure_ascii=False, separators=(',', ':'))
+        self.cache.set(cache_key, zlib.compress(payload.encode('utf-8'), 9))
+
+    def _build_prompt(self, user_input: str, role: str = 'problem') -> str:
+        """
+        Создает изменяемую часть промпта: задание для текста пользователя.
+        
+        Инструкции и примеры не повторяются в каждом запросе: они
+        отправляются системным промптом (_system_prompt), одинаковым
+        для всех запросов.
+        
+        Args:
+            user_input: Исходная текстовая задача от пользователя
+                (или одно ее предложение)
+            role: Роль текста: "problem" - вся задача, "premise" - посылка,
+                "goal" - доказываемое утверждение
+        
+        Returns:
+            str: Задание для модели
+        """
+        templates = self.FOL_TASK_TEMPLATES if self.fol_mode else self.TASK_TEMPLATES
+        return templates[role].format(text=user_input)
+
+    def _system_prompt(self) -> str:
+        """
+        Возвращает неизменную часть промпта: инструкции и примеры.
+        
+        В режиме fol_mode модель только переводит задачу в формулы первого
+        порядка: нормальные формы (ПНФ, СНФ, КНФ) строит Clausifier, поэтому
+        ответ модели короче, а ошибки преобразований исключены.
+        """
+        return self.FOL_SYSTEM_PROMPT if self.fol_mode else self.SYSTEM_PROMPT
+
+    def _stream_model_output(self, prompt: str) -> Iterable[str]:
+        """
+        Запускает генерацию на сервере Ollama и возвращает поток фрагментов вывода.
+        
+        Инструкции отправляются системным промптом. Счетчики сервера
+        (prompt_eval_count - сколько токенов промпта обработано заново)
+        записываются в атрибуты текущего интервала трассировки.
+        
+        Если сервер не запущен, модель запускается через командную строку
+        (_run_ollama_cli), и весь вывод возвращается одним фрагментом.
+        
+        Args:
+            prompt: Текст промпта для модели
+        
+        Returns:
+            Iterable[str]: Фрагменты сырого вывода модели
+        
+        Raises:
+            OllamaTimeoutError: Если сервер не ответил за время таймаута клиента
+            Exception: При других ошибках выполнения запроса
+        """
+        span = tracer.current_span()
+        try:
+            return self.client.stream_generate(prompt, model=self.model_name,
+                                               system=self._system_prompt(),
+                                               timeout=self._deadline.timeout(self.client.timeout),
+                                               on_metrics=span.set_attributes if span else None)
+        except OllamaUnavailableError:
+            return [self._run_ollama_cli(prompt)]
+
+    def _stream_hedge_output(self, prompt: str) -> Iterable[str]:
+        """
+        Запускает страхующую генерацию: модель hedge_model или еще одну выборку той же модели.
+        
+        Args:
+            prompt: Текст промпта для модели
+        
+        Returns:
+            Iterable[str]: Фрагменты сырого вывода модели
+        
+        Raises:
+            OllamaUnavailableError: Если сервер не запущен (страхующий запрос
+                через командную строку не выполняется)
+        """
+        return self.client.stream_generate(prompt, model=self.hedge_model or self.model_name,
+                                           system=self._system_prompt(),
+                                           timeout=self._deadline.timeout(self.client.timeout))
+
+    def _run_ollama_cli(self, prompt: str) -> str:
+        """
+        Запускает модель Ollama отдельным процессом и возвращает результат.
+        
+        У "ollama run" нет системного промпта, поэтому инструкции
+        передаются вместе с заданием.
+        
+        Args:
+            prompt: Текст промпта для модели (изменяемая часть)
+        
+        Returns:
+            str: Сырой вывод от модели Ollama
+        
+        Raises:
+            subprocess.TimeoutExpired: Если выполнение занимает больше 120 секунд
+                (или больше оставшегося срока запроса)
+            Exception: При других ошибках выполнения подпроцесса
+        """
+        # Определение пути к исполняемому файлу Ollama в Windows
+        ollama_executable_path = os.path.join(
+            os.environ["LOCALAPPDATA"],
+            "Programs", "Ollama", "ollama.exe"
+        )
+
+        # Проверка существования файла Ollama
+        if not os.path.exists(ollama_executable_path):
+            raise FileNotFoundError(f"Ollama не найден по пути: {ollama_executable_path}")
+            
+        if os.name == 'nt':
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = 0
+            kwargs = {
+                'startupinfo': startupinfo,
+                'creationflags': subprocess.CREATE_NO_WINDOW
+            }
+        else:
+            kwargs = {}
+
+        # Запуск процесса Ollama
+        process_result = subprocess.run([
+            ollama_executable_path,
+            "run",
+            self.model_name,
+            f"{self._system_prompt()}\n\n{prompt}"
+        ], 
+        capture_output=True, 
+        text=True, 
+        timeout=self._deadline.timeout(120),  # Таймаут 2 минуты или остаток срока
+        encoding='utf-8',
+        **kwargs 
+        )
+
+        # Проверка успешности выполнения
+        if process_result.returncode == 0:
+            return process_result.stdout.strip()
+        else:
+            error_message = f"Ошибка модели (код {process_result.returncode}): {process_result.stderr}"
+            raise RuntimeError(error_message)
+
+    def _iter_formulas(self, chunks: Iterable[str],
+                       diagnostics: Optional[List[ClauseDiagnostic]] = None) -> Iterator[ParsedClause]:
+        """
+        Извлекает дизъюнкты из потока вывода модели по мере завершения строк.
+        
+        Каждая строка один раз токенизируется и разбирается сканером
+        ClauseScanner по грамматике движка резолюций. Блоки
+        "Thinking... ...done thinking." пропускаются. Первая строка без
+        дизъюнктов после уже найденных считается концом списка: дальнейший
+        вывод не читается.
+        
+        Args:
+            chunks: Фрагменты вывода модели (границы фрагментов произвольны)
+            diagnostics: Список, в который добавляются нераспознанные фрагменты
+        
+        Returns:
+            Iterator[ParsedClause]: Разобранные дизъюнкты в порядке появления
+        """
+        scanner = ClauseScanner()
+        found = False
+
+        try:
+            for line in _iter_answer_lines(chunks):
+                clauses = scanner.scan_line(line)
+                if clauses:
+                    found = True
+                    yield from clauses
+                elif found:
+                    # Раздел дизъюнктов закончился - остальное не нужно
+                    return
+        finally:
+            if diagnostics is not None:
+                diagnostics.extend(scanner.diagnostics)
+
+    def _iter_fol_clauses(self, chunks: Iterable[str], role: str,
+                          diagnostics: Optional[List[ClauseDiagnostic]] = None,
+                          clausifier: Optional[Clausifier] = None) -> Iterator[ParsedClause]:
+        """
+        Переводит поток формул первого порядка от модели в дизъюнкты.
+        
+        Дизъюнкты посылок выдаются сразу после разбора строки. Формулы цели
+        (помеченные «Цель:», а для роли "goal" - все формулы) собираются
+        до конца ответа, после чего выдаются дизъюнкты отрицания их конъюнкции.
+        
+        Args:
+            chunks: Фрагменты вывода модели
+            role: Роль текста: "problem", "premise" или "goal"
+            diagnostics: Список, в который добавляются строки с формулами,
+                которые не удалось разобрать (None - не собирать)
+            clausifier: Переводчик, общий для нескольких ответов
+                (None - новый переводчик)
+        
+        Returns:
+            Iterator[ParsedClause]: Разобранные дизъюнкты
+        """
+        if clausifier is None:
+            clausifier = Clausifier()
+        goals = []
+
+        for formula, is_goal in self._iter_fol_formulas(chunks, diagnostics):
+            if is_goal or role == 'goal':
+                goals.append(formula)
+            else:
+                yield from clausifier.clausify_parsed([formula])
+
+        if goals:
+            goal = goals[0] if len(goals) == 1 else And(tuple(goals))
+            yield from clausifier.clausify_parsed([Not(goal)])
+
+    def _iter_fol_formulas(self, chunks: Iterable[str],
+                           diagnostics: Optional[List[ClauseDiagnostic]] = None
+                           ) -> Iterator[Tuple[Formula, bool]]:
+        """
+        Разбирает формулы первого порядка из потока вывода модели.
+        
+        Строки без связок и скобок пропускаются; такая строка после уже
+        найденных формул завершает чтение ответа. Строка со связками или
+        скобками, которую не удалось разобрать, записывается в diagnostics
+        целиком (с пометкой «Цель:») для уточняющего запроса.
+        
+        Args:
+            chunks: Фрагменты вывода модели
+            diagnostics: Список, в который добавляются неразобранные строки
+                (None - не собирать)
+        
+        Returns:
+            Iterator[Tuple[Formula, bool]]: Формулы и признак цели
+        """
+        found = False
+
+        for line_number, line in enumerate(_iter_answer_lines(chunks), 1):
+            match = self.FOL_LINE_PATTERN.match(line)
+            is_goal = match.group(1) is not None
+            text = match.group(2).strip().rstrip('.;')
+
+            if self.FOL_SYMBOL_PATTERN.search(text):
+                try:
+                    formula = parse_formula(text)
+                except FormulaSyntaxError as error:
+                    if diagnostics is not None:
+                        diagnostics.append(ClauseDiagnostic(
+                            line_number, line.find(text) + error.position, line, error.message))
+                    continue
+                found = True
+                yield formula, is_goal
+            elif found:
+                return
+
+
+def _iter_answer_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Выдает непустые строки ответа модели, пропуская блоки "Thinking... ...done thinking."."""
+    thinking = False
+    for line in _iter_lines(chunks):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('Thinking...'):
+            thinking = True
+        if thinking:
+            if '...done thinking.' in line:
+                thinking = False
+            continue
+        yield line
+
+
+def _iter_until(chunks: Iterable[str], cancelled: Optional[threading.Event] = None,
+                deadline: Deadline = NO_DEADLINE) -> Iterator[str]:
+    """Выдает фрагменты вывода, пока запрос не отменен; после истечения срока - DeadlineExceeded."""
+    for chunk in chunks:
+        if cancelled is not None and cancelled.is_set():
+            return
+        deadline.check('ответ модели')
+        yield chunk
+
+
+def _close_stream(chunks: Iterable[str]):
+    """Закрывает поток вывода модели: закрытие прекращает генерацию на сервере."""
+    close = getattr(chunks, 'close', None)
+    if close is not None:
+        close()
+
+
+def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Собирает из фрагментов текста завершенные строки (последняя - без перевода строки)."""
+    buffer = ''
+    for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split('\n')
+        yield from lines
+    if buffer:
+        yield buffer
@@ -0,0 +1,548 @@
+"""
+Модуль клиента REST API локального сервера Ollama.
+Вместо запуска процесса "ollama run" на каждый запрос обращается к уже
+запущенному серверу (/api/generate, /api/chat) через пул постоянных
+HTTP-соединений (keep-alive), поэтому модель остается загруженной между
+запросами. Ответ можно получать целиком или потоком фрагментов.
+ModelWarmer загружает модель в фоне при запуске приложения и продлевает
+ее удержание в памяти, пока приложение используется.
+"""
+
+import os
+import re
+import json
+import time
+import queue
+import socket
+import threading
+import http.client
+from urllib.parse import urlsplit
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Адрес сервера по умолчанию (переменная окружения OLLAMA_HOST, как у самой Ollama)
+DEFAULT_HOST = "http://127.0.0.1:11434"
+
+# Сколько сервер держит модель в памяти после запроса
+DEFAULT_KEEP_ALIVE = "10m"
+
+# Таймаут запроса к модели в секундах
+DEFAULT_TIMEOUT = 120
+
+# Состояния фоновой загрузки модели (ModelWarmer)
+WARMUP_PENDING = "pending"
+WARMUP_LOADING = "loading"
+WARMUP_READY = "ready"
+WARMUP_UNAVAILABLE = "unavailable"
+WARMUP_IDLE = "idle"
+
+# Интервал продления при бессрочном удержании (проверка, что сервер не перезапущен)
+DEFAULT_REFRESH_INTERVAL = 300.0
+
+# Единицы длительности keep_alive в секундах
+DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+# Счетчики завершенной генерации в ответе сервера: prompt_eval_count - токены
+# промпта, обработанные заново (префикс из кэша контекста модели не считается),
+# длительности - в наносекундах
+RESPONSE_METRICS = ("prompt_eval_count", "prompt_eval_duration", "eval_count",
+                    "eval_duration", "load_duration", "total_duration")
+
+
+class OllamaError(RuntimeError):
+    """Ошибка ответа сервера Ollama."""
+
+
+class OllamaUnavailableError(OllamaError):
+    """Сервер Ollama недоступен (не запущен или отказал в соединении)."""
+
+
+class OllamaTimeoutError(OllamaError, TimeoutError):
+    """Сервер Ollama не ответил за отведенное время."""
+
+
+class OllamaClient:
+    """
+    Клиент REST API Ollama с пулом постоянных соединений.
+
+    Соединения переиспользуются между запросами и потоками: свободные
+    соединения хранятся в пуле, занятое соединение принадлежит одному
+    запросу. Если сервер закрыл простаивающее соединение, запрос
+    повторяется один раз на новом соединении.
+
+    Атрибуты:
+        host (str): Адрес сервера, например "http://127.0.0.1:11434"
+        model (str): Модель по умолчанию
+        keep_alive (str): Время удержания модели в памяти сервера ("10m", "-1" - всегда)
+        timeout (float): Таймаут запроса в секундах
+        pool_size (int): Максимальное количество простаивающих соединений
+    """
+
+    def __init__(self, host: Optional[str] = None,
+                 model: str = "deepseek-v3.1:671b-cloud",
+                 keep_alive: str = DEFAULT_KEEP_ALIVE,
+                 timeout: float = DEFAULT_TIMEOUT, pool_size: int = 4):
+        """
+        Инициализация клиента. Соединения открываются при первом запросе.
+
+        Args:
+            host: Адрес сервера (None - OLLAMA_HOST или DEFAULT_HOST)
+            model: Модель по умолчанию
+            keep_alive: Время удержания модели в памяти сервера
+            timeout: Таймаут запроса в секундах
+            pool_size: Максимальное количество простаивающих соединений
+        """
+        self.host = host or os.environ.get("OLLAMA_HOST") or DEFAULT_HOST
+        self.model = model
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(pool_size)
+
+        address = self.host if "://" in self.host else f"http://{self.host}"
+        parts = urlsplit(address)
+        self._https = parts.scheme == "https"
+        self._hostname = parts.hostname or "127.0.0.1"
+        self._port = parts.port or (443 if self._https else 11434)
+        self._base_path = parts.path.rstrip("/")
+
+    def generate(self, prompt: str, model: Optional[str] = None,
+                 system: Optional[str] = None,
+                 options: Optional[Dict[str, Any]] = None,
+                 timeout: Optional[float] = None,
+                 on_metrics: Optional[Callable[[Dict[str, Any]], None]] = None) -> str:
+        """
+        Генерирует ответ модели на промпт (/api/generate).
+
+        Неизменные инструкции лучше передавать в system, а в prompt - только
+        изменяемую часть: сервер повторно использует контекст загруженной
+        модели для совпадающего начала промпта.
+
+        Args:
+            prompt: Текст промпта
+            model: Модель (None - модель клиента)
+            system: Системный промпт
+            options: Параметры генерации Ollama (temperature, num_predict, ...)
+            timeout: Таймаут этого запроса (None - таймаут клиента)
+            on_metrics: Получает счетчики генерации (RESPONSE_METRICS)
+
+        Returns:
+            str: Текст ответа модели
+
+        Raises:
+            OllamaUnavailableError: Если сервер недоступен
+            OllamaTimeoutError: Если сервер не ответил за timeout секунд
+            OllamaError: При ошибке ответа сервера
+        """
+        payload = self._payload(model, options, prompt=prompt)
+        if system is not None:
+            payload["system"] = system
+        result = self.request("/api/generate", payload, timeout=timeout)
+        if on_metrics is not None:
+            on_metrics(_response_metrics(result))
+        return result.get("response", "").strip()
+
+    def chat(self, messages: List[Dict[str, str]], model: Optional[str] = None,
+             options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Генерирует ответ модели в диалоге (/api/chat).
+
+        Args:
+            messages: Сообщения вида {"role": "system"|"user"|"assistant", "content": ...}
+            model: Модель (None - модель клиента)
+            options: Параметры генерации Ollama
+
+        Returns:
+            str: Текст ответа ассистента
+
+        Raises:
+            OllamaUnavailableError: Если сервер недоступен
+            OllamaTimeoutError: Если сервер не ответил за timeout секунд
+            OllamaError: При ошибке ответа сервера
+        """
+        payload = self._payload(model, options, messages=messages)
+        response = self.request("/api/chat", payload)
+        return response.get("message", {}).get("content", "").strip()
+
+    def load_model(self, model: Optional[str] = None,
+                   keep_alive: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Загружает модель в память сервера без генерации (/api/generate без промпта).
+
+        Повторный вызов для загруженной модели только продлевает ее удержание.
+
+        Args:
+            model: Модель (None - модель клиента)
+            keep_alive: Время удержания (None - keep_alive клиента, "0" - выгрузить)
+
+        Returns:
+            Dict[str, Any]: Ответ сервера
+
+        Raises:
+            OllamaUnavailableError: Если сервер недоступен
+            OllamaTimeoutError: Если модель не загрузилась за timeout секунд
+            OllamaError: При ошибке ответа сервера (например, модель не найдена)
+        """
+        payload = self._payload(model, None)
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        return self.request("/api/generate", payload)
+
+    def is_available(self) -> bool:
+        """Проверяет, отвечает ли сервер (/api/version)."""
+        try:
+            self.request("/api/version", method="GET")
+            return True
+        except OllamaError:
+            return False
+
+    def request(self, path: str, payload: Optional[Dict[str, Any]] = None,
+                method: str = "POST", timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Выполняет запрос к API и возвращает разобранный JSON-ответ.
+
+        Args:
+            path: Путь API, например "/api/generate"
+            payload: Тело запроса (для POST)
+            method: HTTP-метод
+            timeout: Таймаут этого запроса (None - таймаут клиента)
+
+        Returns:
+            Dict[str, Any]: Ответ сервера
+
+        Raises:
+            OllamaUnavailableError: Если сервер недоступен
+            OllamaTimeoutError: Если сервер не ответил за timeout секунд
+            OllamaError: При HTTP-ошибке или некорректном ответе
+        """
+        connection, response = self._send(method, path, payload, timeout)
+        try:
+            data = response.read()
+        except socket.timeout as error:
+            connection.close()
+            raise OllamaTimeoutError(f"Таймаут запроса к Ollama ({connection.timeout} с)") from error
+        self._finish(connection, response)
+        return self._parse_response(response.status, data)
+
+    def stream_generate(self, prompt: str, model: Optional[str] = None,
+                        system: Optional[str] = None,
+                        options: Optional[Dict[str, Any]] = None,
+                        timeout: Optional[float] = None,
+                        on_metrics: Optional[Callable[[Dict[str, Any]], None]] = None) -> Iterator[str]:
+        """
+        Генерирует ответ модели с потоковой передачей (/api/generate, stream=true).
+
+        Запрос отправляется сразу (ошибки соединения возникают при вызове),
+        фрагменты текста читаются по мере генерации. Если закрыть итератор
+        до конца ответа, соединение разрывается и сервер прекращает генерацию.
+
+        Args:
+            prompt: Текст промпта
+            model: Модель (None - модель клиента)
+            system: Системный промпт
+            options: Параметры генерации Ollama
+            timeout: Таймаут ожидания очередного фрагмента (None - таймаут клиента)
+            on_metrics: Получает счетчики генерации (RESPONSE_METRICS)
+                после последнего фрагмента; для прерванного потока не вызывается
+
+        Returns:
+            Iterator[str]: Фрагменты ответа модели
+
+        Raises:
+            OllamaUnavailableError: Если сервер недоступен
+            OllamaTimeoutError: Если сервер не ответил за timeout секунд
+            OllamaError: При ошибке ответа сервера
+        """
+        payload = self._payload(model, options, prompt=prompt, stream=True)
+        if system is not None:
+            payload["system"] = system
+        connection, response = self._send("POST", "/api/generate", payload, timeout)
+        if response.status != 200:
+            data = response.read()
+            self._finish(connection, response)
+            self._parse_response(response.status, data)
+        return self._iter_stream(connection, response, on_metrics)
+
+    def close(self):
+        """Закрывает все простаивающие соединения пула."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _payload(self, model: Optional[str], options: Optional[Dict[str, Any]],
+                 **fields) -> Dict[str, Any]:
+        """Формирует тело запроса генерации (по умолчанию без потоковой передачи)."""
+        payload = {"model": model or self.model, "stream": False,
+                   "keep_alive": self.keep_alive}
+        payload.update(fields)
+        if options:
+            payload["options"] = options
+        return payload
+
+    def _send(self, method: str, path: str, payload: Optional[Dict[str, Any]],
+              timeout: Optional[float] = None):
+        """
+        Отправляет запрос и читает заголовки ответа; возвращает (соединение, ответ).
+
+        Если сервер закрыл простаивающее соединение из пула, запрос
+        повторяется один раз на новом соединении. Таймаут устанавливается
+        на соединение для каждого запроса (None - таймаут клиента).
+        """
+        timeout = self.timeout if timeout is None else timeout
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+
+        for attempt in range(2):
+            connection, reused = self._acquire()
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            try:
+                connection.request(method, self._base_path + path, body=body, headers=headers)
+                return connection, connection.getresponse()
+            except socket.timeout as error:
+                connection.close()
+                raise OllamaTimeoutError(f"Таймаут запроса к Ollama ({timeout} с)") from error
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as error:
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                raise OllamaUnavailableError(f"Соединение с Ollama разорвано: {error}") from error
+            except OSError as error:
+                connection.close()
+                raise OllamaUnavailableError(f"Сервер Ollama недоступен по адресу {self.host}: {error}") from error
+
+    def _iter_stream(self, connection: http.client.HTTPConnection,
+                     response: http.client.HTTPResponse,
+                     on_metrics: Optional[Callable[[Dict[str, Any]], None]] = None) -> Iterator[str]:
+        """Читает потоковый ответ (JSON-объект на строку) и выдает фрагменты текста."""
+        done = False
+        try:
+            for line in iter(response.readline, b""):
+                if not line.strip():
+                    continue
+                chunk = self._parse_response(200, line)
+                # Рассуждения моделей с режимом thinking приходят отдельным полем
+                text = chunk.get("response", "")
+                if text:
+                    yield text
+                if chunk.get("done"):
+                    done = True
+                    if on_metrics is not None:
+                        on_metrics(_response_metrics(chunk))
+                    break
+            if done:
+                response.read()
+        except socket.timeout as error:
+            raise OllamaTimeoutError(f"Таймаут запроса к Ollama ({connection.timeout} с)") from error
+        finally:
+            if done:
+                self._finish(connection, response)
+            else:
+                # Генерация прервана: разрыв соединения останавливает ее на сервере
+                connection.close()
+
+    def _finish(self, connection: http.client.HTTPConnection,
+                response: http.client.HTTPResponse):
+        """Возвращает соединение в пул после полностью прочитанного ответа."""
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+
+    def _parse_response(self, status: int, data: bytes) -> Dict[str, Any]:
+        """Разбирает JSON-ответ сервера и проверяет ошибки."""
+        try:
+            result = json.loads(data.decode("utf-8")) if data else {}
+        except ValueError as error:
+            raise OllamaError(f"Некорректный ответ Ollama: {data[:200]!r}") from error
+
+        message = result.get("error") if isinstance(result, dict) else None
+        if status != 200 or message:
+            raise OllamaError(f"Ошибка Ollama (HTTP {status}): {message or ''}")
+        return result
+
+    def _acquire(self):
+        """Берет соединение из пула или открывает новое; возвращает (соединение, из_пула)."""
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            connection_class = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            return connection_class(self._hostname, self._port, timeout=self.timeout), False
+
+    def _release(self, connection: http.client.HTTPConnection):
+        """Возвращает соединение в пул (или закрывает, если пул заполнен)."""
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+
+class ModelWarmer:
+    """
+    Фоновая загрузка модели и удержание ее в памяти сервера.
+
+    Рабочий поток загружает модель сразу после start (OllamaClient.load_model),
+    а затем, пока приложение используется (touch вызывался не позже
+    idle_timeout секунд назад), повторяет запрос каждые refresh_interval
+    секунд и тем самым продлевает keep_alive клиента. После простоя продление
+    прекращается, и сервер выгружает модель по истечении keep_alive; следующий
+    touch сразу загружает ее снова. Недоступный сервер опрашивается с тем же
+    интервалом, поэтому модель загрузится, когда сервер запустится.
+
+    Атрибуты:
+        client (OllamaClient): Клиент сервера (любой адрес, в том числе
+            локальная имитация сервера)
+        model (str): Загружаемая модель
+        idle_timeout (float): Простой в секундах, после которого модель
+            перестает удерживаться
+        refresh_interval (float): Интервал продления в секундах
+        state (str): Состояние: WARMUP_PENDING, WARMUP_LOADING, WARMUP_READY,
+            WARMUP_UNAVAILABLE или WARMUP_IDLE
+        load_time (Optional[float]): Длительность последней загрузки в секундах
+        error (Optional[str]): Ошибка последней неудачной загрузки
+    """
+
+    def __init__(self, client: OllamaClient, model: Optional[str] = None,
+                 on_state: Optional[Callable[[str], None]] = None,
+                 idle_timeout: float = 1800.0,
+                 refresh_interval: Optional[float] = None):
+        """
+        Инициализация без запуска потока.
+
+        Args:
+            client: Клиент сервера Ollama
+            model: Модель (None - модель клиента)
+            on_state: Функция, вызываемая из рабочего потока при смене состояния
+            idle_timeout: Простой в секундах, после которого продление прекращается
+            refresh_interval: Интервал продления (None - половина keep_alive
+                клиента или DEFAULT_REFRESH_INTERVAL при бессрочном удержании)
+        """
+        self.client = client
+        self.model = model or client.model
+        self.on_state = on_state
+        self.idle_timeout = idle_timeout
+        if refresh_interval is None:
+            keep_alive = parse_keep_alive(client.keep_alive)
+            refresh_interval = DEFAULT_REFRESH_INTERVAL if keep_alive is None else max(1.0, keep_alive / 2)
+        self.refresh_interval = refresh_interval
+        self.state = WARMUP_PENDING
+        self.load_time: Optional[float] = None
+        self.error: Optional[str] = None
+        self._last_activity = time.monotonic()
+        self._wake = threading.Event()
+        self._ready = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Запускает фоновую загрузку (повторный вызов ничего не делает)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="model-warmup", daemon=True)
+            self._thread.start()
+
+    def touch(self):
+        """Отмечает использование приложения; после простоя загружает модель снова."""
+        self._last_activity = time.monotonic()
+        if self.state == WARMUP_IDLE:
+            self._wake.set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Ждет первой успешной загрузки модели; возвращает, загружена ли она."""
+        return self._ready.wait(timeout)
+
+    def stop(self, timeout: float = 1.0):
+        """Останавливает продление (модель остается на сервере до конца keep_alive)."""
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        """Цикл рабочего потока: загрузка и продление, пока нет простоя."""
+        while not self._stopped:
+            if time.monotonic() - self._last_activity <= self.idle_timeout:
+                self._load()
+            elif self.state != WARMUP_IDLE:
+                self._set_state(WARMUP_IDLE)
+            self._wake.wait(self.refresh_interval)
+            self._wake.clear()
+
+    def _load(self):
+        """Загружает (или продлевает) модель и обновляет состояние."""
+        if self.state != WARMUP_READY:
+            self._set_state(WARMUP_LOADING)
+        start = time.perf_counter()
+        try:
+            self.client.load_model(self.model)
+        except OllamaError as error:
+            self.error = str(error)
+            self._set_state(WARMUP_UNAVAILABLE)
+            return
+        self.error = None
+        if self.state != WARMUP_READY:
+            self.load_time = time.perf_counter() - start
+            self._ready.set()
+            self._set_state(WARMUP_READY)
+
+    def _set_state(self, state: str):
+        """Меняет состояние и сообщает о нем (после stop - без уведомления)."""
+        self.state = state
+        if self.on_state is not None and not self._stopped:
+            self.on_state(state)
+
+
+def parse_keep_alive(value: str) -> Optional[float]:
+    """
+    Переводит время удержания Ollama в секунды.
+
+    Args:
+        value: Число секунд или длительность вида "10m", "1h30m", "500ms";
+            отрицательное значение - бессрочно
+
+    Returns:
+        Optional[float]: Секунды или None для бессрочного удержания
+
+    Raises:
+        ValueError: При некорректной записи
+
+    Пример:
+        >>> parse_keep_alive("1h30m"), parse_keep_alive("-1")
+        (5400.0, None)
+    """
+    text = str(value).strip()
+    if text.startswith("-"):
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h)", text)
+    if not parts or "".join(number + unit for number, unit in parts) != text:
+        raise ValueError(f"Некорректное время удержания модели: {value!r}")
+    return sum(float(number) * DURATION_UNITS[unit] for number, unit in parts)
+
+
+def _response_metrics(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Выбирает из ответа сервера счетчики генерации (RESPONSE_METRICS)."""
+    return {key: result[key] for key in RESPONSE_METRICS if key in result}
+
+
+_default_client: Optional[OllamaClient] = None
+_default_client_lock = threading.Lock()
+
+
+def default_client() -> OllamaClient:
+    """
+    Возвращает общий клиент приложения (создается при первом вызове).
+
+    Адрес сервера берется из OLLAMA_HOST, время удержания модели - из
+    OLLAMA_KEEP_ALIVE.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = OllamaClient(
+                keep_alive=os.environ.get("OLLAMA_KEEP_ALIVE", DEFAULT_KEEP_ALIVE))
+        return _default_client
@@ -1,796 +1,1652 @@
-"""
-Модуль для доказательства методом резолюций в логике предикатов первого порядка.
-Реализует алгоритм резолюции с унификацией для автоматического доказательства
-теорем в логике предикатов первого порядка.
-"""
-
-import re
-from typing import List, Tuple, Dict, Optional, Any, Set
-
-
-class ResolutionEngine:
-    """
-    Движок резолюций для логики предикатов первого порядка.
-    
-    Реализует алгоритм резолюции с подробным логированием всех шагов,
-    включая унификацию, применение подстановок и проверку на противоречие.
-    
-    Атрибуты:
-        steps_log (List[Dict]): Лог всех шагов доказательства
-        step_counter (int): Счетчик шагов резолюции
-        clause_registry (Dict[int, Dict]): Регистр всех клауз с метаданными
-        next_clause_id (int): Следующий доступный ID для клаузы
-    """
-
-    def __init__(self):
-        """Инициализация движка резолюций с пустыми структурами данных."""
-        self.steps_log = []  # Лог всех шагов резолюции
-        self.step_counter = 0  # Счетчик шагов
-        self.clause_registry = {}  # Регистр клауз: id -> {clause, source, parents}
-        self.next_clause_id = 0  # Счетчик для назначения ID клаузам
-
-    def prove(self, clauses: List[str]) -> Tuple[bool, List[Dict]]:
-        """
-        Основной метод доказательства методом резолюций.
-        
-        Принимает множество клауз и пытается вывести противоречие (пустую клаузу).
-        
-        Args:
-            clauses: Список дизъюнктов в строковом формате, например:
-                    ["P(x) ∨ Q(y)", "¬P(a)", "¬Q(b)"]
-        
-        Returns:
-            Tuple[bool, List[Dict]]: 
-                - bool: True если доказательство успешно (найдено противоречие)
-                - List[Dict]: Подробный лог всех шагов доказательства
-        
-        Пример:
-            >>> engine = ResolutionEngine()
-            >>> success, log = engine.prove(["P(x)", "¬P(a)"])
-            >>> print(success)
-            True
-        """
-        # Инициализация состояния движка для нового доказательства
-        self.steps_log = []
-        self.step_counter = 0
-        self.clause_registry = {}
-        self.next_clause_id = 0
-
-        try:
-            # Шаг 1: Парсинг входных клауз
-            parsed_clauses = [self._parse_clause(clause) for clause in clauses]
-
-            # Шаг 2: Регистрация исходных клауз
-            initial_clause_ids = []
-            for i, clause in enumerate(parsed_clauses):
-                clause_id = self._register_clause(clause, f"Исходная клауза {i+1}")
-                initial_clause_ids.append(clause_id)
-
-            # Шаг 3: Логирование начального состояния
-            self._log_initial_state(initial_clause_ids, clauses)
-
-            # Шаг 4: Запуск алгоритма резолюции
-            result = self._resolution_algorithm(initial_clause_ids)
-
-            return result, self.steps_log
-
-        except Exception as e:
-            # Обработка и логирование ошибок
-            error_step = {
-                'step': 'error',
-                'type': 'error',
-                'message': f'Ошибка при выполнении резолюции: {str(e)}'
-            }
-            self.steps_log.append(error_step)
-            return False, self.steps_log
-
-    def _parse_clause(self, clause_str: str) -> List[Tuple[str, List[str], bool]]:
-        """
-        Парсит строковое представление клаузы во внутреннюю структуру.
-        
-        Внутреннее представление клаузы: список литералов, где каждый литерал -
-        это кортеж (предикат, аргументы, отрицание).
-        
-        Args:
-            clause_str: Строка клаузы, например "P(x) ∨ ¬Q(y,z)"
-        
-        Returns:
-            List[Tuple[str, List[str], bool]]: Список литералов клаузы
-        
-        Пример:
-            >>> self._parse_clause("P(x) ∨ ¬Q(a, f(b))")
-            [('P', ['x'], False), ('Q', ['a', 'f(b)'], True)]
-        """
-        clause = []
-
-        # Разделение клаузы на литералы с учетом вложенных скобок
-        literals = self._split_literals(clause_str)
-
-        for literal in literals:
-            literal = literal.strip()
-            if not literal:
-                continue
-
-            # Определение отрицания (литерал начинается с '¬')
-            negated = literal.startswith('¬')
-            if negated:
-                literal = literal[1:].strip()  # Удаление символа отрицания
-
-            # Извлечение предиката и аргументов
-            pred, args = self._parse_predicate_with_args(literal)
-            if pred:
-                clause.append((pred, args, negated))
-
-        return clause
-
-    def _split_literals(self, clause_str: str) -> List[str]:
-        """
-        Разделяет строку клаузы на отдельные литералы.
-        
-        Учитывает вложенные скобки для корректной обработки функций.
-        
-        Args:
-            clause_str: Строка клаузы с разделителями '∨'
-        
-        Returns:
-            List[str]: Список строк литералов
-        
-        Пример:
-            >>> self._split_literals("P(x) ∨ Q(f(a,b)) ∨ R(z)")
-            ['P(x)', 'Q(f(a,b))', 'R(z)']
-        """
-        literals = []
-        current_literal = ""
-        bracket_depth = 0  # Глубина вложенности скобок
-
-        for char in clause_str:
-            if char == '(':
-                bracket_depth += 1
-            elif char == ')':
-                bracket_depth -= 1
-            elif char == '∨' and bracket_depth == 0:
-                # Разделитель на верхнем уровне - разделяем литералы
-                literals.append(current_literal.strip())
-                current_literal = ""
-                continue
-
-            current_literal += char
-
-        # Добавление последнего литерала
-        if current_literal.strip():
-            literals.append(current_literal.strip())
-
-        return literals
-
-    def _parse_predicate_with_args(self, literal: str) -> Tuple[Optional[str], List[str]]:
-        """
-        Извлекает имя предиката и список аргументов из литерала.
-        
-        Args:
-            literal: Строка литерала без отрицания, например "P(x, f(y))"
-        
-        Returns:
-            Tuple[Optional[str], List[str]]: (предикат, список аргументов)
-        
-        Пример:
-            >>> self._parse_predicate_with_args("P(x, f(a,b))")
-            ('P', ['x', 'f(a,b)'])
-        """
-        # Поиск открывающей скобки с аргументами
-        open_bracket_pos = literal.find('(')
-        if open_bracket_pos == -1 or not literal.endswith(')'):
-            # Литерал без аргументов или с синтаксической ошибкой
-            return None, []
-
-        predicate_name = literal[:open_bracket_pos].strip()
-        args_string = literal[open_bracket_pos+1:-1]  # Текст между скобками
-
-        # Разделение аргументов с учетом вложенных функций
-        arguments = self._split_arguments(args_string)
-
-        return predicate_name, arguments
-
-    def _split_arguments(self, args_str: str) -> List[str]:
-        """
-        Разделяет строку аргументов на отдельные аргументы.
-        
-        Учитывает вложенные скобки в функциональных термах.
-        
-        Args:
-            args_str: Строка аргументов, например "x, f(a,b), y"
-        
-        Returns:
-            List[str]: Список аргументов
-        
-        Пример:
-            >>> self._split_arguments("x, f(a,b), y")
-            ['x', 'f(a,b)', 'y']
-        """
-        arguments = []
-        current_arg = ""
-        bracket_depth = 0
-
-        for char in args_str:
-            if char == '(':
-                bracket_depth += 1
-            elif char == ')':
-                bracket_depth -= 1
-            elif char == ',' and bracket_depth == 0:
-                # Запятая на верхнем уровне - разделитель аргументов
-                arguments.append(current_arg.strip())
-                current_arg = ""
-                continue
-
-            current_arg += char
-
-        # Добавление последнего аргумента
-        if current_arg.strip():
-            arguments.append(current_arg.strip())
-
-        return arguments
-
-    def _register_clause(self, clause: List[Tuple[str, List[str], bool]], 
-                        source: str) -> int:
-        """
-        Регистрирует клаузу в реестре и возвращает её идентификатор.
-        
-        Args:
-            clause: Внутреннее представление клаузы
-            source: Описание источника клаузы
-        
-        Returns:
-            int: Уникальный идентификатор зарегистрированной клаузы
-        """
-        clause_id = self.next_clause_id
-        self.clause_registry[clause_id] = {
-            'clause': clause,           # Внутреннее представление
-            'string': self._clause_to_string(clause),  # Строковое представление
-            'source': source,           # Источник клаузы
-            'parents': []               # ID родительских клауз (для резолюции)
-        }
-        self.next_clause_id += 1
-        return clause_id
-
-    def _clause_to_string(self, clause: List[Tuple[str, List[str], bool]]) -> str:
-        """
-        Конвертирует внутреннее представление клаузы в строку.
-        
-        Args:
-            clause: Внутреннее представление клаузы
-        
-        Returns:
-            str: Строковое представление клаузы
-        
-        Пример:
-            >>> self._clause_to_string([('P', ['x'], False), ('Q', ['y'], True)])
-            'P(x) ∨ ¬Q(y)'
-        """
-        if not clause:  # Пустая клауза - противоречие
-            return '□'
-
-        literals = []
-        for predicate, args, negated in clause:
-            # Форматирование литерала: [¬]предикат(аргументы)
-            negation_symbol = '¬' if negated else ''
-            arguments_str = ', '.join(args)
-            literal_str = f"{negation_symbol}{predicate}({arguments_str})"
-            literals.append(literal_str)
-
-        # Соединение литералов дизъюнкцией
-        return ' ∨ '.join(literals) if len(literals) > 1 else literals[0]
-
-    def _log_initial_state(self, clause_ids: List[int], original_clauses: List[str]):
-        """
-        Логирует начальное состояние системы клауз.
-        
-        Args:
-            clause_ids: Список ID исходных клауз
-            original_clauses: Оригинальные строковые представления клауз
-        """
-        clauses_info = []
-        for clause_id in clause_ids:
-            clause_data = self.clause_registry[clause_id]
-            clauses_info.append({
-                'id': clause_id,
-                'clause': clause_data['string'],
-                'source': clause_data['source']
-            })
-
-        initial_state_log = {
-            'step': 0,
-            'type': 'initial',
-            'clauses': clauses_info,
-            'original_clauses': original_clauses,
-            'message': 'Начальное множество клауз'
-        }
-        self.steps_log.append(initial_state_log)
-
-    def _resolution_algorithm(self, initial_clause_ids: List[int]) -> bool:
-        """
-        Основной алгоритм резолюции.
-        
-        Реализует метод резолюции с поиском в ширину. Алгоритм продолжает
-        генерировать новые резольвенты до тех пор, пока не будет найдена
-        пустая клауза (противоречие) или не исчерпаются возможные резолюции.
-        
-        Args:
-            initial_clause_ids: Список ID исходных клауз
-        
-        Returns:
-            bool: True если найдено противоречие, иначе False
-        """
-        used_pairs: Set[Tuple[int, int]] = set()  # Множество использованных пар клауз
-        all_clause_ids = initial_clause_ids.copy()  # Все известные клаузы
-
-        while True:
-            self.step_counter += 1
-
-            # Проверка на наличие пустой клаузы (противоречия)
-            contradiction_found = self._check_for_contradiction(all_clause_ids)
-            if contradiction_found:
-                return True
-
-            # Попытка применить резолюцию к новым парам клауз
-            new_clauses_found = self._try_resolutions(all_clause_ids, used_pairs)
-
-            if not new_clauses_found:
-                # Не удалось найти новые клаузы - доказательство невозможно
-                no_progress_log = {
-                    'step': self.step_counter,
-                    'type': 'no_new_clauses',
-                    'message': 'Новых клауз не найдено - доказательство невозможно'
-                }
-                self.steps_log.append(no_progress_log)
-                return False
-
-            # Защита от бесконечного цикла
-            if self.step_counter > 100:
-                timeout_log = {
-                    'step': self.step_counter,
-                    'type': 'timeout',
-                    'message': 'Превышено максимальное количество шагов'
-                }
-                self.steps_log.append(timeout_log)
-                return False
-
-    def _check_for_contradiction(self, clause_ids: List[int]) -> bool:
-        """
-        Проверяет множество клауз на наличие пустой клаузы (противоречия).
-        
-        Args:
-            clause_ids: Список ID проверяемых клауз
-        
-        Returns:
-            bool: True если найдена пустая клауза
-        """
-        for clause_id in clause_ids:
-            clause = self.clause_registry[clause_id]['clause']
-            if not clause:  # Пустая клауза □
-                contradiction_log = {
-                    'step': self.step_counter,
-                    'type': 'contradiction_found',
-                    'clause_id': clause_id,
-                    'clause': '□',
-                    'parents': self.clause_registry[clause_id]['parents'],
-                    'message': 'Найдена пустая клауза - противоречие!'
-                }
-                self.steps_log.append(contradiction_log)
-                return True
-        return False
-
-    def _try_resolutions(self, all_clause_ids: List[int], 
-                        used_pairs: Set[Tuple[int, int]]) -> bool:
-        """
-        Пытается применить резолюцию ко всем возможным парам клауз.
-        
-        Args:
-            all_clause_ids: Список всех ID клауз
-            used_pairs: Множество уже использованных пар клауз
-        
-        Returns:
-            bool: True если найдена хотя бы одна новая клауза
-        """
-        new_clauses_found = False
-        n = len(all_clause_ids)
-
-        # Перебор всех возможных пар клауз
-        for i in range(n):
-            for j in range(i + 1, n):
-                clause1_id = all_clause_ids[i]
-                clause2_id = all_clause_ids[j]
-
-                # Пропуск уже использованных пар
-                if (clause1_id, clause2_id) in used_pairs:
-                    continue
-
-                clause1 = self.clause_registry[clause1_id]['clause']
-                clause2 = self.clause_registry[clause2_id]['clause']
-
-                # Применение резолюции к паре клауз
-                resolvents, unification_logs = self._resolve_clauses(
-                    clause1, clause2, clause1_id, clause2_id)
-
-                if resolvents:
-                    used_pairs.add((clause1_id, clause2_id))
-
-                    # Обработка найденных резольвент
-                    for resolvent, log_entry in zip(resolvents, unification_logs):
-                        if self._process_resolvent(resolvent, all_clause_ids, 
-                                                 clause1_id, clause2_id, log_entry):
-                            new_clauses_found = True
-
-        return new_clauses_found
-
-    def _process_resolvent(self, resolvent: List[Tuple[str, List[str], bool]],
-                          all_clause_ids: List[int], clause1_id: int, clause2_id: int,
-                          log_entry: Dict) -> bool:
-        """
-        Обрабатывает найденную резольвенту: проверяет и регистрирует её.
-        
-        Args:
-            resolvent: Резольвента для обработки
-            all_clause_ids: Список всех ID клауз (будет дополнен)
-            clause1_id: ID первой родительской клаузы
-            clause2_id: ID второй родительской клаузы
-            log_entry: Информация для логирования
-        
-        Returns:
-            bool: True если резольвента была добавлена
-        """
-        # Пропуск тавтологий
-        if self._is_tautology(resolvent):
-            return False
-
-        # Пропуск клауз, которые поглощаются существующими
-        if self._is_subsumed(resolvent, all_clause_ids):
-            return False
-
-        # Регистрация новой клаузы
-        parents = [clause1_id, clause2_id]
-        resolvent_id = self._register_clause(resolvent, f"Резольвента шага {self.step_counter}")
-        self.clause_registry[resolvent_id]['parents'] = parents
-
-        all_clause_ids.append(resolvent_id)
-
-        # Логирование шага резолюции
-        resolution_step_log = {
-            'step': self.step_counter,
-            'type': 'resolution_step',
-            'clause1_id': clause1_id,
-            'clause2_id': clause2_id,
-            'clause1': self._clause_to_string(self.clause_registry[clause1_id]['clause']),
-            'clause2': self._clause_to_string(self.clause_registry[clause2_id]['clause']),
-            'resolvent_id': resolvent_id,
-            'resolvent': self._clause_to_string(resolvent),
-            'unification': log_entry['unification'],
-            'literals_resolved': log_entry['literals_resolved'],
-            'parents': parents,
-            'new_clauses_count': len(all_clause_ids),
-            'message': f'Резолюция клауз {clause1_id} и {clause2_id}'
-        }
-        self.steps_log.append(resolution_step_log)
-
-        return True
-
-    def _resolve_clauses(self, clause1: List[Tuple[str, List[str], bool]],
-                        clause2: List[Tuple[str, List[str], bool]],
-                        clause1_id: int, clause2_id: int) -> Tuple[List, List]:
-        """
-        Применяет резолюцию к двум клаузам.
-        
-        Ищет комплементарные литералы и пытается их унифицировать.
-        
-        Args:
-            clause1: Первая клауза
-            clause2: Вторая клауза
-            clause1_id: ID первой клаузы (для отладки)
-            clause2_id: ID второй клаузы (для отладки)
-        
-        Returns:
-            Tuple[List, List]: (список резольвент, список логов унификации)
-        """
-        resolvents = []
-        unification_logs = []
-
-        # Перебор всех пар литералов из разных клауз
-        for i, (pred1, args1, neg1) in enumerate(clause1):
-            for j, (pred2, args2, neg2) in enumerate(clause2):
-                # Условие резолюции: одинаковые предикаты, разные знаки
-                if pred1 == pred2 and neg1 != neg2:
-                    # Попытка унификации аргументов
-                    substitution = self._unify(args1, args2)
-
-                    if substitution is not None:
-                        # Успешная унификация - создаем резольвенту
-                        resolvent = self._create_resolvent(
-                            clause1, clause2, i, j, substitution)
-
-                        resolvents.append(resolvent)
-
-                        # Сохранение информации об унификации для лога
-                        log_entry = {
-                            'unification': substitution,
-                            'literals_resolved': [
-                                (f'{"¬" if neg1 else ""}{pred1}({", ".join(args1)})', i),
-                                (f'{"¬" if neg2 else ""}{pred2}({", ".join(args2)})', j)
-                            ]
-                        }
-                        unification_logs.append(log_entry)
-
-        return resolvents, unification_logs
-
-    def _create_resolvent(self, clause1: List[Tuple[str, List[str], bool]],
-                         clause2: List[Tuple[str, List[str], bool]],
-                         idx1: int, idx2: int,
-                         substitution: Dict[str, str]) -> List[Tuple[str, List[str], bool]]:
-        """
-        Создает резольвенту из двух клауз с применением подстановки.
-        
-        Args:
-            clause1: Первая клауза
-            clause2: Вторая клауза
-            idx1: Индекс разрешаемого литерала в первой клаузе
-            idx2: Индекс разрешаемого литерала во второй клаузе
-            substitution: Подстановка для унификации
-        
-        Returns:
-            List[Tuple]: Новая резольвента
-        """
-        # Применение подстановки к обеим клаузам
-        substituted_clause1 = self._apply_substitution(clause1, substitution)
-        substituted_clause2 = self._apply_substitution(clause2, substitution)
-
-        # Создание резольвенты: объединение без разрешаемых литералов
-        resolvent = []
-
-        # Добавление литералов из первой клаузы (кроме разрешаемого)
-        for k, literal in enumerate(substituted_clause1):
-            if k != idx1:
-                if literal not in resolvent:  # Избегание дубликатов
-                    resolvent.append(literal)
-
-        # Добавление литералов из второй клаузы (кроме разрешаемого)
-        for k, literal in enumerate(substituted_clause2):
-            if k != idx2:
-                if literal not in resolvent:  # Избегание дубликатов
-                    resolvent.append(literal)
-
-        return resolvent
-
-    def _unify(self, args1: List[str], args2: List[str]) -> Optional[Dict[str, str]]:
-        """
-        Унифицирует два списка аргументов.
-        
-        Алгоритм унификации Робинсона для нахождения подстановки,
-        делающей два терма идентичными.
-        
-        Args:
-            args1: Список аргументов первого литерала
-            args2: Список аргументов второго литерала
-        
-        Returns:
-            Optional[Dict[str, str]]: Подстановка или None если унификация невозможна
-        
-        Пример:
-            >>> self._unify(['x', 'a'], ['b', 'y'])
-            {'x': 'b', 'y': 'a'}
-        """
-        if len(args1) != len(args2):
-            return None  # Разное количество аргументов
-
-        substitution = {}
-
-        for term1, term2 in zip(args1, args2):
-            # Случай 1: Оба терма - константы
-            if self._is_constant(term1) and self._is_constant(term2):
-                if term1 != term2:
-                    return None  # Разные константы не унифицируемы
-
-            # Случай 2: Переменная и произвольный терм
-            elif self._is_variable(term1):
-                if term1 in substitution:
-                    # Переменная уже имеет подстановку - рекурсивная унификация
-                    if not self._unify_terms(substitution[term1], term2, substitution):
-                        return None
-                else:
-                    # Новая подстановка: переменная -> терм
-                    substitution[term1] = term2
-
-            # Случай 3: Произвольный терм и переменная
-            elif self._is_variable(term2):
-                if term2 in substitution:
-                    if not self._unify_terms(term1, substitution[term2], substitution):
-                        return None
-                else:
-                    substitution[term2] = term1
-
-            # Случай 4: Оба терма содержат функции
-            elif self._contains_function(term1) or self._contains_function(term2):
-                # Упрощенная проверка: только точное совпадение
-                if term1 != term2:
-                    return None
-
-            # Случай 5: Любой другой случай (не должен происходить)
-            else:
-                return None
-
-        return substitution
-
-    def _unify_terms(self, term1: str, term2: str, 
-                    substitution: Dict[str, str]) -> bool:
-        """
-        Рекурсивно унифицирует два терма с учетом текущей подстановки.
-        
-        Args:
-            term1: Первый терм
-            term2: Второй терм
-            substitution: Текущая подстановка (модифицируется)
-        
-        Returns:
-            bool: True если унификация успешна
-        """
-        # Применяем существующие подстановки к термам
-        resolved_term1 = self._apply_substitution_to_term(term1, substitution)
-        resolved_term2 = self._apply_substitution_to_term(term2, substitution)
-
-        # Базовые случаи унификации
-        if resolved_term1 == resolved_term2:
-            return True
-        elif self._is_variable(resolved_term1):
-            substitution[resolved_term1] = resolved_term2
-            return True
-        elif self._is_variable(resolved_term2):
-            substitution[resolved_term2] = resolved_term1
-            return True
-        else:
-            return False
-
-    def _apply_substitution_to_term(self, term: str, 
-                                  substitution: Dict[str, str]) -> str:
-        """
-        Применяет подстановку к одиночному терму.
-        
-        Args:
-            term: Исходный терм
-            substitution: Подстановка для применения
-        
-        Returns:
-            str: Терм после применения подстановки
-        """
-        result = term
-        for var, value in substitution.items():
-            if result == var:
-                result = value
-            elif var in result:
-                # Замена переменных внутри сложных термов
-                result = result.replace(var, value)
-        return result
-
-    def _apply_substitution(self, clause: List[Tuple[str, List[str], bool]],
-                          substitution: Dict[str, str]) -> List[Tuple[str, List[str], bool]]:
-        """
-        Применяет подстановку ко всем термам в клаузе.
-        
-        Args:
-            clause: Исходная клауза
-            substitution: Подстановка для применения
-        
-        Returns:
-            List[Tuple]: Клауза после применения подстановки
-        """
-        substituted_clause = []
-        for predicate, args, negated in clause:
-            substituted_args = [self._apply_substitution_to_term(arg, substitution) 
-                              for arg in args]
-            substituted_clause.append((predicate, substituted_args, negated))
-        return substituted_clause
-
-    def _is_constant(self, term: str) -> bool:
-        """
-        Проверяет, является ли терм константой.
-        
-        Константы начинаются с заглавной буквы и не содержат скобок.
-        
-        Args:
-            term: Проверяемый терм
-        
-        Returns:
-            bool: True если терм - константа
-        """
-        return (term and 
-                term[0].isupper() and 
-                '(' not in term)
-
-    def _is_variable(self, term: str) -> bool:
-        """
-        Проверяет, является ли терм переменной.
-        
-        Переменные начинаются с строчной буквы и не содержат скобок.
-        
-        Args:
-            term: Проверяемый терм
-        
-        Returns:
-            bool: True если терм - переменная
-        """
-        return (term and 
-                term[0].islower() and 
-                not term.isdigit() and
-                '(' not in term)
-
-    def _contains_function(self, term: str) -> bool:
-        """
-        Проверяет, содержит ли терм функциональный символ.
-        
-        Args:
-            term: Проверяемый терм
-        
-        Returns:
-            bool: True если терм содержит функцию (скобки)
-        """
-        return '(' in term and ')' in term
-
-    def _is_tautology(self, clause: List[Tuple[str, List[str], bool]]) -> bool:
-        """
-        Проверяет, является ли клауза тавтологией.
-        
-        Тавтология содержит комплементарные литералы (P и ¬P).
-        
-        Args:
-            clause: Проверяемая клауза
-        
-        Returns:
-            bool: True если клауза - тавтология
-        """
-        positive_literals = set()
-        negative_literals = set()
-
-        for predicate, args, negated in clause:
-            # Ключ литерала: (предикат, кортеж аргументов)
-            literal_key = (predicate, tuple(args))
-            if negated:
-                negative_literals.add(literal_key)
-            else:
-                positive_literals.add(literal_key)
-
-        # Тавтология если есть пересечение положительных и отрицательных литералов
-        return bool(positive_literals & negative_literals)
-
-    def _is_subsumed(self, clause: List[Tuple[str, List[str], bool]], 
-                    all_clause_ids: List[int]) -> bool:
-        """
-        Проверяет, поглощается ли клауза существующими клаузами.
-        
-        Клауза A поглощается клаузой B если A является подмножеством B
-        с учетом некоторой подстановки.
-        
-        Args:
-            clause: Проверяемая клауза
-            all_clause_ids: Список ID всех существующих клауз
-        
-        Returns:
-            bool: True если клауза поглощается
-        """
-        for existing_id in all_clause_ids:
-            existing_clause = self.clause_registry[existing_id]['clause']
-            if self._subsumes(existing_clause, clause):
-                return True
-        return False
-
-    def _subsumes(self, clause1: List[Tuple[str, List[str], bool]], 
-                 clause2: List[Tuple[str, List[str], bool]]) -> bool:
-        """
-        Проверяет, поглощает ли clause1 clause2.
-        
-        Упрощенная проверка: точное совпадение клауз.
-        В полной реализации должна учитывать подстановки.
-        
-        Args:
-            clause1: Потенциально поглощающая клауза
-            clause2: Потенциально поглощаемая клауза
-        
-        Returns:
-            bool: True если clause1 поглощает clause2
-        """
-        # Упрощенная реализация: проверка точного совпадения
-        return clause1 == clause2
\ No newline at end of file
+"""
+Модуль для доказательства методом резолюций в логике предикатов первого порядка.
+Реализует алгоритм резолюции с унификацией для автоматического доказательства
+теорем в логике предикатов первого порядка.
+"""
+
+import re
+import os
+import copy
+import gzip
+import json
+import zlib
+import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Dict, Optional, Any, Set, Union, Iterable
+
+from array import array
+
+try:
+    from .disk_cache import DiskCache
+    from .clause_store import ClauseStore, Clause
+    from .clause_parser import ParsedClause, parse_clause_strings
+    from .engine_stats import EngineStats
+    from .signature import Signature
+    from .deadline import Deadline, NO_DEADLINE
+    from .tracing import tracer
+except ImportError:
+    from disk_cache import DiskCache
+    from clause_store import ClauseStore, Clause
+    from clause_parser import ParsedClause, parse_clause_strings
+    from engine_stats import EngineStats
+    from signature import Signature
+    from deadline import Deadline, NO_DEADLINE
+    from tracing import tracer
+
+
+class ResolutionEngine:
+    """
+    Движок резолюций для логики предикатов первого порядка.
+    
+    Реализует алгоритм резолюции с подробным логированием всех шагов,
+    включая унификацию, применение подстановок и проверку на противоречие.
+    
+    Атрибуты:
+        steps_log (List[Dict]): Лог всех шагов доказательства
+        step_counter (int): Счетчик шагов резолюции
+        clause_registry (ClauseStore): Регистр всех клауз в компактном виде
+        next_clause_id (int): Следующий доступный ID для клаузы
+        literal_index (Dict[int, List[int]]): Индекс клауз по заголовкам
+            литералов (ID предиката со знаком отрицания)
+        support_ids (Optional[Set[int]]): Множество поддержки (set-of-support)
+            или None, если стратегия не используется
+        max_steps (int): Максимальное количество раундов резолюции
+        cache (Optional[DiskCache]): Кэш результатов доказательств
+        last_cache_hit (bool): Был ли последний результат prove взят из кэша
+        checkpoint_path (Optional[str]): Файл для сохранения чекпоинтов насыщения
+        checkpoint_interval (int): Период сохранения чекпоинта в раундах
+        memory_limit (Optional[int]): Лимит памяти хранилища клауз в байтах
+        signature (Signature): Сигнатура текущей задачи: по ней термы
+            классифицируются как переменные и константы
+    """
+
+    # Версия формата записей кэша доказательств (входит в ключ кэша)
+    CACHE_FORMAT_VERSION = 1
+
+    # Версия формата файлов чекпоинтов
+    CHECKPOINT_FORMAT_VERSION = 2
+
+    # Имя символа в терме, за которым не следует скобка (переменная или константа)
+    SYMBOL_PATTERN = re.compile(r'\b[^\W\d]\w*\b(?!\s*\()')
+
+    def __init__(self, max_steps: int = 100, cache: Optional[DiskCache] = None,
+                 checkpoint_path: Optional[str] = None, checkpoint_interval: int = 10,
+                 memory_limit: Optional[int] = None):
+        """
+        Инициализация движка резолюций с пустыми структурами данных.
+        
+        Args:
+            max_steps: Максимальное количество раундов резолюции
+            cache: Дисковый кэш результатов доказательств (None - без кэша)
+            checkpoint_path: Файл чекпоинта; если задан, состояние насыщения
+                             сохраняется периодически и при исчерпании лимита
+            checkpoint_interval: Период сохранения чекпоинта в раундах
+            memory_limit: Лимит памяти хранилища клауз в байтах; при приближении
+                          к нему вытесняются тяжелые необработанные клаузы
+        """
+        self.max_steps = max_steps
+        self.cache = cache
+        self.last_cache_hit = False
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self._checkpoint_target = checkpoint_path
+        self.memory_limit = memory_limit
+        self.steps_log = []  # Лог всех шагов резолюции
+        self.step_counter = 0  # Счетчик шагов
+        self.clause_registry = ClauseStore(memory_limit)  # Регистр клауз: id -> Clause
+        self.next_clause_id = 0  # Счетчик для назначения ID клаузам
+        self.literal_index = {}  # Индекс: заголовок литерала -> [id клауз]
+        self.support_ids = None  # Множество поддержки (только для prove_many)
+        self.all_clause_ids = []  # Все известные клаузы текущего насыщения
+        self.used_pairs = set()  # Пары клауз, к которым уже применялась резолюция
+        self.stats = EngineStats()  # Счетчики и таймеры последнего доказательства
+        self.signature = Signature()  # Виды символов текущей задачи
+        self.deadline = NO_DEADLINE  # Срок запроса текущего доказательства
+
+    def prove(self, clauses: Iterable[str], resume_from: Optional[str] = None,
+              with_stats: bool = False,
+              signature: Optional[Signature] = None,
+              deadline: Optional[Deadline] = None) -> Union[Tuple[bool, List[Dict]],
+                                                 Tuple[bool, List[Dict], EngineStats]]:
+        """
+        Основной метод доказательства методом резолюций.
+        
+        Принимает множество клауз и пытается вывести противоречие (пустую клаузу).
+        
+        Args:
+            clauses: Дизъюнкты в строковом формате, например:
+                    ["P(x) ∨ Q(y)", "¬P(a)", "¬Q(b)"]; допускается любой
+                    итерируемый объект, в том числе ленивый загрузчик
+                    clause_loader.load_clauses; разобранные дизъюнкты ParsedClause
+                    (например, LogicFormalizer.last_clauses) не разбираются повторно
+            resume_from: Путь к чекпоинту прерванного насыщения тех же клауз;
+                         доказательство продолжается с сохраненного раунда
+            with_stats: Включить таймеры этапов и вернуть статистику третьим
+                        элементом (счетчики доступны в engine.stats всегда)
+            signature: Сигнатура задачи (например, LogicFormalizer.last_signature);
+                       None - переменные и константы различаются по регистру
+                       первой буквы
+            deadline: Срок запроса пользователя; когда он истекает, насыщение
+                      прерывается так же, как при превышении max_steps
+        
+        Returns:
+            Tuple[bool, List[Dict]]: 
+                - bool: True если доказательство успешно (найдено противоречие)
+                - List[Dict]: Подробный лог всех шагов доказательства
+                - EngineStats: Статистика (только при with_stats=True)
+        
+        Пример:
+            >>> engine = ResolutionEngine()
+            >>> success, log = engine.prove(["P(x)", "¬P(a)"])
+            >>> print(success)
+            True
+        """
+        self.stats = EngineStats()
+        self.signature = signature if signature is not None else Signature()
+        self.deadline = deadline if deadline is not None else NO_DEADLINE
+        if with_stats:
+            self._enable_timers()
+
+        start = time.perf_counter()
+        with tracer.span('engine.prove', resumed=resume_from is not None) as span:
+            try:
+                result, log = self._prove(clauses, resume_from)
+            finally:
+                self.stats.timings['total'] += time.perf_counter() - start
+                if with_stats:
+                    self._disable_timers()
+
+            span.set_attribute('result', result)
+            span.set_attribute('outcome', log[-1]['type'] if log else None)
+            span.set_attribute('cache_hit', self.last_cache_hit)
+            span.set_attribute('rounds', self.stats.rounds)
+            span.set_attribute('resolvents_kept', self.stats.resolvents_kept)
+
+        if with_stats:
+            return result, log, self.stats
+        return result, log
+
+    def _prove(self, clauses: Iterable[str],
+               resume_from: Optional[str]) -> Tuple[bool, List[Dict]]:
+        """Выполняет доказательство (см. prove) без учета статистики."""
+        # Инициализация состояния движка для нового доказательства
+        self.steps_log = []
+        self.step_counter = 0
+        self.clause_registry = ClauseStore(self.memory_limit)
+        self.next_clause_id = 0
+        self.literal_index = {}
+        self.support_ids = None
+        self.last_cache_hit = False
+        self._checkpoint_target = self.checkpoint_path or resume_from
+
+        if resume_from is not None:
+            return self._resume(clauses, resume_from)
+
+        try:
+            # Шаги 1-2: Парсинг и регистрация входных клауз по мере чтения
+            # (клаузы могут поступать лениво, например из clause_loader)
+            original_clauses = []
+            initial_clause_ids = []
+            for i, clause_str in enumerate(clauses):
+                clause_id = self._register_clause(
+                    self._parse_clause(clause_str), f"Исходная клауза {i+1}")
+                original_clauses.append(str(clause_str))
+                initial_clause_ids.append(clause_id)
+
+            # Шаг 3: Логирование начального состояния
+            self._log_initial_state(initial_clause_ids, original_clauses)
+
+            # Шаг 4: Поиск готового результата в кэше
+            cache_key, canonical_positions = None, None
+            if self.cache is not None:
+                parsed_clauses = [self.clause_registry.literals(clause_id)
+                                  for clause_id in initial_clause_ids]
+                cache_key, canonical_positions = self._cache_key(parsed_clauses)
+                cached_result = self._cache_lookup(cache_key, canonical_positions)
+                if cached_result is not None:
+                    self.last_cache_hit = True
+                    return cached_result, self.steps_log
+
+            # Шаг 5: Запуск алгоритма резолюции
+            result = self._resolution_algorithm(initial_clause_ids)
+
+            # Насыщение, прерванное по сроку запроса, не доказывает отсутствие
+            # вывода: такой результат не кэшируется (срок не входит в ключ)
+            if cache_key is not None and (result or not self.deadline.expired):
+                self._cache_store(cache_key, canonical_positions, result)
+
+            return result, self.steps_log
+
+        except Exception as e:
+            # Обработка и логирование ошибок
+            error_step = {
+                'step': 'error',
+                'type': 'error',
+                'message': f'Ошибка при выполнении резолюции: {str(e)}'
+            }
+            self.steps_log.append(error_step)
+            return False, self.steps_log
+
+    # Методы, время которых измеряется таймерами EngineStats
+    TIMED_METHODS = (
+        ('parse', '_parse_clause'),
+        ('unify', '_unify'),
+        ('subsume', '_is_subsumed'),
+        ('log', '_log_initial_state'),
+        ('log', '_log_resolution_step'),
+    )
+
+    def _enable_timers(self):
+        """Оборачивает измеряемые методы экземпляра таймерами статистики."""
+        for timer, method_name in self.TIMED_METHODS:
+            setattr(self, method_name, self.stats.timed(timer, getattr(self, method_name)))
+
+    def _disable_timers(self):
+        """Снимает обертки таймеров, возвращая методы класса."""
+        for _, method_name in self.TIMED_METHODS:
+            self.__dict__.pop(method_name, None)
+
+    def _resume(self, clauses: Iterable[str], checkpoint_path: str) -> Tuple[bool, List[Dict]]:
+        """
+        Продолжает насыщение с сохраненного чекпоинта.
+        
+        Args:
+            clauses: Исходные клаузы (должны совпадать с клаузами чекпоинта)
+            checkpoint_path: Путь к файлу чекпоинта
+        
+        Returns:
+            Tuple[bool, List[Dict]]: Результат и полный лог доказательства
+        """
+        try:
+            self._load_checkpoint(checkpoint_path)
+
+            initial_step = self.steps_log[0] if self.steps_log else {}
+            if list(initial_step.get('original_clauses', [])) != [str(clause) for clause in clauses]:
+                raise ValueError("чекпоинт сохранен для другого множества клауз")
+
+            result = self._saturate()
+            return result, self.steps_log
+
+        except Exception as e:
+            self.steps_log.append({
+                'step': 'error',
+                'type': 'error',
+                'message': f'Ошибка при продолжении с чекпоинта: {str(e)}'
+            })
+            return False, self.steps_log
+
+    def prove_many(self, axioms: Iterable[str], goals: List[Union[str, List[str]]],
+                   max_workers: Optional[int] = None,
+                   signature: Optional[Signature] = None,
+                   deadline: Optional[Deadline] = None) -> List[Tuple[bool, List[Dict]]]:
+        """
+        Пакетное доказательство нескольких целей над общим множеством аксиом.
+        
+        Аксиомы разбираются, регистрируются и индексируются один раз. Каждая
+        цель (отрицание доказываемого утверждения) затем доказывается
+        над копией подготовленного состояния со стратегией множества
+        поддержки: резолюция выполняется только для пар, в которых хотя бы
+        одна клауза происходит от цели.
+        
+        Насыщение - вычисления на чистом Python, поэтому цели доказываются
+        в пуле процессов (потоки не дают параллельности из-за GIL).
+        Состояние аксиом передается каждому процессу один раз при запуске
+        (_init_goal_worker). Одна цель или max_workers=1 доказываются
+        в текущем процессе, без затрат на запуск пула.
+        
+        Args:
+            axioms: Дизъюнкты теории, общие для всех целей (любой итерируемый объект)
+            goals: Список целей; каждая цель - дизъюнкт или список дизъюнктов
+                   (отрицание доказываемого утверждения)
+            max_workers: Размер пула рабочих процессов (None - число процессоров)
+            signature: Сигнатура аксиом и целей (None - по регистру первой буквы)
+            deadline: Общий срок для всех целей (None - только max_steps)
+        
+        Returns:
+            List[Tuple[bool, List[Dict]]]: Результаты и логи доказательства
+                для каждой цели в порядке входного списка
+        
+        Пример:
+            >>> engine = ResolutionEngine()
+            >>> results = engine.prove_many(["¬Человек(x) ∨ Смертен(x)", "Человек(Сократ)"],
+            ...                             ["¬Смертен(Сократ)", "¬Смертен(Платон)"])
+            >>> [success for success, _ in results]
+            [True, False]
+        """
+        # Шаг 1: Подготовка общего состояния аксиом (один раз для всех целей)
+        self.steps_log = []
+        self.step_counter = 0
+        self.clause_registry = ClauseStore(self.memory_limit)
+        self.next_clause_id = 0
+        self.literal_index = {}
+        self.support_ids = None
+        self.signature = signature if signature is not None else Signature()
+        self.deadline = deadline if deadline is not None else NO_DEADLINE
+
+        axiom_strings = []
+        try:
+            for i, axiom in enumerate(axioms):
+                self._register_clause(self._parse_clause(axiom), f"Аксиома {i+1}")
+                axiom_strings.append(str(axiom))
+        except Exception as e:
+            error_log = [{
+                'step': 'error',
+                'type': 'error',
+                'message': f'Ошибка при разборе аксиом: {str(e)}'
+            }]
+            return [(False, copy.deepcopy(error_log)) for _ in goals]
+
+        axiom_state = self._snapshot_state()
+
+        # Шаг 2: Доказательство целей в пуле рабочих процессов
+        goal_lists = [[goal] if isinstance(goal, (str, ParsedClause)) else list(goal) for goal in goals]
+        if len(goal_lists) <= 1 or max_workers == 1:
+            return [self._prove_goal(axiom_strings, axiom_state, goal_clauses)
+                    for goal_clauses in goal_lists]
+
+        worker_config = {
+            'max_steps': self.max_steps,
+            'memory_limit': self.memory_limit,
+            'signature': self.signature,
+            'deadline': self.deadline
+        }
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_goal_worker,
+                                 initargs=(worker_config, axiom_strings, axiom_state)) as executor:
+            results = list(executor.map(_prove_goal_in_worker, goal_lists))
+
+        return results
+
+    def _snapshot_state(self) -> Dict[str, Any]:
+        """
+        Возвращает состояние реестра клауз для передачи рабочим процессам.
+        
+        Returns:
+            Dict[str, Any]: Реестр, индекс литералов и счетчик ID клауз
+        """
+        return {
+            'clause_registry': self.clause_registry,
+            'literal_index': self.literal_index,
+            'next_clause_id': self.next_clause_id
+        }
+
+    def _prove_goal(self, axioms: List[str], axiom_state: Dict[str, Any],
+                    goal_clauses: List[str]) -> Tuple[bool, List[Dict]]:
+        """
+        Доказывает одну цель над копией подготовленного состояния аксиом.
+        
+        Args:
+            axioms: Исходные строки аксиом (для лога)
+            axiom_state: Общее состояние аксиом из _snapshot_state
+            goal_clauses: Дизъюнкты цели
+        
+        Returns:
+            Tuple[bool, List[Dict]]: Результат и лог доказательства цели
+        """
+        # Каждая цель получает собственную копию состояния аксиом
+        worker = ResolutionEngine(max_steps=self.max_steps, memory_limit=self.memory_limit)
+        worker.signature = self.signature
+        worker.deadline = self.deadline
+        state = copy.deepcopy(axiom_state)
+        worker.clause_registry = state['clause_registry']
+        worker.literal_index = state['literal_index']
+        worker.next_clause_id = state['next_clause_id']
+
+        try:
+            axiom_ids = list(worker.clause_registry.keys())
+            goal_ids = []
+            for i, clause in enumerate(goal_clauses):
+                clause_id = worker._register_clause(
+                    worker._parse_clause(clause), f"Цель {i+1}")
+                goal_ids.append(clause_id)
+
+            worker.support_ids = set(goal_ids)
+            initial_clause_ids = axiom_ids + goal_ids
+            worker._log_initial_state(initial_clause_ids,
+                                     list(axioms) + [str(clause) for clause in goal_clauses])
+
+            result = worker._resolution_algorithm(initial_clause_ids)
+            return result, worker.steps_log
+
+        except Exception as e:
+            worker.steps_log.append({
+                'step': 'error',
+                'type': 'error',
+                'message': f'Ошибка при выполнении резолюции: {str(e)}'
+            })
+            return False, worker.steps_log
+
+    def _engine_config(self) -> Dict[str, Any]:
+        """
+        Возвращает параметры движка, влияющие на результат доказательства.
+        
+        Сигнатура задачи входит в конфигурацию: виды символов и сорта
+        (отбраковка резольвент разных сортов) меняют результат.
+        
+        Returns:
+            Dict[str, Any]: Конфигурация, входящая в ключ кэша
+        """
+        return {
+            'max_steps': self.max_steps,
+            'memory_limit': self.memory_limit,
+            'signature': self.signature.to_dict(),
+            'format': self.CACHE_FORMAT_VERSION
+        }
+
+    def _canonical_clause(self, clause: List[Tuple[str, List[str], bool]]) -> str:
+        """
+        Строит каноническую запись клаузы, не зависящую от порядка литералов
+        и имен переменных.
+        
+        Литералы сортируются по записи, в которой переменные заменены
+        заполнителем, затем переменные переименовываются по порядку первого
+        вхождения (v0, v1, ...).
+        
+        Args:
+            clause: Внутреннее представление клаузы
+        
+        Returns:
+            str: Каноническая строка клаузы
+        
+        Пример:
+            >>> self._canonical_clause([('Q', ['y'], False), ('P', ['y', 'A'], True)])
+            '¬P(v0, A) ∨ Q(v0)'
+        """
+        def literal_shape(literal):
+            predicate, args, negated = literal
+            masked = [self.SYMBOL_PATTERN.sub(
+                lambda m: '?' if self._is_variable(m.group(0)) else m.group(0), arg)
+                for arg in args]
+            return (predicate, negated, masked)
+
+        renaming = {}
+
+        def rename(match):
+            name = match.group(0)
+            if not self._is_variable(name):
+                return name
+            if name not in renaming:
+                renaming[name] = f"v{len(renaming)}"
+            return renaming[name]
+
+        literals = []
+        for predicate, args, negated in sorted(clause, key=literal_shape):
+            renamed_args = [self.SYMBOL_PATTERN.sub(rename, arg) for arg in args]
+            literals.append((predicate, renamed_args, negated))
+
+        return self._clause_to_string(literals)
+
+    def _cache_key(self, parsed_clauses: List[List[Tuple[str, List[str], bool]]]
+                   ) -> Tuple[str, List[int]]:
+        """
+        Вычисляет ключ кэша для множества клауз и конфигурации движка.
+        
+        Ключ не зависит от порядка клауз и от переименования переменных.
+        
+        Args:
+            parsed_clauses: Разобранные исходные клаузы
+        
+        Returns:
+            Tuple[str, List[int]]: (хэш-ключ, позиция каждой исходной клаузы
+                в каноническом порядке)
+        """
+        canonical = [self._canonical_clause(clause) for clause in parsed_clauses]
+        order = sorted(range(len(canonical)), key=lambda i: canonical[i])
+
+        canonical_positions = [0] * len(canonical)
+        for position, clause_index in enumerate(order):
+            canonical_positions[clause_index] = position
+
+        payload = json.dumps({
+            'clauses': [canonical[i] for i in order],
+            'config': self._engine_config()
+        }, ensure_ascii=False, sort_keys=True)
+        key = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        return key, canonical_positions
+
+    def _cache_lookup(self, cache_key: str, canonical_positions: List[int]) -> Optional[bool]:
+        """
+        Ищет результат в кэше и восстанавливает лог доказательства.
+        
+        ID исходных клауз в сохраненном логе переназначаются в соответствии
+        с порядком клауз текущего запроса. Начальный шаг лога уже записан
+        для текущего запроса и сохраняется.
+        
+        Args:
+            cache_key: Ключ кэша
+            canonical_positions: Позиции исходных клауз в каноническом порядке
+        
+        Returns:
+            Optional[bool]: Результат доказательства или None при промахе
+        """
+        raw_entry = self.cache.get(cache_key)
+        if raw_entry is None:
+            return None
+
+        try:
+            entry = json.loads(zlib.decompress(raw_entry).decode('utf-8'))
+        except (zlib.error, ValueError):
+            self.cache.delete(cache_key)
+            return None
+
+        # Сопоставление ID исходных клауз: сохраненный запрос -> текущий
+        current_by_position = {position: clause_id
+                               for clause_id, position in enumerate(canonical_positions)}
+        id_map = {clause_id: current_by_position[position]
+                  for clause_id, position in enumerate(entry['positions'])}
+
+        def remap(clause_id):
+            return id_map.get(clause_id, clause_id)
+
+        for step in entry['log']:
+            for key in ('clause1_id', 'clause2_id', 'clause_id'):
+                if isinstance(step.get(key), int):
+                    step[key] = remap(step[key])
+            if 'parents' in step:
+                step['parents'] = [remap(parent) for parent in step['parents']]
+            for key in ('clause1', 'clause2'):
+                clause_id = step.get(key + '_id')
+                if key in step and clause_id in self.clause_registry:
+                    step[key] = self._clause_string(clause_id)
+            if 'literals_resolved' in step:
+                step['literals_resolved'] = [tuple(item) for item in step['literals_resolved']]
+
+        self.steps_log.extend(entry['log'])
+        return entry['result']
+
+    def _cache_store(self, cache_key: str, canonical_positions: List[int], result: bool):
+        """
+        Сохраняет результат и сжатый лог доказательства в кэш.
+        
+        Начальный шаг лога не сохраняется: он восстанавливается из запроса.
+        Результаты с ошибками не кэшируются.
+        
+        Args:
+            cache_key: Ключ кэша
+            canonical_positions: Позиции исходных клауз в каноническом порядке
+            result: Результат доказательства
+        """
+        if any(step.get('type') == 'error' for step in self.steps_log):
+            return
+
+        entry = {
+            'result': result,
+            'positions': canonical_positions,
+            'log': [step for step in self.steps_log if step.get('type') != 'initial']
+        }
+        payload = json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+        self.cache.set(cache_key, zlib.compress(payload.encode('utf-8'), 9))
+
+    def _parse_clause(self, clause_str: Union[str, ParsedClause]) -> List[Tuple[str, List[str], bool]]:
+        """
+        Парсит строковое представление клаузы во внутреннюю структуру.
+        
+        Внутреннее представление клаузы: список литералов, где каждый литерал -
+        это кортеж (предикат, аргументы, отрицание). Разбор выполняет
+        однопроходный парсер clause_parser, результаты которого кэшируются
+        по строке клаузы. Атомы без скобок - предикаты арности 0. Литералы
+        уже разобранного дизъюнкта (ParsedClause) переводятся без разбора.
+        
+        Args:
+            clause_str: Строка клаузы, например "P(x) ∨ ¬Q(y,z)", или ParsedClause
+        
+        Returns:
+            List[Tuple[str, List[str], bool]]: Список литералов клаузы
+        
+        Raises:
+            ClauseSyntaxError: При синтаксической ошибке (с позицией)
+        
+        Пример:
+            >>> self._parse_clause("P(x) ∨ ¬Q(a, f(b))")
+            [('P', ['x'], False), ('Q', ['a', 'f(b)'], True)]
+        """
+        if isinstance(clause_str, ParsedClause):
+            return [(literal.predicate, [str(arg) for arg in literal.args], literal.negated)
+                    for literal in clause_str.literals]
+        return [(predicate, list(args), negated)
+                for predicate, args, negated in parse_clause_strings(clause_str)]
+
+    def _register_clause(self, clause: List[Tuple[str, List[str], bool]], 
+                        source: str, parents: Optional[List[int]] = None,
+                        encoded: Optional[array] = None) -> int:
+        """
+        Регистрирует клаузу в реестре и возвращает её идентификатор.
+        
+        Args:
+            clause: Внутреннее представление клаузы
+            source: Описание источника клаузы
+            parents: ID родительских клауз (для резольвент)
+            encoded: Уже закодированные литералы клаузы (если есть)
+        
+        Returns:
+            int: Уникальный идентификатор зарегистрированной клаузы
+        """
+        clause_id = self.next_clause_id
+        if encoded is None:
+            encoded = self.clause_registry.encode(clause)
+        record = Clause(encoded, source, parents or ())
+        self.clause_registry.add(clause_id, record)
+        self._index_clause(clause_id, record)
+        self.next_clause_id += 1
+        return clause_id
+
+    def _index_clause(self, clause_id: int, record: Clause):
+        """
+        Добавляет клаузу в индекс литералов.
+        
+        Args:
+            clause_id: ID клаузы
+            record: Компактная запись клаузы
+        """
+        # Индексация литералов для быстрого поиска комплементарных пар
+        for header in record.headers():
+            ids = self.literal_index.setdefault(header, [])
+            if not ids or ids[-1] != clause_id:
+                ids.append(clause_id)
+
+    def _clause_string(self, clause_id: int) -> str:
+        """
+        Возвращает строковое представление зарегистрированной клаузы.
+        
+        Args:
+            clause_id: ID клаузы
+        
+        Returns:
+            str: Строковое представление клаузы
+        """
+        return self._clause_to_string(self.clause_registry.literals(clause_id))
+
+    def _clause_to_string(self, clause: List[Tuple[str, List[str], bool]]) -> str:
+        """
+        Конвертирует внутреннее представление клаузы в строку.
+        
+        Args:
+            clause: Внутреннее представление клаузы
+        
+        Returns:
+            str: Строковое представление клаузы
+        
+        Пример:
+            >>> self._clause_to_string([('P', ['x'], False), ('Q', ['y'], True)])
+            'P(x) ∨ ¬Q(y)'
+        """
+        if not clause:  # Пустая клауза - противоречие
+            return '□'
+
+        literals = [self._literal_to_string(predicate, args, negated)
+                    for predicate, args, negated in clause]
+
+        # Соединение литералов дизъюнкцией
+        return ' ∨ '.join(literals) if len(literals) > 1 else literals[0]
+
+    def _literal_to_string(self, predicate: str, args: List[str], negated: bool) -> str:
+        """
+        Форматирует литерал: [¬]предикат(аргументы) или [¬]предикат для арности 0.
+        
+        Args:
+            predicate: Имя предиката
+            args: Аргументы литерала
+            negated: Признак отрицания
+        
+        Returns:
+            str: Строковое представление литерала
+        """
+        negation_symbol = '¬' if negated else ''
+        if not args:
+            return f"{negation_symbol}{predicate}"
+        return f"{negation_symbol}{predicate}({', '.join(args)})"
+
+    def _log_initial_state(self, clause_ids: List[int], original_clauses: List[str]):
+        """
+        Логирует начальное состояние системы клауз.
+        
+        Args:
+            clause_ids: Список ID исходных клауз
+            original_clauses: Оригинальные строковые представления клауз
+        """
+        clauses_info = []
+        for clause_id in clause_ids:
+            clauses_info.append({
+                'id': clause_id,
+                'clause': self._clause_string(clause_id),
+                'source': self.clause_registry[clause_id].source
+            })
+
+        initial_state_log = {
+            'step': 0,
+            'type': 'initial',
+            'clauses': clauses_info,
+            'original_clauses': original_clauses,
+            'message': 'Начальное множество клауз'
+        }
+        self.steps_log.append(initial_state_log)
+
+    def _resolution_algorithm(self, initial_clause_ids: List[int]) -> bool:
+        """
+        Основной алгоритм резолюции.
+        
+        Реализует метод резолюции с поиском в ширину. Алгоритм продолжает
+        генерировать новые резольвенты до тех пор, пока не будет найдена
+        пустая клауза (противоречие) или не исчерпаются возможные резолюции.
+        
+        Args:
+            initial_clause_ids: Список ID исходных клауз
+        
+        Returns:
+            bool: True если найдено противоречие, иначе False
+        """
+        self.used_pairs = set()  # Множество использованных пар клауз
+        self.all_clause_ids = initial_clause_ids.copy()  # Все известные клаузы
+
+        return self._saturate()
+
+    def _saturate(self) -> bool:
+        """
+        Цикл насыщения по раундам над текущим состоянием движка.
+        
+        Продолжает работу с состояния all_clause_ids / used_pairs / step_counter,
+        поэтому используется как для нового доказательства, так и для
+        продолжения с чекпоинта. Если задан путь чекпоинта, состояние
+        сохраняется каждые checkpoint_interval раундов и при исчерпании лимита.
+        
+        При заданном лимите памяти после каждого раунда проверяется
+        заполнение хранилища, и тяжелые необработанные клаузы вытесняются
+        (стратегия ограниченных ресурсов). Истечение срока запроса (deadline)
+        прерывает раунд и насыщение, как превышение max_steps.
+        
+        Returns:
+            bool: True если найдено противоречие, иначе False
+        """
+        while True:
+            self.step_counter += 1
+            self.stats.rounds += 1
+
+            # Проверка на наличие пустой клаузы (противоречия)
+            contradiction_found = self._check_for_contradiction(self.all_clause_ids)
+            if contradiction_found:
+                return True
+
+            # Попытка применить резолюцию к новым парам клауз
+            round_start = len(self.all_clause_ids)
+            new_clauses_found = self._try_resolutions(self.all_clause_ids, self.used_pairs)
+
+            # Вытеснение необработанных клауз при приближении к лимиту памяти
+            if self.clause_registry.is_near_limit():
+                self._evict_passive_clauses(self.all_clause_ids[round_start:])
+
+            # Срок запроса истек (раунд мог быть прерван): найденное
+            # в этом раунде противоречие все равно засчитывается
+            if self.deadline.expired:
+                if self._check_for_contradiction(self.all_clause_ids):
+                    return True
+                self._stop_saturation('Истек срок выполнения запроса')
+                return False
+
+            if not new_clauses_found:
+                # Не удалось найти новые клаузы - доказательство невозможно
+                message = 'Новых клауз не найдено - доказательство невозможно'
+                if self.clause_registry.evicted_count:
+                    message = ('Новых клауз не найдено (часть клауз вытеснена '
+                               'по лимиту памяти) - доказательство не найдено')
+                no_progress_log = {
+                    'step': self.step_counter,
+                    'type': 'no_new_clauses',
+                    'message': message
+                }
+                self.steps_log.append(no_progress_log)
+                return False
+
+            # Защита от бесконечного цикла
+            if self.step_counter > self.max_steps:
+                self._stop_saturation('Превышено максимальное количество шагов')
+                return False
+
+            # Периодическое сохранение состояния
+            if (self._checkpoint_target and self.checkpoint_interval > 0 and
+                    self.step_counter % self.checkpoint_interval == 0):
+                self.save_checkpoint(self._checkpoint_target)
+
+    def _stop_saturation(self, message: str):
+        """
+        Записывает прерывание насыщения по лимиту и сохраняет чекпоинт.
+        
+        Args:
+            message: Причина прерывания (лимит раундов или срок запроса)
+        """
+        timeout_log = {
+            'step': self.step_counter,
+            'type': 'timeout',
+            'message': message
+        }
+        self.steps_log.append(timeout_log)
+        if self._checkpoint_target:
+            self.save_checkpoint(self._checkpoint_target)
+
+    def _evict_passive_clauses(self, passive_ids: List[int]):
+        """
+        Вытесняет тяжелые необработанные клаузы из хранилища.
+        
+        Необработанные клаузы еще не участвовали в резолюции и поэтому не
+        являются родителями других клауз: их удаление не разрушает
+        восстановление найденных доказательств. Факт вытеснения
+        записывается в лог.
+        
+        Args:
+            passive_ids: ID клауз, полученных в последнем раунде
+        """
+        evicted_ids = self.clause_registry.select_evictions(passive_ids)
+        if not evicted_ids:
+            return
+
+        evicted = set(evicted_ids)
+        self.all_clause_ids = [clause_id for clause_id in self.all_clause_ids
+                               if clause_id not in evicted]
+        for clause_id in evicted_ids:
+            for header in self.clause_registry[clause_id].headers():
+                ids = self.literal_index.get(header)
+                if ids and clause_id in ids:
+                    ids.remove(clause_id)
+            if self.support_ids is not None:
+                self.support_ids.discard(clause_id)
+            self.clause_registry.remove(clause_id)
+        self.clause_registry.evicted_count += len(evicted_ids)
+
+        self.steps_log.append({
+            'step': self.step_counter,
+            'type': 'clauses_evicted',
+            'evicted_count': len(evicted_ids),
+            'total_evicted': self.clause_registry.evicted_count,
+            'memory_usage': self.clause_registry.memory_usage,
+            'message': f'Вытеснено {len(evicted_ids)} тяжелых необработанных клауз '
+                       f'(лимит памяти {self.memory_limit} байт)'
+        })
+
+    def save_checkpoint(self, path: str):
+        """
+        Сохраняет состояние насыщения в сжатый файл чекпоинта.
+        
+        В чекпоинт входят реестр клауз, очереди обработанных и новых клауз
+        (all_clause_ids и used_pairs), множество поддержки, сигнатура,
+        счетчики шагов и статистики (EngineStats) и лог.
+        Клаузы сохраняются в декодированном виде, поэтому таблица символов
+        и индекс литералов при загрузке строятся заново. Запись атомарна: файл сначала пишется во временный.
+        
+        Args:
+            path: Путь к файлу чекпоинта
+        """
+        state = {
+            'format': self.CHECKPOINT_FORMAT_VERSION,
+            'step_counter': self.step_counter,
+            'next_clause_id': self.next_clause_id,
+            'clause_registry': [
+                [clause_id, [[p, a, n] for p, a, n in self.clause_registry.decode(record.literals)],
+                 record.source, list(record.parents)]
+                for clause_id, record in self.clause_registry.items()
+            ],
+            'all_clause_ids': self.all_clause_ids,
+            'used_pairs': sorted(self.used_pairs),
+            'support_ids': sorted(self.support_ids) if self.support_ids is not None else None,
+            'evicted_count': self.clause_registry.evicted_count,
+            'signature': self.signature.to_dict(),
+            'stats': self.stats.as_dict(),
+            'steps_log': self.steps_log
+        }
+        payload = json.dumps(state, ensure_ascii=False, separators=(',', ':'))
+
+        temporary_path = path + '.tmp'
+        with gzip.open(temporary_path, 'wt', encoding='utf-8') as checkpoint_file:
+            checkpoint_file.write(payload)
+        os.replace(temporary_path, path)
+
+    def _load_checkpoint(self, path: str):
+        """
+        Восстанавливает состояние насыщения из файла чекпоинта.
+        
+        Завершающая запись о превышении лимита удаляется из лога, а счетчики
+        статистики продолжают счет прерванного прогона, чтобы продолжение
+        выглядело как непрерывный прогон. Таймеры не восстанавливаются.
+        
+        Args:
+            path: Путь к файлу чекпоинта
+        
+        Raises:
+            ValueError: Если формат чекпоинта не поддерживается
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as checkpoint_file:
+            state = json.load(checkpoint_file)
+
+        if state.get('format') != self.CHECKPOINT_FORMAT_VERSION:
+            raise ValueError(f"Неподдерживаемый формат чекпоинта: {state.get('format')}")
+
+        self.step_counter = state['step_counter']
+        self.next_clause_id = state['next_clause_id']
+        self.clause_registry = ClauseStore(self.memory_limit)
+        self.literal_index = {}
+        for clause_id, clause, source, parents in state['clause_registry']:
+            encoded = self.clause_registry.encode([(p, a, n) for p, a, n in clause])
+            record = Clause(encoded, source, parents)
+            self.clause_registry.add(clause_id, record)
+            self._index_clause(clause_id, record)
+        self.clause_registry.evicted_count = state.get('evicted_count', 0)
+        self.all_clause_ids = state['all_clause_ids']
+        self.used_pairs = {tuple(pair) for pair in state['used_pairs']}
+        self.support_ids = (set(state['support_ids'])
+                            if state['support_ids'] is not None else None)
+        if 'signature' in state:
+            self.signature = Signature.from_dict(state['signature'])
+        for counter, value in state.get('stats', {}).items():
+            if counter in EngineStats.COUNTERS:
+                setattr(self.stats, counter, value)
+
+        self.steps_log = state['steps_log']
+        for step in self.steps_log:
+            if 'literals_resolved' in step:
+                step['literals_resolved'] = [tuple(item) for item in step['literals_resolved']]
+        if self.steps_log and self.steps_log[-1].get('type') == 'timeout':
+            self.steps_log.pop()
+
+    def _check_for_contradiction(self, clause_ids: List[int]) -> bool:
+        """
+        Проверяет множество клауз на наличие пустой клаузы (противоречия).
+        
+        Args:
+            clause_ids: Список ID проверяемых клауз
+        
+        Returns:
+            bool: True если найдена пустая клауза
+        """
+        for clause_id in clause_ids:
+            record = self.clause_registry[clause_id]
+            if not record.literals:  # Пустая клауза □
+                contradiction_log = {
+                    'step': self.step_counter,
+                    'type': 'contradiction_found',
+                    'clause_id': clause_id,
+                    'clause': '□',
+                    'parents': list(record.parents),
+                    'message': 'Найдена пустая клауза - противоречие!'
+                }
+                self.steps_log.append(contradiction_log)
+                return True
+        return False
+
+    def _try_resolutions(self, all_clause_ids: List[int], 
+                        used_pairs: Set[Tuple[int, int]]) -> bool:
+        """
+        Пытается применить резолюцию ко всем возможным парам клауз.
+        
+        Если задано множество поддержки, перебираются только пары, в которых
+        хотя бы одна клауза принадлежит ему (см. _support_pairs). Перебор
+        прекращается, как только истекает срок запроса.
+        
+        Args:
+            all_clause_ids: Список всех ID клауз
+            used_pairs: Множество уже использованных пар клауз
+        
+        Returns:
+            bool: True если найдена хотя бы одна новая клауза
+        """
+        new_clauses_found = False
+        n = len(all_clause_ids)
+
+        if self.support_ids is not None:
+            # Стратегия множества поддержки: только пары с клаузой из поддержки
+            for clause1_id, clause2_id in self._support_pairs(all_clause_ids, used_pairs):
+                if self.deadline.expired:
+                    break
+                used_pairs.add((clause1_id, clause2_id))
+                self.stats.pairs_considered += 1
+
+                clause1 = self.clause_registry[clause1_id]
+                clause2 = self.clause_registry[clause2_id]
+                resolvents, unification_logs = self._resolve_clauses(
+                    clause1, clause2, clause1_id, clause2_id)
+
+                for resolvent, log_entry in zip(resolvents, unification_logs):
+                    if self._process_resolvent(resolvent, all_clause_ids,
+                                             clause1_id, clause2_id, log_entry):
+                        new_clauses_found = True
+
+            return new_clauses_found
+
+        # Перебор всех возможных пар клауз
+        for i in range(n):
+            if self.deadline.expired:
+                break
+            for j in range(i + 1, n):
+                clause1_id = all_clause_ids[i]
+                clause2_id = all_clause_ids[j]
+
+                # Пропуск уже использованных пар
+                if (clause1_id, clause2_id) in used_pairs:
+                    continue
+                self.stats.pairs_considered += 1
+
+                clause1 = self.clause_registry[clause1_id]
+                clause2 = self.clause_registry[clause2_id]
+
+                # Применение резолюции к паре клауз
+                resolvents, unification_logs = self._resolve_clauses(
+                    clause1, clause2, clause1_id, clause2_id)
+
+                if resolvents:
+                    used_pairs.add((clause1_id, clause2_id))
+
+                    # Обработка найденных резольвент
+                    for resolvent, log_entry in zip(resolvents, unification_logs):
+                        if self._process_resolvent(resolvent, all_clause_ids, 
+                                                 clause1_id, clause2_id, log_entry):
+                            new_clauses_found = True
+
+        return new_clauses_found
+
+    def _support_pairs(self, all_clause_ids: List[int],
+                       used_pairs: Set[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Находит пары клауз для резолюции по стратегии множества поддержки.
+        
+        Кандидаты для каждой клаузы из поддержки берутся из индекса литералов:
+        только клаузы с комплементарным литералом того же предиката. Если
+        в сигнатуре есть сорта, кандидаты без пары литералов совместимых
+        сортов отбрасываются (_pair_well_sorted).
+        
+        Args:
+            all_clause_ids: Список ID клауз, известных на начало раунда
+            used_pairs: Множество уже использованных пар клауз
+        
+        Returns:
+            List[Tuple[int, int]]: Упорядоченный список новых пар (меньший ID первым)
+        """
+        known_ids = set(all_clause_ids)
+        pairs = set()
+
+        for support_id in all_clause_ids:
+            if support_id not in self.support_ids:
+                continue
+            for header in self.clause_registry[support_id].headers():
+                for other_id in self.literal_index.get(-header, ()):
+                    if other_id == support_id or other_id not in known_ids:
+                        continue
+                    self.stats.index_hits += 1
+                    pair = (min(support_id, other_id), max(support_id, other_id))
+                    if pair not in used_pairs:
+                        pairs.add(pair)
+
+        if self.signature.has_sorts:
+            pairs = {pair for pair in pairs if self._pair_well_sorted(*pair)}
+        return sorted(pairs)
+
+    def _pair_well_sorted(self, clause1_id: int, clause2_id: int) -> bool:
+        """
+        Проверяет, есть ли у двух клауз пара комплементарных литералов совместимых сортов.
+        
+        Args:
+            clause1_id: ID первой клаузы
+            clause2_id: ID второй клаузы
+        
+        Returns:
+            bool: False если любая резолюция клауз связала бы термы разных сортов
+        """
+        decoded1 = self.clause_registry.decode(self.clause_registry[clause1_id].literals)
+        decoded2 = self.clause_registry.decode(self.clause_registry[clause2_id].literals)
+        sorts1 = self._variable_sorts(decoded1)
+        sorts2 = self._variable_sorts(decoded2)
+        for pred1, args1, neg1 in decoded1:
+            for pred2, args2, neg2 in decoded2:
+                if (pred1 == pred2 and neg1 != neg2 and
+                        self._well_sorted(pred1, args1, args2, sorts1, sorts2)):
+                    return True
+        self.stats.ill_sorted_rejected += 1
+        return False
+
+    def _process_resolvent(self, resolvent: List[Tuple[str, List[str], bool]],
+                          all_clause_ids: List[int], clause1_id: int, clause2_id: int,
+                          log_entry: Dict) -> bool:
+        """
+        Обрабатывает найденную резольвенту: проверяет и регистрирует её.
+        
+        Args:
+            resolvent: Резольвента для обработки
+            all_clause_ids: Список всех ID клауз (будет дополнен)
+            clause1_id: ID первой родительской клаузы
+            clause2_id: ID второй родительской клаузы
+            log_entry: Информация для логирования
+        
+        Returns:
+            bool: True если резольвента была добавлена
+        """
+        self.stats.resolvents_generated += 1
+
+        # Пропуск тавтологий
+        if self._is_tautology(resolvent):
+            self.stats.tautologies_deleted += 1
+            return False
+
+        # Пропуск клауз, которые поглощаются существующими
+        encoded = self.clause_registry.encode(resolvent)
+        if self._is_subsumed(encoded, all_clause_ids):
+            self.stats.subsumed_deleted += 1
+            return False
+
+        # Регистрация новой клаузы
+        parents = [clause1_id, clause2_id]
+        resolvent_id = self._register_clause(resolvent, f"Резольвента шага {self.step_counter}",
+                                             parents, encoded)
+
+        all_clause_ids.append(resolvent_id)
+        self.stats.resolvents_kept += 1
+
+        # Потомки клауз из множества поддержки также входят в него
+        if self.support_ids is not None:
+            self.support_ids.add(resolvent_id)
+
+        self._log_resolution_step(resolvent, resolvent_id, clause1_id, clause2_id,
+                                  parents, log_entry, len(all_clause_ids))
+        return True
+
+    def _log_resolution_step(self, resolvent: List[Tuple[str, List[str], bool]],
+                             resolvent_id: int, clause1_id: int, clause2_id: int,
+                             parents: List[int], log_entry: Dict, clauses_count: int):
+        """
+        Записывает шаг резолюции в лог.
+        
+        Args:
+            resolvent: Резольвента
+            resolvent_id: ID зарегистрированной резольвенты
+            clause1_id: ID первой родительской клаузы
+            clause2_id: ID второй родительской клаузы
+            parents: ID родителей
+            log_entry: Информация об унификации
+            clauses_count: Количество известных клауз после добавления
+        """
+        resolution_step_log = {
+            'step': self.step_counter,
+            'type': 'resolution_step',
+            'clause1_id': clause1_id,
+            'clause2_id': clause2_id,
+            'clause1': self._clause_string(clause1_id),
+            'clause2': self._clause_string(clause2_id),
+            'resolvent_id': resolvent_id,
+            'resolvent': self._clause_to_string(resolvent),
+            'unification': log_entry['unification'],
+            'literals_resolved': log_entry['literals_resolved'],
+            'parents': parents,
+            'new_clauses_count': clauses_count,
+            'message': f'Резолюция клауз {clause1_id} и {clause2_id}'
+        }
+        self.steps_log.append(resolution_step_log)
+
+    def _resolve_clauses(self, clause1: Clause, clause2: Clause,
+                        clause1_id: int, clause2_id: int) -> Tuple[List, List]:
+        """
+        Применяет резолюцию к двум клаузам.
+        
+        Ищет комплементарные литералы и пытается их унифицировать.
+        Комплементарность проверяется сравнением целочисленных заголовков
+        литералов прямо в массивах клауз; клаузы декодируются только при
+        совпадении предикатов. Если в сигнатуре есть сорта, пары литералов
+        с термами разных сортов в одной позиции отбрасываются до унификации.
+        
+        Args:
+            clause1: Первая клауза
+            clause2: Вторая клауза
+            clause1_id: ID первой клаузы (для отладки)
+            clause2_id: ID второй клаузы (для отладки)
+        
+        Returns:
+            Tuple[List, List]: (список резольвент, список логов унификации)
+        """
+        resolvents = []
+        unification_logs = []
+
+        literals1 = clause1.literals
+        literals2 = clause2.literals
+        decoded1 = decoded2 = None
+        check_sorts = self.signature.has_sorts
+
+        # Перебор всех пар литералов из разных клауз
+        position1, i = 0, 0
+        while position1 < len(literals1):
+            header1 = literals1[position1]
+            position2, j = 0, 0
+            while position2 < len(literals2):
+                header2 = literals2[position2]
+                # Условие резолюции: одинаковые предикаты, разные знаки
+                if header1 == -header2:
+                    if decoded1 is None:
+                        decoded1 = self.clause_registry.decode(literals1)
+                        decoded2 = self.clause_registry.decode(literals2)
+                        if check_sorts:
+                            sorts1 = self._variable_sorts(decoded1)
+                            sorts2 = self._variable_sorts(decoded2)
+                            # Переменная с разными сортами в двух клаузах сорта не имеет
+                            variable_sorts = dict(sorts1)
+                            for variable, sort in sorts2.items():
+                                variable_sorts[variable] = (
+                                    sort if variable_sorts.get(variable, sort) == sort else None)
+                    pred1, args1, neg1 = decoded1[i]
+                    pred2, args2, neg2 = decoded2[j]
+
+                    if check_sorts and not self._well_sorted(pred1, args1, args2, sorts1, sorts2):
+                        # Термы разных сортов: резольвента не строится
+                        self.stats.ill_sorted_rejected += 1
+                        substitution = None
+                    else:
+                        # Попытка унификации аргументов
+                        self.stats.unification_attempts += 1
+                        substitution = self._unify(args1, args2,
+                                                   variable_sorts if check_sorts else None)
+
+                    if substitution is not None:
+                        self.stats.unification_successes += 1
+                        # Успешная унификация - создаем резольвенту
+                        resolvent = self._create_resolvent(
+                            decoded1, decoded2, i, j, substitution)
+
+                        resolvents.append(resolvent)
+
+                        # Сохранение информации об унификации для лога
+                        log_entry = {
+                            'unification': substitution,
+                            'literals_resolved': [
+                                (self._literal_to_string(pred1, args1, neg1), i),
+                                (self._literal_to_string(pred2, args2, neg2), j)
+                            ]
+                        }
+                        unification_logs.append(log_entry)
+
+                position2 += 2 + literals2[position2 + 1]
+                j += 1
+            position1 += 2 + literals1[position1 + 1]
+            i += 1
+
+        return resolvents, unification_logs
+
+    def _variable_sorts(self, clause: List[Tuple[str, List[str], bool]]) -> Dict[str, Optional[str]]:
+        """
+        Определяет сорта переменных клаузы по позициям предикатов.
+        
+        Переменная, стоящая в позициях разных сортов, сорта не имеет.
+        
+        Args:
+            clause: Внутреннее представление клаузы
+        
+        Returns:
+            Dict[str, Optional[str]]: Сорт каждой переменной в позиции с сортом
+        """
+        sorts = {}
+        for predicate, args, _ in clause:
+            for position, arg in enumerate(args):
+                if self._is_variable(arg):
+                    sort = self.signature.argument_sort(predicate, position)
+                    if sort is not None:
+                        sorts[arg] = sort if sorts.get(arg, sort) == sort else None
+        return sorts
+
+    def _well_sorted(self, predicate: str, args1: List[str], args2: List[str],
+                     sorts1: Dict[str, Optional[str]], sorts2: Dict[str, Optional[str]]) -> bool:
+        """
+        Проверяет, совместимы ли сорта аргументов двух литералов предиката.
+        
+        В каждой позиции сорт позиции, сорт терма первого литерала и сорт
+        терма второго литерала (если известны) должны совпадать.
+        
+        Args:
+            predicate: Предикат литералов
+            args1: Аргументы первого литерала
+            args2: Аргументы второго литерала
+            sorts1: Сорта переменных первой клаузы
+            sorts2: Сорта переменных второй клаузы
+        
+        Returns:
+            bool: False если унификация связала бы термы разных сортов
+        """
+        for position, (term1, term2) in enumerate(zip(args1, args2)):
+            expected = self.signature.argument_sort(predicate, position)
+            for term, variable_sorts in ((term1, sorts1), (term2, sorts2)):
+                if self._is_variable(term):
+                    sort = variable_sorts.get(term)
+                else:
+                    sort = self.signature.term_sort(term)
+                if sort is None:
+                    continue
+                if expected is None:
+                    expected = sort
+                elif sort != expected:
+                    return False
+        return True
+
+    def _create_resolvent(self, clause1: List[Tuple[str, List[str], bool]],
+                         clause2: List[Tuple[str, List[str], bool]],
+                         idx1: int, idx2: int,
+                         substitution: Dict[str, str]) -> List[Tuple[str, List[str], bool]]:
+        """
+        Создает резольвенту из двух клауз с применением подстановки.
+        
+        Args:
+            clause1: Первая клауза
+            clause2: Вторая клауза
+            idx1: Индекс разрешаемого литерала в первой клаузе
+            idx2: Индекс разрешаемого литерала во второй клаузе
+            substitution: Подстановка для унификации
+        
+        Returns:
+            List[Tuple]: Новая резольвента
+        """
+        # Применение подстановки к обеим клаузам
+        substituted_clause1 = self._apply_substitution(clause1, substitution)
+        substituted_clause2 = self._apply_substitution(clause2, substitution)
+
+        # Создание резольвенты: объединение без разрешаемых литералов
+        resolvent = []
+
+        # Добавление литералов из первой клаузы (кроме разрешаемого)
+        for k, literal in enumerate(substituted_clause1):
+            if k != idx1:
+                if literal not in resolvent:  # Избегание дубликатов
+                    resolvent.append(literal)
+
+        # Добавление литералов из второй клаузы (кроме разрешаемого)
+        for k, literal in enumerate(substituted_clause2):
+            if k != idx2:
+                if literal not in resolvent:  # Избегание дубликатов
+                    resolvent.append(literal)
+
+        return resolvent
+
+    def _unify(self, args1: List[str], args2: List[str],
+               variable_sorts: Optional[Dict[str, Optional[str]]] = None) -> Optional[Dict[str, str]]:
+        """
+        Унифицирует два списка аргументов.
+        
+        Алгоритм унификации Робинсона для нахождения подстановки,
+        делающей два терма идентичными. При заданных сортах переменных
+        переменная не связывается с термом другого сорта (_can_bind),
+        в том числе при связывании через ранее найденные подстановки.
+        
+        Args:
+            args1: Список аргументов первого литерала
+            args2: Список аргументов второго литерала
+            variable_sorts: Сорта переменных обеих клауз (None - без проверки сортов)
+        
+        Returns:
+            Optional[Dict[str, str]]: Подстановка или None если унификация невозможна
+        
+        Пример:
+            >>> self._unify(['x', 'a'], ['b', 'y'])
+            {'x': 'b', 'y': 'a'}
+        """
+        if len(args1) != len(args2):
+            return None  # Разное количество аргументов
+
+        substitution = {}
+
+        for term1, term2 in zip(args1, args2):
+            # Случай 1: Оба терма - константы
+            if self._is_constant(term1) and self._is_constant(term2):
+                if term1 != term2:
+                    return None  # Разные константы не унифицируемы
+
+            # Случай 2: Переменная и произвольный терм
+            elif self._is_variable(term1):
+                if term1 in substitution:
+                    # Переменная уже имеет подстановку - рекурсивная унификация
+                    if not self._unify_terms(substitution[term1], term2, substitution,
+                                             variable_sorts):
+                        return None
+                elif not self._can_bind(term1, term2, variable_sorts):
+                    return None
+                else:
+                    # Новая подстановка: переменная -> терм
+                    substitution[term1] = term2
+
+            # Случай 3: Произвольный терм и переменная
+            elif self._is_variable(term2):
+                if term2 in substitution:
+                    if not self._unify_terms(term1, substitution[term2], substitution,
+                                             variable_sorts):
+                        return None
+                elif not self._can_bind(term2, term1, variable_sorts):
+                    return None
+                else:
+                    substitution[term2] = term1
+
+            # Случай 4: Оба терма содержат функции
+            elif self._contains_function(term1) or self._contains_function(term2):
+                # Упрощенная проверка: только точное совпадение
+                if term1 != term2:
+                    return None
+
+            # Случай 5: Любой другой случай (не должен происходить)
+            else:
+                return None
+
+        return substitution
+
+    def _unify_terms(self, term1: str, term2: str, 
+                    substitution: Dict[str, str],
+                    variable_sorts: Optional[Dict[str, Optional[str]]] = None) -> bool:
+        """
+        Рекурсивно унифицирует два терма с учетом текущей подстановки.
+        
+        Args:
+            term1: Первый терм
+            term2: Второй терм
+            substitution: Текущая подстановка (модифицируется)
+            variable_sorts: Сорта переменных (None - без проверки сортов)
+        
+        Returns:
+            bool: True если унификация успешна
+        """
+        # Применяем существующие подстановки к термам
+        resolved_term1 = self._apply_substitution_to_term(term1, substitution)
+        resolved_term2 = self._apply_substitution_to_term(term2, substitution)
+
+        # Базовые случаи унификации
+        if resolved_term1 == resolved_term2:
+            return True
+        elif self._is_variable(resolved_term1):
+            if not self._can_bind(resolved_term1, resolved_term2, variable_sorts):
+                return False
+            substitution[resolved_term1] = resolved_term2
+            return True
+        elif self._is_variable(resolved_term2):
+            if not self._can_bind(resolved_term2, resolved_term1, variable_sorts):
+                return False
+            substitution[resolved_term2] = resolved_term1
+            return True
+        else:
+            return False
+
+    def _can_bind(self, variable: str, term: str,
+                  variable_sorts: Optional[Dict[str, Optional[str]]]) -> bool:
+        """
+        Проверяет, можно ли связать переменную с термом с учетом сортов.
+        
+        Args:
+            variable: Связываемая переменная
+            term: Терм (переменная или терм без переменных-аргументов)
+            variable_sorts: Сорта переменных (None - без проверки сортов)
+        
+        Returns:
+            bool: False если сорта переменной и терма известны и различны
+        """
+        if variable_sorts is None:
+            return True
+        sort = variable_sorts.get(variable)
+        if sort is None:
+            return True
+        if self._is_variable(term):
+            term_sort = variable_sorts.get(term)
+        else:
+            term_sort = self.signature.term_sort(term)
+        if term_sort is None or term_sort == sort:
+            return True
+        self.stats.ill_sorted_rejected += 1
+        return False
+
+    def _apply_substitution_to_term(self, term: str, 
+                                  substitution: Dict[str, str]) -> str:
+        """
+        Применяет подстановку к одиночному терму.
+        
+        Args:
+            term: Исходный терм
+            substitution: Подстановка для применения
+        
+        Returns:
+            str: Терм после применения подстановки
+        """
+        result = term
+        for var, value in substitution.items():
+            if result == var:
+                result = value
+            elif var in result:
+                # Замена переменных внутри сложных термов
+                result = result.replace(var, value)
+        return result
+
+    def _apply_substitution(self, clause: List[Tuple[str, List[str], bool]],
+                          substitution: Dict[str, str]) -> List[Tuple[str, List[str], bool]]:
+        """
+        Применяет подстановку ко всем термам в клаузе.
+        
+        Args:
+            clause: Исходная клауза
+            substitution: Подстановка для применения
+        
+        Returns:
+            List[Tuple]: Клауза после применения подстановки
+        """
+        substituted_clause = []
+        for predicate, args, negated in clause:
+            substituted_args = [self._apply_substitution_to_term(arg, substitution) 
+                              for arg in args]
+            substituted_clause.append((predicate, substituted_args, negated))
+        return substituted_clause
+
+    def _is_constant(self, term: str) -> bool:
+        """
+        Проверяет, является ли терм константой.
+        
+        Вид терма берется из сигнатуры задачи: константы, числа и
+        сколемовские константы. Необъявленные символы без скобок с заглавной
+        буквы - константы.
+        
+        Args:
+            term: Проверяемый терм
+        
+        Returns:
+            bool: True если терм - константа
+        """
+        return self.signature.is_constant(term)
+
+    def _is_variable(self, term: str) -> bool:
+        """
+        Проверяет, является ли терм переменной.
+        
+        Вид терма берется из сигнатуры задачи; необъявленные символы без
+        скобок со строчной буквы - переменные.
+        
+        Args:
+            term: Проверяемый терм
+        
+        Returns:
+            bool: True если терм - переменная
+        """
+        return self.signature.is_variable(term)
+
+    def _contains_function(self, term: str) -> bool:
+        """
+        Проверяет, содержит ли терм функциональный символ.
+        
+        Args:
+            term: Проверяемый терм
+        
+        Returns:
+            bool: True если терм содержит функцию (скобки)
+        """
+        return '(' in term and ')' in term
+
+    def _is_tautology(self, clause: List[Tuple[str, List[str], bool]]) -> bool:
+        """
+        Проверяет, является ли клауза тавтологией.
+        
+        Тавтология содержит комплементарные литералы (P и ¬P).
+        
+        Args:
+            clause: Проверяемая клауза
+        
+        Returns:
+            bool: True если клауза - тавтология
+        """
+        positive_literals = set()
+        negative_literals = set()
+
+        for predicate, args, negated in clause:
+            # Ключ литерала: (предикат, кортеж аргументов)
+            literal_key = (predicate, tuple(args))
+            if negated:
+                negative_literals.add(literal_key)
+            else:
+                positive_literals.add(literal_key)
+
+        # Тавтология если есть пересечение положительных и отрицательных литералов
+        return bool(positive_literals & negative_literals)
+
+    def _is_subsumed(self, encoded: array, all_clause_ids: List[int]) -> bool:
+        """
+        Проверяет, поглощается ли клауза существующими клаузами.
+        
+        Клауза A поглощается клаузой B если A является подмножеством B
+        с учетом некоторой подстановки.
+        
+        Args:
+            encoded: Закодированные литералы проверяемой клаузы
+            all_clause_ids: Список ID всех существующих клауз
+        
+        Returns:
+            bool: True если клауза поглощается
+        """
+        for existing_id in all_clause_ids:
+            if self._subsumes(self.clause_registry[existing_id].literals, encoded):
+                return True
+        return False
+
+    def _subsumes(self, clause1: array, clause2: array) -> bool:
+        """
+        Проверяет, поглощает ли clause1 clause2.
+        
+        Упрощенная проверка: точное совпадение клауз.
+        В полной реализации должна учитывать подстановки.
+        
+        Args:
+            clause1: Закодированные литералы потенциально поглощающей клаузы
+            clause2: Закодированные литералы потенциально поглощаемой клаузы
+        
+        Returns:
+            bool: True если clause1 поглощает clause2
+        """
+        # Упрощенная реализация: проверка точного совпадения массивов
+        return clause1 == clause2
+
+
+# Настройки движка и состояние аксиом рабочего процесса prove_many
+_goal_worker = None
+
+
+def _init_goal_worker(worker_config: Dict[str, Any], axioms: List[str],
+                      axiom_state: Dict[str, Any]):
+    """Сохраняет в рабочем процессе настройки движка и состояние аксиом (один раз на процесс)."""
+    global _goal_worker
+    engine = ResolutionEngine(max_steps=worker_config['max_steps'],
+                              memory_limit=worker_config['memory_limit'])
+    engine.signature = worker_config['signature']
+    engine.deadline = worker_config['deadline']
+    _goal_worker = (engine, axioms, axiom_state)
+
+
+def _prove_goal_in_worker(goal_clauses: List[str]) -> Tuple[bool, List[Dict]]:
+    """Доказывает одну цель prove_many в рабочем процессе."""
+    engine, axioms, axiom_state = _goal_worker
+    return engine._prove_goal(axioms, axiom_state, goal_clauses)
@@ -0,0 +1,444 @@
+"""
+Модуль сигнатуры задачи: вид и арность каждого символа дизъюнктов.
+Движок резолюций различает переменные и константы по сигнатуре, а не по
+регистру первой буквы, поэтому сколемовские константы со строчной буквы
+(a, b, c из правил промпта) и числа классифицируются правильно.
+Классификация каждого терма вычисляется один раз и запоминается.
+
+Сигнатура может быть многосортной: аргументам предикатов и результатам
+функций и констант назначаются сорта (объявленные или выведенные из
+множества дизъюнктов), и движок не выполняет резолюцию, при которой
+терм одного сорта попал бы в позицию другого.
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Tuple, Union
+
+try:
+    from .clause_parser import ClauseSyntaxError, ParsedClause, Term, clause_literals
+except ImportError:
+    from clause_parser import ClauseSyntaxError, ParsedClause, Term, clause_literals
+
+
+# Виды символов
+VARIABLE = 'variable'
+CONSTANT = 'constant'
+NUMERAL = 'numeral'
+FUNCTION = 'function'
+SKOLEM_CONSTANT = 'skolem_constant'
+SKOLEM_FUNCTION = 'skolem_function'
+PREDICATE = 'predicate'
+
+SYMBOL_KINDS = (VARIABLE, CONSTANT, NUMERAL, FUNCTION, SKOLEM_CONSTANT, SKOLEM_FUNCTION, PREDICATE)
+
+# Виды, которые унифицируются как константы (совпадают только сами с собой)
+CONSTANT_KINDS = frozenset((CONSTANT, NUMERAL, SKOLEM_CONSTANT))
+
+# Запись числа: целое или десятичное
+NUMERAL_PATTERN = re.compile(r'^\d+(?:[.,]\d+)?$')
+
+# Сорт чисел, если он не объявлен явно
+NUMBER_SORT = 'Число'
+
+
+class SignatureError(ValueError):
+    """Противоречивое объявление символа (другой вид или арность)."""
+
+
+class Symbol(NamedTuple):
+    """Объявление символа: вид и арность."""
+    kind: str
+    arity: int = 0
+
+
+def classify_by_convention(name: str) -> str:
+    """
+    Определяет вид необъявленного символа без аргументов по соглашению движка.
+
+    Args:
+        name: Имя символа
+
+    Returns:
+        str: NUMERAL для чисел, VARIABLE для имен со строчной буквы,
+            иначе CONSTANT
+    """
+    if NUMERAL_PATTERN.match(name):
+        return NUMERAL
+    if name[:1].islower():
+        return VARIABLE
+    return CONSTANT
+
+
+class Signature:
+    """
+    Сигнатура задачи: объявления символов термов и предикатов.
+
+    Символы термов и предикаты хранятся раздельно (у них разные
+    пространства имен). Необъявленные символы классифицируются по
+    соглашению движка (classify_by_convention). Результат классификации
+    запоминается для каждой строки терма, поэтому повторные проверки
+    при унификации выполняются за O(1).
+
+    Сорта необязательны: позиция или символ без сорта совместимы с любым
+    термом. Сорта объявляются declare_sorts и declare_result_sort, а
+    infer_sorts распространяет их по множеству дизъюнктов.
+
+    Атрибуты:
+        symbols (Dict[str, Symbol]): Объявления символов термов
+        predicates (Dict[str, int]): Арности предикатов
+        predicate_sorts (Dict[str, Tuple[Optional[str], ...]]): Сорта
+            аргументов предикатов (None - позиция без сорта)
+        result_sorts (Dict[str, str]): Сорта констант и результатов функций
+        sort_conflicts (List[str]): Противоречия, найденные при выводе сортов
+    """
+
+    def __init__(self):
+        """Создает пустую сигнатуру."""
+        self.symbols: Dict[str, Symbol] = {}
+        self.predicates: Dict[str, int] = {}
+        self.predicate_sorts: Dict[str, Tuple[Optional[str], ...]] = {}
+        self.result_sorts: Dict[str, str] = {}
+        self.sort_conflicts: List[str] = []
+        self._kinds: Dict[str, str] = {}
+        self._sorts: Dict[str, Optional[str]] = {}
+        self._has_sorts = False
+
+    def declare(self, name: str, kind: str, arity: int = 0):
+        """
+        Объявляет символ.
+
+        Повторное объявление с тем же видом и арностью допускается.
+
+        Args:
+            name: Имя символа
+            kind: Вид символа (одна из констант SYMBOL_KINDS)
+            arity: Число аргументов
+
+        Raises:
+            SignatureError: Если символ уже объявлен с другим видом или арностью
+            ValueError: При неизвестном виде символа
+        """
+        if kind not in SYMBOL_KINDS:
+            raise ValueError(f"Неизвестный вид символа: {kind}")
+
+        if kind == PREDICATE:
+            declared = self.predicates.setdefault(name, arity)
+            if declared != arity:
+                raise SignatureError(
+                    f"Предикат {name} используется с арностью {declared} и {arity}")
+            return
+
+        symbol = Symbol(kind, arity)
+        declared = self.symbols.setdefault(name, symbol)
+        if declared != symbol:
+            raise SignatureError(
+                f"Символ {name} объявлен как {declared.kind}/{declared.arity}, "
+                f"а используется как {kind}/{arity}")
+        self._kinds.clear()
+        self._sorts.clear()
+
+    def declare_sorts(self, predicate: str, *sorts: Optional[str]):
+        """
+        Объявляет сорта аргументов предиката.
+
+        Args:
+            predicate: Имя предиката
+            *sorts: Сорт каждого аргумента (None - позиция без сорта)
+
+        Raises:
+            SignatureError: Если предикат объявлен с другой арностью
+
+        Пример:
+            >>> signature.declare_sorts('Возраст', 'Человек', 'Число')
+        """
+        self.declare(predicate, PREDICATE, len(sorts))
+        self.predicate_sorts[predicate] = tuple(sorts)
+        self._has_sorts = self._has_sorts or any(sort is not None for sort in sorts)
+
+    def declare_result_sort(self, symbol: str, sort: str):
+        """
+        Объявляет сорт константы или результата функции.
+
+        Args:
+            symbol: Имя константы или функционального символа
+            sort: Сорт
+        """
+        self.result_sorts[symbol] = sort
+        self._sorts.clear()
+        self._has_sorts = True
+
+    @property
+    def has_sorts(self) -> bool:
+        """Объявлен или выведен ли хотя бы один сорт."""
+        return self._has_sorts
+
+    def argument_sort(self, predicate: str, position: int) -> Optional[str]:
+        """Возвращает сорт аргумента предиката (None - без сорта)."""
+        sorts = self.predicate_sorts.get(predicate)
+        return sorts[position] if sorts is not None and position < len(sorts) else None
+
+    def term_sort(self, term: str) -> Optional[str]:
+        """
+        Возвращает сорт терма без переменных-аргументов в строковой записи движка.
+
+        Сорт составного терма - сорт результата функции, сорт числа -
+        NUMBER_SORT, если для него не объявлен другой. Переменные сорта
+        не имеют (он определяется позициями в клаузе).
+
+        Args:
+            term: Терм, например "Сократ", "70" или "Отец(x)"
+
+        Returns:
+            Optional[str]: Сорт или None
+        """
+        if term in self._sorts:
+            return self._sorts[term]
+        kind = self.kind(term)
+        if kind == VARIABLE:
+            sort = None
+        else:
+            name = term.split('(', 1)[0].strip()
+            sort = self.result_sorts.get(name)
+            if sort is None and kind == NUMERAL:
+                sort = NUMBER_SORT
+        self._sorts[term] = sort
+        return sort
+
+    def infer_sorts(self, clauses: Iterable[Union[str, ParsedClause]]):
+        """
+        Выводит сорта необъявленных позиций предикатов и символов.
+
+        Строится граф: позиция предиката связана с термами, которые в ней
+        стоят, а вхождения одной переменной в клаузе связаны между собой.
+        Сорта распространяются от объявленных узлов (числа имеют сорт
+        NUMBER_SORT): необъявленный узел получает сорт, если все известные
+        сорта его соседей совпадают. Узел с соседями разных сортов остается
+        без сорта и не передает сорт дальше, а противоречие записывается
+        в sort_conflicts, поэтому одна ошибочная запись не лишает сортов
+        остальные символы.
+
+        Args:
+            clauses: Дизъюнкты в формате движка или разобранные дизъюнкты
+                (строки с ошибками пропускаются)
+
+        Пример:
+            >>> signature.declare_sorts('Возраст', 'Человек', 'Число')
+            >>> signature.infer_sorts(["Возраст(Сократ, 70)", "¬Возраст(x, n) ∨ Взрослый(x)"])
+            >>> signature.term_sort('Сократ'), signature.argument_sort('Взрослый', 0)
+            ('Человек', 'Человек')
+        """
+        neighbors: Dict[Tuple, List[Tuple]] = {}
+
+        def link(first: Tuple, second: Tuple):
+            neighbors.setdefault(first, []).append(second)
+            neighbors.setdefault(second, []).append(first)
+
+        def term_node(term: Term, clause_index: int) -> Tuple:
+            if term.args:
+                for position, arg in enumerate(term.args):
+                    link(('argument', term.name, position), term_node(arg, clause_index))
+                return ('symbol', term.name)
+            if self.kind(term.name) == VARIABLE:
+                return ('variable', clause_index, term.name)
+            return ('symbol', term.name)
+
+        # Шаг 1: Граф позиций, символов и переменных
+        for clause_index, clause in enumerate(clauses):
+            try:
+                literals = clause_literals(clause)
+            except ClauseSyntaxError:
+                continue
+            for literal in literals:
+                for position, arg in enumerate(literal.args):
+                    link(('position', literal.predicate, position), term_node(arg, clause_index))
+
+        # Шаг 2: Распространение сортов от объявленных узлов
+        sorts = {node: self._declared_sort(node) for node in neighbors}
+        inferred = {node for node, sort in sorts.items() if sort is None}
+        conflicts = set()
+        changed = True
+        while changed:
+            changed = False
+            for node in neighbors:
+                if sorts[node] is not None or node in conflicts:
+                    continue
+                known = {sorts[other] for other in neighbors[node]
+                         if sorts[other] is not None and other not in conflicts}
+                if len(known) == 1:
+                    sorts[node] = known.pop()
+                    changed = True
+                elif len(known) > 1:
+                    conflicts.add(node)
+                    changed = True
+                    if node[0] != 'variable':
+                        self.sort_conflicts.append(
+                            f"{node[1]}: несовместимые сорта {', '.join(sorted(known))}")
+
+        # Шаг 3: Назначение выведенных сортов позициям и символам
+        for node in inferred:
+            if sorts[node] is not None:
+                self._assign_sort(node, sorts[node])
+        self._sorts.clear()
+
+    def _declared_sort(self, node: Tuple) -> Optional[str]:
+        """Сорт узла вывода сортов, если он объявлен (или это число)."""
+        if node[0] == 'position':
+            return self.argument_sort(node[1], node[2])
+        if node[0] == 'symbol':
+            sort = self.result_sorts.get(node[1])
+            if sort is None and NUMERAL_PATTERN.match(node[1]):
+                return NUMBER_SORT
+            return sort
+        return None
+
+    def _assign_sort(self, node: Tuple, sort: str):
+        """Назначает выведенный сорт позиции предиката или символу."""
+        if node[0] == 'position':
+            _, predicate, position = node
+            sorts = list(self.predicate_sorts.get(predicate, (None,) * self.predicates.get(predicate, 0)))
+            sorts.extend([None] * (position + 1 - len(sorts)))
+            sorts[position] = sort
+            self.predicate_sorts[predicate] = tuple(sorts)
+        elif node[0] == 'symbol':
+            self.result_sorts[node[1]] = sort
+        self._has_sorts = True
+
+    def kind(self, term: str) -> str:
+        """
+        Возвращает вид терма в строковой записи движка.
+
+        Args:
+            term: Терм, например "x", "Сократ", "5" или "f(a)"
+
+        Returns:
+            str: Вид символа; для составного терма - вид его функции
+        """
+        kind = self._kinds.get(term)
+        if kind is None:
+            kind = self._classify(term)
+            self._kinds[term] = kind
+        return kind
+
+    def is_variable(self, term: str) -> bool:
+        """Проверяет, является ли терм переменной."""
+        return bool(term) and self.kind(term) == VARIABLE
+
+    def is_constant(self, term: str) -> bool:
+        """Проверяет, является ли терм константой (в том числе числом или сколемовской)."""
+        return bool(term) and self.kind(term) in CONSTANT_KINDS
+
+    def merge(self, other: 'Signature'):
+        """
+        Добавляет объявления другой сигнатуры.
+
+        Raises:
+            SignatureError: При противоречащих объявлениях
+        """
+        for name, symbol in other.symbols.items():
+            self.declare(name, symbol.kind, symbol.arity)
+        for name, arity in other.predicates.items():
+            self.declare(name, PREDICATE, arity)
+        for name, sorts in other.predicate_sorts.items():
+            self.declare_sorts(name, *sorts)
+        for name, sort in other.result_sorts.items():
+            self.declare_result_sort(name, sort)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает сигнатуру в виде, пригодном для JSON."""
+        return {
+            'symbols': {name: [symbol.kind, symbol.arity] for name, symbol in self.symbols.items()},
+            'predicates': dict(self.predicates),
+            'predicate_sorts': {name: list(sorts) for name, sorts in self.predicate_sorts.items()},
+            'result_sorts': dict(self.result_sorts),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Signature':
+        """Восстанавливает сигнатуру, сохраненную to_dict."""
+        signature = cls()
+        for name, (kind, arity) in data.get('symbols', {}).items():
+            signature.declare(name, kind, arity)
+        for name, arity in data.get('predicates', {}).items():
+            signature.declare(name, PREDICATE, arity)
+        for name, sorts in data.get('predicate_sorts', {}).items():
+            signature.declare_sorts(name, *sorts)
+        for name, sort in data.get('result_sorts', {}).items():
+            signature.declare_result_sort(name, sort)
+        return signature
+
+    @classmethod
+    def from_clauses(cls, clauses: Iterable[Union[str, ParsedClause]],
+                     skolem_constants: Optional[Pattern] = None,
+                     skolem_functions: Optional[Pattern] = None) -> 'Signature':
+        """
+        Строит сигнатуру по символам дизъюнктов.
+
+        Символы без аргументов классифицируются по соглашению движка, кроме
+        имен, подходящих под шаблон сколемовских констант; функциональные
+        символы, подходящие под шаблон сколемовских функций, объявляются
+        сколемовскими. Строки с синтаксическими ошибками пропускаются.
+
+        Args:
+            clauses: Дизъюнкты в формате движка или разобранные дизъюнкты
+            skolem_constants: Шаблон имен сколемовских констант
+            skolem_functions: Шаблон имен сколемовских функций
+
+        Returns:
+            Signature: Сигнатура символов дизъюнктов
+
+        Raises:
+            SignatureError: Если символ используется с разной арностью
+
+        Пример:
+            >>> signature = Signature.from_clauses(["Любит(a, x)"], re.compile(r'^[a-e]$'))
+            >>> signature.kind('a'), signature.kind('x')
+            ('skolem_constant', 'variable')
+        """
+        signature = cls()
+        for clause in clauses:
+            try:
+                literals = clause_literals(clause)
+            except ClauseSyntaxError:
+                continue
+            for literal in literals:
+                signature.declare(literal.predicate, PREDICATE, len(literal.args))
+                for term in _iter_terms(literal.args):
+                    signature._declare_term(term, skolem_constants, skolem_functions)
+        return signature
+
+    def _declare_term(self, term: Term, skolem_constants: Optional[Pattern],
+                      skolem_functions: Optional[Pattern]):
+        """Объявляет символ терма по соглашению движка и шаблонам сколемовских символов."""
+        if term.args:
+            skolem = skolem_functions is not None and skolem_functions.match(term.name)
+            self.declare(term.name, SKOLEM_FUNCTION if skolem else FUNCTION, len(term.args))
+        elif skolem_constants is not None and skolem_constants.match(term.name):
+            self.declare(term.name, SKOLEM_CONSTANT)
+        else:
+            self.declare(term.name, classify_by_convention(term.name))
+
+    def _classify(self, term: str) -> str:
+        """Классифицирует терм по объявлениям или по соглашению движка."""
+        if '(' in term:
+            symbol = self.symbols.get(term.split('(', 1)[0].strip())
+            return symbol.kind if symbol is not None and symbol.arity else FUNCTION
+        symbol = self.symbols.get(term)
+        if symbol is not None and not symbol.arity:
+            return symbol.kind
+        return classify_by_convention(term)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.symbols or name in self.predicates
+
+    def __len__(self) -> int:
+        return len(self.symbols) + len(self.predicates)
+
+    def __repr__(self) -> str:
+        return f"Signature({len(self.symbols)} symbols, {len(self.predicates)} predicates)"
+
+
+def _iter_terms(terms: Iterable[Term]) -> Iterator[Term]:
+    """Перебирает термы и все их подтермы."""
+    for term in terms:
+        yield term
+        yield from _iter_terms(term.args)
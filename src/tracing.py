@@ -0,0 +1,276 @@
+"""
+Модуль трассировки конвейера формализация → доказательство → объяснение.
+Реализует вложенные интервалы (spans) с атрибутами, экспорт в JSONL
+и в формат Chrome trace (chrome://tracing, Perfetto), а также сводную
+статистику длительностей по этапам.
+"""
+
+import os
+import json
+import time
+import threading
+import itertools
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+
+class Span:
+    """
+    Интервал трассировки: именованный этап с временем начала и конца.
+
+    Атрибуты:
+        name (str): Имя этапа, например "engine.prove"
+        span_id (int): Уникальный ID интервала
+        parent_id (Optional[int]): ID родительского интервала
+        trace_id (int): ID корневого интервала (одного запроса)
+        thread_id (int): ID потока, в котором открыт интервал
+        attributes (Dict[str, Any]): Произвольные атрибуты этапа
+        start (float): Время начала (time.perf_counter)
+        end (Optional[float]): Время окончания (None - интервал открыт)
+    """
+
+    __slots__ = ('name', 'span_id', 'parent_id', 'trace_id', 'thread_id',
+                 'attributes', 'start', 'end')
+
+    def __init__(self, name: str, span_id: int, parent: Optional['Span'],
+                 attributes: Dict[str, Any]):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = parent.trace_id if parent is not None else span_id
+        self.thread_id = threading.get_ident()
+        self.attributes = attributes
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+
+    def set_attribute(self, key: str, value: Any):
+        """Устанавливает атрибут интервала."""
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        """Устанавливает несколько атрибутов интервала."""
+        self.attributes.update(attributes)
+
+    @property
+    def duration(self) -> float:
+        """Длительность в секундах (для открытого интервала - на текущий момент)."""
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает интервал в виде словаря для экспорта."""
+        return {
+            'name': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'trace_id': self.trace_id,
+            'thread_id': self.thread_id,
+            'start': self.start,
+            'duration': self.duration,
+            'attributes': self.attributes,
+        }
+
+
+class _NullSpan:
+    """Заглушка интервала при выключенной трассировке."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        pass
+
+    @property
+    def duration(self) -> float:
+        return 0.0
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Сборщик интервалов трассировки.
+
+    Вложенность определяется стеком открытых интервалов текущего потока;
+    для продолжения трассы в другом потоке (например, в обработчике GUI)
+    родитель передается явно. Хранится не более max_spans последних
+    завершенных интервалов.
+
+    Атрибуты:
+        enabled (bool): Включена ли трассировка
+        max_spans (int): Максимальное количество хранимых интервалов
+    """
+
+    def __init__(self, max_spans: int = 10000, enabled: bool = True):
+        """
+        Инициализация трассировщика.
+
+        Args:
+            max_spans: Максимальное количество хранимых интервалов
+            enabled: Включена ли трассировка
+        """
+        self.enabled = enabled
+        self.max_spans = max_spans
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+
+    @contextmanager
+    def span(self, name: str, parent: Optional[Span] = None,
+             **attributes) -> Iterator[Span]:
+        """
+        Открывает интервал на время блока with.
+
+        Исключение, вышедшее из блока, записывается в атрибут "error"
+        и пробрасывается дальше.
+
+        Args:
+            name: Имя этапа
+            parent: Явный родитель (по умолчанию - текущий интервал потока)
+            **attributes: Начальные атрибуты
+
+        Returns:
+            Iterator[Span]: Открытый интервал (NULL_SPAN, если трассировка выключена)
+
+        Пример:
+            >>> with tracer.span("engine.prove", clauses=3) as span:
+            ...     span.set_attribute("result", True)
+        """
+        if not self.enabled:
+            yield NULL_SPAN
+            return
+
+        stack = self._stack()
+        if parent is None and stack:
+            parent = stack[-1]
+
+        span = Span(name, next(self._ids), parent, attributes)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.attributes['error'] = f"{type(error).__name__}: {error}"
+            raise
+        finally:
+            span.end = time.perf_counter()
+            stack.pop()
+            with self._lock:
+                self._spans.append(span)
+
+    def current_span(self) -> Optional[Span]:
+        """Возвращает текущий открытый интервал потока."""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def spans(self, trace_id: Optional[int] = None) -> List[Span]:
+        """
+        Возвращает завершенные интервалы в порядке начала.
+
+        Args:
+            trace_id: ID трассы (None - все интервалы)
+
+        Returns:
+            List[Span]: Интервалы
+        """
+        with self._lock:
+            spans = list(self._spans)
+        if trace_id is not None:
+            spans = [span for span in spans if span.trace_id == trace_id]
+        return sorted(spans, key=lambda span: span.start)
+
+    def clear(self):
+        """Удаляет все сохраненные интервалы."""
+        with self._lock:
+            self._spans.clear()
+
+    def summary(self, trace_id: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Сводная статистика длительностей по именам этапов.
+
+        Args:
+            trace_id: ID трассы (None - по всем запросам)
+
+        Returns:
+            Dict[str, Dict[str, float]]: Для каждого этапа: count, total,
+                mean и max (в секундах)
+        """
+        summary: Dict[str, Dict[str, float]] = {}
+        for span in self.spans(trace_id):
+            entry = summary.setdefault(span.name, {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += span.duration
+            entry['max'] = max(entry['max'], span.duration)
+        for entry in summary.values():
+            entry['mean'] = entry['total'] / entry['count']
+        return summary
+
+    def format_summary(self, trace_id: Optional[int] = None) -> str:
+        """Форматирует сводную статистику в текстовую таблицу."""
+        lines = [f"{'Этап':<32} {'Кол-во':>7} {'Всего, мс':>11} {'Среднее, мс':>12} {'Макс, мс':>10}"]
+        for name, entry in sorted(self.summary(trace_id).items(),
+                                  key=lambda item: -item[1]['total']):
+            lines.append(f"{name:<32} {entry['count']:7d} {entry['total'] * 1000:11.1f} "
+                         f"{entry['mean'] * 1000:12.1f} {entry['max'] * 1000:10.1f}")
+        return '\n'.join(lines)
+
+    def export_jsonl(self, path: str, trace_id: Optional[int] = None):
+        """
+        Дописывает интервалы в файл JSONL (один интервал на строку).
+
+        Args:
+            path: Путь к файлу
+            trace_id: ID трассы (None - все интервалы)
+        """
+        _ensure_directory(path)
+        with open(path, 'a', encoding='utf-8') as file:
+            for span in self.spans(trace_id):
+                file.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + '\n')
+
+    def export_chrome_trace(self, path: str, trace_id: Optional[int] = None):
+        """
+        Записывает интервалы в формате Chrome trace (события "X").
+
+        Файл открывается в chrome://tracing или https://ui.perfetto.dev.
+
+        Args:
+            path: Путь к файлу
+            trace_id: ID трассы (None - все интервалы)
+        """
+        events = [{
+            'name': span.name,
+            'cat': span.name.split('.')[0],
+            'ph': 'X',
+            'ts': span.start * 1e6,
+            'dur': span.duration * 1e6,
+            'pid': os.getpid(),
+            'tid': span.thread_id,
+            'args': dict(span.attributes, span_id=span.span_id,
+                         parent_id=span.parent_id, trace_id=span.trace_id),
+        } for span in self.spans(trace_id)]
+
+        _ensure_directory(path)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file,
+                      ensure_ascii=False, default=str)
+
+    def _stack(self) -> List[Span]:
+        """Возвращает стек открытых интервалов текущего потока."""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+def _ensure_directory(path: str):
+    """Создает каталог файла, если его нет."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+
+# Общий трассировщик приложения
+tracer = Tracer()
@@ -0,0 +1,89 @@
+import json
+
+from benchmarks.bench_prompts import build_prompts, prompt_sizes
+from benchmarks.bench_resolution import main, run_problem
+from benchmarks.problems import default_problems, pigeonhole, random_3cnf
+from benchmarks.regression_gate import compare_reports, main as gate_main, summarize_times
+
+
+def test_problem_generators():
+    """Генераторы семейств детерминированы и дают корректные клаузы"""
+    assert len(pigeonhole(2).clauses) == 3 + 2 * 3
+    assert random_3cnf(4).clauses == random_3cnf(4).clauses
+    names = [problem.name for problem in default_problems()]
+    assert len(names) == len(set(names))
+
+
+def test_run_problem_metrics():
+    """Метрики задачи: результат, счетчики и пиковая память"""
+    metrics = run_problem(pigeonhole(1), repeat=2)
+    print(metrics)
+    assert metrics['result'] is True and metrics['correct'] is True
+    assert len(metrics['wall_times']) == 2
+    assert metrics['generated_clauses'] >= metrics['kept_clauses'] > 0
+    assert metrics['unification_calls'] > 0 and metrics['peak_memory'] > 0
+
+
+def test_benchmark_json_report(tmp_path):
+    """Отчет бенчмарка записывается в JSON"""
+    output = tmp_path / "bench.json"
+    assert main(['--families', 'skolem', '--repeat', '1', '--no-memory',
+                 '--output', str(output)]) == 0
+
+    report = json.loads(output.read_text(encoding='utf-8'))
+    assert report['format_version'] == 1
+    assert [metrics['name'] for metrics in report['problems']] == [
+        'skolem-4', 'skolem-8', 'skolem-16', 'skolem-32']
+    assert all(metrics['peak_memory'] is None for metrics in report['problems'])
+
+
+def _report(times, generated=100, result=True):
+    """Минимальный отчет бенчмарка с одной задачей"""
+    return {'problems': [{'name': 'chain-3', 'wall_times': times, 'result': result,
+                          'generated_clauses': generated, 'unification_calls': 50}]}
+
+
+def test_regression_gate_tolerance():
+    """Замедление в пределах шума не считается регрессией, рост счетчиков - считается"""
+    assert summarize_times([1.0, 2.0, 3.0, 4.0, 100.0])[0] == 3.0
+
+    baseline = _report([0.10, 0.10, 0.11, 0.10, 0.10])
+    assert compare_reports(baseline, _report([0.12, 0.11, 0.12, 0.12, 0.13]))[0]['status'] == 'ok'
+
+    slower = compare_reports(baseline, _report([0.30, 0.31, 0.29, 0.30, 0.30]))[0]
+    print(slower)
+    assert slower['status'] == 'regression' and slower['ratio'] > 2
+
+    # Большой разброс прогонов поглощает разницу медиан
+    noisy = compare_reports(baseline, _report([0.05, 0.10, 0.16, 0.30, 0.50]))[0]
+    assert noisy['status'] == 'ok'
+
+    counters = compare_reports(baseline, _report([0.10] * 5, generated=120))[0]
+    assert counters['status'] == 'regression'
+    assert counters['regressions'] == ['generated_clauses 100 -> 120']
+
+
+def test_regression_gate_exit_codes(tmp_path):
+    """Команда завершается с ненулевым кодом при регрессии"""
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(_report([0.10] * 5)), encoding='utf-8')
+
+    current.write_text(json.dumps(_report([0.10] * 5, generated=90)), encoding='utf-8')
+    assert gate_main(['--baseline', str(baseline), '--current', str(current)]) == 0
+
+    current.write_text(json.dumps(_report([0.10] * 5, result=False)), encoding='utf-8')
+    assert gate_main(['--baseline', str(baseline), '--current', str(current)]) == 1
+
+    assert gate_main(['--baseline', str(tmp_path / "none.json"),
+                      '--current', str(current)]) == 2
+
+
+def test_prompt_sizes():
+    """Изменяемая часть промпта формализатора мала по сравнению с системным промптом"""
+    prompts = build_prompts()
+    sizes = {kind: prompt_sizes(system, variable) for kind, (system, variable) in prompts.items()}
+    print(sizes)
+    assert set(sizes) == {'formalizer', 'formalizer-fol', 'explainer'}
+    assert sizes['formalizer']['variable_share'] < 0.2
+    assert all(system not in prompt for system, variable in prompts.values() for prompt in variable)
@@ -0,0 +1,77 @@
+import pytest
+
+from src.clause_loader import ClauseFileError, iter_tptp_clauses, load_clauses
+from src.resolution_engine import ResolutionEngine
+
+
+def test_tptp_cnf_translation(tmp_path):
+    """Перевод cnf(...) TPTP в запись движка"""
+    problem = tmp_path / "PUZ.p"
+    problem.write_text(
+        "% Сократ смертен\n"
+        "cnf(rule, axiom, ~ man(X) | mortal(X)).\n"
+        "cnf(fact, axiom, man(socrates)).\n"
+        "cnf(goal, negated_conjecture,\n"
+        "    ( ~ mortal(socrates) )).\n",
+        encoding='utf-8')
+
+    clauses = list(load_clauses(str(problem)))
+    print(f"Клаузы: {clauses}")
+    assert clauses == ["¬man(x) ∨ mortal(x)", "man(Socrates)", "¬mortal(Socrates)"]
+
+    success, _ = ResolutionEngine().prove(load_clauses(str(problem)))
+    assert success
+
+
+def test_tptp_include_equality_and_constants(tmp_path):
+    """Директива include с выбором имен, равенство и $false"""
+    axioms = tmp_path / "Axioms"
+    axioms.mkdir()
+    (axioms / "SET.ax").write_text(
+        "cnf(a1, axiom, f(X) = g(X, c)).\n"
+        "/* пропускаемая\n   аксиома */\n"
+        "cnf(a2, axiom, X != f(X) | $false, inference(a, [], [])).\n"
+        "cnf(a3, axiom, p | $true).\n",
+        encoding='utf-8')
+    problem = tmp_path / "SET.p"
+    problem.write_text(
+        "include('Axioms/SET.ax', [a1, a2, a3]).\n"
+        "include('Axioms/SET.ax', [a2]).\n"
+        "cnf(empty, negated_conjecture, $false).\n",
+        encoding='utf-8')
+
+    clauses = list(iter_tptp_clauses(str(problem)))
+    print(f"Клаузы: {clauses}")
+    assert clauses == ["equal(F(x), G(x, C))", "¬equal(x, F(x))", "¬equal(x, F(x))", "□"]
+
+
+def test_dimacs_streaming(tmp_path):
+    """Клаузы DIMACS (в том числе многострочные) читаются лениво"""
+    problem = tmp_path / "php.cnf"
+    problem.write_text("c пример\np cnf 2 3\n1 -2 0\n2\n0\n-1 0\n", encoding='utf-8')
+
+    clauses = load_clauses(str(problem))
+    assert next(clauses) == "P1 ∨ ¬P2"
+    assert list(clauses) == ["P2", "¬P1"]
+
+    success, log = ResolutionEngine().prove(load_clauses(str(problem)))
+    assert success
+    assert log[0]['original_clauses'] == ["P1 ∨ ¬P2", "P2", "¬P1"]
+
+
+def test_format_errors(tmp_path):
+    """Ошибки формата сообщаются с номером строки"""
+    problem = tmp_path / "bad.p"
+    problem.write_text("cnf(ok, axiom, p(a)).\n\ncnf(bad, axiom, p(a) | ).\n", encoding='utf-8')
+    with pytest.raises(ClauseFileError) as error:
+        list(load_clauses(str(problem)))
+    print(error.value)
+    assert error.value.line == 3
+
+    missing = tmp_path / "missing.p"
+    missing.write_text("include('Axioms/NONE.ax').\n", encoding='utf-8')
+    with pytest.raises(ClauseFileError):
+        list(load_clauses(str(missing)))
+
+    success, log = ResolutionEngine().prove(load_clauses(str(problem)))
+    assert not success and log[-1]['type'] == 'error'
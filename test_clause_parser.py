@@ -0,0 +1,84 @@
+import pytest
+
+from src.clause_parser import (ClauseParser, ClauseScanner, ClauseSyntaxError, Literal, Term,
+                               parse_clause, parse_clause_strings, tokenize)
+from src.resolution_engine import ResolutionEngine
+
+
+def test_structured_terms():
+    """Разбор вложенных функциональных термов"""
+    literals = parse_clause("¬СдалЭкзамен(x, f(x, g(Иван))) ∨ Студент(x)")
+    print(f"Литералы: {literals}")
+    assert literals[0] == Literal('СдалЭкзамен',
+                                  (Term('x'), Term('f', (Term('x'), Term('g', (Term('Иван'),))))),
+                                  True)
+    assert str(literals[0].args[1]) == 'f(x, g(Иван))'
+    assert literals[1] == Literal('Студент', (Term('x'),), False)
+
+
+def test_propositional_atoms_and_empty_clause():
+    """Атомы без скобок и пустая клауза не теряются"""
+    assert parse_clause_strings("¬ФермерПрисутствует ∨ Съест(волк, коза)") == (
+        ('ФермерПрисутствует', (), True),
+        ('Съест', ('волк', 'коза'), False))
+    assert parse_clause("□") == ()
+    assert parse_clause("¬¬P(a)")[0].negated is False
+    assert parse_clause_strings("Мотив(кто-то)") == (('Мотив', ('кто-то',), False),)
+
+
+def test_syntax_errors_with_positions():
+    """Синтаксические ошибки сообщаются с позицией"""
+    cases = [
+        ("P(x ∨ Q(y)", 4),
+        ("P(x) ∨", 6),
+        ("P(x) Q(y)", 5),
+        ("P(x; y)", 3),
+    ]
+    for text, position in cases:
+        with pytest.raises(ClauseSyntaxError) as error:
+            ClauseParser(text).parse_clause()
+        print(f"{text!r}: {error.value}")
+        assert error.value.position == position
+
+
+def test_tokenizer_single_pass():
+    """Токенизатор возвращает токены с позициями"""
+    tokens = tokenize("¬P(a,b)")
+    assert [kind for kind, _, _ in tokens] == [
+        'not', 'name', 'lparen', 'name', 'comma', 'name', 'rparen', 'end']
+    assert tokens[3] == ('name', 'a', 3)
+
+
+def test_parse_cache():
+    """Повторный разбор той же строки берется из кэша"""
+    parse_clause_strings.cache_clear()
+    for _ in range(3):
+        parse_clause_strings("¬Человек(x) ∨ Смертен(x)")
+    assert parse_clause_strings.cache_info().hits == 2
+
+
+def test_engine_reports_syntax_error():
+    """Движок записывает синтаксическую ошибку с позицией в лог"""
+    success, log = ResolutionEngine().prove(["Человек(Сократ", "¬Человек(x)"])
+    print(log[-1]['message'])
+    assert not success
+    assert log[-1]['type'] == 'error' and 'позиция' in log[-1]['message']
+
+
+def test_clause_scanner():
+    """Сканер извлекает дизъюнкты из строк ответа и сообщает о нераспознанных фрагментах"""
+    scanner = ClauseScanner()
+    clauses = scanner.scan_line("1. Человек(Сократ), ¬Человек(x)∨Смертен(x).")
+    assert [clause.text for clause in clauses] == ["Человек(Сократ)", "¬Человек(x) ∨ Смертен(x)"]
+    assert clauses[1].literals == parse_clause("¬Человек(x) ∨ Смертен(x)")
+
+    assert [str(clause) for clause in scanner.scan_line("Дизъюнкты: P(a); Q(f(b, c))")] == ["P(a)", "Q(f(b, c))"]
+    assert scanner.scan_line("Пояснение: задача решена.") == []
+    assert scanner.diagnostics == []
+
+    clauses = scanner.scan_line("- P(a) ∧ Q(b), Итак, R(x)")
+    print(f"Диагностика: {scanner.diagnostics}")
+    assert [clause.text for clause in clauses] == ["R(x)"]
+    assert [(d.line, d.position, d.fragment) for d in scanner.diagnostics] == [
+        (4, 7, "P(a) ∧ Q(b)"), (4, 15, "Итак")]
+    assert "'∧'" in scanner.diagnostics[0].message
@@ -0,0 +1,42 @@
+from src.clause_store import ClauseStore, Clause
+
+
+def test_encode_decode_roundtrip():
+    """Кодирование клаузы в массив ID символов и обратно"""
+    store = ClauseStore()
+    clause = [('Человек', ['x'], True), ('Смертен', ['x'], False), ('Любит', ['f(x, A)', 'Б'], False)]
+
+    encoded = store.encode(clause)
+    print(f"Закодированная клауза: {encoded.tolist()}")
+    assert encoded.typecode == 'i'
+    assert store.decode(encoded) == clause
+
+    # Одинаковые символы интернируются один раз
+    store.encode([('Человек', ['Сократ'], False)])
+    assert len(store.symbols) == 7
+
+
+def test_complementary_headers():
+    """Комплементарные литералы имеют противоположные заголовки"""
+    store = ClauseStore()
+    positive = Clause(store.encode([('P', ['x'], False)]), "Исходная клауза 1")
+    negative = Clause(store.encode([('Q', ['a'], False), ('P', ['A'], True)]), "Исходная клауза 2")
+
+    assert list(positive.headers()) == [1]
+    assert list(negative.headers())[1] == -1
+    assert len(negative) == 2
+
+
+def test_memory_accounting():
+    """Учет памяти при добавлении и удалении записей"""
+    store = ClauseStore(memory_limit=10_000)
+    base_usage = store.memory_usage
+    for clause_id in range(20):
+        store.add(clause_id, Clause(store.encode([('P', [f'A{clause_id}'], False)]),
+                                    "Резольвента шага 1", [0, 1]))
+    print(f"Оценка памяти: {store.memory_usage} байт")
+    assert store.memory_usage > base_usage
+
+    usage = store.memory_usage
+    store.remove(19)
+    assert store.memory_usage < usage and 19 not in store
@@ -0,0 +1,182 @@
+import pytest
+
+from src.clausifier import (And, Atom, Clausifier, FormulaSyntaxError, Implies, Not,
+                            Quantified, clausify, parse_formula)
+from src.clause_parser import Term
+from src.signature import VARIABLE
+from src import logic_formalizer
+from src.logic_formalizer import LogicFormalizer
+from src.resolution_engine import ResolutionEngine
+
+
+def test_parse_formula_precedence_and_scope():
+    """Приоритет связок, область кванторов и ASCII-синонимы"""
+    formula = parse_formula("∀x Человек(x) ∧ Грек(x) → Смертен(x)")
+    print(f"Дерево: {formula}")
+    x = (Term('x'),)
+    assert formula == Quantified('∀', 'x', Implies(
+        And((Atom('Человек', x), Atom('Грек', x))), Atom('Смертен', x)))
+
+    assert parse_formula("~P(A) & Q -> R") == parse_formula("(¬P(A) ∧ Q) → R")
+    assert parse_formula("∀x,y: Любит(x, y)") == parse_formula("∀x ∀y Любит(x, y)")
+    assert parse_formula("¬¬Кто-то(A)") == Not(Not(Atom('Кто-то', (Term('A'),))))
+
+    with pytest.raises(FormulaSyntaxError) as error:
+        parse_formula("∀x (P(x) ∧ )")
+    print(f"Ошибка: {error.value}")
+    assert error.value.position == 11
+
+
+def test_clausify_normal_forms():
+    """ННФ, сколемизация со свежими символами, КНФ и упрощение"""
+    clauses = clausify([
+        "∀x (Человек(x) → ∃y Мать(y, x))",
+        "∃x (Дракон(x) ∧ ¬ДышитОгнем(x))",
+        "¬∀x ∃y Больше(y, x)",
+        "∀x (P(x) ↔ Q(x))",
+        "∀x (P(x) → P(x))",
+        "Sk1(A)",
+    ])
+    print(f"Дизъюнкты: {clauses}")
+    assert clauses == [
+        "¬Человек(x) ∨ Мать(Sk2(x), x)",
+        "Дракон(Sk3)", "¬ДышитОгнем(Sk3)",
+        "¬Больше(y, Sk4)",
+        "¬P(x) ∨ Q(x)", "P(x) ∨ ¬Q(x)",
+        "Sk1(A)",
+    ]
+
+    # Связанные переменные с одинаковыми именами переименовываются,
+    # свободные строчные имена - неявный квантор всеобщности
+    clausifier = Clausifier()
+    assert clausifier.clausify_formula("∀x P(x) ∨ ∃x Q(x, z)") == ["P(x) ∨ Q(Sk1(z), z)"]
+    assert clausifier.clausify_formula("(A ∧ B) ∨ (C ∧ D)") == ["A ∨ C", "A ∨ D", "B ∨ C", "B ∨ D"]
+    assert clausifier.clausify_formula("⊥ ∨ ¬⊤") == ["□"]
+    assert clausifier.clausify_formula("P ∨ ⊤") == []
+
+
+def test_clausified_problem_is_provable():
+    """Дизъюнкты локального перевода доказываются движком"""
+    clauses = clausify([
+        "∀x (Человек(x) → Смертен(x))",
+        "∀x (Грек(x) → Человек(x))",
+        "Грек(Сократ)",
+        "¬Смертен(Сократ)",
+    ])
+    success, _ = ResolutionEngine().prove(clauses)
+    assert success
+
+
+def test_formalizer_fol_mode():
+    """В режиме fol_mode модель выдает формулы, дизъюнкты строятся локально"""
+    prompts = []
+
+    def fake_stream(prompt):
+        prompts.append(prompt)
+        return ["Thinking...\nпереводим\n...done thinking.\n",
+                "1. Человек(Сократ)\n2. ∀x (Человек(x) → Смертен(x))\n",
+                "Цель: Смертен(Сократ)\n\nПояснение: задача решена.\n"]
+
+    formalizer = LogicFormalizer(model_name="test-model", fol_mode=True)
+    formalizer._stream_model_output = fake_stream
+    formulas = formalizer.formalize_problem("Сократ — человек. Все люди смертны. Докажи, что Сократ смертен.")
+    print(f"Формулы: {formulas}")
+    assert formulas == ["Человек(Сократ)", "¬Человек(x) ∨ Смертен(x)", "¬Смертен(Сократ)"]
+    system_prompt = formalizer._system_prompt()
+    assert "НЕ нужно" in system_prompt and "КНФ" not in system_prompt
+    assert prompts[0].startswith("Теперь переведи") and "Вход:" not in prompts[0]
+
+    # Цель из нескольких формул отрицается целиком
+    formalizer._stream_model_output = lambda prompt: ["Цель: P(A)\nЦель: ∃x Q(x)\n"]
+    assert formalizer.formalize_problem("Докажи, что P(A) и что-то Q.") == ["¬P(A) ∨ ¬Q(x)"]
+
+
+def test_fol_sentence_symbols():
+    """Пофразовый перевод fol_mode: строчные имена остаются переменными, Sk<n> переименовываются"""
+    answers = {
+        "Все люди смертны.": "∀a (Человек(a) → Смертен(a))",
+        "У каждого есть мать.": "∀h ∃y Мать(y, h)",
+        "Докажи, что Сократ смертен.": "Цель: Смертен(Сократ)",
+    }
+    formalizer = LogicFormalizer(model_name="test-model", fol_mode=True, split_sentences=True)
+    formalizer._stream_model_output = lambda prompt: [
+        next(answer for sentence, answer in answers.items() if prompt.endswith(sentence))]
+    formulas = formalizer.formalize_problem(" ".join(answers))
+    print(f"Формулы: {formulas}")
+    assert formulas == ["¬Человек(a) ∨ Смертен(a)", "Мать(Sk1_2(h), h)", "¬Смертен(Сократ)"]
+    assert formalizer.last_signature.kind('a') == VARIABLE
+
+    # Определения Def<n> разных предложений не сливаются в один предикат
+    answers = {
+        "Первое правило.": "∀x ((A(x) ∧ B(x) ∧ C(x)) ∨ (D(x) ∧ E(x) ∧ F(x)))",
+        "Второе правило.": "∀x ((G(x) ∧ H(x) ∧ I(x)) ∨ (J(x) ∧ K(x) ∧ L(x)))",
+    }
+    formulas = formalizer.formalize_problem(" ".join(answers))
+    print(f"Формулы: {formulas}")
+    definitions = {literal.split('(')[0].lstrip('¬')
+                   for clause in formulas for literal in clause.split(' ∨ ') if 'Def' in literal}
+    assert definitions == {"Def1_1", "Def1_2"}
+    assert "Def1_1(x) ∨ D(x)" in formulas and "Def1_2(x) ∨ J(x)" in formulas
+
+
+def test_fol_repair():
+    """fol_mode: неразобранные строки с формулами исправляются уточняющим запросом"""
+    prompts = []
+
+    def fake_stream(prompt):
+        prompts.append(prompt)
+        if len(prompts) == 1:
+            return ["∃y Мать(y, Анна)\n∃z (Отец(z, Анна)\nЦель: Человек(Анна)\n"]
+        return ["∃z Отец(z, Анна)\n"]
+
+    formalizer = LogicFormalizer(model_name="test-model", fol_mode=True, repair_rounds=1)
+    formalizer._stream_model_output = fake_stream
+    formulas = formalizer.formalize_problem("У Анны есть мать и отец. Докажи, что Анна - человек.")
+    print(f"Уточняющий запрос: {prompts[1]}")
+    assert len(prompts) == 2
+    assert "- ∃z (Отец(z, Анна) (" in prompts[1] and "формулами первого порядка" in prompts[1]
+    # Сколемовская константа исправленной формулы не совпадает с Sk1 основного ответа
+    assert formulas == ["Мать(Sk1, Анна)", "¬Человек(Анна)", "Отец(Sk2, Анна)"]
+    assert formalizer.last_diagnostics == []
+
+
+def test_fol_cache_key(monkeypatch):
+    """Ключ кэша fol_mode зависит от версии переводчика и порога определений"""
+    formalizer = LogicFormalizer(model_name="test-model", fol_mode=True)
+    key = formalizer._cache_key("Сократ — человек.")
+    monkeypatch.setattr(logic_formalizer, "CLAUSIFIER_VERSION", logic_formalizer.CLAUSIFIER_VERSION + 1)
+    assert formalizer._cache_key("Сократ — человек.") != key
+    monkeypatch.undo()
+    monkeypatch.setattr(logic_formalizer, "DEFAULT_DEFINITION_THRESHOLD", None)
+    assert formalizer._cache_key("Сократ — человек.") != key
+
+
+def test_definitional_cnf():
+    """Определения вместо дистрибуции: вложенные ↔ дают линейное число дизъюнктов"""
+    def nested_iff(n):
+        formula = f"P{n}"
+        for i in range(n - 1, 0, -1):
+            formula = f"P{i} ↔ ({formula})"
+        return formula
+
+    distributed = Clausifier(definition_threshold=None).clausify([nested_iff(12)])
+    defined = Clausifier().clausify([nested_iff(12)])
+    print(f"Дистрибуция: {len(distributed)}, с определениями: {len(defined)}")
+    assert len(distributed) == 2 ** 11
+    assert len(defined) <= 4 * 12
+    assert all(clause.count("Def") <= 2 for clause in defined)
+
+    # Полярность: операнд в положительном контексте получает только Def → F,
+    # определение зависит от свободных переменных операнда
+    clauses = clausify(["∀x ((A(x) ∧ B(x) ∧ C(x)) ∨ (D(x) ∧ E(x) ∧ F(x)))", "¬A(K)", "¬F(K)"])
+    print(f"Дизъюнкты: {clauses}")
+    assert clauses == [
+        "Def1(x) ∨ D(x)", "Def1(x) ∨ E(x)", "Def1(x) ∨ F(x)",
+        "¬Def1(x) ∨ A(x)", "¬Def1(x) ∨ B(x)", "¬Def1(x) ∨ C(x)",
+        "¬A(K)", "¬F(K)",
+    ]
+    success, _ = ResolutionEngine().prove(clauses)
+    assert success
+
+    # Небольшие подформулы по-прежнему раскрываются дистрибуцией
+    assert clausify(["(A ∧ B) ∨ (C ∧ D)"]) == ["A ∨ C", "A ∨ D", "B ∨ C", "B ∨ D"]
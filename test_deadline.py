@@ -0,0 +1,82 @@
+import pytest
+
+from src.deadline import Deadline, DeadlineExceeded
+from src.logic_formalizer import LogicFormalizer
+from src.proof_explainer import ProofExplainer
+from src.resolution_engine import ResolutionEngine
+
+
+class FakeClock:
+    """Часы, которые тест сдвигает вручную"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_deadline_budget():
+    """Остаток срока, таймауты этапов и проверка истечения"""
+    clock = FakeClock()
+    deadline = Deadline(10, clock=clock)
+    assert deadline.timeout(60) == 10 and deadline.timeout(3) == 3
+
+    clock.now = 7.5
+    print(f"Срок: {deadline}")
+    assert deadline.remaining() == 2.5 and not deadline.expired
+    deadline.check('доказательство')
+
+    clock.now = 12
+    assert deadline.expired and deadline.remaining() == 0
+    with pytest.raises(DeadlineExceeded):
+        deadline.timeout(60)
+    with pytest.raises(DeadlineExceeded) as error:
+        deadline.check('объяснение')
+    assert "объяснение" in str(error.value)
+
+    # Без бюджета срок не ограничен
+    assert Deadline().remaining() is None and Deadline().timeout(60) == 60
+
+
+def test_deadline_propagation():
+    """Этапы запроса останавливаются или упрощаются по общему сроку"""
+    clock = FakeClock()
+
+    # Формализация: медленный ответ модели прерывается по сроку
+    def slow_stream(prompt):
+        for chunk in ["Человек(Сократ)\n", "¬Человек(x) ∨ Смертен(x)\n", "¬Смертен(Сократ)\n"]:
+            clock.now += 20
+            yield chunk
+
+    formalizer = LogicFormalizer(model_name="test-model")
+    formalizer._stream_model_output = slow_stream
+    formulas = formalizer.formalize_problem("Сократ - человек.", deadline=Deadline(30, clock=clock))
+    print(f"Формализация: {formulas}")
+    assert formulas == ["Ошибка: истек срок выполнения запроса"]
+
+    # Доказательство: насыщение останавливается с частичным логом
+    clauses = ["P(A)", "¬P(x) ∨ P(f(x))", "¬Q(B)"]
+    engine = ResolutionEngine()
+    success, log = engine.prove(clauses, deadline=Deadline(0, clock=clock))
+    print(f"Итог: {log[-1]['message']}")
+    assert not success
+    assert log[-1]['type'] == 'timeout' and "срок" in log[-1]['message']
+    assert engine.prove(clauses[:1] + ["¬P(A)"], deadline=Deadline(5, clock=clock))[0]
+
+    # Объяснение: при малом остатке строится локально, без модели
+    def no_model(prompt):
+        raise AssertionError("модель не должна вызываться")
+
+    explainer = ProofExplainer(model_name="test-model")
+    explainer._execute_ollama_query = no_model
+    success, log = engine.prove(clauses[:1] + ["¬P(A)"])
+    explanation = explainer.explain_proof(log, success, deadline=Deadline(2, clock=clock))
+    print(f"Объяснение: {explanation}")
+    assert explanation.startswith("Утверждение доказано")
+    assert "истек срок" in explanation
+
+    prompts = []
+    explainer._execute_ollama_query = lambda prompt: prompts.append(prompt) or "Противоречие найдено."
+    assert explainer.explain_proof(log, success, deadline=Deadline(60, clock=clock)) == "Противоречие найдено."
+    assert len(prompts) == 1
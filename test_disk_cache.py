@@ -0,0 +1,46 @@
+import time
+
+from src.disk_cache import DiskCache
+
+
+def test_lru_eviction(tmp_path):
+    """Вытеснение наименее используемых записей при превышении лимита"""
+    cache = DiskCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    time.sleep(0.01)
+    assert cache.get("a") == b"1"  # "a" становится недавно использованной
+    time.sleep(0.01)
+    cache.set("c", b"3")
+
+    print(f"Записей в кэше: {len(cache)}")
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1" and cache.get("c") == b"3"
+
+
+def test_size_and_age_limits(tmp_path):
+    """Ограничение суммарного объема и возраста записей"""
+    path = str(tmp_path / "cache.sqlite")
+    cache = DiskCache(path, max_entries=100, max_bytes=10)
+    cache.set("a", b"x" * 6)
+    time.sleep(0.01)
+    cache.set("b", b"y" * 6)
+    assert cache.get("a") is None and cache.get("b") == b"y" * 6
+
+    aged = DiskCache(str(tmp_path / "aged.sqlite"), max_age=0.05)
+    aged.set("k", b"v")
+    assert aged.get("k") == b"v"
+    time.sleep(0.1)
+    assert aged.get("k") is None
+
+
+def test_persistence(tmp_path):
+    """Записи сохраняются между открытиями файла"""
+    path = str(tmp_path / "cache.sqlite")
+    cache = DiskCache(path)
+    cache.set("ключ", "значение".encode("utf-8"))
+    cache.close()
+
+    reopened = DiskCache(path)
+    assert reopened.get("ключ").decode("utf-8") == "значение"
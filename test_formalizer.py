@@ -1,180 +1,391 @@
-from src.logic_formalizer import LogicFormalizer
-
-formalizer = LogicFormalizer()
-
-def test_negations_original():
-    test_cases = [
-        "Сократ — человек. Все люди смертны. Докажи, что Сократ смертен.",
-
-        "Все честные люди говорят правду. Джон лжет. Докажи, что Джон не честный человек.",
-        "Все млекопитающие теплокровные. Змея не теплокровная. Следовательно, змея не млекопитающее.",
-
-        "Все рыбы живут в воде. Кит не рыба. Докажи, что кит не обязательно живет в воде.",
-        "Все птицы летают. Пингвин не летает. Значит, пингвин не птица.",
-
-        "Если число четное, то оно делится на 2. Число 7 не делится на 2. Докажи, что число 7 не четное."
-    ]
-
-    print("ТЕСТИРОВАНИЕ ЗАДАЧ С ОТРИЦАНИЯМИ")
-    print("=" * 60)
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nТест {i}: {case}")
-        result = formalizer.formalize_problem(case)
-        print(f"Формулы: {result}\n")
-
-# ===================================================================
-# 2. Только один объект обладает свойством 
-# ===================================================================
-def test_only_one_possesses_property():
-    test_cases = [
-        "В классе 30 учеников. Каждый отличник сдал математику на 5. Только Маша сдала математику на 5. Докажи, что только Маша — отличница."
-    ]
-
-    print("ТЕСТ: ТОЛЬКО ОДИН ОБЪЕКТ ОБЛАДАЕТ СВОЙСТВОМ")
-    print("=" * 60)
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nТест {i}: {case}")
-        result = formalizer.formalize_problem(case)
-        print(f"Формулы: {result}\n")
-
-# ===================================================================
-# 3. Существование + отрицание всеобщности
-# ===================================================================
-def test_exists_not_all():
-    test_cases = [
-        "Все драконы дышат огнём. Комодо не дышит огнём. Существует хотя бы одно существо, которое не является драконом."
-    ]
-
-    print("ТЕСТ: СУЩЕСТВОВАНИЕ СОБЫТИЯ + ОТРИЦАНИЕ ВСЕОБЩНОСТИ")
-    print("=" * 60)
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nТест {i}: {case}")
-        result = formalizer.formalize_problem(case)
-        print(f"Формулы: {result}\n")
-
-# ===================================================================
-# 4. Двойное отрицание и несуществование
-# ===================================================================
-def test_double_negation():
-    test_cases = [
-        "Ни один единорог не существует в реальности. Докажи, что утверждение «существует единорог» ложно."
-    ]
-
-    print("ТЕСТ: ДВОЙНОЕ ОТРИЦАНИЕ И НЕСУЩЕСТВОВАНИЕ")
-    print("=" * 60)
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nТест {i}: {case}")
-        result = formalizer.formalize_problem(case)
-        print(f"Формулы: {result}\n")
-
-# ===================================================================
-# 5. Контрапозиция
-# ===================================================================
-def test_contraposition():
-    test_cases = [
-        "Если студент подготовился, то он сдаст экзамен. Петя не сдал экзамен. Значит, Петя не готовился к экзамену."
-    ]
-
-    print("ТЕСТ: КОНТРАПОЗИЦИЯ (MODUS TOLLENS)")
-    print("=" * 60)
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nТест {i}: {case}")
-        result = formalizer.formalize_problem(case)
-        print(f"Формулы: {result}\n")
-
-# ===================================================================
-# 6. Чередование кванторов ∀∃ и ∃∀
-# ===================================================================
-def test_quantifier_alternation():
-    test_cases = [
-        "Каждый студент выбрал хотя бы одну книгу в библиотеке. Каждая книга была выбрана хотя бы одним студентом."
-    ]
-
-    print("ТЕСТ: ЧЕРЕДОВАНИЕ КВАНТОРОВ (∀∃ и ∃∀)")
-    print("=" * 60)
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nТест {i}: {case}")
-        result = formalizer.formalize_problem(case)
-        print(f"Формулы: {result}\n")
-
-# ===================================================================
-# 7. Транзитивность отношения
-# ===================================================================
-def test_transitivity():
-    test_cases = [
-        "Маша старше Кати, а Катя старше Лены. Докажи, что Маша старше Лены."
-    ]
-
-    print("ТЕСТ: ТРАНЗИТИВНОСТЬ ОТНОШЕНИЯ")
-    print("=" * 60)
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nТест {i}: {case}")
-        result = formalizer.formalize_problem(case)
-        print(f"Формулы: {result}\n")
-#Если A старше B и B старше C, то A старше C.
-# ===================================================================
-# 8. «Никто, кроме...» 
-# ===================================================================
-def test_no_one_except():
-    test_cases = [
-        "Никто из рыцарей не лжёт. Все лжецы — не рыцари. Сэр Ланселот — рыцарь. Кроме сэра Ланселота никто не знает правду о Граале. Докажи, что сэр Ланселот не лжёт."
-    ]
-
-    print("ТЕСТ: «НИКТО, КРОМЕ...» + РЫЦАРИ/ЛЖЕЦЫ")
-    print("=" * 60)
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nТест {i}: {case}")
-        result = formalizer.formalize_problem(case)
-        print(f"Формулы: {result}\n")
-
-# ===================================================================
-# 9. Необходимое условие
-# ===================================================================
-def test_necessary_condition():
-    test_cases = [
-        "Быть простым числом — необходимое условие для того, чтобы число было простым в аддитивной группе. Число 1 не является простым в аддитивной группе. Докажи, что 1 не простое число."
-    ]
-
-    print("ТЕСТ: НЕОБХОДИМОЕ УСЛОВИЕ")
-    print("=" * 60)
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nТест {i}: {case}")
-        result = formalizer.formalize_problem(case)
-        print(f"Формулы: {result}\n")
-
-# ===================================================================
-# 10. Закон де Моргана и отрицание конъюнкции
-# ===================================================================
-def test_de_morgan():
-    test_cases = [
-        "Ни один волшебник не является одновременно магом и колдуном. Мерлин — волшебник. Докажи, что Мерлин не может быть и магом, и колдуном."
-    ]
-
-    print("ТЕСТ: ЗАКОН ДЕ МОРГАНА (¬(P ∧ Q))")
-    print("=" * 60)
-    for i, case in enumerate(test_cases, 1):
-        print(f"\nТест {i}: {case}")
-        result = formalizer.formalize_problem(case)
-        print(f"Формулы: {result}\n")
-
-if __name__ == "__main__":
-    print("\n" + " ПОЛНЫЙ НАБОР ТЕСТОВ ДЛЯ LogicFormalizer ".center(80, "═") + "\n")
-
-    test_negations_original()
-    test_only_one_possesses_property()
-    test_exists_not_all()
-    test_double_negation()
-    test_contraposition()
-    test_quantifier_alternation()
-    test_transitivity()
-    test_no_one_except()
-    test_necessary_condition()
-    test_de_morgan()
-
-    print("═" * 80)
-    print("                  ВСЕ ТЕСТЫ ЗАВЕРШЕНЫ")
-    print("═" * 80)
-
-
-
-
+import threading
+import time
+
+from src.logic_formalizer import LogicFormalizer
+from src.disk_cache import DiskCache
+from src.clause_parser import parse_clause_strings
+from src.resolution_engine import ResolutionEngine
+
+formalizer = LogicFormalizer()
+
+def test_negations_original():
+    test_cases = [
+        "Сократ — человек. Все люди смертны. Докажи, что Сократ смертен.",
+
+        "Все честные люди говорят правду. Джон лжет. Докажи, что Джон не честный человек.",
+        "Все млекопитающие теплокровные. Змея не теплокровная. Следовательно, змея не млекопитающее.",
+
+        "Все рыбы живут в воде. Кит не рыба. Докажи, что кит не обязательно живет в воде.",
+        "Все птицы летают. Пингвин не летает. Значит, пингвин не птица.",
+
+        "Если число четное, то оно делится на 2. Число 7 не делится на 2. Докажи, что число 7 не четное."
+    ]
+
+    print("ТЕСТИРОВАНИЕ ЗАДАЧ С ОТРИЦАНИЯМИ")
+    print("=" * 60)
+    for i, case in enumerate(test_cases, 1):
+        print(f"\nТест {i}: {case}")
+        result = formalizer.formalize_problem(case)
+        print(f"Формулы: {result}\n")
+
+# ===================================================================
+# 2. Только один объект обладает свойством 
+# ===================================================================
+def test_only_one_possesses_property():
+    test_cases = [
+        "В классе 30 учеников. Каждый отличник сдал математику на 5. Только Маша сдала математику на 5. Докажи, что только Маша — отличница."
+    ]
+
+    print("ТЕСТ: ТОЛЬКО ОДИН ОБЪЕКТ ОБЛАДАЕТ СВОЙСТВОМ")
+    print("=" * 60)
+    for i, case in enumerate(test_cases, 1):
+        print(f"\nТест {i}: {case}")
+        result = formalizer.formalize_problem(case)
+        print(f"Формулы: {result}\n")
+
+# ===================================================================
+# 3. Существование + отрицание всеобщности
+# ===================================================================
+def test_exists_not_all():
+    test_cases = [
+        "Все драконы дышат огнём. Комодо не дышит огнём. Существует хотя бы одно существо, которое не является драконом."
+    ]
+
+    print("ТЕСТ: СУЩЕСТВОВАНИЕ СОБЫТИЯ + ОТРИЦАНИЕ ВСЕОБЩНОСТИ")
+    print("=" * 60)
+    for i, case in enumerate(test_cases, 1):
+        print(f"\nТест {i}: {case}")
+        result = formalizer.formalize_problem(case)
+        print(f"Формулы: {result}\n")
+
+# ===================================================================
+# 4. Двойное отрицание и несуществование
+# ===================================================================
+def test_double_negation():
+    test_cases = [
+        "Ни один единорог не существует в реальности. Докажи, что утверждение «существует единорог» ложно."
+    ]
+
+    print("ТЕСТ: ДВОЙНОЕ ОТРИЦАНИЕ И НЕСУЩЕСТВОВАНИЕ")
+    print("=" * 60)
+    for i, case in enumerate(test_cases, 1):
+        print(f"\nТест {i}: {case}")
+        result = formalizer.formalize_problem(case)
+        print(f"Формулы: {result}\n")
+
+# ===================================================================
+# 5. Контрапозиция
+# ===================================================================
+def test_contraposition():
+    test_cases = [
+        "Если студент подготовился, то он сдаст экзамен. Петя не сдал экзамен. Значит, Петя не готовился к экзамену."
+    ]
+
+    print("ТЕСТ: КОНТРАПОЗИЦИЯ (MODUS TOLLENS)")
+    print("=" * 60)
+    for i, case in enumerate(test_cases, 1):
+        print(f"\nТест {i}: {case}")
+        result = formalizer.formalize_problem(case)
+        print(f"Формулы: {result}\n")
+
+# ===================================================================
+# 6. Чередование кванторов ∀∃ и ∃∀
+# ===================================================================
+def test_quantifier_alternation():
+    test_cases = [
+        "Каждый студент выбрал хотя бы одну книгу в библиотеке. Каждая книга была выбрана хотя бы одним студентом."
+    ]
+
+    print("ТЕСТ: ЧЕРЕДОВАНИЕ КВАНТОРОВ (∀∃ и ∃∀)")
+    print("=" * 60)
+    for i, case in enumerate(test_cases, 1):
+        print(f"\nТест {i}: {case}")
+        result = formalizer.formalize_problem(case)
+        print(f"Формулы: {result}\n")
+
+# ===================================================================
+# 7. Транзитивность отношения
+# ===================================================================
+def test_transitivity():
+    test_cases = [
+        "Маша старше Кати, а Катя старше Лены. Докажи, что Маша старше Лены."
+    ]
+
+    print("ТЕСТ: ТРАНЗИТИВНОСТЬ ОТНОШЕНИЯ")
+    print("=" * 60)
+    for i, case in enumerate(test_cases, 1):
+        print(f"\nТест {i}: {case}")
+        result = formalizer.formalize_problem(case)
+        print(f"Формулы: {result}\n")
+#Если A старше B и B старше C, то A старше C.
+# ===================================================================
+# 8. «Никто, кроме...» 
+# ===================================================================
+def test_no_one_except():
+    test_cases = [
+        "Никто из рыцарей не лжёт. Все лжецы — не рыцари. Сэр Ланселот — рыцарь. Кроме сэра Ланселота никто не знает правду о Граале. Докажи, что сэр Ланселот не лжёт."
+    ]
+
+    print("ТЕСТ: «НИКТО, КРОМЕ...» + РЫЦАРИ/ЛЖЕЦЫ")
+    print("=" * 60)
+    for i, case in enumerate(test_cases, 1):
+        print(f"\nТест {i}: {case}")
+        result = formalizer.formalize_problem(case)
+        print(f"Формулы: {result}\n")
+
+# ===================================================================
+# 9. Необходимое условие
+# ===================================================================
+def test_necessary_condition():
+    test_cases = [
+        "Быть простым числом — необходимое условие для того, чтобы число было простым в аддитивной группе. Число 1 не является простым в аддитивной группе. Докажи, что 1 не простое число."
+    ]
+
+    print("ТЕСТ: НЕОБХОДИМОЕ УСЛОВИЕ")
+    print("=" * 60)
+    for i, case in enumerate(test_cases, 1):
+        print(f"\nТест {i}: {case}")
+        result = formalizer.formalize_problem(case)
+        print(f"Формулы: {result}\n")
+
+# ===================================================================
+# 10. Закон де Моргана и отрицание конъюнкции
+# ===================================================================
+def test_de_morgan():
+    test_cases = [
+        "Ни один волшебник не является одновременно магом и колдуном. Мерлин — волшебник. Докажи, что Мерлин не может быть и магом, и колдуном."
+    ]
+
+    print("ТЕСТ: ЗАКОН ДЕ МОРГАНА (¬(P ∧ Q))")
+    print("=" * 60)
+    for i, case in enumerate(test_cases, 1):
+        print(f"\nТест {i}: {case}")
+        result = formalizer.formalize_problem(case)
+        print(f"Формулы: {result}\n")
+
+def test_formalization_cache(tmp_path):
+    """Повторная формализация того же текста берется из дискового кэша"""
+    calls = []
+    cache = DiskCache(str(tmp_path / "formalization.sqlite"), max_entries=10)
+    cached_formalizer = LogicFormalizer(model_name="test-model", cache=cache)
+
+    def fake_stream(prompt):
+        calls.append(prompt)
+        return ["Человек(Сократ), ¬Человек(x) ∨ Смертен(x), ¬Смертен(Сократ)"]
+
+    cached_formalizer._stream_model_output = fake_stream
+    text = "Сократ — человек. Все люди смертны. Докажи, что Сократ смертен."
+
+    first = cached_formalizer.formalize_problem(text)
+    assert not cached_formalizer.last_cache_hit
+
+    received = []
+    second = cached_formalizer.formalize_problem("  Сократ — человек.\nВсе люди   смертны. Докажи, что Сократ смертен. ",
+                                                 on_formula=received.append)
+    print(f"Формулы из кэша: {second}")
+    assert second == first == received
+    assert cached_formalizer.last_cache_hit and len(calls) == 1
+
+    # Обход кэша, другая модель и другая версия промпта обращаются к модели
+    cached_formalizer.formalize_problem(text, use_cache=False)
+    cached_formalizer.model_name = "other-model"
+    cached_formalizer.formalize_problem(text)
+    cached_formalizer.PROMPT_VERSION += 1
+    cached_formalizer.formalize_problem(text)
+    assert len(calls) == 4
+
+    # Неудачные результаты не кэшируются
+    cached_formalizer._stream_model_output = lambda prompt: ["Не понимаю задачу"]
+    assert cached_formalizer.formalize_problem("Непонятный текст") == ["Не удалось извлечь валидные формулы"]
+    assert len(cache) == 3
+
+
+def test_sentence_level_formalization(tmp_path):
+    """Предложения формализуются параллельно, символы согласуются, кэш пофразовый"""
+    answers = {
+        "Каждый студент сдал экзамен.": "¬Студент(x) ∨ Сдал_экзамен(x)",
+        "Некоторый студент сдал экзамен на отлично.": "Студент(a), Отличник(a), ¬Студент(x) ∨ Руководитель(f(x))",
+        "У каждого студента есть руководитель.": "¬Студент(x) ∨ Руководит(f(x), x), Студент(a)",
+        "Докажи, что кто-то сдал экзамен.": "¬СдалЭкзамен(x)",
+        "Непонятное предложение.": "Не понимаю",
+    }
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0, "calls": []}
+
+    def fake_stream(prompt):
+        task = prompt.strip().splitlines()[-1]
+        sentence = next(text for text in answers if task.endswith(text))
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            state["calls"].append((sentence, "отрицания" in task))
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return [answers[sentence]]
+
+    cache = DiskCache(str(tmp_path / "formalization.sqlite"))
+    parallel_formalizer = LogicFormalizer(model_name="test-model", cache=cache,
+                                          split_sentences=True, max_workers=2)
+    parallel_formalizer._stream_model_output = fake_stream
+    text = " ".join(answers)
+
+    received = []
+    formulas = parallel_formalizer.formalize_problem(text, on_formula=received.append)
+    print(f"Формулы: {formulas}")
+    assert formulas == received == [
+        "¬Студент(x) ∨ Сдал_экзамен(x)",
+        "Студент(A_2)", "Отличник(A_2)", "¬Студент(x) ∨ Руководитель(f_2(x))",
+        "¬Студент(x) ∨ Руководит(f_3(x), x)", "Студент(A_3)",
+        "¬Сдал_экзамен(x)",
+    ]
+    assert state["peak"] == 2
+    assert [is_goal for sentence, is_goal in state["calls"]].count(True) == 1
+
+    # Изменение одной посылки формализует заново только ее
+    state["calls"].clear()
+    answers["Каждый студент сдал зачет."] = "¬Студент(x) ∨ СдалЗачет(x)"
+    edited = text.replace("сдал экзамен.", "сдал зачет.", 1)
+    formulas = parallel_formalizer.formalize_problem(edited)
+    assert state["calls"] == [("Каждый студент сдал зачет.", False), ("Непонятное предложение.", False)]
+    assert formulas[0] == "¬Студент(x) ∨ СдалЗачет(x)"
+    assert not parallel_formalizer.last_cache_hit
+
+
+def test_parsed_clauses_and_diagnostics():
+    """Формализатор возвращает разобранные дизъюнкты и диагностику, движок не разбирает их повторно"""
+    scanning_formalizer = LogicFormalizer(model_name="test-model")
+    scanning_formalizer._stream_model_output = lambda prompt: [
+        "Дизъюнкты:\n1. Грек(Сократ), ¬Грек(x) ∨ Человек(x)\n",
+        "2. ¬Человек(y) ∨ Смертен(y), Смертен(Сократ) ∧ Грек(Сократ)\n",
+        "3. ¬Смертен(Сократ).\nПояснение: задача решена.\n"]
+    formulas = scanning_formalizer.formalize_problem("Сократ - грек. Греки - люди. Люди смертны.")
+    print(f"Формулы: {formulas}")
+    print(f"Диагностика: {scanning_formalizer.last_diagnostics}")
+    assert formulas == ["Грек(Сократ)", "¬Грек(x) ∨ Человек(x)",
+                        "¬Человек(y) ∨ Смертен(y)", "¬Смертен(Сократ)"]
+    assert [clause.text for clause in scanning_formalizer.last_clauses] == formulas
+    assert [(d.line, d.fragment) for d in scanning_formalizer.last_diagnostics] == [
+        (3, "Смертен(Сократ) ∧ Грек(Сократ)")]
+
+    parse_clause_strings.cache_clear()
+    success, _ = ResolutionEngine().prove(scanning_formalizer.last_clauses)
+    assert success
+    assert parse_clause_strings.cache_info().misses == 0
+
+
+def test_repair_invalid_fragments():
+    """Уточняющий запрос содержит только нераспознанные фрагменты, исправления добавляются к результату"""
+    prompts = []
+    repairs = ["Смертен(Сократ, ∧ Грек(Сократ)\n", "Смертен(Сократ), Грек(Сократ), ¬Грек(x) ∨ Человек(x)\n"]
+
+    def fake_stream(prompt):
+        prompts.append(prompt)
+        if len(prompts) == 1:
+            return ["¬Грек(x) ∨ Человек(x), Смертен(Сократ) ∧ Грек(Сократ)\n"]
+        return [repairs[len(prompts) - 2]]
+
+    repairing_formalizer = LogicFormalizer(model_name="test-model", repair_rounds=2)
+    repairing_formalizer._stream_model_output = fake_stream
+    received = []
+    formulas = repairing_formalizer.formalize_problem("Сократ - смертный грек.", on_formula=received.append)
+    print(f"Уточняющий запрос: {prompts[1]}")
+    assert formulas == received == ["¬Грек(x) ∨ Человек(x)", "Смертен(Сократ)", "Грек(Сократ)"]
+    assert repairing_formalizer.last_diagnostics == []
+    assert len(prompts) == 3
+    assert "Смертен(Сократ) ∧ Грек(Сократ) (Ожидалось конец клаузы, найдено '∧')" in prompts[1]
+    assert "Смертен(Сократ, ∧ Грек(Сократ)" in prompts[2] and "¬Грек(x)" not in prompts[2]
+    assert len(prompts[1]) < len(repairing_formalizer._system_prompt() + prompts[0]) / 2
+
+    # Число уточняющих запросов ограничено, неисправленные фрагменты остаются в диагностике
+    prompts.clear()
+    repairs[:] = ["Смертен(Сократ) ∧ Грек(Сократ)\n"] * 3
+    formulas = repairing_formalizer.formalize_problem("Сократ - смертный грек.")
+    assert formulas == ["¬Грек(x) ∨ Человек(x)"] and len(prompts) == 3
+    assert [d.fragment for d in repairing_formalizer.last_diagnostics] == ["Смертен(Сократ) ∧ Грек(Сократ)"]
+
+
+def test_hedged_requests():
+    """Страхующий запрос: принимается первый валидный ответ, остальные прерываются"""
+    state = {"primary_chunks": 0, "primary_closed": False, "hedge_calls": 0}
+
+    def slow_primary(prompt):
+        try:
+            for chunk in ["Размышляю...\n"] * 50 + ["Человек(Сократ)\n"]:
+                state["primary_chunks"] += 1
+                time.sleep(0.02)
+                yield chunk
+        finally:
+            state["primary_closed"] = True
+
+    def fast_hedge(prompt):
+        state["hedge_calls"] += 1
+        return ["Человек(Сократ), ¬Человек(x) ∨ Смертен(x)\n"]
+
+    hedged_formalizer = LogicFormalizer(model_name="test-model", hedge_delay=0.1, hedge_model="small-model")
+    hedged_formalizer._stream_model_output = slow_primary
+    hedged_formalizer._stream_hedge_output = fast_hedge
+    received = []
+    start = time.perf_counter()
+    formulas = hedged_formalizer.formalize_problem("Сократ - человек.", on_formula=received.append)
+    elapsed = time.perf_counter() - start
+    print(f"Формулы: {formulas}, {elapsed:.2f} с")
+    assert formulas == received == ["Человек(Сократ)", "¬Человек(x) ∨ Смертен(x)"]
+    assert elapsed < 0.5
+    for _ in range(50):
+        if state["primary_closed"]:
+            break
+        time.sleep(0.02)
+    assert state["primary_closed"] and state["primary_chunks"] < 50
+
+    # Быстрый валидный основной ответ - страхующий запрос не отправляется
+    hedged_formalizer._stream_model_output = lambda prompt: ["Человек(Платон)\n"]
+    hedged_formalizer.hedge_delay = 5
+    state["hedge_calls"] = 0
+    assert hedged_formalizer.formalize_problem("Платон - человек.") == ["Человек(Платон)"]
+    assert state["hedge_calls"] == 0
+
+    # Основной ответ не прошел проверку - страхующий отправляется, не дожидаясь задержки
+    hedged_formalizer._stream_model_output = lambda prompt: ["Человек(Платон) ∧ Грек(Платон)\n"]
+    start = time.perf_counter()
+    assert hedged_formalizer.formalize_problem("Платон - грек.") == ["Человек(Сократ)", "¬Человек(x) ∨ Смертен(x)"]
+    assert time.perf_counter() - start < 1 and state["hedge_calls"] == 1
+
+    # Формулы ведущего запроса передаются по мере генерации, до конца ответа
+    def streaming_primary(prompt):
+        yield "Человек(Платон)\n"
+        time.sleep(0.2)
+        yield "¬Человек(x) ∨ Смертен(x)\n"
+
+    hedged_formalizer._stream_model_output = streaming_primary
+    arrivals = []
+    start = time.perf_counter()
+    formulas = hedged_formalizer.formalize_problem(
+        "Платон - человек. Люди смертны.",
+        on_formula=lambda formula: arrivals.append((formula, time.perf_counter() - start)))
+    print(f"Поступление формул: {arrivals}")
+    assert [formula for formula, _ in arrivals] == formulas == ["Человек(Платон)", "¬Человек(x) ∨ Смертен(x)"]
+    assert arrivals[0][1] < 0.15 < arrivals[1][1]
+
+
+if __name__ == "__main__":
+    print("\n" + " ПОЛНЫЙ НАБОР ТЕСТОВ ДЛЯ LogicFormalizer ".center(80, "═") + "\n")
+
+    test_negations_original()
+    test_only_one_possesses_property()
+    test_exists_not_all()
+    test_double_negation()
+    test_contraposition()
+    test_quantifier_alternation()
+    test_transitivity()
+    test_no_one_except()
+    test_necessary_condition()
+    test_de_morgan()
+
+    print("═" * 80)
+    print("                  ВСЕ ТЕСТЫ ЗАВЕРШЕНЫ")
+    print("═" * 80)
+
+
+
+
@@ -0,0 +1,246 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.ollama_client import (WARMUP_IDLE, WARMUP_READY, WARMUP_UNAVAILABLE, ModelWarmer,
+                               OllamaClient, OllamaError, OllamaUnavailableError, parse_keep_alive)
+from src.tracing import tracer
+from src.logic_formalizer import LogicFormalizer
+from src.proof_explainer import ProofExplainer
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Имитация REST API Ollama: отвечает фиксированным текстом"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append((self.path, None, self.client_address))
+        self._reply(200, {"version": "0.0-test"})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.path, body, self.client_address))
+        if body["model"] == "missing":
+            self._reply(404, {"error": "model 'missing' not found"})
+        elif self.path == "/api/generate" and body.get("stream"):
+            self._stream(body["model"])
+        elif self.path == "/api/generate":
+            self._reply(200, {"model": body["model"], "response": self.server.answer, "done": True,
+                              "prompt_eval_count": len(body.get("prompt", ""))})
+        elif self.path == "/api/chat":
+            self._reply(200, {"message": {"role": "assistant", "content": self.server.answer}, "done": True})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def _stream(self, model):
+        """Потоковый ответ: по JSON-объекту на фрагмент, кодирование chunked"""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        chunks = self.server.stream_chunks
+        try:
+            for index, text in enumerate(chunks + [None]):
+                payload = {"model": model, "response": text or "", "done": text is None}
+                if text is None:
+                    payload.update(prompt_eval_count=7, eval_count=len(chunks))
+                data = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                self.wfile.flush()
+                self.server.chunks_sent = index + 1
+                time.sleep(0.01)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.server.aborted = True
+            self.close_connection = True
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllamaHandler)
+    server.requests = []
+    server.answer = "Человек(Сократ), ¬Человек(x) ∨ Смертен(x), ¬Смертен(Сократ)"
+    server.stream_chunks = [server.answer]
+    server.chunks_sent = 0
+    server.aborted = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _closed_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def test_generate_and_chat_reuse_connection(fake_server):
+    """Запросы generate и chat идут через одно постоянное соединение"""
+    client = OllamaClient(host=f"127.0.0.1:{fake_server.server_port}", model="test-model",
+                          keep_alive="30m")
+
+    assert client.is_available()
+    assert client.generate("промпт") == fake_server.answer
+    assert client.chat([{"role": "user", "content": "вопрос"}], model="other") == fake_server.answer
+
+    paths = [path for path, _, _ in fake_server.requests]
+    print(f"Запросы: {paths}")
+    assert paths == ["/api/version", "/api/generate", "/api/chat"]
+    generate_body = fake_server.requests[1][1]
+    assert generate_body == {"model": "test-model", "stream": False, "keep_alive": "30m", "prompt": "промпт"}
+    assert fake_server.requests[2][1]["model"] == "other"
+    assert len({address for _, _, address in fake_server.requests}) == 1
+
+    with pytest.raises(OllamaError, match="not found"):
+        client.generate("промпт", model="missing")
+    client.close()
+
+
+def test_formalizer_uses_server_and_falls_back(fake_server):
+    """Формализатор обращается к серверу, а без сервера запускает ollama run"""
+    client = OllamaClient(host=f"http://127.0.0.1:{fake_server.server_port}")
+    formalizer = LogicFormalizer(model_name="test-model", client=client)
+    formulas = formalizer.formalize_problem("Сократ - человек.")
+    print(f"Формулы: {formulas}")
+    assert formulas == ["Человек(Сократ)", "¬Человек(x) ∨ Смертен(x)", "¬Смертен(Сократ)"]
+    assert fake_server.requests[-1][1]["model"] == "test-model"
+
+    offline = OllamaClient(host=f"127.0.0.1:{_closed_port()}")
+    with pytest.raises(OllamaUnavailableError):
+        offline.generate("промпт")
+    assert not offline.is_available()
+
+    formalizer = LogicFormalizer(client=offline)
+    formalizer._run_ollama_cli = lambda prompt: "Человек(Сократ)"
+    assert formalizer.formalize_problem("Сократ - человек.") == ["Человек(Сократ)"]
+
+    explainer = ProofExplainer(client=offline)
+    explainer._execute_ollama_cli = lambda prompt: "Объяснение, полученное через командную строку."
+    log = [{'type': 'contradiction_found', 'step': 1, 'message': 'Найдено противоречие'}]
+    assert explainer.explain_proof(log, True) == "Объяснение, полученное через командную строку."
+
+
+def test_streaming_formalization_stops_early(fake_server):
+    """Формулы выдаются по мере генерации, рассуждения пропускаются, болтовня обрывает поток"""
+    chatter = [f"Пояснение {i}: так получается дизъюнкт.\n" for i in range(60)]
+    fake_server.stream_chunks = [
+        "Thinking...\nНужно привести к КНФ (аккуратно)", " ∨ проверить.\n...done thinking.\n\n",
+        "Человек(Сок", "рат), ¬Человек(x) ∨ Смертен(x)\n",
+        "¬Смертен(Сократ)\n", "\n",
+    ] + chatter
+
+    client = OllamaClient(host=f"127.0.0.1:{fake_server.server_port}")
+    assert "".join(client.stream_generate("промпт", model="m")).startswith("Thinking...")
+    assert fake_server.chunks_sent == len(fake_server.stream_chunks) + 1
+
+    received = []
+    formalizer = LogicFormalizer(model_name="test-model", client=client)
+    formulas = formalizer.formalize_problem("Сократ - человек.", on_formula=received.append)
+    print(f"Формулы: {formulas}")
+    assert formulas == received == ["Человек(Сократ)", "¬Человек(x) ∨ Смертен(x)", "¬Смертен(Сократ)"]
+    assert fake_server.requests[-1][1]["stream"] is True
+
+    # Разрыв соединения останавливает генерацию задолго до конца ответа
+    for _ in range(100):
+        if fake_server.aborted:
+            break
+        time.sleep(0.02)
+    assert fake_server.aborted
+    assert fake_server.chunks_sent < len(fake_server.stream_chunks)
+
+    # Пул продолжает работать после прерванного потока
+    assert client.generate("промпт") == fake_server.answer
+
+
+def test_static_system_prompt_and_metrics(fake_server):
+    """Инструкции уходят неизменным системным промптом, счетчики сервера попадают в трассу"""
+    client = OllamaClient(host=f"127.0.0.1:{fake_server.server_port}")
+    metrics = []
+    assert client.generate("промпт", system="инструкции", on_metrics=metrics.append) == fake_server.answer
+    assert "".join(client.stream_generate("промпт", on_metrics=metrics.append)) == fake_server.answer
+    assert metrics == [{"prompt_eval_count": 6}, {"prompt_eval_count": 7, "eval_count": 1}]
+
+    formalizer = LogicFormalizer(model_name="test-model", client=client)
+    with tracer.span("gui.request") as request_span:
+        formalizer.formalize_problem("Сократ - человек.")
+        formalizer.formalize_problem("Платон - человек.")
+    bodies = [body for path, body, _ in fake_server.requests if path == "/api/generate"][-2:]
+    print(f"Изменяемая часть: {bodies[0]['prompt']}")
+    assert bodies[0]["system"] == bodies[1]["system"] == LogicFormalizer.SYSTEM_PROMPT
+    assert bodies[0]["prompt"] == "Теперь преобразуй следующую задачу: Сократ - человек."
+    calls = [span for span in tracer.spans(request_span.trace_id) if span.name == "formalizer.model_call"]
+    assert [span.attributes["prompt_eval_count"] for span in calls] == [7, 7]
+
+    explainer = ProofExplainer(model_name="test-model", client=client)
+    log = [{'type': 'contradiction_found', 'step': 1, 'message': 'Найдено противоречие'}]
+    explainer.explain_proof(log, True)
+    body = fake_server.requests[-1][1]
+    assert body["system"] == ProofExplainer.SYSTEM_PROMPT
+    assert body["prompt"].startswith("ДАННЫЕ ДОКАЗАТЕЛЬСТВА") and "ИНСТРУКЦИИ" not in body["prompt"]
+    client.close()
+
+
+def test_model_warmup_and_keep_alive(fake_server):
+    """Модель загружается в фоне, удерживается при использовании и отпускается после простоя"""
+    assert parse_keep_alive("10m") == 600 and parse_keep_alive("1h30m") == 5400
+    assert parse_keep_alive("45") == 45 and parse_keep_alive("-1") is None
+    with pytest.raises(ValueError):
+        parse_keep_alive("десять минут")
+
+    client = OllamaClient(host=f"127.0.0.1:{fake_server.server_port}", model="test-model", keep_alive="30m")
+    assert ModelWarmer(client).refresh_interval == 900
+
+    states = []
+    warmer = ModelWarmer(client, on_state=states.append, idle_timeout=0.3, refresh_interval=0.05)
+    warmer.start()
+    assert warmer.wait_ready(5)
+    loads = [body for path, body, _ in fake_server.requests if path == "/api/generate"]
+    assert loads[0] == {"model": "test-model", "stream": False, "keep_alive": "30m"}
+
+    # Пока приложение используется, удержание продлевается
+    for _ in range(4):
+        warmer.touch()
+        time.sleep(0.05)
+    assert len(fake_server.requests) > 2
+
+    # После простоя продление прекращается, следующее использование снова загружает модель
+    for _ in range(100):
+        if warmer.state == WARMUP_IDLE:
+            break
+        time.sleep(0.02)
+    requests_when_idle = len(fake_server.requests)
+    time.sleep(0.15)
+    assert len(fake_server.requests) == requests_when_idle
+    warmer.touch()
+    for _ in range(100):
+        if warmer.state == WARMUP_READY:
+            break
+        time.sleep(0.02)
+    warmer.stop()
+    print(f"Состояния: {states}")
+    assert states[:2] == ["loading", "ready"] and states[-3:] == ["idle", "loading", "ready"]
+
+    # Недоступный сервер отображается в состоянии, модель не считается загруженной
+    offline = ModelWarmer(OllamaClient(host=f"127.0.0.1:{_closed_port()}"), refresh_interval=0.05)
+    offline.start()
+    assert not offline.wait_ready(0.2)
+    offline.stop()
+    assert offline.state == WARMUP_UNAVAILABLE and "недоступен" in offline.error
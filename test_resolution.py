@@ -1,313 +1,515 @@
-from src.resolution_engine import ResolutionEngine
-
-def print_detailed_proof(log, engine):
-    """Выводит доказательство с нумерацией клауз"""
-    print("\n" + "="*60)
-    print("ДЕТАЛИЗИРОВАННОЕ ДОКАЗАТЕЛЬСТВО")
-    print("="*60)
-
-    # Выводим исходные клаузы
-    print("ИСХОДНЫЕ КЛАУЗЫ:")
-    for step in log:
-        if step['type'] == 'initial':
-            for clause_info in step['clauses']:
-                print(f"{clause_info['id']}. {clause_info['clause']}  [{clause_info['source']}]")
-            break
-    print("-" * 40)
-
-    # Выводим шаги резолюции
-    print("ШАГИ РЕЗОЛЮЦИИ:")
-    for step in log:
-        if step['type'] == 'resolution_step':
-            clause1_id = step['clause1_id']
-            clause2_id = step['clause2_id']
-            resolvent_id = step['resolvent_id']
-            resolvent = step['resolvent']
-
-            print(f"{resolvent_id}. {resolvent}  [резолюция {clause1_id} и {clause2_id}]")
-            if step['unification']:
-                print(f"   Унификация: {step['unification']}")
-
-        elif step['type'] == 'contradiction_found':
-            print("-" * 40)
-            print(f" НАЙДЕНО ПРОТИВОРЕЧИЕ! Доказательство завершено.")
-            clause_id = step['clause_id']
-            parents = step['parents']
-            print(f"Пустая клауза {clause_id} получена из клауз {parents}")
-
-
-# Тестирование
-def test_resolution_engine():
-    """Тестирование движка резолюций с улучшенным выводом"""
-    engine = ResolutionEngine()
-    test_count = 0
-    passed_tests = 0
-
-    # Пример 1: Классический силлогизм
-    test_count += 1
-    print("=== ТЕСТ 1: Сократ смертен ===")
-    clauses = [
-        "Человек(Сократ)",
-        "¬Человек(x) ∨ Смертен(x)", 
-        "¬Смертен(Сократ)"
-    ]
-
-    success, log = engine.prove(clauses)
-    print(f"Результат доказательства: {success}")
-    print_detailed_proof(log, engine)
-    if success:
-        passed_tests += 1
-
-    # Пример 2: С квантором существования (ИСПРАВЛЕННЫЙ ВВОД)
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 2: Студент сдал экзамен ===")
-    clauses2 = [
-        "¬Студент(x) ∨ СдалЭкзамен(x, f(x))",  # ЗАКРЫТАЯ СКОБКА!
-        "Студент(Иван)",
-        "¬СдалЭкзамен(Иван, y)"
-    ]
-
-    success2, log2 = engine.prove(clauses2)
-    print(f"Результат доказательства: {success2}")
-    print_detailed_proof(log2, engine)
-    if success2:
-        passed_tests += 1
-
-    # Пример 3: Три предиката
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 3: Три предиката (конкретный пример) ===")
-    print("Если кто-то студент, то он учится в университете.")
-    print("Если кто-то учится в университете, то он сдает экзамены.")
-    print("Иван - студент, но он не сдает экзамены.")
-
-    clauses3 = [
-        "Студент(Иван)",
-        "¬Студент(x) ∨ УчитсяВУниверситете(x)", 
-        "¬УчитсяВУниверситете(y) ∨ СдаетЭкзамены(y)",
-        "¬СдаетЭкзамены(Иван)"
-    ]
-
-    success3, log3 = engine.prove(clauses3)
-    print(f"Результат доказательства: {success3}")
-    print_detailed_proof(log3, engine)
-    if success3:
-        passed_tests += 1
-
-    # "Если A больше B, и B больше C, то A больше C. A больше B, B больше C. Докажи, что A больше C."
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 4: Транзитивность ===")
-    print("Если A больше B, и B больше C, то A больше C. A больше B, B больше C. Докажи, что A больше C.")
-
-    clauses4 = [
-        "Больше(A, B)",
-        "Больше(B, C)",
-        "¬Больше(x, y) ∨ ¬Больше(y, z) ∨ Больше(x, z)",  # Транзитивность
-        "¬Больше(A, C)"  # Отрицание того, что нужно доказать
-    ]
-
-    success4, log4 = engine.prove(clauses4)
-    print(f"Результат доказательства: {success4}")
-    # print_detailed_proof(log4, engine)
-    if success4:
-        passed_tests += 1
-
-    # "Каждый студент изучает какой-то предмет. Математику изучают только умные. Петя - студент. Докажи, что Петя умный."
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 5: Сложная логика ===")
-    print("Каждый студент изучает какой-то предмет. Математику изучают только умные. Петя - студент и изучает математику. Докажи, что Петя умный.")
-
-    clauses5 = [
-        "Студент(Петя)",
-        "Изучает(Петя, Математика)",  # Явно указываем, что Петя изучает математику
-        "¬Изучает(y, Математика) ∨ Умный(y)",  # Изучающие математику - умные
-        "¬Умный(Петя)"  # Отрицание того, что нужно доказать
-    ]
-
-    success5, log5 = engine.prove(clauses5)
-    print(f"Результат доказательства: {success5}")
-    print_detailed_proof(log5, engine)
-    if success5:
-        passed_tests += 1
-
-    # Тест 6: Симметричные отношения
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 6: Симметричность ===")
-    clauses6 = [
-        "Друг(Алиса, Боб)",
-        "¬Друг(x, y) ∨ Друг(y, x)",  # Симметричность
-        "¬Друг(Боб, Алиса)"  # Отрицание симметричности
-    ]
-    success6, log6 = engine.prove(clauses6)
-    print(f"Результат доказательства: {success6}")
-    print_detailed_proof(log6, engine)
-    if success6:
-        passed_tests += 1
-
-    # Тест 7: Множественные переменные
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 7: Множественные переменные ===")
-    clauses7 = [
-        "R(a, b)",
-        "¬R(x, y) ∨ S(y, x)",
-        "¬S(b, a)"  # Отрицание того, что должно следовать
-    ]
-    success7, log7 = engine.prove(clauses7)
-    print(f"Результат доказательства: {success7}")
-    print_detailed_proof(log7, engine)
-    if success7:
-        passed_tests += 1
-
-    # ТЕСТ 8: Кто-то украл пирог
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 8: Кто украл пирог? ===")
-    print("В доме были только мама, папа и ребёнок. Пирог украл тот, кто был дома и любит сладкое.")
-    print("Ребёнок любит сладкое. Папа не любит сладкое. Докажи, что пирог украл ребёнок.")
-
-    clauses8 = [
-        "БылДома(ребёнок)",
-        "БылДома(мама)",
-        "БылДома(папа)",
-        "¬БылДома(x) ∨ ¬ЛюбитСладкое(x) ∨ УкралПирог(x)",  # только тот, кто был дома и любит сладкое
-        "ЛюбитСладкое(ребёнок)",
-        "¬ЛюбитСладкое(папа)",
-        "¬УкралПирог(ребёнок)"  # опровергнем это
-    ]
-    success8, log8 = engine.prove(clauses8)
-    print(f"Результат доказательства: {success8}")
-    print_detailed_proof(log8, engine)
-    if success8:
-        passed_tests += 1
-
-    # ТЕСТ 9: Волк, коза и капуста (классическая головоломка в логике)
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 9: Волк, коза и капуста ===")
-    print("Если волк остаётся с козой без фермера — волк съест козу.")
-    print("Если коза остаётся с капустой без фермера — коза съест капусту.")
-    print("Сейчас фермера нет, волк, коза и капуста на одном берегу. Докажи, что что-то будет съедено.")
-
-    clauses9 = [
-        "¬ФермерПрисутствует",
-        "НаОдномБерегу(волк, коза)",
-        "НаОдномБерегу(коза, капуста)",
-        "¬ФермерПрисутствует ∨ ¬НаОдномБерегу(волк, коза) ∨ ¬Съест(волк, коза)",
-        "¬ФермерПрисутствует ∨ ¬НаОдномБерегу(коза, капуста) ∨ ¬Съест(коза, капуста)",
-        "¬Съест(волк, коза) ∨ ¬Съест(коза, капуста)"  # опровергнем, что оба НЕ съедят
-    ]
-    success9, log9 = engine.prove(clauses9)
-    print(f"Результат доказательства: {success9}")
-    print_detailed_proof(log9, engine)
-    if success9:
-        passed_tests += 1
-
-    # ТЕСТ 10: Тайный поклонник
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 10: Тайный поклонник ===")
-    print("Кто-то из трёх парней (Антон, Борис, Виктор) — тайный поклонник Маши.")
-    print("Тайный поклонник дарит цветы каждый день. Антон вчера не дарил цветы.")
-    print("Борис дарит цветы только по понедельникам, а сегодня среда. Докажи, что поклонник — Виктор.")
-
-    clauses10 = [
-        "Поклонник(Антон) ∨ Поклонник(Борис) ∨ Поклонник(Виктор)",  # кто-то из них
-        "¬Поклонник(x) ∨ ДаритЦветыКаждыйДень(x)",
-        "¬ДаритЦветыКаждыйДень(Антон)",   # вчера не дарил → не каждый день
-        "¬Понедельник ∨ ДаритЦветы(Борис)",   # обратное: если не понедельник → Борис НЕ дарит
-        "¬Понедельник",
-        "¬Поклонник(Виктор)"  # попробуем опровергнуть
-    ]
-    success10, log10 = engine.prove(clauses10)
-    print(f"Результат доказательства: {success10}")
-    print_detailed_proof(log10, engine)
-    if success10:
-        passed_tests += 1
-
-    # ТЕСТ 11: Лжец и правдивый на острове
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 11: Остров лжецов и правдивых ===")
-    print("На острове либо всегда лгут, либо всегда говорят правду.")
-    print("Абориген сказал: «Я — лжец». Докажи, что это невозможно.")
-
-    clauses11 = [
-        # Либо лжец, либо правдивый (исключающее ИЛИ)
-        "Лжец(абориген) ∨ Правдивый(абориген)",
-        "¬Лжец(абориген) ∨ ¬Правдивый(абориген)",  # не может быть одновременно
-        
-        "¬Лжец(абориген) ∨ ¬ГоворитПравду(абориген)", # Лжец всегда лжет: если он лжец, то когда говорит "я лжец" - это ложь
-        "¬Правдивый(абориген) ∨ ГоворитПравду(абориген)",# Правдивый всегда говорит правду: если он правдивый, то когда говорит "я лжец" - это правда
-        "¬ГоворитПравду(абориген) ∨ Лжец(абориген)", # Если говорит "я лжец" и это правда, то он лжец
-        "ГоворитПравду(абориген) ∨ ¬Лжец(абориген)", # Если говорит "я лжец" и это ложь, то он не лжец (правдивый)
-        
-        # Отрицание того, что хотим доказать (что ситуация возможна)
-        "Лжец(абориген)",
-        "Правдивый(абориген)" 
-    ]
-
-    success11, log11 = engine.prove(clauses11)
-    print(f"Результат доказательства: {success11}")
-    print_detailed_proof(log11, engine)
-    if success11:
-        passed_tests += 1
-
-    # ТЕСТ 12: Преступление в восточном экспрессе
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 12: Все виноваты  ===")
-    print("Убийство совершил либо один человек, либо все пассажиры вагона вместе.")
-    print("Если один — то у него был мотив и возможность. Ни у кого одного не было и мотива, и возможности одновременно.")
-    print("Убийство совершено. Докажи, что виноваты все.")
-
-    clauses12 = [
-        "УбийствоСовершено",
-        "ВиноватОдин ∨ ВиноватыВсе",
-        "¬ВиноватОдин ∨ ЕстьМотивИВозможность(кто-то)",
-        "¬ЕстьМотивИВозможность(все_пассажиры_по_отдельности)",
-        "¬ВиноватыВсе"  # опровергнем
-    ]
-
-    success12, log12 = engine.prove(clauses12)
-    print(f"Результат доказательства: {success12}")
-    print_detailed_proof(log12, engine)
-    if success12:
-        passed_tests += 1
-
-    # ТЕСТ 13: Вампиры и чеснок
-    test_count += 1
-    print("\n" + "="*60)
-    print("=== ТЕСТ 13: Вампиры боятся чеснока ===")
-    print("Все вампиры боятся чеснока. Некоторые бессмертные — вампиры.")
-    print("Дракула бессмертный и ест чеснок. Докажи, что Дракула не вампир.")
-
-    clauses13 = [
-        "¬Вампир(x) ∨ БоитсяЧеснока(x)",
-        "Бессмертный(Дракула)",
-        "ЕстЧеснок(Дракула)",
-        "¬ЕстЧеснок(y) ∨ ¬БоитсяЧеснока(y)",  # кто ест — тот не боится
-        "Бессмертный(z) ∨ Вампир(z)",         # некоторые бессмертные — вампиры (обратное для опровержения)
-        "Вампир(Дракула)"                     # предположим и опровергнем
-    ]
-    success13, log13 = engine.prove(clauses13)
-    print(f"Результат доказательства: {success13}")
-    print_detailed_proof(log13, engine)
-    if success13:
-        passed_tests += 1
-
-    # Вывод итоговой статистики
-    print("\n" + "="*60)
-    print("ИТОГИ ТЕСТИРОВАНИЯ")
-    print("="*60)
-    print(f"Всего тестов: {test_count}")
-    print(f"Пройдено тестов: {passed_tests}")
-    print(f"Успешность: {passed_tests}/{test_count} ({passed_tests/test_count*100:.1f}%)")
-
-
-if __name__ == "__main__":
-    test_resolution_engine()
\ No newline at end of file
+from src.resolution_engine import ResolutionEngine
+from src.disk_cache import DiskCache
+from src.engine_stats import profile_prove
+from src.deadline import Deadline
+from src.signature import Signature
+
+def print_detailed_proof(log, engine):
+    """Выводит доказательство с нумерацией клауз"""
+    print("\n" + "="*60)
+    print("ДЕТАЛИЗИРОВАННОЕ ДОКАЗАТЕЛЬСТВО")
+    print("="*60)
+
+    # Выводим исходные клаузы
+    print("ИСХОДНЫЕ КЛАУЗЫ:")
+    for step in log:
+        if step['type'] == 'initial':
+            for clause_info in step['clauses']:
+                print(f"{clause_info['id']}. {clause_info['clause']}  [{clause_info['source']}]")
+            break
+    print("-" * 40)
+
+    # Выводим шаги резолюции
+    print("ШАГИ РЕЗОЛЮЦИИ:")
+    for step in log:
+        if step['type'] == 'resolution_step':
+            clause1_id = step['clause1_id']
+            clause2_id = step['clause2_id']
+            resolvent_id = step['resolvent_id']
+            resolvent = step['resolvent']
+
+            print(f"{resolvent_id}. {resolvent}  [резолюция {clause1_id} и {clause2_id}]")
+            if step['unification']:
+                print(f"   Унификация: {step['unification']}")
+
+        elif step['type'] == 'contradiction_found':
+            print("-" * 40)
+            print(f" НАЙДЕНО ПРОТИВОРЕЧИЕ! Доказательство завершено.")
+            clause_id = step['clause_id']
+            parents = step['parents']
+            print(f"Пустая клауза {clause_id} получена из клауз {parents}")
+
+
+# Тестирование
+def test_resolution_engine():
+    """Тестирование движка резолюций с улучшенным выводом"""
+    engine = ResolutionEngine()
+    test_count = 0
+    passed_tests = 0
+
+    # Пример 1: Классический силлогизм
+    test_count += 1
+    print("=== ТЕСТ 1: Сократ смертен ===")
+    clauses = [
+        "Человек(Сократ)",
+        "¬Человек(x) ∨ Смертен(x)", 
+        "¬Смертен(Сократ)"
+    ]
+
+    success, log = engine.prove(clauses)
+    print(f"Результат доказательства: {success}")
+    print_detailed_proof(log, engine)
+    if success:
+        passed_tests += 1
+
+    # Пример 2: С квантором существования (ИСПРАВЛЕННЫЙ ВВОД)
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 2: Студент сдал экзамен ===")
+    clauses2 = [
+        "¬Студент(x) ∨ СдалЭкзамен(x, f(x))",  # ЗАКРЫТАЯ СКОБКА!
+        "Студент(Иван)",
+        "¬СдалЭкзамен(Иван, y)"
+    ]
+
+    success2, log2 = engine.prove(clauses2)
+    print(f"Результат доказательства: {success2}")
+    print_detailed_proof(log2, engine)
+    if success2:
+        passed_tests += 1
+
+    # Пример 3: Три предиката
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 3: Три предиката (конкретный пример) ===")
+    print("Если кто-то студент, то он учится в университете.")
+    print("Если кто-то учится в университете, то он сдает экзамены.")
+    print("Иван - студент, но он не сдает экзамены.")
+
+    clauses3 = [
+        "Студент(Иван)",
+        "¬Студент(x) ∨ УчитсяВУниверситете(x)", 
+        "¬УчитсяВУниверситете(y) ∨ СдаетЭкзамены(y)",
+        "¬СдаетЭкзамены(Иван)"
+    ]
+
+    success3, log3 = engine.prove(clauses3)
+    print(f"Результат доказательства: {success3}")
+    print_detailed_proof(log3, engine)
+    if success3:
+        passed_tests += 1
+
+    # "Если A больше B, и B больше C, то A больше C. A больше B, B больше C. Докажи, что A больше C."
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 4: Транзитивность ===")
+    print("Если A больше B, и B больше C, то A больше C. A больше B, B больше C. Докажи, что A больше C.")
+
+    clauses4 = [
+        "Больше(A, B)",
+        "Больше(B, C)",
+        "¬Больше(x, y) ∨ ¬Больше(y, z) ∨ Больше(x, z)",  # Транзитивность
+        "¬Больше(A, C)"  # Отрицание того, что нужно доказать
+    ]
+
+    success4, log4 = engine.prove(clauses4)
+    print(f"Результат доказательства: {success4}")
+    # print_detailed_proof(log4, engine)
+    if success4:
+        passed_tests += 1
+
+    # "Каждый студент изучает какой-то предмет. Математику изучают только умные. Петя - студент. Докажи, что Петя умный."
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 5: Сложная логика ===")
+    print("Каждый студент изучает какой-то предмет. Математику изучают только умные. Петя - студент и изучает математику. Докажи, что Петя умный.")
+
+    clauses5 = [
+        "Студент(Петя)",
+        "Изучает(Петя, Математика)",  # Явно указываем, что Петя изучает математику
+        "¬Изучает(y, Математика) ∨ Умный(y)",  # Изучающие математику - умные
+        "¬Умный(Петя)"  # Отрицание того, что нужно доказать
+    ]
+
+    success5, log5 = engine.prove(clauses5)
+    print(f"Результат доказательства: {success5}")
+    print_detailed_proof(log5, engine)
+    if success5:
+        passed_tests += 1
+
+    # Тест 6: Симметричные отношения
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 6: Симметричность ===")
+    clauses6 = [
+        "Друг(Алиса, Боб)",
+        "¬Друг(x, y) ∨ Друг(y, x)",  # Симметричность
+        "¬Друг(Боб, Алиса)"  # Отрицание симметричности
+    ]
+    success6, log6 = engine.prove(clauses6)
+    print(f"Результат доказательства: {success6}")
+    print_detailed_proof(log6, engine)
+    if success6:
+        passed_tests += 1
+
+    # Тест 7: Множественные переменные
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 7: Множественные переменные ===")
+    clauses7 = [
+        "R(a, b)",
+        "¬R(x, y) ∨ S(y, x)",
+        "¬S(b, a)"  # Отрицание того, что должно следовать
+    ]
+    success7, log7 = engine.prove(clauses7)
+    print(f"Результат доказательства: {success7}")
+    print_detailed_proof(log7, engine)
+    if success7:
+        passed_tests += 1
+
+    # ТЕСТ 8: Кто-то украл пирог
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 8: Кто украл пирог? ===")
+    print("В доме были только мама, папа и ребёнок. Пирог украл тот, кто был дома и любит сладкое.")
+    print("Ребёнок любит сладкое. Папа не любит сладкое. Докажи, что пирог украл ребёнок.")
+
+    clauses8 = [
+        "БылДома(ребёнок)",
+        "БылДома(мама)",
+        "БылДома(папа)",
+        "¬БылДома(x) ∨ ¬ЛюбитСладкое(x) ∨ УкралПирог(x)",  # только тот, кто был дома и любит сладкое
+        "ЛюбитСладкое(ребёнок)",
+        "¬ЛюбитСладкое(папа)",
+        "¬УкралПирог(ребёнок)"  # опровергнем это
+    ]
+    success8, log8 = engine.prove(clauses8)
+    print(f"Результат доказательства: {success8}")
+    print_detailed_proof(log8, engine)
+    if success8:
+        passed_tests += 1
+
+    # ТЕСТ 9: Волк, коза и капуста (классическая головоломка в логике)
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 9: Волк, коза и капуста ===")
+    print("Если волк остаётся с козой без фермера — волк съест козу.")
+    print("Если коза остаётся с капустой без фермера — коза съест капусту.")
+    print("Сейчас фермера нет, волк, коза и капуста на одном берегу. Докажи, что что-то будет съедено.")
+
+    clauses9 = [
+        "¬ФермерПрисутствует",
+        "НаОдномБерегу(волк, коза)",
+        "НаОдномБерегу(коза, капуста)",
+        "¬ФермерПрисутствует ∨ ¬НаОдномБерегу(волк, коза) ∨ ¬Съест(волк, коза)",
+        "¬ФермерПрисутствует ∨ ¬НаОдномБерегу(коза, капуста) ∨ ¬Съест(коза, капуста)",
+        "¬Съест(волк, коза) ∨ ¬Съест(коза, капуста)"  # опровергнем, что оба НЕ съедят
+    ]
+    success9, log9 = engine.prove(clauses9)
+    print(f"Результат доказательства: {success9}")
+    print_detailed_proof(log9, engine)
+    if success9:
+        passed_tests += 1
+
+    # ТЕСТ 10: Тайный поклонник
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 10: Тайный поклонник ===")
+    print("Кто-то из трёх парней (Антон, Борис, Виктор) — тайный поклонник Маши.")
+    print("Тайный поклонник дарит цветы каждый день. Антон вчера не дарил цветы.")
+    print("Борис дарит цветы только по понедельникам, а сегодня среда. Докажи, что поклонник — Виктор.")
+
+    clauses10 = [
+        "Поклонник(Антон) ∨ Поклонник(Борис) ∨ Поклонник(Виктор)",  # кто-то из них
+        "¬Поклонник(x) ∨ ДаритЦветыКаждыйДень(x)",
+        "¬ДаритЦветыКаждыйДень(Антон)",   # вчера не дарил → не каждый день
+        "¬Понедельник ∨ ДаритЦветы(Борис)",   # обратное: если не понедельник → Борис НЕ дарит
+        "¬Понедельник",
+        "¬Поклонник(Виктор)"  # попробуем опровергнуть
+    ]
+    success10, log10 = engine.prove(clauses10)
+    print(f"Результат доказательства: {success10}")
+    print_detailed_proof(log10, engine)
+    if success10:
+        passed_tests += 1
+
+    # ТЕСТ 11: Лжец и правдивый на острове
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 11: Остров лжецов и правдивых ===")
+    print("На острове либо всегда лгут, либо всегда говорят правду.")
+    print("Абориген сказал: «Я — лжец». Докажи, что это невозможно.")
+
+    clauses11 = [
+        # Либо лжец, либо правдивый (исключающее ИЛИ)
+        "Лжец(абориген) ∨ Правдивый(абориген)",
+        "¬Лжец(абориген) ∨ ¬Правдивый(абориген)",  # не может быть одновременно
+        
+        "¬Лжец(абориген) ∨ ¬ГоворитПравду(абориген)", # Лжец всегда лжет: если он лжец, то когда говорит "я лжец" - это ложь
+        "¬Правдивый(абориген) ∨ ГоворитПравду(абориген)",# Правдивый всегда говорит правду: если он правдивый, то когда говорит "я лжец" - это правда
+        "¬ГоворитПравду(абориген) ∨ Лжец(абориген)", # Если говорит "я лжец" и это правда, то он лжец
+        "ГоворитПравду(абориген) ∨ ¬Лжец(абориген)", # Если говорит "я лжец" и это ложь, то он не лжец (правдивый)
+        
+        # Отрицание того, что хотим доказать (что ситуация возможна)
+        "Лжец(абориген)",
+        "Правдивый(абориген)" 
+    ]
+
+    success11, log11 = engine.prove(clauses11)
+    print(f"Результат доказательства: {success11}")
+    print_detailed_proof(log11, engine)
+    if success11:
+        passed_tests += 1
+
+    # ТЕСТ 12: Преступление в восточном экспрессе
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 12: Все виноваты  ===")
+    print("Убийство совершил либо один человек, либо все пассажиры вагона вместе.")
+    print("Если один — то у него был мотив и возможность. Ни у кого одного не было и мотива, и возможности одновременно.")
+    print("Убийство совершено. Докажи, что виноваты все.")
+
+    clauses12 = [
+        "УбийствоСовершено",
+        "ВиноватОдин ∨ ВиноватыВсе",
+        "¬ВиноватОдин ∨ ЕстьМотивИВозможность(кто-то)",
+        "¬ЕстьМотивИВозможность(все_пассажиры_по_отдельности)",
+        "¬ВиноватыВсе"  # опровергнем
+    ]
+
+    success12, log12 = engine.prove(clauses12)
+    print(f"Результат доказательства: {success12}")
+    print_detailed_proof(log12, engine)
+    if success12:
+        passed_tests += 1
+
+    # ТЕСТ 13: Вампиры и чеснок
+    test_count += 1
+    print("\n" + "="*60)
+    print("=== ТЕСТ 13: Вампиры боятся чеснока ===")
+    print("Все вампиры боятся чеснока. Некоторые бессмертные — вампиры.")
+    print("Дракула бессмертный и ест чеснок. Докажи, что Дракула не вампир.")
+
+    clauses13 = [
+        "¬Вампир(x) ∨ БоитсяЧеснока(x)",
+        "Бессмертный(Дракула)",
+        "ЕстЧеснок(Дракула)",
+        "¬ЕстЧеснок(y) ∨ ¬БоитсяЧеснока(y)",  # кто ест — тот не боится
+        "Бессмертный(z) ∨ Вампир(z)",         # некоторые бессмертные — вампиры (обратное для опровержения)
+        "Вампир(Дракула)"                     # предположим и опровергнем
+    ]
+    success13, log13 = engine.prove(clauses13)
+    print(f"Результат доказательства: {success13}")
+    print_detailed_proof(log13, engine)
+    if success13:
+        passed_tests += 1
+
+    # Вывод итоговой статистики
+    print("\n" + "="*60)
+    print("ИТОГИ ТЕСТИРОВАНИЯ")
+    print("="*60)
+    print(f"Всего тестов: {test_count}")
+    print(f"Пройдено тестов: {passed_tests}")
+    print(f"Успешность: {passed_tests}/{test_count} ({passed_tests/test_count*100:.1f}%)")
+
+
+def test_prove_many():
+    """Пакетное доказательство нескольких целей над общими аксиомами"""
+    engine = ResolutionEngine()
+    axioms = [
+        "Человек(Сократ)",
+        "Человек(Платон)",
+        "¬Человек(x) ∨ Смертен(x)",
+        "Больше(A, B)",
+        "Больше(B, C)",
+        "¬Больше(x, y) ∨ ¬Больше(y, z) ∨ Больше(x, z)"
+    ]
+    goals = [
+        "¬Смертен(Сократ)",
+        "¬Больше(A, C)",
+        "¬Смертен(Зевс)",
+        ["¬Смертен(Платон)", "¬Человек(Платон)"]
+    ]
+
+    print("\n" + "="*60)
+    print("=== ПАКЕТНОЕ ДОКАЗАТЕЛЬСТВО (prove_many) ===")
+    results = engine.prove_many(axioms, goals, max_workers=2)
+    for goal, (success, log) in zip(goals, results):
+        print(f"Цель {goal}: {success}")
+
+    assert [success for success, _ in results] == [True, True, False, True]
+
+    # Результаты возвращаются в порядке целей, каждый лог начинается с исходных клауз
+    for goal, (_, log) in zip(goals, results):
+        goal_clauses = [goal] if isinstance(goal, str) else goal
+        assert log[0]['type'] == 'initial'
+        assert log[0]['original_clauses'] == axioms + goal_clauses
+
+    # Результаты совпадают с обычным доказательством над полным множеством клауз
+    single_success, _ = ResolutionEngine().prove(axioms + ["¬Больше(A, C)"])
+    assert single_success == results[1][0]
+
+    # Без пула процессов (max_workers=1) результаты и логи те же
+    sequential = engine.prove_many(axioms, goals, max_workers=1)
+    assert [log for _, log in sequential] == [log for _, log in results]
+
+
+
+def test_proof_cache(tmp_path):
+    """Повторное доказательство берется из дискового кэша"""
+    cache = DiskCache(str(tmp_path / "proofs.sqlite"), max_entries=10)
+    engine = ResolutionEngine(cache=cache)
+    clauses = [
+        "Больше(A, B)",
+        "Больше(B, C)",
+        "¬Больше(x, y) ∨ ¬Больше(y, z) ∨ Больше(x, z)",
+        "¬Больше(A, C)"
+    ]
+
+    print("\n" + "="*60)
+    print("=== КЭШ ДОКАЗАТЕЛЬСТВ ===")
+    success, log = engine.prove(clauses)
+    assert success and not engine.last_cache_hit
+
+    # Тот же набор с другим порядком клауз и другими именами переменных
+    reordered = [
+        "¬Больше(A, C)",
+        "¬Больше(u, v) ∨ Больше(u, w) ∨ ¬Больше(v, w)",
+        "Больше(B, C)",
+        "Больше(A, B)"
+    ]
+    cached_success, cached_log = engine.prove(reordered)
+    print(f"Результат из кэша: {cached_success}, попадание: {engine.last_cache_hit}")
+    assert cached_success and engine.last_cache_hit
+    assert [step['type'] for step in cached_log] == [step['type'] for step in log]
+    assert cached_log[0]['original_clauses'] == reordered
+
+    # ID исходных клауз в шагах соответствуют порядку нового запроса
+    first_step = next(step for step in cached_log if step['type'] == 'resolution_step')
+    for key in ('clause1', 'clause2'):
+        clause_id = first_step[key + '_id']
+        if clause_id < len(reordered):
+            assert first_step[key] == cached_log[0]['clauses'][clause_id]['clause']
+
+    # Другая конфигурация движка - другой ключ кэша
+    ResolutionEngine(max_steps=5, cache=cache).prove(clauses)
+    assert len(cache) == 2
+    ResolutionEngine(memory_limit=10 ** 6, cache=cache).prove(clauses)
+    assert len(cache) == 3
+
+    # Сорта сигнатуры меняют результат - и ключ кэша
+    sorted_clauses = ["Возраст(Сократ, x)", "¬Возраст(y, 70)"]
+    signature = Signature.from_clauses(sorted_clauses)
+    signature.declare_sorts('Возраст', 'Человек', 'Человек')
+    assert not engine.prove(sorted_clauses, signature=signature)[0]
+    success, _ = engine.prove(sorted_clauses)
+    assert success and not engine.last_cache_hit
+
+    # Прерванное по сроку запроса насыщение не попадает в кэш
+    deadline_cache = DiskCache(str(tmp_path / "deadline.sqlite"), max_entries=10)
+    success, log = ResolutionEngine(cache=deadline_cache).prove(clauses, deadline=Deadline(0.0))
+    assert not success and log[-1]['type'] == 'timeout'
+    assert len(deadline_cache) == 0
+    success, _ = ResolutionEngine(cache=deadline_cache).prove(clauses)
+    assert success and len(deadline_cache) == 1
+
+
+
+def test_checkpoint_resume(tmp_path):
+    """Продолжение насыщения с чекпоинта после исчерпания лимита раундов"""
+    clauses = [
+        "Меньше(A0, A1)",
+        "Меньше(A1, A2)",
+        "¬Меньше(x, y) ∨ ¬Меньше(y, z) ∨ Меньше(x, z)",
+        "¬Меньше(A0, A2)"
+    ]
+    checkpoint = str(tmp_path / "saturation.ckpt")
+
+    print("\n" + "="*60)
+    print("=== ЧЕКПОИНТ И ПРОДОЛЖЕНИЕ НАСЫЩЕНИЯ ===")
+    full_success, full_log = ResolutionEngine().prove(clauses)
+
+    # Первый прогон упирается в лимит и сохраняет состояние
+    limited = ResolutionEngine(max_steps=1, checkpoint_path=checkpoint)
+    success, log = limited.prove(clauses)
+    print(f"Прогон с лимитом: {success}, последний шаг: {log[-1]['type']}")
+    assert not success and log[-1]['type'] == 'timeout'
+
+    # Продолжение с увеличенным лимитом дает тот же результат, лог и счетчики
+    full_stats = ResolutionEngine().prove(clauses, with_stats=True)[2]
+    resumed_success, resumed_log, resumed_stats = ResolutionEngine().prove(
+        clauses, resume_from=checkpoint, with_stats=True)
+    print(f"Продолжение с чекпоинта: {resumed_success}")
+    assert resumed_success == full_success
+    assert resumed_log == full_log
+    assert resumed_stats.rounds == full_stats.rounds > 1
+    assert resumed_stats.resolvents_kept == full_stats.resolvents_kept
+
+    # Чекпоинт чужого множества клауз не принимается
+    mismatch_success, mismatch_log = ResolutionEngine().prove(clauses[:2], resume_from=checkpoint)
+    assert not mismatch_success and mismatch_log[-1]['type'] == 'error'
+
+
+
+def test_memory_limited_store():
+    """Вытеснение тяжелых необработанных клауз при лимите памяти"""
+    clauses = [
+        "Меньше(A0, A1)",
+        "Меньше(A1, A2)",
+        "Меньше(A2, A3)",
+        "¬Меньше(x, y) ∨ ¬Меньше(y, z) ∨ Меньше(x, z)",
+        "¬Меньше(A0, A3)"
+    ]
+
+    print("\n" + "="*60)
+    print("=== ОГРАНИЧЕНИЕ ПАМЯТИ ХРАНИЛИЩА КЛАУЗ ===")
+    engine = ResolutionEngine(memory_limit=300_000)
+    success, log = engine.prove(clauses)
+    evictions = [step for step in log if step['type'] == 'clauses_evicted']
+    print(f"Результат: {success}, вытеснено клауз: {engine.clause_registry.evicted_count}")
+
+    assert success
+    assert evictions and evictions[-1]['total_evicted'] == engine.clause_registry.evicted_count
+
+    # Родители всех оставшихся клауз сохранены для восстановления доказательства
+    for clause_id in engine.clause_registry:
+        for parent_id in engine.clause_registry[clause_id].parents:
+            assert parent_id in engine.clause_registry
+
+
+def test_engine_stats(tmp_path):
+    """Счетчики и таймеры доказательства, профилирование одной задачи"""
+    clauses = [
+        "Больше(A, B)",
+        "Больше(B, C)",
+        "¬Больше(x, y) ∨ ¬Больше(y, z) ∨ Больше(x, z)",
+        "¬Больше(A, C)"
+    ]
+
+    print("\n" + "="*60)
+    print("=== СТАТИСТИКА ДВИЖКА ===")
+    engine = ResolutionEngine()
+    success, log, stats = engine.prove(clauses, with_stats=True)
+    print(stats)
+
+    assert success and stats is engine.stats
+    kept = sum(1 for step in log if step['type'] == 'resolution_step')
+    assert stats.resolvents_kept == kept
+    assert stats.resolvents_generated == (kept + stats.tautologies_deleted +
+                                          stats.subsumed_deleted)
+    assert stats.unification_attempts >= stats.unification_successes == stats.resolvents_generated
+    assert stats.timings['unify'] > 0 and stats.timings['total'] >= stats.timings['subsume']
+
+    # Без with_stats таймеры не включаются, счетчики считаются
+    success, log = engine.prove(clauses)
+    assert engine.stats.timings['unify'] == 0 and engine.stats.resolvents_kept == kept
+    assert '_unify' not in engine.__dict__
+
+    profile_prove(ResolutionEngine(), clauses, str(tmp_path), "transitivity")
+    assert (tmp_path / "transitivity.prof").exists()
+    assert "Пиковая память" in (tmp_path / "transitivity.tracemalloc.txt").read_text(encoding='utf-8')
+
+
+if __name__ == "__main__":
+    test_resolution_engine()
+    test_prove_many()
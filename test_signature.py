@@ -0,0 +1,112 @@
+import pytest
+
+from src.signature import (CONSTANT, FUNCTION, NUMERAL, SKOLEM_CONSTANT, SKOLEM_FUNCTION, VARIABLE,
+                           Signature, SignatureError)
+from src.logic_formalizer import LogicFormalizer
+from src.resolution_engine import ResolutionEngine
+
+
+def test_signature_classification():
+    """Виды символов: объявления, соглашение движка, числа и составные термы"""
+    signature = Signature.from_clauses(
+        ["¬Любит(x, a) ∨ Знает(f(x), Сократ)", "Возраст(Сократ, 70)"],
+        LogicFormalizer.SKOLEM_CONSTANT_PATTERN, LogicFormalizer.SKOLEM_FUNCTION_PATTERN)
+    print(f"Сигнатура: {signature.to_dict()}")
+
+    assert signature.kind('x') == VARIABLE
+    assert signature.kind('a') == SKOLEM_CONSTANT
+    assert signature.kind('f(x)') == SKOLEM_FUNCTION
+    assert signature.kind('Сократ') == CONSTANT
+    assert signature.kind('70') == NUMERAL
+    assert signature.predicates == {'Любит': 2, 'Знает': 2, 'Возраст': 2}
+    assert signature.is_constant('a') and not signature.is_variable('a')
+
+    # Необъявленные символы классифицируются по регистру первой буквы
+    assert signature.kind('y') == VARIABLE
+    assert signature.kind('g(y)') == FUNCTION
+    assert signature.is_constant('3.5')
+
+    assert Signature.from_dict(signature.to_dict()).to_dict() == signature.to_dict()
+    with pytest.raises(SignatureError):
+        signature.declare('f', FUNCTION, 2)
+
+
+def test_engine_uses_signature():
+    """Сколемовская константа со строчной буквы не унифицируется с другой константой"""
+    clauses = ["Любит(a, Сократ)", "¬Любит(Платон, Сократ)"]
+    engine = ResolutionEngine()
+    success, _ = engine.prove(clauses)
+    assert success  # без сигнатуры "a" считается переменной
+
+    signature = Signature.from_clauses(clauses, LogicFormalizer.SKOLEM_CONSTANT_PATTERN)
+    success, log = engine.prove(clauses, signature=signature)
+    print(f"Итог: {log[-1]['message']}")
+    assert not success
+    success, _ = engine.prove(clauses + ["¬Любит(a, y)"], signature=signature)
+    assert success
+
+    # Числа - константы: совпадают только сами с собой
+    assert engine.prove(["Больше(5, 3)", "¬Больше(x, 3)"])[0]
+    assert not engine.prove(["Больше(5, 3)", "¬Больше(4, 3)"])[0]
+
+
+def test_formalizer_emits_signature():
+    """Формализатор возвращает сигнатуру вместе с дизъюнктами"""
+    formalizer = LogicFormalizer(model_name="test-model")
+    formalizer._stream_model_output = lambda prompt: ["Дракон(a), ¬ДышитОгнем(a), ¬Дракон(x) ∨ Летает(x)\n"]
+    formulas = formalizer.formalize_problem("Существует дракон, который не дышит огнем.")
+    assert formulas == ["Дракон(a)", "¬ДышитОгнем(a)", "¬Дракон(x) ∨ Летает(x)"]
+    assert formalizer.last_signature.kind('a') == SKOLEM_CONSTANT
+    assert formalizer.last_signature.kind('x') == VARIABLE
+
+    # В режиме fol_mode строчные имена модели - переменные, Sk<n> - сколемовские
+    formalizer = LogicFormalizer(model_name="test-model", fol_mode=True)
+    formalizer._stream_model_output = lambda prompt: ["∃y Любит(y, a)\n"]
+    assert formalizer.formalize_problem("Кто-то любит всех.") == ["Любит(Sk1(a), a)"]
+    assert formalizer.last_signature.kind('a') == VARIABLE
+    assert formalizer.last_signature.kind('Sk1(a)') == SKOLEM_FUNCTION
+
+
+def test_sorts_prune_resolution():
+    """Сорта выводятся из дизъюнктов, резолюция термов разных сортов отбрасывается"""
+    clauses = [
+        "Человек(Сократ)", "Человек(Платон)",
+        "Возраст(Сократ, 70)", "Возраст(Платон, 80)", "Возраст(75, Платон)",
+        "¬Возраст(x, n) ∨ ¬Больше(n, 18) ∨ Взрослый(x)",
+        "Больше(70, 18)", "Больше(80, 18)", "Больше(75, 18)",
+        "¬Взрослый(y) ∨ ¬Человек(y) ∨ Голосует(y)",
+        "¬Голосует(Сократ)",
+    ]
+    signature = Signature.from_clauses(clauses)
+    signature.declare_sorts('Возраст', 'Человек', 'Число')
+    signature.infer_sorts(clauses)
+    print(f"Сорта: {signature.predicate_sorts}, конфликты: {signature.sort_conflicts}")
+
+    assert signature.argument_sort('Больше', 0) == 'Число'
+    assert signature.argument_sort('Взрослый', 0) == 'Человек'
+    assert signature.term_sort('Сократ') == 'Человек'
+    assert signature.term_sort('18') == 'Число'
+    # Ошибочная запись Возраст(75, Платон) не лишает сортов остальные символы
+    assert signature.term_sort('Платон') is None
+    assert signature.sort_conflicts == ["Платон: несовместимые сорта Человек, Число"]
+
+    engine = ResolutionEngine()
+    success, log, unsorted_stats = engine.prove(clauses, with_stats=True)
+    assert success and unsorted_stats.ill_sorted_rejected == 0
+    assert any("Взрослый(75)" in step.get('resolvent', '') for step in log)
+
+    success, log, sorted_stats = engine.prove(clauses, with_stats=True, signature=signature)
+    print(f"Резольвент: {unsorted_stats.resolvents_generated} -> {sorted_stats.resolvents_generated}")
+    assert success
+    assert sorted_stats.ill_sorted_rejected > 0
+    assert sorted_stats.resolvents_generated < unsorted_stats.resolvents_generated
+    assert not any("Взрослый(75)" in step.get('resolvent', '') for step in log)
+
+    # Кандидаты из индекса без пары литералов совместимых сортов отбрасываются
+    assert engine._pair_well_sorted(2, 5) and not engine._pair_well_sorted(4, 5)
+
+    # Унификатор не связывает переменную с термом другого сорта,
+    # в том числе через ранее найденную подстановку x -> n
+    assert engine._unify(['x', 'x'], ['n', 'Сократ']) == {'x': 'n', 'n': 'Сократ'}
+    assert engine._unify(['x', 'x'], ['n', 'Сократ'], {'n': 'Число'}) is None
+    assert engine._unify(['x', 'x'], ['n', '70'], {'n': 'Число'}) == {'x': 'n', 'n': '70'}
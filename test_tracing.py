@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from src.tracing import NULL_SPAN, Tracer, tracer
+from src.logic_formalizer import LogicFormalizer
+from src.resolution_engine import ResolutionEngine
+
+
+def test_span_nesting_and_export(tmp_path):
+    """Вложенные интервалы, атрибуты, ошибки и экспорт трассы"""
+    local_tracer = Tracer()
+
+    with local_tracer.span("request", user="тест") as root:
+        with local_tracer.span("stage.first") as first:
+            first.set_attribute("items", 3)
+        with pytest.raises(ValueError):
+            with local_tracer.span("stage.failed"):
+                raise ValueError("сбой")
+    with local_tracer.span("other") as other:
+        pass
+
+    spans = local_tracer.spans(root.trace_id)
+    print(f"Интервалы: {[span.name for span in spans]}")
+    assert [span.name for span in spans] == ["request", "stage.first", "stage.failed"]
+    assert all(span.parent_id == root.span_id for span in spans[1:])
+    assert spans[1].attributes == {"items": 3}
+    assert spans[2].attributes["error"] == "ValueError: сбой"
+    assert other.trace_id != root.trace_id and other.parent_id is None
+    assert root.duration >= spans[1].duration
+
+    summary = local_tracer.summary(root.trace_id)
+    assert summary["stage.first"]["count"] == 1
+    assert "stage.failed" in local_tracer.format_summary()
+
+    jsonl_path = tmp_path / "traces" / "trace.jsonl"
+    local_tracer.export_jsonl(str(jsonl_path), root.trace_id)
+    local_tracer.export_jsonl(str(jsonl_path), other.trace_id)
+    records = [json.loads(line) for line in jsonl_path.read_text(encoding='utf-8').splitlines()]
+    assert [record["name"] for record in records] == ["request", "stage.first", "stage.failed", "other"]
+    assert records[0]["attributes"] == {"user": "тест"}
+
+    chrome_path = tmp_path / "trace.json"
+    local_tracer.export_chrome_trace(str(chrome_path))
+    events = json.loads(chrome_path.read_text(encoding='utf-8'))["traceEvents"]
+    assert len(events) == 4
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+
+    # Выключенный трассировщик ничего не записывает
+    disabled = Tracer(enabled=False)
+    with disabled.span("request") as span:
+        span.set_attribute("ignored", True)
+    assert span is NULL_SPAN and disabled.spans() == []
+
+
+def test_pipeline_spans():
+    """Формализатор и движок создают интервалы этапов внутри запроса"""
+    formalizer = LogicFormalizer()
+    formalizer._stream_model_output = lambda prompt: ["Человек(Сократ)\n¬Человек(x) ∨ ", "Смертен(x)\n¬Смертен(Сократ)"]
+    engine = ResolutionEngine()
+
+    with tracer.span("gui.request") as request_span:
+        formulas = formalizer.formalize_problem("Сократ - человек. Люди смертны.")
+        success, _ = engine.prove(formulas)
+    assert success
+
+    spans = {span.name: span for span in tracer.spans(request_span.trace_id)}
+    print(tracer.format_summary(request_span.trace_id))
+    for name in ("formalizer.formalize_problem", "formalizer.build_prompt",
+                 "formalizer.model_call", "engine.prove"):
+        assert name in spans
+    assert spans["formalizer.model_call"].parent_id == spans["formalizer.formalize_problem"].span_id
+    assert spans["engine.prove"].parent_id == request_span.span_id
+    assert spans["engine.prove"].attributes["result"] is True
+    assert spans["formalizer.formalize_problem"].attributes["formulas"] == 3
+
+
+def test_pipeline_without_tracing():
+    """С выключенной трассировкой формализация и доказательство работают как обычно"""
+    formalizer = LogicFormalizer()
+    formalizer._stream_model_output = lambda prompt: ["Человек(Сократ)\n¬Человек(x) ∨ Смертен(x)\n¬Смертен(Сократ)\n"]
+    tracer.enabled = False
+    try:
+        formulas = formalizer.formalize_problem("Сократ - человек. Люди смертны.")
+        success, _ = ResolutionEngine().prove(formulas)
+    finally:
+        tracer.enabled = True
+    print(f"Формулы: {formulas}")
+    assert formulas == ["Человек(Сократ)", "¬Человек(x) ∨ Смертен(x)", "¬Смертен(Сократ)"]
+    assert success